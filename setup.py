@@ -107,6 +107,7 @@ setup(
         "performance": [
             "numba>=0.54.0",          # JIT compilation - allow latest optimizations
             "cython>=0.29.0",         # C extensions - stable API
+            "orjson>=3.6.0",          # Fast JSON responses - optional, stdlib fallback
         ],
         "visualization": [
             "plotly>=5.0.0",          # Interactive plotting - stable API
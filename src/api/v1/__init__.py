@@ -15,9 +15,23 @@ The v1 API includes endpoints for:
 
 from flask import Blueprint
 
+from ...utils.config import config
+from ...utils.serialization import init_serialization
+from .middleware.timing import add_server_timing_header
+
 # Create the main v1 blueprint
 api_v1 = Blueprint("api_v1", __name__, url_prefix="/api/v1")
 
+# Serve v1 responses through the fast JSON provider with compression
+api_v1.record_once(
+    lambda state: init_serialization(
+        state.app, config.get("performance.serialization", {})
+    )
+)
+
+# Report per-stage request timings (validation, ...) in Server-Timing
+api_v1.after_request(add_server_timing_header)
+
 # Import route modules - routes are automatically registered via decorators
 from .routes import alerts, analysis, exports, health, models, simulation
 
@@ -0,0 +1,57 @@
+"""
+Request stage timing middleware for API v1.
+
+This module collects per-request stage durations (validation, inference,
+serialization, ...) and reports them in a ``Server-Timing`` response header.
+"""
+
+from typing import Dict
+
+from flask import g, has_request_context
+
+
+def record_stage_timing(stage: str, duration_ms: float) -> None:
+    """
+    Record the duration of a request processing stage.
+
+    Repeated stages within one request are accumulated.
+
+    Args:
+        stage: Stage name (e.g. "validation")
+        duration_ms: Duration in milliseconds
+    """
+    if not has_request_context():
+        return
+
+    timings = g.setdefault("stage_timings", {})
+    timings[stage] = timings.get(stage, 0.0) + duration_ms
+
+
+def get_stage_timings() -> Dict[str, float]:
+    """
+    Get the stage timings recorded for the current request.
+
+    Returns:
+        Mapping of stage name to duration in milliseconds
+    """
+    if not has_request_context():
+        return {}
+    return dict(g.get("stage_timings", {}))
+
+
+def add_server_timing_header(response):
+    """
+    After-request hook adding recorded stage timings as a Server-Timing header.
+
+    Args:
+        response: Flask response object
+
+    Returns:
+        The response with the header added
+    """
+    timings = get_stage_timings()
+    if timings:
+        response.headers["Server-Timing"] = ", ".join(
+            f"{stage};dur={duration:.3f}" for stage, duration in timings.items()
+        )
+    return response
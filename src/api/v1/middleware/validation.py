@@ -6,14 +6,67 @@ API requests against defined schemas.
 """
 
 import logging
-from functools import wraps
+import time
+from functools import lru_cache, wraps
 from typing import Any, Dict, Optional, Type
 
 from flask import jsonify, request
 
+from .timing import record_stage_timing
+
 logger = logging.getLogger(__name__)
 
 
+class CompiledValidator:
+    """
+    Reusable validator built once per schema class.
+
+    Holds a single schema instance and its optional fast-path check so that
+    per-request validation allocates nothing beyond the result object.
+    Schemas opt into the fast path by implementing ``is_well_formed``, which
+    must only return True for payloads the full validation would accept; any
+    other answer falls through to the schema's full ``validate``.
+    """
+
+    def __init__(self, schema_class: Type):
+        self.schema_class = schema_class
+        self.schema = schema_class()
+        self._fast_check = getattr(self.schema, "is_well_formed", None)
+
+    def validate(self, data: Dict[str, Any]) -> "ValidationResult":
+        """
+        Validate request data, taking the fast path for well-formed payloads.
+
+        Args:
+            data: Request data to validate
+
+        Returns:
+            ValidationResult indicating success or failure
+        """
+        if self._fast_check is not None:
+            try:
+                if self._fast_check(data) is True:
+                    return ValidationResult()
+            except Exception:
+                # Any surprise in the fast path defers to full validation
+                pass
+        return self.schema.validate(data)
+
+
+@lru_cache(maxsize=None)
+def compile_schema(schema_class: Type) -> CompiledValidator:
+    """
+    Get the cached compiled validator for a schema class.
+
+    Args:
+        schema_class: Schema class to compile
+
+    Returns:
+        CompiledValidator shared by every route using the schema
+    """
+    return CompiledValidator(schema_class)
+
+
 def validate_request(schema_class: Optional[Type] = None):
     """
     Decorator to validate incoming request data against a schema.
@@ -25,41 +78,58 @@ def validate_request(schema_class: Optional[Type] = None):
         Decorated function with request validation
     """
 
+    # Compile once when the route is registered, not on every request
+    validator = compile_schema(schema_class) if schema_class else None
+
+    def validation_error():
+        """Check the request body; returns an error response, or None if valid"""
+        # Get request data
+        data = request.get_json()
+
+        if data is None:
+            return jsonify({"error": "No JSON data provided"}), 400
+
+        # Perform basic validation
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request data must be a JSON object"}), 400
+
+        # If schema class is provided, validate against it
+        if validator:
+            try:
+                validation_result = validator.validate(data)
+
+                if not validation_result.is_valid:
+                    return (
+                        jsonify(
+                            {
+                                "error": "Validation failed",
+                                "details": validation_result.errors,
+                            }
+                        ),
+                        400,
+                    )
+
+            except Exception as e:
+                logger.error(f"Schema validation error: {str(e)}")
+                return jsonify({"error": "Schema validation failed"}), 400
+
+        return None
+
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             try:
-                # Get request data
-                data = request.get_json()
-
-                if data is None:
-                    return jsonify({"error": "No JSON data provided"}), 400
-
-                # Perform basic validation
-                if not isinstance(data, dict):
-                    return jsonify({"error": "Request data must be a JSON object"}), 400
-
-                # If schema class is provided, validate against it
-                if schema_class:
-                    try:
-                        # Instantiate schema and validate
-                        schema = schema_class()
-                        validation_result = schema.validate(data)
-
-                        if not validation_result.is_valid:
-                            return (
-                                jsonify(
-                                    {
-                                        "error": "Validation failed",
-                                        "details": validation_result.errors,
-                                    }
-                                ),
-                                400,
-                            )
+                # Rejected requests report their validation time too
+                start_time = time.perf_counter()
+                try:
+                    error_response = validation_error()
+                finally:
+                    record_stage_timing(
+                        "validation", (time.perf_counter() - start_time) * 1000
+                    )
 
-                    except Exception as e:
-                        logger.error(f"Schema validation error: {str(e)}")
-                        return jsonify({"error": "Schema validation failed"}), 400
+                if error_response is not None:
+                    return error_response
 
                 # Call the original function
                 return f(*args, **kwargs)
@@ -9,13 +9,18 @@ from datetime import datetime
 from flask import jsonify, request
 
 from ....core.services.alert_service import AlertService
+from ....utils.config import config
+from ....utils.serialization import export_response
 from .. import api_v1
 from ..middleware.error_handling import handle_api_errors
 from ..middleware.validation import validate_request
 from ..schemas.response_schemas import AlertsResponseSchema
 
 # Initialize services
-alert_service = AlertService()
+alert_service = AlertService(
+    rationale_cache=config.get("performance.rationale_cache", {}),
+    alert_history=config.get("performance.alert_history", {}),
+)
 
 
 @api_v1.route("/alerts/history", methods=["GET"])
@@ -26,18 +31,26 @@ def get_alerts_history():
 
     Query Parameters:
         limit: Maximum number of alerts to return
+        offset: Number of matching alerts to skip
         type: Alert type filter
         severity: Severity level filter
         trader_id: Filter by trader ID
+        status: Investigation status filter
+        start_date: Earliest alert timestamp (ISO format)
+        end_date: Latest alert timestamp (ISO format)
 
     Returns:
         JSON response with historical alerts
     """
     # Extract query parameters
     limit = request.args.get("limit", 100, type=int)
+    offset = request.args.get("offset", 0, type=int)
     alert_type = request.args.get("type")
     severity = request.args.get("severity")
     trader_id = request.args.get("trader_id")
+    status = request.args.get("status")
+    start_date = request.args.get("start_date")
+    end_date = request.args.get("end_date")
 
     # Build filters
     filters = {}
@@ -47,10 +60,23 @@ def get_alerts_history():
         filters["severity"] = severity
     if trader_id:
         filters["trader_id"] = trader_id
+    if status:
+        filters["status"] = status
+    if start_date:
+        filters["start_date"] = start_date
+    if end_date:
+        filters["end_date"] = end_date
 
     # Get alerts from service
     alerts = alert_service.get_historical_alerts(
-        limit=limit, alert_type=alert_type, **filters
+        limit=limit,
+        offset=offset,
+        alert_type=alert_type,
+        severity=severity,
+        trader_id=trader_id,
+        status=status,
+        start_date=start_date,
+        end_date=end_date,
     )
 
     # Format response
@@ -117,3 +143,66 @@ def update_alert_status(alert_id):
     }
 
     return jsonify(response)
+
+
+@api_v1.route("/alerts/export/stor", methods=["GET"])
+@handle_api_errors
+def export_stor_bulk():
+    """
+    Stream STOR records for all alerts matching the filters.
+
+    Records are written as JSON lines, one alert at a time, reusing
+    regulatory rationales that have already been generated.
+
+    Query Parameters:
+        start_date: Earliest alert timestamp (ISO format)
+        end_date: Latest alert timestamp (ISO format)
+        type: Alert type (typology) filter
+        severity: Severity level filter
+
+    Returns:
+        Streamed application/x-ndjson download
+    """
+    alerts = _select_export_alerts()
+    filename = f"stor_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    return export_response(
+        alert_service.iter_stor_lines(alerts),
+        "application/x-ndjson",
+        filename,
+        config.get("performance.serialization", {}),
+    )
+
+
+@api_v1.route("/alerts/export/csv", methods=["GET"])
+@handle_api_errors
+def export_regulatory_csv_bulk():
+    """
+    Stream a regulatory CSV report for all alerts matching the filters.
+
+    Query Parameters:
+        start_date: Earliest alert timestamp (ISO format)
+        end_date: Latest alert timestamp (ISO format)
+        type: Alert type (typology) filter
+        severity: Severity level filter
+
+    Returns:
+        Streamed text/csv download, one row per alert
+    """
+    alerts = _select_export_alerts()
+    filename = f"regulatory_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+    return export_response(
+        alert_service.iter_regulatory_csv_rows(alerts),
+        "text/csv",
+        filename,
+        config.get("performance.serialization", {}),
+    )
+
+
+def _select_export_alerts():
+    """Select alerts for a bulk export from the request's query parameters"""
+    return alert_service.select_alerts(
+        start_date=request.args.get("start_date"),
+        end_date=request.args.get("end_date"),
+        alert_type=request.args.get("type"),
+        severity=request.args.get("severity"),
+    )
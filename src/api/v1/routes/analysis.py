@@ -12,6 +12,7 @@ from flask import jsonify, request
 
 from ....core.services.analysis_service import AnalysisService
 from ....core.services.regulatory_service import RegulatoryService
+from ....utils.config import config
 from ....utils.logger import setup_logger
 from .. import api_v1
 from ..middleware.error_handling import handle_api_errors
@@ -22,7 +23,10 @@ from ..schemas.response_schemas import AnalysisResponseSchema
 logger = setup_logger()
 
 # Initialize services
-analysis_service = AnalysisService()
+analysis_service = AnalysisService(
+    realtime_batching=config.get("performance.realtime_batching", {}),
+    analysis_jobs=config.get("performance.analysis_jobs", {}),
+)
 regulatory_service = RegulatoryService()
 
 
@@ -88,10 +92,12 @@ def analyze_batch_data():
     Analyze multiple trading datasets in batch.
 
     This endpoint allows for efficient processing of multiple trading
-    scenarios in a single request.
+    scenarios in a single request. With "async": true (or ?async=true) the
+    batch is queued as a job and a job ID is returned immediately; poll
+    /analyze/jobs/<job_id> for progress and results.
 
     Returns:
-        JSON response with batch analysis results
+        JSON response with batch analysis results, or 202 with the job ID
     """
     try:
         data = request.get_json()
@@ -100,6 +106,24 @@ def analyze_batch_data():
         if not batch_data:
             return jsonify({"error": "No batch data provided"}), 400
 
+        run_async = data.get("async", False) or request.args.get(
+            "async", "false"
+        ).lower() in ("1", "true")
+        if run_async:
+            job_id = analysis_service.submit_batch_job(
+                batch_data, metadata=data.get("metadata")
+            )
+            response = {
+                "timestamp": datetime.utcnow().isoformat(),
+                "job_id": job_id,
+                "status": "queued",
+                "total_items": len(batch_data),
+                "status_url": f"/api/v1/analyze/jobs/{job_id}",
+                "results_url": f"/api/v1/analyze/jobs/{job_id}/results",
+            }
+            logger.info(f"Batch analysis job {job_id} queued for {len(batch_data)} datasets")
+            return jsonify(response), 202
+
         # Process batch analysis
         batch_results = analysis_service.analyze_batch_data(batch_data)
 
@@ -159,3 +183,93 @@ def analyze_realtime_data():
     except Exception as e:
         logger.error(f"Error in analyze_realtime_data: {str(e)}")
         raise
+
+
+@api_v1.route("/analyze/jobs/<job_id>", methods=["GET"])
+@handle_api_errors
+def get_analysis_job_status(job_id):
+    """
+    Get status and progress of an asynchronous batch analysis job.
+
+    Args:
+        job_id: ID returned by /analyze/batch in async mode
+
+    Returns:
+        JSON response with job status and progress
+    """
+    status = analysis_service.get_analysis_status(job_id)
+
+    if status["status"] == "not_found":
+        return jsonify({"error": f"Analysis job {job_id} not found"}), 404
+
+    return jsonify(status)
+
+
+@api_v1.route("/analyze/jobs/<job_id>/results", methods=["GET"])
+@handle_api_errors
+def get_analysis_job_results(job_id):
+    """
+    Get partial or final results of an asynchronous batch analysis job.
+
+    Query Parameters:
+        offset: Index of the first result to return
+        limit: Maximum number of results to return
+
+    Returns:
+        JSON response with job status and a page of results
+    """
+    offset = request.args.get("offset", 0, type=int)
+    limit = request.args.get("limit", 100, type=int)
+
+    status = analysis_service.get_analysis_status(job_id)
+    if status["status"] == "not_found":
+        return jsonify({"error": f"Analysis job {job_id} not found"}), 404
+
+    results = analysis_service.get_batch_job_results(job_id, offset=offset, limit=limit)
+
+    response = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "job_id": job_id,
+        "status": status["status"],
+        "progress": status["progress"],
+        "offset": offset,
+        "count": len(results),
+        "results": results,
+    }
+
+    return jsonify(response)
+
+
+@api_v1.route("/analyze/jobs/<job_id>", methods=["DELETE"])
+@handle_api_errors
+def cancel_analysis_job(job_id):
+    """
+    Cancel a queued or running batch analysis job.
+
+    Args:
+        job_id: ID of the job to cancel
+
+    Returns:
+        JSON response confirming cancellation
+    """
+    if not analysis_service.cancel_batch_job(job_id):
+        status = analysis_service.get_analysis_status(job_id)
+        if status["status"] == "not_found":
+            return jsonify({"error": f"Analysis job {job_id} not found"}), 404
+        return (
+            jsonify(
+                {
+                    "error": f"Analysis job {job_id} already {status['status']}",
+                    "job_id": job_id,
+                }
+            ),
+            409,
+        )
+
+    response = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "job_id": job_id,
+        "message": "Analysis job cancellation requested",
+    }
+
+    return jsonify(response)
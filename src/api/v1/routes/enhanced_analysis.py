@@ -8,7 +8,8 @@ into the Korinsic surveillance platform's API endpoints.
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List
 
 from flask import Blueprint, jsonify, request
 
@@ -178,11 +179,9 @@ def analyze_trading_data_enhanced():
                 with tracer.tracer.start_as_current_span(
                     "regulatory_rationale"
                 ) as rationale_span:
-                    for alert in alerts:
-                        rationale = _generate_regulatory_rationale(
-                            alert, processed_data
-                        )
-                        regulatory_rationales.append(rationale)
+                    regulatory_rationales = _generate_regulatory_rationales(
+                        alerts, processed_data
+                    )
 
                     rationale_span.set_attribute(
                         "rationale.count", len(regulatory_rationales)
@@ -422,9 +421,23 @@ def _generate_regulatory_rationale(
     alert: Dict[str, Any], processed_data: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Generate regulatory rationale (placeholder for actual logic)."""
+    rationale = dict(_regulatory_rationale_template(alert["type"]))
+    rationale["confidence"] = alert.get("confidence", "Medium")
+    return rationale
+
+
+def _generate_regulatory_rationales(
+    alerts: List[Dict[str, Any]], processed_data: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Generate regulatory rationales for all alerts in one pass."""
+    return [_generate_regulatory_rationale(alert, processed_data) for alert in alerts]
+
+
+@lru_cache(maxsize=64)
+def _regulatory_rationale_template(alert_type: str) -> Dict[str, Any]:
+    """Parts of a regulatory rationale that depend only on the alert type."""
     return {
-        "alert_type": alert["type"],
-        "rationale": f"Regulatory rationale for {alert['type']} alert",
-        "applicable_regulations": ["MiFID II", "MAR"],
-        "confidence": alert.get("confidence", "Medium"),
+        "alert_type": alert_type,
+        "rationale": f"Regulatory rationale for {alert_type} alert",
+        "applicable_regulations": ("MiFID II", "MAR"),
     }
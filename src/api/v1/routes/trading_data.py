@@ -5,19 +5,23 @@ This module provides API endpoints for accessing comprehensive raw trading data
 for analyst investigations of market abuse alerts.
 """
 
+import atexit
+import base64
 import csv
 import io
 import json
 import logging
 from datetime import datetime
 
-from flask import Blueprint, jsonify, request, send_file
+from flask import Blueprint, jsonify, request
 
 from core.alert_generator import AlertGenerator
 from core.bayesian_engine import BayesianEngine
 from core.data_processor import DataProcessor
 from core.risk_calculator import RiskCalculator
 from core.trading_data_service import TradingDataService
+from utils.config import config
+from utils.serialization import drain_buffer, export_response
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +30,15 @@ trading_data_bp = Blueprint("trading_data", __name__)
 
 # Initialize services
 trading_data_service = TradingDataService()
+atexit.register(trading_data_service.close)
 data_processor = DataProcessor()
 alert_generator = AlertGenerator()
 bayesian_engine = BayesianEngine()
 risk_calculator = RiskCalculator()
 
+# Number of CSV rows written per streamed export chunk
+_CSV_ROWS_PER_CHUNK = 500
+
 
 @trading_data_bp.route("/raw-data/alert/<alert_id>", methods=["POST"])
 def get_raw_data_for_alert(alert_id):
@@ -166,7 +174,9 @@ def export_raw_data_csv(alert_id):
     """
     Export raw trading data as CSV for analyst investigation
 
-    Provides downloadable CSV file with comprehensive trading data
+    Provides downloadable CSV file with comprehensive trading data. Rows are
+    streamed as they are written (gzip-compressed on the fly when the client
+    accepts it), so memory use does not grow with the export size.
     """
     try:
         data = request.get_json()
@@ -177,28 +187,16 @@ def export_raw_data_csv(alert_id):
         # Process the data
         processed_data = data_processor.process(data)
 
-        # Get raw trading data
-        raw_data = trading_data_service.get_raw_trading_data_for_alert(
-            alert_id, processed_data
-        )
-
-        # Create CSV content
-        csv_content = _create_csv_content(raw_data)
-
-        # Create in-memory file
-        output = io.StringIO()
-        output.write(csv_content)
-        output.seek(0)
-
-        # Convert to bytes for download
-        csv_bytes = io.BytesIO()
-        csv_bytes.write(output.getvalue().encode("utf-8"))
-        csv_bytes.seek(0)
+        # Extract raw trading data
+        raw_trades, raw_orders, summary = _extract_raw_data(alert_id, processed_data)
 
         filename = f"raw_trading_data_{alert_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
 
-        return send_file(
-            csv_bytes, mimetype="text/csv", as_attachment=True, download_name=filename
+        return export_response(
+            _iter_csv_content(raw_trades, raw_orders, summary),
+            "text/csv",
+            filename,
+            config.get("performance.serialization", {}),
         )
 
     except Exception as e:
@@ -213,7 +211,8 @@ def export_raw_data_json(alert_id):
     """
     Export raw trading data as JSON for analyst investigation
 
-    Provides downloadable JSON file with comprehensive trading data
+    Provides downloadable JSON file with comprehensive trading data. Records
+    are streamed one at a time, gzip-compressed on the fly when accepted.
     """
     try:
         data = request.get_json()
@@ -224,26 +223,16 @@ def export_raw_data_json(alert_id):
         # Process the data
         processed_data = data_processor.process(data)
 
-        # Get raw trading data
-        raw_data = trading_data_service.get_raw_trading_data_for_alert(
-            alert_id, processed_data
-        )
-
-        # Create JSON content
-        json_content = json.dumps(raw_data, indent=2, default=str)
-
-        # Create in-memory file
-        json_bytes = io.BytesIO()
-        json_bytes.write(json_content.encode("utf-8"))
-        json_bytes.seek(0)
+        # Extract raw trading data
+        raw_trades, raw_orders, summary = _extract_raw_data(alert_id, processed_data)
 
         filename = f"raw_trading_data_{alert_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
 
-        return send_file(
-            json_bytes,
-            mimetype="application/json",
-            as_attachment=True,
-            download_name=filename,
+        return export_response(
+            _iter_json_content(alert_id, raw_trades, raw_orders, summary),
+            "application/json",
+            filename,
+            config.get("performance.serialization", {}),
         )
 
     except Exception as e:
@@ -380,6 +369,9 @@ def search_raw_trading_data():
     Request body should contain search criteria:
     - trader_id: Trader identifier
     - instrument: Instrument filter
+    - venue: Execution venue (exchange)
+    - desk: Trading desk (trades only)
+    - alert_id: Alert the data was extracted for
     - start_date: Start date
     - end_date: End date
     - direction: Trade direction (buy/sell)
@@ -387,6 +379,10 @@ def search_raw_trading_data():
     - max_quantity: Maximum quantity
     - min_price: Minimum price
     - max_price: Maximum price
+
+    Pagination:
+    - limit: Maximum trades and orders per page
+    - cursor: next_cursor value from the previous page
     """
     try:
         search_criteria = request.get_json()
@@ -394,45 +390,53 @@ def search_raw_trading_data():
         if not search_criteria:
             return jsonify({"error": "No search criteria provided"}), 400
 
-        # Extract search parameters
-        trader_id = search_criteria.get("trader_id")
-        instrument = search_criteria.get("instrument")
-        start_date = search_criteria.get("start_date")
-        end_date = search_criteria.get("end_date")
-        direction = search_criteria.get("direction")
-        min_quantity = search_criteria.get("min_quantity")
-        max_quantity = search_criteria.get("max_quantity")
-        min_price = search_criteria.get("min_price")
-        max_price = search_criteria.get("max_price")
-
-        # Search through cached data
-        matching_trades = []
-        matching_orders = []
-
-        for alert_id, trades in trading_data_service.raw_trades_cache.items():
-            for trade in trades:
-                if _matches_criteria(trade, search_criteria):
-                    matching_trades.append(trade.to_dict())
-
-        for alert_id, orders in trading_data_service.raw_orders_cache.items():
-            for order in orders:
-                if _matches_order_criteria(order, search_criteria):
-                    matching_orders.append(order.to_dict())
+        search_config = config.get("performance.raw_data_search", {})
+        max_page_size = search_config.get("max_page_size", 1000)
+        try:
+            limit = int(
+                search_criteria.get("limit", search_config.get("default_page_size", 100))
+            )
+        except (TypeError, ValueError):
+            return jsonify({"error": "limit must be an integer"}), 400
+        if not 1 <= limit <= max_page_size:
+            return (
+                jsonify({"error": f"limit must be between 1 and {max_page_size}"}),
+                400,
+            )
+
+        try:
+            trades_after, orders_after = _decode_search_cursor(
+                search_criteria.get("cursor")
+            )
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+        # A list exhausted on an earlier page is not searched again
+        trades_exhausted = trades_after == _CURSOR_EXHAUSTED
+        orders_exhausted = orders_after == _CURSOR_EXHAUSTED
+        results = trading_data_service.search_raw_data(
+            search_criteria,
+            limit=limit,
+            trades_after=None if trades_exhausted else trades_after,
+            orders_after=None if orders_exhausted else orders_after,
+            search_trades=not trades_exhausted,
+            search_orders=not orders_exhausted,
+        )
+
+        next_cursor = _encode_search_cursor(
+            results.pop("next_trade_position"), results.pop("next_order_position")
+        )
 
         response = {
             "status": "success",
             "search_criteria": search_criteria,
-            "results": {
-                "trades": matching_trades,
-                "orders": matching_orders,
-                "total_trades": len(matching_trades),
-                "total_orders": len(matching_orders),
-            },
+            "results": results,
+            "next_cursor": next_cursor,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
         logger.info(
-            f"Search completed: {len(matching_trades)} trades, {len(matching_orders)} orders found"
+            f"Search completed: {results['total_trades']} trades, {results['total_orders']} orders found"
         )
         return jsonify(response)
 
@@ -441,93 +445,107 @@ def search_raw_trading_data():
         return jsonify({"error": "Internal server error", "details": str(e)}), 500
 
 
-def _create_csv_content(raw_data):
-    """Create CSV content from raw trading data"""
-    output = io.StringIO()
+def _extract_raw_data(alert_id, processed_data):
+    """Extract raw trades, orders and their summary for an alert"""
+    raw_trades = trading_data_service.extract_raw_trades_for_alert(
+        alert_id, processed_data
+    )
+    raw_orders = trading_data_service.extract_raw_orders_for_alert(
+        alert_id, processed_data
+    )
+    summary = trading_data_service.generate_trading_data_summary(
+        alert_id, raw_trades, raw_orders
+    )
+    return raw_trades, raw_orders, summary
 
-    # Write trades data
-    if raw_data["raw_trades"]:
-        output.write("=== TRADES DATA ===\n")
-        trade_fieldnames = raw_data["raw_trades"][0].keys()
-        writer = csv.DictWriter(output, fieldnames=trade_fieldnames)
-        writer.writeheader()
-        writer.writerows(raw_data["raw_trades"])
-        output.write("\n")
 
-    # Write orders data
-    if raw_data["raw_orders"]:
-        output.write("=== ORDERS DATA ===\n")
-        order_fieldnames = raw_data["raw_orders"][0].keys()
-        writer = csv.DictWriter(output, fieldnames=order_fieldnames)
-        writer.writeheader()
-        writer.writerows(raw_data["raw_orders"])
+def _iter_csv_content(raw_trades, raw_orders, summary):
+    """Yield CSV content for raw trading data in batches of rows"""
+    output = io.StringIO()
+
+    for title, records in (("TRADES", raw_trades), ("ORDERS", raw_orders)):
+        if not records:
+            continue
+        output.write(f"=== {title} DATA ===\n")
+        writer = None
+        for row_number, record in enumerate(records, 1):
+            row = record.to_dict()
+            if writer is None:
+                writer = csv.DictWriter(output, fieldnames=row.keys())
+                writer.writeheader()
+            writer.writerow(row)
+            if row_number % _CSV_ROWS_PER_CHUNK == 0:
+                yield drain_buffer(output)
         output.write("\n")
+        yield drain_buffer(output)
 
     # Write summary
     output.write("=== SUMMARY ===\n")
-    summary_data = raw_data["summary"]
-    for key, value in summary_data.items():
+    for key, value in summary.to_dict().items():
         output.write(f"{key},{value}\n")
+    yield drain_buffer(output)
 
-    return output.getvalue()
-
-
-def _matches_criteria(trade, criteria):
-    """Check if trade matches search criteria"""
-    if criteria.get("trader_id") and trade.trader_id != criteria["trader_id"]:
-        return False
-
-    if criteria.get("instrument") and trade.instrument != criteria["instrument"]:
-        return False
-
-    if (
-        criteria.get("start_date")
-        and trade.execution_timestamp < criteria["start_date"]
-    ):
-        return False
-
-    if criteria.get("end_date") and trade.execution_timestamp > criteria["end_date"]:
-        return False
-
-    if criteria.get("direction") and trade.direction.value != criteria["direction"]:
-        return False
-
-    if criteria.get("min_quantity") and trade.quantity < criteria["min_quantity"]:
-        return False
-
-    if criteria.get("max_quantity") and trade.quantity > criteria["max_quantity"]:
-        return False
-
-    if criteria.get("min_price") and trade.executed_price < criteria["min_price"]:
-        return False
 
-    if criteria.get("max_price") and trade.executed_price > criteria["max_price"]:
-        return False
-
-    return True
-
-
-def _matches_order_criteria(order, criteria):
-    """Check if order matches search criteria"""
-    if criteria.get("trader_id") and order.trader_id != criteria["trader_id"]:
-        return False
-
-    if criteria.get("instrument") and order.instrument != criteria["instrument"]:
-        return False
-
-    if criteria.get("start_date") and order.order_timestamp < criteria["start_date"]:
-        return False
-
-    if criteria.get("end_date") and order.order_timestamp > criteria["end_date"]:
-        return False
-
-    if criteria.get("direction") and order.side.value != criteria["direction"]:
-        return False
-
-    if criteria.get("min_quantity") and order.quantity < criteria["min_quantity"]:
-        return False
-
-    if criteria.get("max_quantity") and order.quantity > criteria["max_quantity"]:
-        return False
+def _iter_json_content(alert_id, raw_trades, raw_orders, summary):
+    """
+    Yield the JSON export one record at a time.
 
-    return True
+    Output matches ``json.dumps(raw_data, indent=2, default=str)`` of the
+    fully materialised export.
+    """
+    yield "{\n"
+    yield f'  "alert_id": {json.dumps(alert_id)},\n'
+    for key, records in (("raw_trades", raw_trades), ("raw_orders", raw_orders)):
+        if not records:
+            yield f'  "{key}": [],\n'
+            continue
+        yield f'  "{key}": [\n'
+        for index, record in enumerate(records):
+            separator = ",\n" if index < len(records) - 1 else "\n"
+            yield _indent_json(record.to_dict(), 4) + separator
+        yield "  ],\n"
+    yield f'  "summary": {_indent_json(summary.to_dict(), 2).lstrip()},\n'
+    yield f'  "extraction_timestamp": {json.dumps(datetime.utcnow().isoformat())}\n'
+    yield "}"
+
+
+def _indent_json(value, indent):
+    """Dump a value with indent=2, shifted right by ``indent`` spaces"""
+    padding = " " * indent
+    return "\n".join(
+        padding + line for line in json.dumps(value, indent=2, default=str).split("\n")
+    )
+
+
+# Cursor marker for a result list that has no further pages
+_CURSOR_EXHAUSTED = "end"
+
+
+def _encode_search_cursor(trade_position, order_position):
+    """Encode the resume positions of both result lists as an opaque cursor"""
+    if trade_position is None and order_position is None:
+        return None
+    payload = {
+        "trades": list(trade_position) if trade_position else _CURSOR_EXHAUSTED,
+        "orders": list(order_position) if order_position else _CURSOR_EXHAUSTED,
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def _decode_search_cursor(cursor):
+    """Decode a search cursor into (trades_after, orders_after) positions"""
+    if not cursor:
+        return None, None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        positions = []
+        for key in ("trades", "orders"):
+            value = payload[key]
+            if value == _CURSOR_EXHAUSTED:
+                positions.append(_CURSOR_EXHAUSTED)
+            else:
+                timestamp, record_id = value
+                positions.append((str(timestamp), int(record_id)))
+        return tuple(positions)
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
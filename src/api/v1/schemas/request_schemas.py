@@ -51,6 +51,16 @@ class BaseRequestSchema:
         """Validate specific schema requirements. Override in subclasses."""
         pass
 
+    def is_well_formed(self, data: Dict[str, Any]) -> Optional[bool]:
+        """
+        Cheap fast-path check for the common well-formed case.
+
+        Must only return True when validate() would report no errors.
+        Returning None or False runs the full validation. Override in
+        subclasses whose full validation is expensive.
+        """
+        return None
+
 
 class AnalysisRequestSchema(BaseRequestSchema):
     """
@@ -77,6 +87,28 @@ class AnalysisRequestSchema(BaseRequestSchema):
         - Trader IDs must be consistent across trades and orders
         - Material events must have valid event types
     """
+
+    REQUIRED_TRADE_FIELDS = frozenset(["timestamp", "volume", "value", "symbol"])
+    REQUIRED_ORDER_FIELDS = frozenset(["timestamp", "quantity", "price", "side"])
+
+    def is_well_formed(self, data: Dict[str, Any]) -> Optional[bool]:
+        """Fast path: non-empty trade/order lists whose records carry all required fields."""
+        if type(data) is not dict:
+            return False
+        trades = data.get("trades")
+        orders = data.get("orders")
+        if type(trades) is not list or type(orders) is not list:
+            return False
+        if not trades or not orders:
+            return False
+
+        trade_fields = self.REQUIRED_TRADE_FIELDS
+        order_fields = self.REQUIRED_ORDER_FIELDS
+        return all(
+            type(trade) is dict and trade.keys() >= trade_fields for trade in trades
+        ) and all(
+            type(order) is dict and order.keys() >= order_fields for order in orders
+        )
     
     def _validate_specific(self, data: Dict[str, Any], result: "ValidationResult"):
         """
@@ -199,6 +231,16 @@ class SimulationRequestSchema(BaseRequestSchema):
 class BatchAnalysisRequestSchema(BaseRequestSchema):
     """Schema for batch analysis request validation."""
 
+    def is_well_formed(self, data: Dict[str, Any]) -> Optional[bool]:
+        """Fast path: every batch item passes the analysis fast path."""
+        if type(data) is not dict:
+            return False
+        batch_data = data.get("batch_data")
+        if type(batch_data) is not list or not batch_data:
+            return False
+        item_check = AnalysisRequestSchema().is_well_formed
+        return all(item_check(item) is True for item in batch_data)
+
     def _validate_specific(self, data: Dict[str, Any], result: "ValidationResult"):
         """Validate batch analysis request specific requirements."""
         if "batch_data" not in data:
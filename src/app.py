@@ -19,6 +19,7 @@ from src.core.alert_generator import AlertGenerator
 from src.core.risk_calculator import RiskCalculator
 from src.utils.config import Config
 from src.utils.logger import setup_logger
+from src.utils.serialization import init_serialization
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -33,6 +34,9 @@ config = Config()
 cors_origins = config.get('security', {}).get('cors_origins', ['http://localhost:3000'])
 CORS(app, origins=cors_origins, allow_headers=['Content-Type', 'Authorization'])
 
+# Fast JSON provider (numpy/datetime aware) with gzip/deflate negotiation
+init_serialization(app, config.get('performance', {}).get('serialization', {}))
+
 bayesian_engine = BayesianEngine()
 data_processor = DataProcessor()
 alert_generator = AlertGenerator()
@@ -17,7 +17,7 @@ Features:
 import logging
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import numpy as np
 
 from src.models.person_centric import (
@@ -505,12 +505,23 @@ class CrossTypologyEngine:
             "analysis_timestamp": datetime.now(timezone.utc).isoformat()
         }
     
-    def cleanup_expired_signals(self):
-        """Remove expired signals based on decay parameters"""
+    def cleanup_expired_signals(self, person_ids: Optional[Iterable[str]] = None):
+        """
+        Remove expired signals based on decay parameters
+        
+        Args:
+            person_ids: Persons whose signals to decay (all persons if None)
+        """
         
         current_time = datetime.now(timezone.utc)
         
-        for person_id in list(self.active_signals.keys()):
+        full_cleanup = person_ids is None
+        if full_cleanup:
+            person_ids = list(self.active_signals.keys())
+        
+        for person_id in person_ids:
+            if person_id not in self.active_signals:
+                continue
             active_signals = []
             
             for signal in self.active_signals[person_id]:
@@ -533,7 +544,8 @@ class CrossTypologyEngine:
             else:
                 del self.active_signals[person_id]
         
-        logger.info(f"Signal cleanup completed. Active signals for {len(self.active_signals)} persons.")
+        if full_cleanup:
+            logger.info(f"Signal cleanup completed. Active signals for {len(self.active_signals)} persons.")
     
     def update_typology_correlations(self, correlations: Dict[Tuple[RiskTypology, RiskTypology], float]):
         """
@@ -10,13 +10,15 @@ Features:
 - Dynamic identity graph maintenance
 - Fuzzy matching for name/email variations
 - HR data override capabilities
+- Blocking index to limit fuzzy matching to plausible candidates
 """
 
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 from uuid import uuid4
 
 import numpy as np
@@ -24,6 +26,13 @@ from difflib import SequenceMatcher
 
 logger = logging.getLogger(__name__)
 
+# Identifiers that resolve a person by exact lookup
+EXACT_MATCH_ATTRIBUTES = ('account_id', 'email', 'comm_handle')
+# Fuzzy matches must score above this to link a record to a person
+MIN_FUZZY_MATCH_CONFIDENCE = 0.7
+# Default confidence for newly created persons
+NEW_PERSON_CONFIDENCE = 0.8
+
 
 @dataclass
 class IdentityLink:
@@ -202,14 +211,212 @@ class IdentityMatcher:
         return confidence, evidence
 
 
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def soundex(token: str) -> str:
+    """American Soundex code of a lowercase alphabetic token"""
+    letters = [char for char in token if char.isalpha()]
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # 'h' and 'w' do not separate letters with the same code
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+# Length of the character n-grams names are blocked on
+NAME_GRAM_SIZE = 3
+
+
+def _tokens(value: str) -> List[str]:
+    """Lowercase alphanumeric tokens of at least two characters"""
+    return [token for token in re.split(r'[^a-z0-9]+', value.lower()) if len(token) > 1]
+
+
+def blocking_keys(attributes: Dict[str, Any]) -> Set[str]:
+    """
+    Blocking keys for the name, email and desk of an attribute set.
+
+    Names contribute their tokens, each token's Soundex code and, for
+    tokens longer than NAME_GRAM_SIZE, its character n-grams, so typos that
+    change a token's sound still share a block. Emails contribute their
+    local part, local-part tokens and domain, and desks their normalised id.
+    """
+    keys = set()
+
+    name = attributes.get('name')
+    if name:
+        for token in _tokens(str(name)):
+            keys.add(f"name:{token}")
+            if token.isalpha():
+                keys.add(f"name_sound:{soundex(token)}")
+                if len(token) > NAME_GRAM_SIZE:
+                    keys.update(
+                        f"name_gram:{token[i:i + NAME_GRAM_SIZE]}"
+                        for i in range(len(token) - NAME_GRAM_SIZE + 1)
+                    )
+
+    email = attributes.get('email')
+    if email:
+        local, _, domain = str(email).lower().strip().partition('@')
+        if local:
+            keys.add(f"email_local:{local}")
+            keys.update(f"email_local:{token}" for token in _tokens(local))
+        if domain:
+            keys.add(f"email_domain:{domain}")
+
+    desk = attributes.get('desk')
+    if desk:
+        keys.add("desk:" + re.sub(r'[\s_\-]+', '_', str(desk).strip().upper()))
+
+    return keys
+
+
+def hr_identifier_keys(hr_record: Dict[str, Any]) -> List[str]:
+    """Index keys for the identifying attributes of an HR record, employee id first"""
+    keys = []
+    if hr_record.get('employee_id') is not None:
+        keys.append(f"employee_id:{hr_record['employee_id']}")
+    if hr_record.get('email'):
+        keys.append(f"email:{str(hr_record['email']).lower().strip()}")
+    keys.extend(f"account_id:{account_id}" for account_id in hr_record.get('account_ids') or ())
+    return keys
+
+
+class BlockingIndex:
+    """
+    Inverted index from blocking keys to the persons carrying them.
+
+    Fuzzy matching scores only the persons sharing a key with the incoming
+    record rather than every known person. Keys held by more than
+    ``max_block_size`` persons (a firm-wide email domain, a large desk)
+    say little about identity and are skipped when collecting candidates.
+    """
+
+    def __init__(self, max_block_size: int = 200):
+        self.max_block_size = max_block_size
+        self._blocks: Dict[str, Set[str]] = defaultdict(set)
+        self._order: Dict[str, int] = {}
+
+    def add(self, person_id: str, attributes: Dict[str, Any]):
+        """Index a person under the blocking keys of the given attributes"""
+        self._order.setdefault(person_id, len(self._order))
+        for key in blocking_keys(attributes):
+            self._blocks[key].add(person_id)
+
+    def candidates(self, attributes: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Persons sharing a usable blocking key with the attributes, in the
+        order they were first indexed.
+
+        Returns:
+            Candidate person ids, or None if the attributes have no usable
+            key and every person has to be considered
+        """
+        usable = False
+        candidates: Set[str] = set()
+        for key in blocking_keys(attributes):
+            block = self._blocks.get(key)
+            if block is None:
+                usable = True
+            elif len(block) <= self.max_block_size:
+                usable = True
+                candidates.update(block)
+        if not usable:
+            return None
+        return sorted(candidates, key=self._order.__getitem__)
+
+    def clear(self):
+        self._blocks.clear()
+        self._order.clear()
+
+
+class DisjointSet:
+    """Union-find over hashable items, with path halving and union by size"""
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        self._parent: Dict[Hashable, Hashable] = {}
+        self._size: Dict[Hashable, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Hashable):
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+
+    def find(self, item: Hashable) -> Hashable:
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: Hashable, second: Hashable) -> bool:
+        """Merge the sets of two items; returns False if already merged"""
+        root1, root2 = self.find(first), self.find(second)
+        if root1 == root2:
+            return False
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size[root2]
+        return True
+
+    def groups(self) -> List[List[Hashable]]:
+        """Sets in the order of their first item added, members in insertion order"""
+        groups: Dict[Hashable, List[Hashable]] = {}
+        for item in self._parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
+
+
+@dataclass
+class BatchResolution:
+    """Outcome of resolving a batch of attribute sets"""
+
+    person_ids: List[str]  # Resolved person per record, in input order
+    confidences: List[float]
+    report: Dict[str, Any] = field(default_factory=dict)
+
+    def record_to_person(self) -> Dict[int, str]:
+        """Map of record position to resolved person"""
+        return dict(enumerate(self.person_ids))
+
+
 class IdentityGraph:
     """Maintains the dynamic identity graph for person resolution"""
     
-    def __init__(self):
+    def __init__(self, use_blocking: bool = True, max_block_size: int = 200):
+        """
+        Args:
+            use_blocking: Limit fuzzy matching to persons sharing a
+                blocking key with the record, instead of scoring everyone
+            max_block_size: Persons above which a blocking key is ignored
+        """
         self.persons: Dict[str, PersonIdentity] = {}
         self.identity_links: List[IdentityLink] = []
         self.attribute_to_person: Dict[str, str] = {}  # Maps attribute values to person_ids
         self.matcher = IdentityMatcher()
+        self.max_block_size = max_block_size
+        self.blocking_index = BlockingIndex(max_block_size) if use_blocking else None
+        self.hr_index: Dict[str, str] = {}  # Maps HR identifiers to person_ids
         
     def resolve_person_id(self, attributes: Dict[str, Any], hr_override: bool = False) -> Tuple[str, float]:
         """
@@ -222,13 +429,13 @@ class IdentityGraph:
         Returns:
             Tuple of (person_id, confidence_score)
         """
-        logger.info(f"Resolving PersonID for attributes: {attributes}")
+        logger.debug(f"Resolving PersonID for attributes: {attributes}")
         
         # Check for existing exact matches first
         person_id = self._find_exact_match(attributes)
         if person_id:
             confidence = self.persons[person_id].confidence_score
-            logger.info(f"Found exact match: {person_id} with confidence {confidence}")
+            logger.debug(f"Found exact match: {person_id} with confidence {confidence}")
             return person_id, confidence
             
         # HR override logic
@@ -242,29 +449,155 @@ class IdentityGraph:
         if best_match:
             person_id, confidence = best_match
             self._update_person_identity(person_id, attributes)
-            logger.info(f"Found fuzzy match: {person_id} with confidence {confidence}")
+            logger.debug(f"Found fuzzy match: {person_id} with confidence {confidence}")
             return person_id, confidence
             
         # Create new person identity
         person_id = self._create_new_person(attributes)
-        logger.info(f"Created new person: {person_id}")
-        return person_id, 0.8  # Default confidence for new persons
+        logger.debug(f"Created new person: {person_id}")
+        return person_id, NEW_PERSON_CONFIDENCE
     
     def _find_exact_match(self, attributes: Dict[str, Any]) -> Optional[str]:
         """Find exact match based on known identifiers"""
-        for attr_type in ['account_id', 'email', 'comm_handle']:
+        for attr_type in EXACT_MATCH_ATTRIBUTES:
             if attr_type in attributes:
                 attr_key = f"{attr_type}:{attributes[attr_type]}"
                 if attr_key in self.attribute_to_person:
                     return self.attribute_to_person[attr_key]
         return None
     
+    def resolve_batch(self, attribute_sets: List[Dict[str, Any]]) -> BatchResolution:
+        """
+        Resolve PersonIDs for many attribute sets at once
+        
+        Identical attribute sets are resolved once. Sets carrying a known
+        account, email or comm handle are joined to their person directly.
+        The rest are clustered with union-find, linking sets that share an
+        identifier and sets that fuzzy-match a cluster's leading set within
+        their blocks. Each cluster is then matched against existing persons,
+        or becomes a new person.
+        
+        Args:
+            attribute_sets: Attribute dicts as taken by resolve_person_id,
+                with hashable values
+            
+        Returns:
+            BatchResolution with the person and confidence per record and a
+            merge report
+        """
+        # Deduplicate identical attribute sets
+        slots: Dict[Tuple, int] = {}
+        unique_sets: List[Dict[str, Any]] = []
+        record_slots = []
+        for attributes in attribute_sets:
+            key = tuple(sorted(attributes.items()))
+            slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(unique_sets)
+                unique_sets.append(attributes)
+            record_slots.append(slot)
+        
+        slot_person: List[Optional[str]] = [None] * len(unique_sets)
+        slot_confidence = [0.0] * len(unique_sets)
+        
+        # Exact matches against known identifiers
+        pending = []
+        for slot, attributes in enumerate(unique_sets):
+            person_id = self._find_exact_match(attributes)
+            if person_id:
+                slot_person[slot] = person_id
+                slot_confidence[slot] = self.persons[person_id].confidence_score
+            else:
+                pending.append(slot)
+        exact_sets = len(unique_sets) - len(pending)
+        
+        # Cluster the rest on shared identifiers and blocked fuzzy matches
+        clusters = DisjointSet(pending)
+        identifier_owner: Dict[str, int] = {}
+        for slot in pending:
+            attributes = unique_sets[slot]
+            for attr_type in EXACT_MATCH_ATTRIBUTES:
+                if attr_type in attributes:
+                    owner = identifier_owner.setdefault(f"{attr_type}:{attributes[attr_type]}", slot)
+                    clusters.union(owner, slot)
+        
+        # Each cluster is led by its first attribute set, which plays the part
+        # of a person's primary attributes: later sets join the best-matching
+        # leader in their blocks, unless an identifier already joined them
+        leaders = BlockingIndex(self.max_block_size)
+        led_roots = set()
+        for slot in pending:
+            root = clusters.find(slot)
+            if root in led_roots:
+                continue
+            attributes = unique_sets[slot]
+            best_leader = None
+            best_confidence = MIN_FUZZY_MATCH_CONFIDENCE
+            for leader in leaders.candidates(attributes) or ():
+                confidence, _ = self.matcher.match_attributes(attributes, unique_sets[leader])
+                if confidence > best_confidence:
+                    best_leader, best_confidence = leader, confidence
+            if best_leader is None:
+                leaders.add(slot, attributes)
+            else:
+                clusters.union(best_leader, slot)
+            led_roots.add(clusters.find(slot))
+        
+        # Match each cluster to an existing person or create one
+        groups = clusters.groups()
+        fuzzy_sets = 0
+        new_persons = 0
+        merges = []
+        for cluster in groups:
+            match = self._find_fuzzy_match(unique_sets[cluster[0]])
+            if match:
+                person_id, confidence = match
+                fuzzy_sets += len(cluster)
+            else:
+                person_id = self._create_new_person(unique_sets[cluster[0]])
+                confidence = NEW_PERSON_CONFIDENCE
+                new_persons += 1
+            for slot in cluster:
+                self._update_person_identity(person_id, unique_sets[slot])
+                slot_person[slot] = person_id
+                slot_confidence[slot] = confidence
+            if len(cluster) > 1:
+                merges.append({
+                    "person_id": person_id,
+                    "attribute_sets": len(cluster),
+                    "matched_existing_person": match is not None,
+                })
+        
+        person_ids = [slot_person[slot] for slot in record_slots]
+        report = {
+            "records": len(record_slots),
+            "unique_attribute_sets": len(unique_sets),
+            "exact_matches": exact_sets,
+            "fuzzy_matches": fuzzy_sets,
+            "new_persons": new_persons,
+            "clusters": len(groups),
+            "merged_clusters": len(merges),
+            "persons_resolved": len(set(person_ids)),
+            "merges": merges,
+        }
+        logger.info(
+            f"Batch identity resolution: {report['records']} records, "
+            f"{report['unique_attribute_sets']} unique attribute sets, "
+            f"{exact_sets} exact, {fuzzy_sets} fuzzy, {new_persons} new persons, "
+            f"{len(merges)} merged clusters"
+        )
+        return BatchResolution(
+            person_ids=person_ids,
+            confidences=[slot_confidence[slot] for slot in record_slots],
+            report=report
+        )
+    
     def _find_fuzzy_match(self, attributes: Dict[str, Any]) -> Optional[Tuple[str, float]]:
         """Find best fuzzy match among existing persons"""
         best_person_id = None
         best_confidence = 0.0
         
-        for person_id, person in self.persons.items():
+        for person_id, person in self._fuzzy_candidates(attributes):
             # Create comparison attributes from person data
             person_attrs = {
                 'name': person.primary_name,
@@ -279,24 +612,42 @@ class IdentityGraph:
                 
             confidence, evidence = self.matcher.match_attributes(attributes, person_attrs)
             
-            if confidence > best_confidence and confidence > 0.7:  # Minimum threshold
+            if confidence > best_confidence and confidence > MIN_FUZZY_MATCH_CONFIDENCE:
                 best_confidence = confidence
                 best_person_id = person_id
                 
         return (best_person_id, best_confidence) if best_person_id else None
+
+    def _fuzzy_candidates(self, attributes: Dict[str, Any]) -> List[Tuple[str, PersonIdentity]]:
+        """Persons worth scoring against the attributes, in creation order"""
+        if self.blocking_index is not None:
+            candidate_ids = self.blocking_index.candidates(attributes)
+            if candidate_ids is not None:
+                return [(person_id, self.persons[person_id]) for person_id in candidate_ids]
+        return list(self.persons.items())
     
     def _handle_hr_override(self, attributes: Dict[str, Any]) -> Optional[str]:
         """Handle HR data override for authoritative identity resolution"""
-        hr_id = attributes['hr_employee_id']
+        identifiers = {
+            'employee_id': attributes['hr_employee_id'],
+            'email': attributes.get('email'),
+            'account_ids': attributes.get('hr_account_ids'),
+        }
         
-        # Look for existing person with this HR ID
-        for person in self.persons.values():
-            for hr_record in person.hr_records:
-                if hr_record.get('employee_id') == hr_id:
-                    self._update_person_identity(person.person_id, attributes)
-                    return person.person_id
+        # Look for existing person with this HR ID, then the other HR identifiers
+        for key in hr_identifier_keys(identifiers):
+            person_id = self.hr_index.get(key)
+            if person_id is not None:
+                self._update_person_identity(person_id, attributes)
+                return person_id
                     
         return None
+
+    def _index_hr_record(self, person_id: str, hr_record: Dict[str, Any]):
+        """Index an HR record by each of its identifying attributes"""
+        for key in hr_identifier_keys(hr_record):
+            # The person first linked to an identifier keeps it
+            self.hr_index.setdefault(key, person_id)
     
     def _create_new_person(self, attributes: Dict[str, Any]) -> str:
         """Create a new person identity"""
@@ -304,13 +655,14 @@ class IdentityGraph:
         
         person = PersonIdentity(
             person_id=person_id,
-            confidence_score=0.8,
+            confidence_score=NEW_PERSON_CONFIDENCE,
             primary_name=attributes.get('name'),
             primary_role=attributes.get('role')
         )
         
         self._update_person_identity(person_id, attributes)
         self.persons[person_id] = person
+        self._index_person(person_id, {'name': person.primary_name})
         
         return person_id
     
@@ -345,15 +697,26 @@ class IdentityGraph:
                 'name': attributes.get('name'),
                 'role': attributes.get('role'),
                 'department': attributes.get('department'),
+                'email': attributes.get('email'),
+                'account_ids': list(attributes.get('hr_account_ids', [])),
                 'updated_at': datetime.now(timezone.utc).isoformat()
             }
             person.hr_records.append(hr_record)
+            self._index_hr_record(person_id, hr_record)
             
         # Update primary fields if not set
+        indexed = {'email': attributes.get('email'), 'desk': attributes.get('desk')}
         if not person.primary_name and 'name' in attributes:
             person.primary_name = attributes['name']
+            indexed['name'] = person.primary_name
         if not person.primary_role and 'role' in attributes:
             person.primary_role = attributes['role']
+        self._index_person(person_id, indexed)
+
+    def _index_person(self, person_id: str, attributes: Dict[str, Any]):
+        """Add the name, emails and desks fuzzy matching compares to the blocking index"""
+        if self.blocking_index is not None:
+            self.blocking_index.add(person_id, attributes)
     
     def get_person_accounts(self, person_id: str) -> Set[str]:
         """Get all account IDs linked to a person"""
@@ -391,8 +754,18 @@ class IdentityGraph:
 class EntityResolutionService:
     """Main service for entity resolution functionality"""
     
-    def __init__(self):
-        self.identity_graph = IdentityGraph()
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Entity resolution configuration (the ``entity_resolution``
+                section of the person-centric surveillance config)
+        """
+        self.config = config or {}
+        blocking_config = self.config.get("blocking", {})
+        self.identity_graph = IdentityGraph(
+            use_blocking=blocking_config.get("enabled", True),
+            max_block_size=blocking_config.get("max_block_size", 200)
+        )
         
     def resolve_trading_data_person_id(self, trade_data: Dict[str, Any]) -> Tuple[str, float]:
         """
@@ -404,6 +777,32 @@ class EntityResolutionService:
         Returns:
             Tuple of (person_id, confidence_score)
         """
+        return self.identity_graph.resolve_person_id(self._trading_attributes(trade_data))
+    
+    def resolve_communication_person_id(self, comm_data: Dict[str, Any]) -> Tuple[str, float]:
+        """Resolve PersonID from communication data"""
+        return self.identity_graph.resolve_person_id(self._communication_attributes(comm_data))
+
+    def resolve_trading_data_batch(self, trades: List[Dict[str, Any]]) -> BatchResolution:
+        """
+        Resolve PersonIDs for many trades at once
+        
+        Args:
+            trades: Trading data dicts containing trader_id, desk, etc.
+            
+        Returns:
+            BatchResolution with the person per trade and a merge report
+        """
+        return self.identity_graph.resolve_batch([self._trading_attributes(trade) for trade in trades])
+
+    def resolve_communication_batch(self, communications: List[Dict[str, Any]]) -> BatchResolution:
+        """Resolve PersonIDs for many communications at once"""
+        return self.identity_graph.resolve_batch(
+            [self._communication_attributes(comm) for comm in communications]
+        )
+
+    def _trading_attributes(self, trade_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Identity attributes of a trade"""
         attributes = {
             'account_id': trade_data.get('trader_id'),
             'name': trade_data.get('trader_name'),
@@ -413,21 +812,17 @@ class EntityResolutionService:
         }
         
         # Remove None values
-        attributes = {k: v for k, v in attributes.items() if v is not None}
-        
-        return self.identity_graph.resolve_person_id(attributes)
-    
-    def resolve_communication_person_id(self, comm_data: Dict[str, Any]) -> Tuple[str, float]:
-        """Resolve PersonID from communication data"""
+        return {k: v for k, v in attributes.items() if v is not None}
+
+    def _communication_attributes(self, comm_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Identity attributes of a communication"""
         attributes = {
             'email': comm_data.get('sender_email'),
             'comm_handle': comm_data.get('sender_handle'),
             'name': comm_data.get('sender_name')
         }
         
-        attributes = {k: v for k, v in attributes.items() if v is not None}
-        
-        return self.identity_graph.resolve_person_id(attributes)
+        return {k: v for k, v in attributes.items() if v is not None}
     
     def add_hr_data(self, hr_records: List[Dict[str, Any]]):
         """Add HR data with override authority"""
@@ -438,7 +833,10 @@ class EntityResolutionService:
                 'email': record.get('email'),
                 'role': record.get('job_title'),
                 'department': record.get('department'),
-                'desk': record.get('desk_assignment')
+                'desk': record.get('desk_assignment'),
+                'hr_account_ids': (
+                    list(record.get('trading_accounts') or []) + list(record.get('trader_ids') or [])
+                ) or None
             }
             
             attributes = {k: v for k, v in attributes.items() if v is not None}
@@ -450,6 +848,10 @@ class EntityResolutionService:
         """Get comprehensive person summary across all linked accounts"""
         return self.identity_graph.get_cross_account_evidence(person_id)
     
+    def get_person(self, person_id: str) -> Optional[PersonIdentity]:
+        """Get a resolved person identity by ID"""
+        return self.identity_graph.persons.get(person_id)
+    
     def get_all_persons(self) -> Dict[str, PersonIdentity]:
         """Get all resolved person identities"""
         return self.identity_graph.persons.copy()
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Person Activity Tracker
+
+Keeps each person's trades and communications over the evidence lookback
+window between surveillance runs, so that only persons whose activity has
+changed need their evidence and alerts recomputed.
+
+Features:
+- Per-person record store keyed by trade id or message identity
+- Data version per person, bumped whenever in-window records change,
+  including a known trade id arriving with amended content
+- Dirty tracking against the version each person was last evaluated at
+- Heap-based expiry touching only records that have left the window
+"""
+
+import heapq
+import itertools
+import logging
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from src.models.trading_data import RawTradeData
+
+from .entity_resolution import PersonIdentity
+from .temporal_index import parse_record_time
+
+logger = logging.getLogger(__name__)
+
+TRADE_RECORDS = "trades"
+COMMUNICATION_RECORDS = "communications"
+
+# Fields filled in on our side (resolution, scoring, ingest time) rather than
+# by the source; a change to any other field is an amendment
+DERIVED_TRADE_FIELDS = frozenset([
+    "person_id", "person_confidence", "alert_ids", "risk_score",
+    "cross_account_risk_factors", "person_level_context", "created_at",
+])
+TRADE_CONTENT_FIELDS = tuple(
+    f.name for f in fields(RawTradeData) if f.name not in DERIVED_TRADE_FIELDS
+)
+DERIVED_COMMUNICATION_KEYS = frozenset(["person_id", "person_confidence"])
+
+
+def communication_key(comm: Dict[str, Any]) -> Hashable:
+    """Identity of a communication: its id, or its sender, time and content"""
+    if comm.get("id") is not None:
+        return comm["id"]
+    sender = comm.get("sender_email") or comm.get("sender_handle") or comm.get("sender_id")
+    return (str(comm.get("timestamp")), sender, comm.get("channel"), comm.get("content"))
+
+
+def record_content(kind: str, record: Any) -> Any:
+    """The source content of a record, compared to detect amendments"""
+    if kind == TRADE_RECORDS:
+        return tuple(getattr(record, name) for name in TRADE_CONTENT_FIELDS)
+    return {key: value for key, value in record.items() if key not in DERIVED_COMMUNICATION_KEYS}
+
+
+def identity_signature(identity: Optional[PersonIdentity]) -> Tuple:
+    """Summary of a person identity that changes whenever evidence inputs do"""
+    if identity is None:
+        return ()
+    return (
+        len(identity.linked_accounts),
+        len(identity.linked_emails),
+        len(identity.linked_desks),
+        len(identity.linked_comm_handles),
+        len(identity.hr_records),
+        identity.primary_name,
+        identity.primary_role,
+        identity.confidence_score,
+    )
+
+
+class PersonActivityTracker:
+    """
+    Per-person record store over the evidence lookback window
+
+    Each person's in-window records carry a data version that moves when a
+    record is added or amended, a record leaves the window or the person's
+    identity changes. Persons whose version differs from the one they were
+    last evaluated at are dirty. Records with unreadable timestamps never
+    expire, matching the evidence aggregator, which keeps them in every window.
+    """
+
+    def __init__(self, lookback_hours: float = 24):
+        self.lookback = timedelta(hours=lookback_hours)
+        self.records: Dict[str, Dict[str, Dict[Hashable, Any]]] = {}
+        self.data_versions: Dict[str, int] = {}
+        self.evaluated_versions: Dict[str, int] = {}
+        self.identity_signatures: Dict[str, Tuple] = {}
+
+        # (record time, sequence, person, record kind, record key)
+        self._expiry: List[Tuple[datetime, int, str, str, Hashable]] = []
+        self._sequence = itertools.count()
+
+    def _person_records(self, person_id: str) -> Dict[str, Dict[Hashable, Any]]:
+        records = self.records.get(person_id)
+        if records is None:
+            records = self.records[person_id] = {TRADE_RECORDS: {}, COMMUNICATION_RECORDS: {}}
+            self.data_versions[person_id] = 0
+        return records
+
+    def _bump(self, person_id: str):
+        self.data_versions[person_id] += 1
+
+    def _add(self, person_id: str, kind: str, key: Hashable, record: Any, record_time: Optional[datetime], cutoff: datetime) -> bool:
+        if record_time is not None and record_time < cutoff:
+            return False
+        store = self._person_records(person_id)[kind]
+        if key in store and record_content(kind, store[key]) == record_content(kind, record):
+            return False
+        # An amended record replaces the stored one and is re-queued at its
+        # own time; the earlier queue entry is skipped once it no longer
+        # matches the stored record's time
+        store[key] = record
+        if record_time is not None:
+            heapq.heappush(self._expiry, (record_time, next(self._sequence), person_id, kind, key))
+        return True
+
+    @staticmethod
+    def _record_time(kind: str, record: Any) -> Optional[datetime]:
+        if kind == TRADE_RECORDS:
+            return parse_record_time(record.execution_timestamp)
+        return parse_record_time(record.get("timestamp"))
+
+    def add_trades(self, person_id: str, trades: List[RawTradeData], now: datetime) -> int:
+        """Store a person's unseen or amended in-window trades; returns how many were stored"""
+        cutoff = now - self.lookback
+        added = sum(
+            self._add(person_id, TRADE_RECORDS, trade.trade_id, trade,
+                      self._record_time(TRADE_RECORDS, trade), cutoff)
+            for trade in trades
+        )
+        if added:
+            self._bump(person_id)
+        return added
+
+    def add_communications(self, person_id: str, communications: List[Dict[str, Any]], now: datetime) -> int:
+        """Store a person's unseen or amended in-window communications; returns how many were stored"""
+        cutoff = now - self.lookback
+        added = sum(
+            self._add(person_id, COMMUNICATION_RECORDS, communication_key(comm), comm,
+                      self._record_time(COMMUNICATION_RECORDS, comm), cutoff)
+            for comm in communications
+        )
+        if added:
+            self._bump(person_id)
+        return added
+
+    def update_identity(self, person_id: str, identity: Optional[PersonIdentity]):
+        """Mark a tracked person dirty if their identity changed since last seen"""
+        if person_id not in self.records:
+            return
+        signature = identity_signature(identity)
+        if self.identity_signatures.get(person_id) != signature:
+            self.identity_signatures[person_id] = signature
+            self._bump(person_id)
+
+    def expire(self, now: datetime) -> int:
+        """Drop records that have left the lookback window; returns how many were dropped"""
+        cutoff = now - self.lookback
+        expired = 0
+        while self._expiry and self._expiry[0][0] < cutoff:
+            record_time, _, person_id, kind, key = heapq.heappop(self._expiry)
+            records = self.records.get(person_id)
+            if records is None or key not in records[kind]:
+                continue
+            if self._record_time(kind, records[kind][key]) != record_time:
+                # Queued before the record was amended to another time
+                continue
+            del records[kind][key]
+            expired += 1
+            self._bump(person_id)
+        return expired
+
+    def dirty_persons(self) -> List[str]:
+        """Persons whose data version moved since they were last evaluated, in tracking order"""
+        return [
+            person_id for person_id, version in self.data_versions.items()
+            if self.evaluated_versions.get(person_id) != version
+        ]
+
+    def get_trades(self, person_id: str) -> List[RawTradeData]:
+        """A person's in-window trades in arrival order"""
+        records = self.records.get(person_id)
+        return list(records[TRADE_RECORDS].values()) if records else []
+
+    def get_communications(self, person_id: str) -> List[Dict[str, Any]]:
+        """A person's in-window communications in arrival order"""
+        records = self.records.get(person_id)
+        return list(records[COMMUNICATION_RECORDS].values()) if records else []
+
+    def mark_evaluated(self, person_id: str):
+        """Record that a person was evaluated at their current data version"""
+        records = self.records.get(person_id)
+        if records is None:
+            return
+        if not records[TRADE_RECORDS] and not records[COMMUNICATION_RECORDS]:
+            # All activity has aged out and its evidence was cleared; stop tracking
+            self.forget(person_id)
+            return
+        self.evaluated_versions[person_id] = self.data_versions[person_id]
+
+    def forget(self, person_id: str):
+        """Stop tracking a person; their queued expiries are skipped when popped"""
+        self.records.pop(person_id, None)
+        self.data_versions.pop(person_id, None)
+        self.evaluated_versions.pop(person_id, None)
+        self.identity_signatures.pop(person_id, None)
+
+    def clear(self):
+        """Drop all tracked activity"""
+        self.records.clear()
+        self.data_versions.clear()
+        self.evaluated_versions.clear()
+        self.identity_signatures.clear()
+        self._expiry.clear()
@@ -0,0 +1,148 @@
+"""
+Person Alert Buffer
+
+Bounded, deduplicating buffer of person-centric alerts. Alerts raised for
+the same person, typology and activity window are merged into the alert
+already held instead of being appended again.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models.person_centric import PersonCentricAlert, RiskTypology
+
+# (person_id, typology, window fingerprint)
+AlertKey = Tuple[str, RiskTypology, int]
+
+
+class PersonAlertBuffer:
+    """
+    Ring buffer of person-centric alerts with a hash index on
+    (person, typology, window fingerprint).
+
+    Adding an alert whose key is already held merges it into the held
+    alert in O(1); the held alert keeps its id, so downstream consumers
+    see one alert per key. When the buffer is full the alert that was
+    least recently raised or merged is dropped.
+    """
+
+    def __init__(self, max_alerts: int = 10000, window_hours: float = 24):
+        """
+        Args:
+            max_alerts: Maximum alerts held
+            window_hours: Width of the activity windows alerts are keyed by
+        """
+        if max_alerts < 1:
+            raise ValueError("max_alerts must be at least 1")
+        if window_hours <= 0:
+            raise ValueError("window_hours must be positive")
+
+        self.max_alerts = max_alerts
+        self.window_seconds = window_hours * 3600
+        self._alerts: "OrderedDict[AlertKey, PersonCentricAlert]" = OrderedDict()
+        self._by_person: Dict[str, Dict[AlertKey, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __iter__(self) -> Iterator[PersonCentricAlert]:
+        """Iterate over held alerts, least recently raised first"""
+        return iter(list(self._alerts.values()))
+
+    def fingerprint(self, alert: PersonCentricAlert) -> int:
+        """Activity window an alert falls in, from its activity start"""
+        moment = alert.activity_period_start or alert.detection_timestamp
+        return int(moment.timestamp() // self.window_seconds)
+
+    def key(self, alert: PersonCentricAlert) -> AlertKey:
+        return (alert.person_id, alert.risk_typology, self.fingerprint(alert))
+
+    def get(self, key: AlertKey) -> Optional[PersonCentricAlert]:
+        return self._alerts.get(key)
+
+    def add(self, alert: PersonCentricAlert) -> Tuple[PersonCentricAlert, bool]:
+        """
+        Hold a new alert, or merge it into the alert held for its key.
+
+        Returns:
+            The held alert and whether the new alert was merged into it
+        """
+        key = self.key(alert)
+        held = self._alerts.get(key)
+        if held is not None:
+            merge_alerts(held, alert)
+            self._alerts.move_to_end(key)
+            return held, True
+
+        self._alerts[key] = alert
+        self._by_person.setdefault(alert.person_id, {})[key] = None
+        while len(self._alerts) > self.max_alerts:
+            self._evict_oldest()
+        return alert, False
+
+    def for_person(self, person_id: str) -> List[PersonCentricAlert]:
+        """Alerts held for a person, in the order they were first raised"""
+        return [self._alerts[key] for key in self._by_person.get(person_id, ())]
+
+    def clear(self) -> None:
+        self._alerts.clear()
+        self._by_person.clear()
+
+    def _evict_oldest(self) -> None:
+        key, alert = self._alerts.popitem(last=False)
+        keys = self._by_person.get(alert.person_id)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._by_person[alert.person_id]
+
+
+def merge_alerts(held: PersonCentricAlert, new: PersonCentricAlert) -> None:
+    """
+    Merge a repeated alert into the one already raised.
+
+    The newer assessment supersedes scores, evidence and narrative when it
+    is at least as probable; accounts, desks and escalation factors are
+    combined and the activity window widened either way.
+    """
+    if new.probability_score >= held.probability_score:
+        held.probability_score = new.probability_score
+        held.confidence_score = new.confidence_score
+        held.severity = new.severity
+        held.primary_evidence = new.primary_evidence
+        held.supporting_evidence = new.supporting_evidence
+        held.cross_account_patterns = new.cross_account_patterns
+        held.related_typologies = new.related_typologies
+        held.regulatory_rationale = new.regulatory_rationale
+        held.stor_eligible = held.stor_eligible or new.stor_eligible
+        held.explanation_summary = new.explanation_summary
+        held.key_driver_nodes = new.key_driver_nodes
+        held.evidence_trail = new.evidence_trail
+
+    held.involved_accounts = _union(held.involved_accounts, new.involved_accounts)
+    held.involved_desks = _union(held.involved_desks, new.involved_desks)
+    held.account_count = len(held.involved_accounts)
+    held.desk_count = len(held.involved_desks)
+    held.escalation_factors = _union(held.escalation_factors, new.escalation_factors)
+
+    held.activity_period_start = _earliest(held.activity_period_start, new.activity_period_start)
+    held.activity_period_end = _latest(held.activity_period_end, new.activity_period_end)
+    held.occurrence_count += new.occurrence_count
+    held.last_detection_timestamp = new.detection_timestamp
+
+
+def _union(first: List, second: List) -> List:
+    return list(dict.fromkeys(first + second))
+
+
+def _earliest(first: Optional[datetime], second: Optional[datetime]) -> Optional[datetime]:
+    if first is None or second is None:
+        return first or second
+    return min(first, second)
+
+
+def _latest(first: Optional[datetime], second: Optional[datetime]) -> Optional[datetime]:
+    if first is None or second is None:
+        return first or second
+    return max(first, second)
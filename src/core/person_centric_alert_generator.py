@@ -28,10 +28,12 @@ from src.models.person_centric import (
     EvidenceType
 )
 from src.models.trading_data import RawTradeData
+from src.services.alert_repository import AlertRepository
 from .entity_resolution import EntityResolutionService
 from .person_evidence_aggregator import PersonEvidenceAggregator
 from .person_centric_nodes import PersonRiskNode
 from .cross_typology_engine import CrossTypologyEngine
+from .person_alert_buffer import PersonAlertBuffer
 from .regulatory_explainability import RegulatoryExplainabilityEngine
 
 logger = logging.getLogger(__name__)
@@ -47,7 +49,8 @@ class PersonCentricAlertGenerator:
         entity_resolution_service: EntityResolutionService,
         evidence_aggregator: PersonEvidenceAggregator,
         cross_typology_engine: CrossTypologyEngine,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        alert_repository: Optional[AlertRepository] = None
     ):
         self.entity_resolution = entity_resolution_service
         self.evidence_aggregator = evidence_aggregator
@@ -78,9 +81,17 @@ class PersonCentricAlertGenerator:
             "systematic_pattern": 0.25
         }
         
-        # Alert history for tracking
-        self.alert_history: List[PersonCentricAlert] = []
+        # Alert history for tracking; repeated alerts for the same person,
+        # typology and activity window are merged rather than appended
+        buffer_config = self.config.get("alert_buffer", {})
+        self.alert_history = PersonAlertBuffer(
+            max_alerts=buffer_config.get("max_alerts", 10000),
+            window_hours=buffer_config.get("dedup_window_hours", 24)
+        )
         self.person_alert_counts: Dict[str, int] = {}
+        
+        # Durable alert records shared across workers (optional)
+        self.alert_repository = alert_repository
     
     def generate_person_alert(
         self,
@@ -107,6 +118,29 @@ class PersonCentricAlertGenerator:
         """
         logger.info(f"Generating person alert for {person_id}, typology {risk_typology.value}")
         
+        alert = self.build_person_alert(
+            person_id, risk_typology, person_profile, trade_data, communication_data, news_events
+        )
+        if alert is None:
+            return None
+        return self.record_person_alert(alert)
+    
+    def build_person_alert(
+        self,
+        person_id: str,
+        risk_typology: RiskTypology,
+        person_profile: PersonRiskProfile,
+        trade_data: List[RawTradeData],
+        communication_data: Optional[List[Dict[str, Any]]] = None,
+        news_events: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[PersonCentricAlert]:
+        """
+        Assess a person for a risk typology and build the alert, without
+        recording it in the alert history
+        
+        Returns:
+            PersonCentricAlert if alert criteria are met, None otherwise
+        """
         try:
             # Calculate base risk probability
             base_risk_prob = self._calculate_base_risk_probability(
@@ -165,6 +199,8 @@ class PersonCentricAlertGenerator:
                 cross_account_patterns, escalation_factors
             )
             
+            activity_start, activity_end = self._get_activity_period(trade_data)
+            
             # Create the alert
             alert = PersonCentricAlert(
                 alert_id=f"person_alert_{uuid4().hex[:8]}",
@@ -178,6 +214,8 @@ class PersonCentricAlertGenerator:
                 involved_desks=list(person_profile.linked_desks),
                 account_count=len(person_profile.linked_accounts),
                 desk_count=len(person_profile.linked_desks),
+                activity_period_start=activity_start,
+                activity_period_end=activity_end,
                 primary_evidence=primary_evidence,
                 supporting_evidence=supporting_evidence,
                 cross_account_patterns=cross_account_patterns,
@@ -190,11 +228,34 @@ class PersonCentricAlertGenerator:
                 evidence_trail=self._create_evidence_trail(person_id, primary_evidence, supporting_evidence)
             )
             
-            # Store alert in history
-            self.alert_history.append(alert)
+            return alert
+            
+        except Exception as e:
+            logger.error(f"Error generating person alert for {person_id}: {str(e)}")
+            return None
+    
+    def record_person_alert(self, alert: PersonCentricAlert) -> Optional[PersonCentricAlert]:
+        """
+        Store a built alert in history, merging repeats of an alert already raised
+        
+        Returns:
+            The alert held in history (the earlier alert if merged), or None
+            if it could not be stored
+        """
+        person_id = alert.person_id
+        try:
+            alert, merged = self.alert_history.add(alert)
+            if merged:
+                if self.alert_repository is not None:
+                    self.alert_repository.replace(alert.to_dict())
+                logger.info(f"Merged repeat detection into person alert {alert.alert_id} for {person_id} ({alert.occurrence_count} occurrences)")
+                return alert
+            
             self.person_alert_counts[person_id] = self.person_alert_counts.get(person_id, 0) + 1
+            if self.alert_repository is not None:
+                self.alert_repository.append(alert.to_dict())
             
-            logger.info(f"Generated person alert {alert.alert_id} for {person_id}: {severity.value} severity, {final_probability:.3f} probability")
+            logger.info(f"Generated person alert {alert.alert_id} for {person_id}: {alert.severity.value} severity, {alert.probability_score:.3f} probability")
             return alert
             
         except Exception as e:
@@ -372,7 +433,7 @@ class PersonCentricAlertGenerator:
         communication_data: List[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Group communications by channel for the person"""
-        person_identity = self.entity_resolution.get_all_persons().get(person_id)
+        person_identity = self.entity_resolution.get_person(person_id)
         if not person_identity:
             return {}
         
@@ -915,9 +976,34 @@ class PersonCentricAlertGenerator:
         time_span = (timestamps[-1] - timestamps[0]).total_seconds() / 3600  # Convert to hours
         return time_span
     
+    def _get_activity_period(
+        self, trade_data: List[RawTradeData]
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Get the first and last trade execution times (UTC)"""
+        
+        timestamps = []
+        for trade in trade_data:
+            try:
+                dt = datetime.fromisoformat(trade.execution_timestamp.replace('Z', '+00:00'))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            timestamps.append(dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc))
+        
+        if not timestamps:
+            return None, None
+        return min(timestamps), max(timestamps)
+    
     def get_person_alert_history(self, person_id: str) -> List[PersonCentricAlert]:
         """Get alert history for a specific person"""
-        return [alert for alert in self.alert_history if alert.person_id == person_id]
+        return self.alert_history.for_person(person_id)
+    
+    def get_person_alert_records(self, person_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get a person's alerts as dictionaries, most recent first, from the repository when configured"""
+        if self.alert_repository is not None:
+            return self.alert_repository.query(trader_id=person_id, limit=limit)
+        alerts = self.get_person_alert_history(person_id)
+        alerts.sort(key=lambda alert: alert.detection_timestamp, reverse=True)
+        return [alert.to_dict() for alert in alerts[:limit]]
     
     def get_alert_statistics(self) -> Dict[str, Any]:
         """Get overall alert statistics"""
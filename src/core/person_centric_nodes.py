@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 import numpy as np
 
 from src.core.node_library import BayesianNode, EvidenceNode, RiskFactorNode, OutcomeNode
+from src.core.temporal_index import EpochArrays, synchronized_pair_counts
 from src.models.person_centric import RiskTypology, PersonRiskProfile, EvidenceType
 from src.models.trading_data import RawTradeData
 
@@ -245,32 +246,40 @@ class PersonTradingPatternNode(PersonEvidenceNode):
         accounts = list(trades_by_account.keys())
         correlations = {}
         
+        # Trade pairs within 5 minutes, for every account pair in one sweep
+        sync_counts = synchronized_pair_counts({
+            account: EpochArrays.from_trades(trades) for account, trades in trades_by_account.items()
+        })
+        instruments = {
+            account: set(t.symbol for t in trades) for account, trades in trades_by_account.items()
+        }
+        
         for i, account1 in enumerate(accounts):
             for account2 in accounts[i+1:]:
-                correlation = self._calculate_account_correlation(
-                    trades_by_account[account1], 
-                    trades_by_account[account2]
+                correlations[f"{account1}_{account2}"] = self._calculate_account_correlation(
+                    len(trades_by_account[account1]) * len(trades_by_account[account2]),
+                    sync_counts.get((account1, account2), 0),
+                    instruments[account1],
+                    instruments[account2]
                 )
-                correlations[f"{account1}_{account2}"] = correlation
                 
         self.cross_account_patterns = correlations
     
     def _calculate_account_correlation(
         self, 
-        trades1: List[RawTradeData], 
-        trades2: List[RawTradeData]
+        total_comparisons: int,
+        synchronized_count: int,
+        instruments1: Set[str],
+        instruments2: Set[str]
     ) -> float:
         """Calculate correlation between two accounts"""
-        if not trades1 or not trades2:
+        if not total_comparisons:
             return 0.0
             
         # Timing correlation
-        timing_corr = self._calculate_timing_correlation(trades1, trades2)
+        timing_corr = synchronized_count / total_comparisons
         
         # Instrument correlation
-        instruments1 = set(t.symbol for t in trades1)
-        instruments2 = set(t.symbol for t in trades2)
-        
         if not instruments1 or not instruments2:
             instrument_corr = 0.0
         else:
@@ -279,36 +288,6 @@ class PersonTradingPatternNode(PersonEvidenceNode):
             instrument_corr = len(intersection) / len(union)
             
         return (timing_corr + instrument_corr) / 2
-    
-    def _calculate_timing_correlation(
-        self, 
-        trades1: List[RawTradeData], 
-        trades2: List[RawTradeData]
-    ) -> float:
-        """Calculate timing correlation between accounts"""
-        if not trades1 or not trades2:
-            return 0.0
-            
-        # Count trades within 5-minute windows
-        from datetime import datetime
-        
-        synchronized_count = 0
-        total_comparisons = 0
-        
-        for trade1 in trades1:
-            for trade2 in trades2:
-                total_comparisons += 1
-                try:
-                    dt1 = datetime.fromisoformat(trade1.execution_timestamp.replace('Z', '+00:00'))
-                    dt2 = datetime.fromisoformat(trade2.execution_timestamp.replace('Z', '+00:00'))
-                    
-                    time_diff = abs((dt1 - dt2).total_seconds())
-                    if time_diff <= 300:  # Within 5 minutes
-                        synchronized_count += 1
-                except:
-                    continue
-                    
-        return synchronized_count / total_comparisons if total_comparisons > 0 else 0.0
 
 
 class PersonCommunicationNode(PersonEvidenceNode):
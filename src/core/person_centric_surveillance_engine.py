@@ -13,11 +13,16 @@ Features:
 - Comprehensive logging and error handling
 """
 
+import itertools
 import json
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
 
 from src.models.person_centric import (
     PersonCentricAlert,
@@ -26,14 +31,158 @@ from src.models.person_centric import (
     AlertSeverity
 )
 from src.models.trading_data import RawTradeData
+from src.services.alert_repository import PERSON_ALERT_COLUMNS, AlertRepository
 
 from .entity_resolution import EntityResolutionService
+from .person_activity_tracker import PersonActivityTracker
 from .person_evidence_aggregator import PersonEvidenceAggregator
 from .cross_typology_engine import CrossTypologyEngine
 from .person_centric_alert_generator import PersonCentricAlertGenerator
 
 logger = logging.getLogger(__name__)
 
+WORKER_POOLS = ("thread", "process")
+
+# Relative alert database paths are resolved against the project root, not
+# the working directory of whichever process starts the engine
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class PersonTask:
+    """One person's records and carried-over state, sent to a worker"""
+    person_id: str
+    trades: List[RawTradeData]
+    communications: List[Dict[str, Any]]
+    profile: Optional[PersonRiskProfile] = None
+    risk_nodes: Optional[Dict[RiskTypology, Any]] = None
+    active_signals: Optional[List[Any]] = None
+
+
+@dataclass
+class PersonEvaluation:
+    """Outcome of evaluating one person, with the state to carry forward"""
+    person_id: str
+    profile: Optional[PersonRiskProfile] = None
+    signals_generated: int = 0
+    cross_typology_summary: Dict[str, Any] = field(default_factory=dict)
+    alerts: List[PersonCentricAlert] = field(default_factory=list)
+    risk_nodes: Optional[Dict[RiskTypology, Any]] = None
+    active_signals: Optional[List[Any]] = None
+    error: Optional[str] = None
+
+
+class PersonEvaluator:
+    """
+    Per-worker components running evidence aggregation, cross-typology
+    analysis and alert building for one person at a time
+    
+    The identity graph is shared read-only. Per-person state arrives with
+    each task and is handed back with the evaluation, so the worker holds
+    nothing between tasks; alerts are built here but recorded by the engine.
+    """
+    
+    def __init__(
+        self,
+        entity_resolution: EntityResolutionService,
+        typology_correlations: Optional[Dict[Tuple[RiskTypology, RiskTypology], float]] = None,
+        news_events: Optional[List[Dict[str, Any]]] = None,
+        typologies: Optional[List[RiskTypology]] = None,
+        evidence_window_hours: int = 24
+    ):
+        self.evidence_aggregator = PersonEvidenceAggregator(entity_resolution)
+        self.cross_typology_engine = CrossTypologyEngine()
+        if typology_correlations:
+            self.cross_typology_engine.typology_correlations = dict(typology_correlations)
+        self.alert_generator = PersonCentricAlertGenerator(
+            entity_resolution, self.evidence_aggregator, self.cross_typology_engine
+        )
+        self.news_events = news_events
+        self.typologies = typologies or list(RiskTypology)
+        self.evidence_window_hours = evidence_window_hours
+    
+    def evaluate(self, task: PersonTask) -> PersonEvaluation:
+        """Evaluate one person, isolating any failure to that person"""
+        person_id = task.person_id
+        aggregator = self.evidence_aggregator
+        cross_typology = self.cross_typology_engine
+        
+        if task.profile is not None:
+            aggregator.risk_profiles[person_id] = task.profile
+        if task.risk_nodes is not None:
+            cross_typology.person_risk_nodes[person_id] = task.risk_nodes
+        if task.active_signals is not None:
+            cross_typology.active_signals[person_id] = task.active_signals
+        
+        try:
+            profile = aggregator.aggregate_person_evidence(
+                person_id, task.trades, task.communications,
+                time_window_hours=self.evidence_window_hours
+            )
+            signals = cross_typology.analyze_cross_typology_signals(person_id)
+            summary = cross_typology.get_person_cross_typology_summary(person_id)
+            cross_typology.cleanup_expired_signals([person_id])
+            
+            alerts = []
+            for typology in self.typologies:
+                alert = self.alert_generator.build_person_alert(
+                    person_id=person_id,
+                    risk_typology=typology,
+                    person_profile=profile,
+                    trade_data=task.trades,
+                    communication_data=task.communications,
+                    news_events=self.news_events
+                )
+                if alert:
+                    alerts.append(alert)
+            
+            return PersonEvaluation(
+                person_id=person_id,
+                profile=profile,
+                signals_generated=len(signals),
+                cross_typology_summary=summary,
+                alerts=alerts,
+                risk_nodes=cross_typology.person_risk_nodes.get(person_id),
+                active_signals=cross_typology.active_signals.get(person_id)
+            )
+        except Exception as e:
+            logger.error(f"Error evaluating person {person_id}: {str(e)}")
+            return PersonEvaluation(person_id=person_id, error=str(e))
+        finally:
+            aggregator.risk_profiles.pop(person_id, None)
+            cross_typology.person_risk_nodes.pop(person_id, None)
+            cross_typology.active_signals.pop(person_id, None)
+
+
+@dataclass
+class EvaluationContext:
+    """Inputs shared by every person of one run, sent along with each batch of tasks"""
+    run_id: str
+    entity_resolution: EntityResolutionService
+    typology_correlations: Optional[Dict[Tuple[RiskTypology, RiskTypology], float]] = None
+    news_events: Optional[List[Dict[str, Any]]] = None
+    typologies: Optional[List[RiskTypology]] = None
+    evidence_window_hours: int = 24
+
+
+_worker_state = threading.local()
+
+
+def _evaluate_person_batch(context: EvaluationContext, tasks: List[PersonTask]) -> List[PersonEvaluation]:
+    """
+    Pool task evaluating a batch of persons
+    
+    Workers outlive runs, so each builds its evaluator on the first batch
+    of a run and reuses it for that run's later batches.
+    """
+    if getattr(_worker_state, "run_id", None) != context.run_id:
+        _worker_state.evaluator = PersonEvaluator(
+            context.entity_resolution, context.typology_correlations,
+            context.news_events, context.typologies, context.evidence_window_hours
+        )
+        _worker_state.run_id = context.run_id
+    return [_worker_state.evaluator.evaluate(task) for task in tasks]
+
 
 class PersonCentricSurveillanceEngine:
     """
@@ -54,13 +203,21 @@ class PersonCentricSurveillanceEngine:
         self.config = self._load_configuration(config_path)
         
         # Initialize core services
-        self.entity_resolution = EntityResolutionService()
+        self.entity_resolution = EntityResolutionService(
+            self.config.get("person_centric_surveillance", {}).get("entity_resolution", {})
+        )
         self.evidence_aggregator = PersonEvidenceAggregator(self.entity_resolution)
         self.cross_typology_engine = CrossTypologyEngine()
+        alert_db_path = self.config.get("person_centric_surveillance", {}).get("alert_db_path")
+        if alert_db_path and alert_db_path != ":memory:":
+            alert_db_path = str(PROJECT_ROOT / alert_db_path)
         self.alert_generator = PersonCentricAlertGenerator(
             self.entity_resolution,
             self.evidence_aggregator,
-            self.cross_typology_engine
+            self.cross_typology_engine,
+            alert_repository=AlertRepository(
+                alert_db_path, table="person_alerts", columns=PERSON_ALERT_COLUMNS
+            ) if alert_db_path else None
         )
         
         # Performance tracking
@@ -74,9 +231,36 @@ class PersonCentricSurveillanceEngine:
         
         # Processing state
         self.is_enabled = self.config.get("person_centric_surveillance", {}).get("enabled", True)
-        self.processing_batch_size = self.config.get("person_centric_surveillance", {}).get(
+        batch_config = self.config.get("person_centric_surveillance", {}).get(
+            "performance_optimization", {}
+        ).get("batch_processing", {})
+        self.processing_batch_size = batch_config.get("max_persons_per_batch", 100)
+        
+        # Per-person evaluation fan-out is opt-in; one worker keeps everything
+        # in-process. Evaluation is CPU-bound Python, so threads are limited
+        # by the GIL and a "process" pool is the option that can use more
+        # cores. The pool is started on first use and kept across runs, and
+        # only runs with enough persons to repay the hand-off are fanned out.
+        self.max_workers = 1
+        if batch_config.get("parallel_processing_enabled", False):
+            self.max_workers = max(1, int(batch_config.get("max_worker_threads", 1)))
+        self.worker_pool = batch_config.get("worker_pool", "thread")
+        if self.worker_pool not in WORKER_POOLS:
+            logger.warning(f"Unknown worker pool '{self.worker_pool}', using threads")
+            self.worker_pool = "thread"
+        self.parallel_min_persons = max(2, int(batch_config.get("parallel_min_persons", 50)))
+        self._executor = None
+        
+        # Evidence lookback window, and incremental re-runs over it
+        self.evidence_window_hours = self.config.get("person_centric_surveillance", {}).get(
+            "evidence_aggregation", {}
+        ).get("time_windows", {}).get("default_hours", 24)
+        incremental_config = self.config.get("person_centric_surveillance", {}).get(
             "performance_optimization", {}
-        ).get("batch_processing", {}).get("max_persons_per_batch", 100)
+        ).get("incremental_processing", {})
+        self.activity_tracker = PersonActivityTracker(
+            self.evidence_window_hours
+        ) if incremental_config.get("enabled", False) else None
         
         logger.info("Person-Centric Surveillance Engine initialized")
     
@@ -124,6 +308,11 @@ class PersonCentricSurveillanceEngine:
         """
         Process surveillance data for person-centric analysis
         
+        With incremental processing enabled (opt-in), only persons whose
+        in-window records changed since their last evaluation are evaluated:
+        repeating a call with identical input evaluates nobody and returns no
+        alerts, and alerts already raised stay in the alert history.
+        
         Args:
             trade_data: Trading data from all accounts
             communication_data: Communication data from all channels
@@ -146,23 +335,50 @@ class PersonCentricSurveillanceEngine:
             logger.info("Step 1: Performing identity resolution")
             person_identities = self._perform_identity_resolution(trade_data, communication_data, hr_data)
             
-            # Step 2: Evidence Aggregation
-            logger.info("Step 2: Aggregating evidence across persons")
-            person_profiles = self._aggregate_person_evidence(
-                person_identities, trade_data, communication_data
+            # Partition records by resolved person once for all later steps
+            person_trades = self._group_by_person(trade_data, lambda trade: trade.person_id)
+            person_comms = self._group_by_person(
+                communication_data or [], lambda comm: comm.get("person_id")
             )
             
-            # Step 3: Cross-Typology Analysis
-            logger.info("Step 3: Performing cross-typology analysis")
-            cross_typology_results = self._perform_cross_typology_analysis(
-                person_profiles, target_typologies or list(RiskTypology)
-            )
+            if self.activity_tracker is not None:
+                # Only persons whose in-window activity changed are re-evaluated
+                person_ids, person_trades, person_comms = self._select_changed_persons(
+                    person_trades, person_comms, refresh_all_identities=bool(hr_data)
+                )
+            else:
+                person_ids = list(dict.fromkeys(person_identities.values()))
             
-            # Step 4: Alert Generation
-            logger.info("Step 4: Generating person-centric alerts")
-            alerts = self._generate_person_alerts(
-                person_profiles, trade_data, communication_data, news_events, target_typologies
-            )
+            failed_persons = []
+            if self.max_workers > 1 and len(person_ids) >= self.parallel_min_persons:
+                # Steps 2-4 per person, fanned out over a worker pool
+                logger.info(f"Steps 2-4: Evaluating {len(person_ids)} persons on {self.max_workers} {self.worker_pool} workers")
+                person_profiles, cross_typology_results, alerts, failed_persons = self._evaluate_persons_parallel(
+                    person_ids, person_trades, person_comms, news_events, target_typologies
+                )
+            else:
+                # Step 2: Evidence Aggregation
+                logger.info("Step 2: Aggregating evidence across persons")
+                person_profiles = self._aggregate_person_evidence(
+                    person_ids, person_trades, person_comms, failed_persons
+                )
+                
+                # Step 3: Cross-Typology Analysis
+                logger.info("Step 3: Performing cross-typology analysis")
+                cross_typology_results = self._perform_cross_typology_analysis(
+                    person_profiles, target_typologies or list(RiskTypology), failed_persons
+                )
+                
+                # Step 4: Alert Generation
+                logger.info("Step 4: Generating person-centric alerts")
+                alerts = self._generate_person_alerts(
+                    person_profiles, person_trades, person_comms, news_events, target_typologies,
+                    failed_persons
+                )
+            
+            if self.activity_tracker is not None:
+                for person_id in person_profiles:
+                    self.activity_tracker.mark_evaluated(person_id)
             
             # Step 5: Performance Tracking
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -173,9 +389,11 @@ class PersonCentricSurveillanceEngine:
                 "status": "completed",
                 "processing_time_seconds": processing_time,
                 "persons_analyzed": len(person_identities),
+                "persons_evaluated": len(person_profiles),
                 "alerts_generated": len(alerts),
                 "alerts": [alert.to_dict() for alert in alerts],
                 "cross_typology_summary": cross_typology_results,
+                "failed_persons": failed_persons,
                 "performance_metrics": self.performance_metrics.copy(),
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
@@ -207,24 +425,30 @@ class PersonCentricSurveillanceEngine:
         if hr_data:
             self.entity_resolution.add_hr_data(hr_data)
         
-        # Resolve person IDs for trading data
+        # Resolve person IDs for trading data, from the first trade of each account
         account_to_person = {}
-        
+        first_trades = {}
         for trade in trade_data:
-            if trade.trader_id not in account_to_person:
-                person_id, confidence = self.entity_resolution.resolve_trading_data_person_id(
-                    trade.__dict__
-                )
-                account_to_person[trade.trader_id] = person_id
-                
-                # Update trade data with person information
-                trade.person_id = person_id
-                trade.person_confidence = confidence
+            first_trades.setdefault(trade.trader_id, trade)
+        
+        resolution = self.entity_resolution.resolve_trading_data_batch(
+            [trade.to_dict() for trade in first_trades.values()]
+        )
+        for trade, person_id, confidence in zip(
+            first_trades.values(), resolution.person_ids, resolution.confidences
+        ):
+            account_to_person[trade.trader_id] = person_id
+            
+            # Update trade data with person information
+            trade.person_id = person_id
+            trade.person_confidence = confidence
         
         # Resolve person IDs for communication data
         if communication_data:
-            for comm in communication_data:
-                person_id, confidence = self.entity_resolution.resolve_communication_person_id(comm)
+            resolution = self.entity_resolution.resolve_communication_batch(communication_data)
+            for comm, person_id, confidence in zip(
+                communication_data, resolution.person_ids, resolution.confidences
+            ):
                 comm["person_id"] = person_id
                 comm["person_confidence"] = confidence
         
@@ -234,30 +458,107 @@ class PersonCentricSurveillanceEngine:
         
         return account_to_person
     
+    @staticmethod
+    def _group_by_person(
+        records: List[Any],
+        person_of: Callable[[Any], Optional[str]]
+    ) -> Dict[Optional[str], List[Any]]:
+        """Partition records by resolved person in one pass, keeping record order"""
+        grouped: Dict[Optional[str], List[Any]] = {}
+        for record in records:
+            person_id = person_of(record)
+            group = grouped.get(person_id)
+            if group is None:
+                grouped[person_id] = [record]
+            else:
+                group.append(record)
+        return grouped
+    
+    def _select_changed_persons(
+        self,
+        person_trades: Dict[Optional[str], List[RawTradeData]],
+        person_comms: Dict[Optional[str], List[Dict[str, Any]]],
+        refresh_all_identities: bool = False
+    ) -> Tuple[List[str], Dict[str, List[RawTradeData]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        Fold this run's records into the activity tracker and pick the persons
+        to re-evaluate
+        
+        A person is re-evaluated when records were added to or aged out of
+        their lookback window, or their identity changed, since their last
+        evaluation. They are evaluated over everything still in their window.
+        
+        Returns:
+            Changed person ids, with each one's in-window trades and communications
+        """
+        tracker = self.activity_tracker
+        now = datetime.now(timezone.utc)
+        expired = tracker.expire(now)
+        
+        for person_id, trades in person_trades.items():
+            if person_id is not None:
+                tracker.add_trades(person_id, trades, now)
+        for person_id, comms in person_comms.items():
+            if person_id is not None:
+                tracker.add_communications(person_id, comms, now)
+        
+        # HR feeds can change identities of persons with no new activity
+        persons = self.entity_resolution.identity_graph.persons
+        touched = list(tracker.records) if refresh_all_identities else [
+            person_id for person_id in itertools.chain(person_trades, person_comms) if person_id is not None
+        ]
+        for person_id in touched:
+            tracker.update_identity(person_id, persons.get(person_id))
+        
+        person_ids = tracker.dirty_persons()
+        logger.info(f"Incremental processing: {len(person_ids)} of {len(tracker.records)} tracked persons changed, {expired} records aged out")
+        return (
+            person_ids,
+            {person_id: tracker.get_trades(person_id) for person_id in person_ids},
+            {person_id: tracker.get_communications(person_id) for person_id in person_ids}
+        )
+    
+    def _record_person_failure(
+        self,
+        person_id: str,
+        error: Exception,
+        failed_persons: Optional[List[Dict[str, str]]]
+    ):
+        """Report a person whose evaluation raised; the run carries on without them"""
+        logger.error(f"Person evaluation failed for {person_id}: {str(error)}")
+        if failed_persons is None:
+            raise error
+        failed_persons.append({"person_id": person_id, "error": str(error)})
+    
     def _aggregate_person_evidence(
         self,
-        person_identities: Dict[str, str],
-        trade_data: List[RawTradeData],
-        communication_data: Optional[List[Dict[str, Any]]]
+        person_ids: List[str],
+        person_trades: Dict[Optional[str], List[RawTradeData]],
+        person_comms: Dict[Optional[str], List[Dict[str, Any]]],
+        failed_persons: Optional[List[Dict[str, str]]] = None
     ) -> Dict[str, PersonRiskProfile]:
-        """Aggregate evidence for each person"""
+        """
+        Aggregate evidence for each person from their pre-grouped records
+        
+        With a failed_persons list, a person whose aggregation raises is
+        reported there and left out; otherwise the error propagates.
+        """
         
         person_profiles = {}
-        unique_persons = set(person_identities.values())
         
-        for person_id in unique_persons:
-            # Get person's trade data
-            person_trades = [trade for trade in trade_data if trade.person_id == person_id]
-            
-            # Get person's communication data
-            person_comms = []
-            if communication_data:
-                person_comms = [comm for comm in communication_data if comm.get("person_id") == person_id]
-            
-            # Aggregate evidence
-            person_profile = self.evidence_aggregator.aggregate_person_evidence(
-                person_id, person_trades, person_comms
-            )
+        for person_id in person_ids:
+            had_profile = person_id in self.evidence_aggregator.risk_profiles
+            try:
+                # Aggregate evidence
+                person_profile = self.evidence_aggregator.aggregate_person_evidence(
+                    person_id, person_trades.get(person_id, []), person_comms.get(person_id, []),
+                    time_window_hours=self.evidence_window_hours
+                )
+            except Exception as e:
+                if not had_profile:
+                    self.evidence_aggregator.risk_profiles.pop(person_id, None)
+                self._record_person_failure(person_id, e, failed_persons)
+                continue
             
             person_profiles[person_id] = person_profile
         
@@ -267,20 +568,32 @@ class PersonCentricSurveillanceEngine:
     def _perform_cross_typology_analysis(
         self,
         person_profiles: Dict[str, PersonRiskProfile],
-        target_typologies: List[RiskTypology]
+        target_typologies: List[RiskTypology],
+        failed_persons: Optional[List[Dict[str, str]]] = None
     ) -> Dict[str, Any]:
-        """Perform cross-typology analysis for all persons"""
+        """
+        Perform cross-typology analysis for all persons
+        
+        With a failed_persons list, a person whose analysis raises is reported
+        there and dropped from person_profiles, so no alerts are raised for them.
+        """
         
         cross_typology_results = {}
         total_signals = 0
         
-        for person_id in person_profiles.keys():
-            # Analyze cross-typology signals for this person
-            signals = self.cross_typology_engine.analyze_cross_typology_signals(person_id)
-            total_signals += len(signals)
+        for person_id in list(person_profiles.keys()):
+            try:
+                # Analyze cross-typology signals for this person
+                signals = self.cross_typology_engine.analyze_cross_typology_signals(person_id)
+                
+                # Get comprehensive summary
+                summary = self.cross_typology_engine.get_person_cross_typology_summary(person_id)
+            except Exception as e:
+                del person_profiles[person_id]
+                self._record_person_failure(person_id, e, failed_persons)
+                continue
             
-            # Get comprehensive summary
-            summary = self.cross_typology_engine.get_person_cross_typology_summary(person_id)
+            total_signals += len(signals)
             cross_typology_results[person_id] = summary
         
         # Cleanup expired signals
@@ -297,34 +610,44 @@ class PersonCentricSurveillanceEngine:
     def _generate_person_alerts(
         self,
         person_profiles: Dict[str, PersonRiskProfile],
-        trade_data: List[RawTradeData],
-        communication_data: Optional[List[Dict[str, Any]]],
+        person_trades: Dict[Optional[str], List[RawTradeData]],
+        person_comms: Dict[Optional[str], List[Dict[str, Any]]],
         news_events: Optional[List[Dict[str, Any]]],
-        target_typologies: Optional[List[RiskTypology]]
+        target_typologies: Optional[List[RiskTypology]],
+        failed_persons: Optional[List[Dict[str, str]]] = None
     ) -> List[PersonCentricAlert]:
-        """Generate person-centric alerts"""
+        """
+        Generate person-centric alerts from each person's pre-grouped records
+        
+        A person's alerts are all built before any is recorded, so with a
+        failed_persons list a person whose alerts raise is reported there and
+        leaves nothing in the alert history.
+        """
         
         all_alerts = []
         typologies_to_analyze = target_typologies or list(RiskTypology)
         
         for person_id, person_profile in person_profiles.items():
-            # Get person's data
-            person_trades = [trade for trade in trade_data if trade.person_id == person_id]
-            person_comms = []
-            if communication_data:
-                person_comms = [comm for comm in communication_data if comm.get("person_id") == person_id]
+            try:
+                # Build alerts for each typology
+                person_alerts = [
+                    self.alert_generator.build_person_alert(
+                        person_id=person_id,
+                        risk_typology=typology,
+                        person_profile=person_profile,
+                        trade_data=person_trades.get(person_id, []),
+                        communication_data=person_comms.get(person_id, []),
+                        news_events=news_events
+                    )
+                    for typology in typologies_to_analyze
+                ]
+            except Exception as e:
+                self._record_person_failure(person_id, e, failed_persons)
+                continue
             
-            # Generate alerts for each typology
-            for typology in typologies_to_analyze:
-                alert = self.alert_generator.generate_person_alert(
-                    person_id=person_id,
-                    risk_typology=typology,
-                    person_profile=person_profile,
-                    trade_data=person_trades,
-                    communication_data=person_comms,
-                    news_events=news_events
-                )
-                
+            for alert in person_alerts:
+                if alert:
+                    alert = self.alert_generator.record_person_alert(alert)
                 if alert:
                     all_alerts.append(alert)
         
@@ -334,6 +657,120 @@ class PersonCentricSurveillanceEngine:
         logger.info(f"Alert generation completed: {len(all_alerts)} alerts generated")
         return all_alerts
     
+    def _evaluate_persons_parallel(
+        self,
+        person_ids: List[str],
+        person_trades: Dict[Optional[str], List[RawTradeData]],
+        person_comms: Dict[Optional[str], List[Dict[str, Any]]],
+        news_events: Optional[List[Dict[str, Any]]],
+        target_typologies: Optional[List[RiskTypology]]
+    ) -> Tuple[Dict[str, PersonRiskProfile], Dict[str, Any], List[PersonCentricAlert], List[Dict[str, str]]]:
+        """
+        Run evidence aggregation, cross-typology analysis and alert building
+        per person on a worker pool
+        
+        Each worker evaluates batches of whole persons against its own
+        components and the run's identity graph (shared by thread workers, a
+        copy per batch for process workers). Results are merged back in
+        person order, so alert history and ordering match a sequential run; a
+        person whose evaluation fails is reported and skipped.
+        
+        Returns:
+            Person profiles, cross-typology results, alerts and failed persons
+        """
+        cross_typology = self.cross_typology_engine
+        tasks = [
+            PersonTask(
+                person_id=person_id,
+                trades=person_trades.get(person_id, []),
+                communications=person_comms.get(person_id, []),
+                profile=self.evidence_aggregator.risk_profiles.get(person_id),
+                risk_nodes=cross_typology.person_risk_nodes.get(person_id),
+                active_signals=cross_typology.active_signals.get(person_id)
+            )
+            for person_id in person_ids
+        ]
+        
+        context = EvaluationContext(
+            run_id=uuid4().hex,
+            entity_resolution=self.entity_resolution,
+            typology_correlations=cross_typology.typology_correlations,
+            news_events=news_events,
+            typologies=target_typologies,
+            evidence_window_hours=self.evidence_window_hours
+        )
+        # A couple of batches per worker balances load while sending the
+        # context to process workers only a few times per run
+        batch_count = min(len(tasks), self.max_workers * 2)
+        batches = [tasks[i::batch_count] for i in range(batch_count)]
+        executor = self._get_executor()
+        batch_results = list(executor.map(_evaluate_person_batch, [context] * batch_count, batches))
+        evaluation_by_person = {
+            evaluation.person_id: evaluation
+            for evaluations in batch_results for evaluation in evaluations
+        }
+        evaluations = [evaluation_by_person[person_id] for person_id in person_ids]
+        
+        person_profiles = {}
+        person_summaries = {}
+        alerts = []
+        failed_persons = []
+        total_signals = 0
+        for evaluation in evaluations:
+            person_id = evaluation.person_id
+            if evaluation.error is not None:
+                logger.error(f"Person evaluation failed for {person_id}: {evaluation.error}")
+                failed_persons.append({"person_id": person_id, "error": evaluation.error})
+                continue
+            
+            self.evidence_aggregator.risk_profiles[person_id] = evaluation.profile
+            for state, value in (
+                (cross_typology.person_risk_nodes, evaluation.risk_nodes),
+                (cross_typology.active_signals, evaluation.active_signals)
+            ):
+                if value is None:
+                    state.pop(person_id, None)
+                else:
+                    state[person_id] = value
+            
+            person_profiles[person_id] = evaluation.profile
+            person_summaries[person_id] = evaluation.cross_typology_summary
+            total_signals += evaluation.signals_generated
+            for alert in evaluation.alerts:
+                alert = self.alert_generator.record_person_alert(alert)
+                if alert:
+                    alerts.append(alert)
+        
+        # Workers decayed the signals of the persons they evaluated
+        evaluated = set(person_ids)
+        cross_typology.cleanup_expired_signals(
+            [person_id for person_id in cross_typology.active_signals if person_id not in evaluated]
+        )
+        
+        alerts.sort(key=lambda x: x.probability_score, reverse=True)
+        
+        logger.info(f"Parallel evaluation completed: {len(alerts)} alerts and {total_signals} signals across {len(person_profiles)} persons, {len(failed_persons)} failed")
+        
+        cross_typology_results = {
+            "total_signals_generated": total_signals,
+            "persons_analyzed": len(person_profiles),
+            "person_summaries": person_summaries
+        }
+        return person_profiles, cross_typology_results, alerts, failed_persons
+    
+    def _get_executor(self):
+        """The engine's worker pool, started on first use and kept across runs"""
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.worker_pool == "process" else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+    
+    def close(self):
+        """Stop the worker pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
     def _update_performance_metrics(self, persons_count: int, alerts_count: int, processing_time: float):
         """Update performance metrics"""
         self.performance_metrics["total_persons_processed"] += persons_count
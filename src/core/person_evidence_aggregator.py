@@ -12,10 +12,11 @@ Features:
 - Cross-typology evidence sharing
 """
 
+import itertools
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 from dataclasses import asdict
@@ -30,6 +31,15 @@ from src.models.person_centric import (
 )
 from src.models.trading_data import RawTradeData, TradeDirection
 from .entity_resolution import EntityResolutionService, PersonIdentity
+from .temporal_index import (
+    SYNC_WINDOW_SECONDS,
+    EpochArrays,
+    RecordTimeIndex,
+    pair_counts_within,
+    sorted_epoch_minutes,
+    synchronized_pair_counts,
+    synchronized_trade_pairs
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +68,18 @@ class PersonEvidenceAggregator:
             "medium": 0.6,
             "low": 0.4
         }
+        
+        # Synchronized activity: trades in one instrument and direction from
+        # different accounts within the window, hashed into time buckets
+        self.synchronization = {
+            "window_seconds": SYNC_WINDOW_SECONDS,
+            "bucket_seconds": SYNC_WINDOW_SECONDS,
+            "min_synchronized_pairs": 2
+        }
+        
+        # Per (record kind, person): the source list an index was built from,
+        # its length then, and the person's records from it sorted by time
+        self._record_indexes: Dict[Tuple[str, str], Tuple[Sequence[Any], int, RecordTimeIndex]] = {}
     
     def aggregate_person_evidence(
         self, 
@@ -92,35 +114,40 @@ class PersonEvidenceAggregator:
         
         profile = self.risk_profiles[person_id]
         
-        # Aggregate trading patterns
-        trading_evidence = self._aggregate_trading_evidence(person_id, trade_data, time_window_hours)
-        
-        # Aggregate communication evidence
-        comm_evidence = self._aggregate_communication_evidence(
-            person_id, communication_data or [], time_window_hours
-        )
-        
-        # Aggregate timing evidence
-        timing_evidence = self._aggregate_timing_evidence(person_id, trade_data, time_window_hours)
-        
-        # Aggregate access/role evidence
-        access_evidence = self._aggregate_access_evidence(person_id, person_identity)
-        
-        # Update profile with aggregated evidence
-        profile.aggregated_evidence = {
-            "trading_patterns": trading_evidence,
-            "communications": comm_evidence,
-            "timing_patterns": timing_evidence,
-            "access_patterns": access_evidence
-        }
-        
-        # Calculate cross-account correlations
-        profile.cross_risk_correlations = self._calculate_cross_account_correlations(
-            person_id, trade_data
-        )
-        
-        # Update evidence sources
-        profile.evidence_sources = self._map_evidence_sources(person_id, trade_data, communication_data)
+        try:
+            # Aggregate trading patterns
+            trading_evidence = self._aggregate_trading_evidence(person_id, trade_data, time_window_hours)
+            
+            # Aggregate communication evidence
+            comm_evidence = self._aggregate_communication_evidence(
+                person_id, communication_data or [], time_window_hours
+            )
+            
+            # Aggregate timing evidence
+            timing_evidence = self._aggregate_timing_evidence(person_id, trade_data, time_window_hours)
+            
+            # Aggregate access/role evidence
+            access_evidence = self._aggregate_access_evidence(person_id, person_identity)
+            
+            # Update profile with aggregated evidence
+            profile.aggregated_evidence = {
+                "trading_patterns": trading_evidence,
+                "communications": comm_evidence,
+                "timing_patterns": timing_evidence,
+                "access_patterns": access_evidence
+            }
+            
+            # Calculate cross-account correlations
+            profile.cross_risk_correlations = self._calculate_cross_account_correlations(
+                person_id, trade_data
+            )
+            
+            # Update evidence sources
+            profile.evidence_sources = self._map_evidence_sources(person_id, trade_data, communication_data)
+        finally:
+            # The person's record indexes only serve this aggregation
+            self._record_indexes.pop(("trades", person_id), None)
+            self._record_indexes.pop(("communications", person_id), None)
         
         # Update temporal metadata
         profile.last_updated = datetime.now(timezone.utc)
@@ -130,8 +157,7 @@ class PersonEvidenceAggregator:
     
     def _get_person_identity(self, person_id: str) -> Optional[PersonIdentity]:
         """Get person identity from entity resolution service"""
-        all_persons = self.entity_resolution.get_all_persons()
-        return all_persons.get(person_id)
+        return self.entity_resolution.get_person(person_id)
     
     def _initialize_risk_profile(self, person_identity: PersonIdentity) -> PersonRiskProfile:
         """Initialize a new risk profile from person identity"""
@@ -275,66 +301,67 @@ class PersonEvidenceAggregator:
             "desk_sensitivity": access_analysis.get("desk_sensitivity", "low")
         }
     
+    def _person_record_index(
+        self,
+        kind: str,
+        person_id: str,
+        records: Sequence[Any],
+        belongs_to_person,
+        timestamp_of
+    ) -> RecordTimeIndex:
+        """Index of the person's records from the source list, built once per aggregation"""
+        
+        cached = self._record_indexes.get((kind, person_id))
+        if cached is not None and cached[0] is records and cached[1] == len(records):
+            return cached[2]
+        
+        index = RecordTimeIndex((record for record in records if belongs_to_person(record)), timestamp_of)
+        self._record_indexes[(kind, person_id)] = (records, len(records), index)
+        return index
+    
     def _filter_person_trades(
         self, 
         person_id: str, 
         trade_data: List[RawTradeData], 
         time_window_hours: int
-    ) -> List[RawTradeData]:
-        """Filter trades belonging to the person within time window"""
+    ) -> Sequence[RawTradeData]:
+        """Filter trades belonging to the person within time window, oldest first"""
         
         person_accounts = self.entity_resolution.identity_graph.get_person_accounts(person_id)
         if not person_accounts:
             return []
         
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
-        
-        person_trades = []
-        for trade in trade_data:
-            # Check if trade belongs to person's accounts
-            if trade.trader_id in person_accounts:
-                # Check time window
-                try:
-                    trade_time = datetime.fromisoformat(trade.execution_timestamp.replace('Z', '+00:00'))
-                    if trade_time >= cutoff_time:
-                        person_trades.append(trade)
-                except (ValueError, AttributeError):
-                    # Include trade if timestamp parsing fails
-                    person_trades.append(trade)
-        
-        return person_trades
+        index = self._person_record_index(
+            "trades", person_id, trade_data,
+            lambda trade: trade.trader_id in person_accounts,
+            lambda trade: trade.execution_timestamp
+        )
+        # Trades with unreadable timestamps sort last and stay in every window
+        return index.since(datetime.now(timezone.utc) - timedelta(hours=time_window_hours))
     
     def _filter_person_communications(
         self, 
         person_id: str, 
         communication_data: List[Dict[str, Any]], 
         time_window_hours: int
-    ) -> List[Dict[str, Any]]:
-        """Filter communications belonging to the person within time window"""
+    ) -> Sequence[Dict[str, Any]]:
+        """Filter communications belonging to the person within time window, oldest first"""
         
         person_identity = self._get_person_identity(person_id)
         if not person_identity:
             return []
         
-        person_identifiers = person_identity.get_all_identifiers()
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
-        
-        person_comms = []
-        for comm in communication_data:
-            # Check if communication involves person
-            if (comm.get("sender_email") in person_identity.linked_emails or
-                comm.get("sender_handle") in person_identity.linked_comm_handles or
-                comm.get("sender_id") in person_identity.linked_accounts):
-                
-                # Check time window
-                try:
-                    comm_time = datetime.fromisoformat(comm.get("timestamp", "").replace('Z', '+00:00'))
-                    if comm_time >= cutoff_time:
-                        person_comms.append(comm)
-                except (ValueError, AttributeError):
-                    person_comms.append(comm)
+        def involves_person(comm: Dict[str, Any]) -> bool:
+            return (comm.get("sender_email") in person_identity.linked_emails or
+                    comm.get("sender_handle") in person_identity.linked_comm_handles or
+                    comm.get("sender_id") in person_identity.linked_accounts)
         
-        return person_comms
+        index = self._person_record_index(
+            "communications", person_id, communication_data,
+            involves_person,
+            lambda comm: comm.get("timestamp")
+        )
+        return index.since(datetime.now(timezone.utc) - timedelta(hours=time_window_hours))
     
     def _analyze_cross_account_patterns(self, trades_by_account: Dict[str, List[RawTradeData]]) -> Dict[str, Any]:
         """Analyze patterns across multiple accounts"""
@@ -382,86 +409,68 @@ class PersonEvidenceAggregator:
         if len(trades_by_account) <= 1:
             return {}
         
+        # Pair statistics come from one pass over all accounts
+        timing_correlations = self._account_pair_timing_correlations(trades_by_account)
+        instruments = self._account_instruments(trades_by_account)
+        
         correlations = {}
         accounts = list(trades_by_account.keys())
         
         for i, account1 in enumerate(accounts):
             for account2 in accounts[i+1:]:
                 corr_key = f"{account1}_{account2}"
-                correlation = self._calculate_account_pair_correlation(
-                    trades_by_account[account1], 
-                    trades_by_account[account2]
-                )
-                correlations[corr_key] = correlation
+                instrument_correlation = self._instrument_overlap(instruments[account1], instruments[account2])
+                correlations[corr_key] = (timing_correlations[(account1, account2)] + instrument_correlation) / 2
         
         return correlations
     
-    def _calculate_account_pair_correlation(
+    def _account_pair_timing_correlations(
         self, 
-        trades1: List[RawTradeData], 
-        trades2: List[RawTradeData]
-    ) -> float:
-        """Calculate correlation between two accounts' trading patterns"""
-        
-        if not trades1 or not trades2:
-            return 0.0
-        
-        # Simple correlation based on timing and instruments
-        timing_correlation = self._calculate_timing_correlation_pair(trades1, trades2)
-        instrument_correlation = self._calculate_instrument_correlation_pair(trades1, trades2)
-        
-        return (timing_correlation + instrument_correlation) / 2
-    
-    def _calculate_timing_correlations(self, trades_by_account: Dict[str, List[RawTradeData]]) -> float:
-        """Calculate timing correlations across accounts"""
+        trades_by_account: Dict[str, List[RawTradeData]]
+    ) -> Dict[Tuple[str, str], float]:
+        """Share of each account pair's trade pairs executed within 5 minutes of each other"""
         
+        close_pairs = pair_counts_within(
+            {account: sorted_epoch_minutes(trades) for account, trades in trades_by_account.items()}, 5
+        )
         accounts = list(trades_by_account.keys())
-        if len(accounts) <= 1:
-            return 0.0
         
-        correlations = []
+        correlations = {}
         for i, account1 in enumerate(accounts):
             for account2 in accounts[i+1:]:
-                corr = self._calculate_timing_correlation_pair(
-                    trades_by_account[account1], 
-                    trades_by_account[account2]
+                total_comparisons = len(trades_by_account[account1]) * len(trades_by_account[account2])
+                correlations[(account1, account2)] = (
+                    close_pairs.get((account1, account2), 0) / total_comparisons if total_comparisons > 0 else 0.0
                 )
-                correlations.append(corr)
-        
-        return np.mean(correlations) if correlations else 0.0
+        return correlations
     
-    def _calculate_timing_correlation_pair(
-        self, 
-        trades1: List[RawTradeData], 
-        trades2: List[RawTradeData]
-    ) -> float:
-        """Calculate timing correlation between two trade lists"""
+    def _account_instruments(self, trades_by_account: Dict[str, List[RawTradeData]]) -> Dict[str, Set[str]]:
+        """Instruments traded by each account"""
+        return {
+            account: set(t.symbol for t in trades) for account, trades in trades_by_account.items()
+        }
+    
+    @staticmethod
+    def _instrument_overlap(instruments1: Set[str], instruments2: Set[str]) -> float:
+        """Jaccard overlap between two accounts' instruments"""
         
-        if not trades1 or not trades2:
+        if not instruments1 or not instruments2:
             return 0.0
         
-        # Convert timestamps to minutes since epoch for correlation
-        def to_minutes(timestamp_str):
-            try:
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                return dt.timestamp() / 60
-            except:
-                return 0
+        intersection = instruments1.intersection(instruments2)
+        union = instruments1.union(instruments2)
         
-        times1 = [to_minutes(t.execution_timestamp) for t in trades1]
-        times2 = [to_minutes(t.execution_timestamp) for t in trades2]
+        return len(intersection) / len(union) if union else 0.0
+    
+    def _calculate_timing_correlations(self, trades_by_account: Dict[str, List[RawTradeData]]) -> float:
+        """Calculate timing correlations across accounts"""
         
-        # Simple correlation: check for trades within same time windows
-        correlation_count = 0
-        total_comparisons = 0
+        if len(trades_by_account) <= 1:
+            return 0.0
         
-        for t1 in times1:
-            for t2 in times2:
-                total_comparisons += 1
-                if abs(t1 - t2) <= 5:  # Within 5 minutes
-                    correlation_count += 1
+        correlations = list(self._account_pair_timing_correlations(trades_by_account).values())
         
-        return correlation_count / total_comparisons if total_comparisons > 0 else 0.0
+        return np.mean(correlations) if correlations else 0.0
     
     def _calculate_instrument_correlations(self, trades_by_account: Dict[str, List[RawTradeData]]) -> float:
         """Calculate instrument correlations across accounts"""
@@ -470,74 +479,30 @@ class PersonEvidenceAggregator:
         if len(accounts) <= 1:
             return 0.0
         
+        instruments = self._account_instruments(trades_by_account)
         correlations = []
         for i, account1 in enumerate(accounts):
             for account2 in accounts[i+1:]:
-                corr = self._calculate_instrument_correlation_pair(
-                    trades_by_account[account1], 
-                    trades_by_account[account2]
-                )
-                correlations.append(corr)
+                correlations.append(self._instrument_overlap(instruments[account1], instruments[account2]))
         
         return np.mean(correlations) if correlations else 0.0
     
-    def _calculate_instrument_correlation_pair(
-        self, 
-        trades1: List[RawTradeData], 
-        trades2: List[RawTradeData]
-    ) -> float:
-        """Calculate instrument overlap between two trade lists"""
-        
-        if not trades1 or not trades2:
-            return 0.0
-        
-        instruments1 = set(t.symbol for t in trades1)
-        instruments2 = set(t.symbol for t in trades2)
-        
-        if not instruments1 or not instruments2:
-            return 0.0
-        
-        intersection = instruments1.intersection(instruments2)
-        union = instruments1.union(instruments2)
-        
-        return len(intersection) / len(union) if union else 0.0
-    
     def _detect_synchronized_activity(self, trades_by_account: Dict[str, List[RawTradeData]]) -> bool:
         """Detect synchronized trading activity across accounts"""
         
         if len(trades_by_account) <= 1:
             return False
         
-        # Check for trades in same instruments within short time windows
-        all_trades = []
-        for account_trades in trades_by_account.values():
-            all_trades.extend(account_trades)
-        
-        # Sort by timestamp
-        all_trades.sort(key=lambda t: t.execution_timestamp)
-        
-        # Look for clusters of trades from different accounts
-        synchronized_clusters = 0
-        time_window = 300  # 5 minutes in seconds
-        
-        for i, trade in enumerate(all_trades):
-            if i == 0:
-                continue
-                
-            try:
-                current_time = datetime.fromisoformat(trade.execution_timestamp.replace('Z', '+00:00'))
-                prev_time = datetime.fromisoformat(all_trades[i-1].execution_timestamp.replace('Z', '+00:00'))
-                
-                time_diff = (current_time - prev_time).total_seconds()
-                
-                if (time_diff <= time_window and 
-                    trade.trader_id != all_trades[i-1].trader_id and
-                    trade.symbol == all_trades[i-1].symbol):
-                    synchronized_clusters += 1
-            except:
-                continue
+        # Trades from different accounts in the same instrument and direction
+        # within the sync window, found by time-bucket hashing
+        required = self.synchronization["min_synchronized_pairs"]
+        synchronized_pairs = synchronized_trade_pairs(
+            itertools.chain.from_iterable(trades_by_account.values()),
+            window_seconds=self.synchronization["window_seconds"],
+            bucket_seconds=self.synchronization["bucket_seconds"]
+        )
         
-        return synchronized_clusters >= 2
+        return sum(1 for _ in itertools.islice(synchronized_pairs, required)) >= required
     
     def _calculate_trading_pattern_strength(
         self, 
@@ -824,16 +789,12 @@ class PersonEvidenceAggregator:
         if len(trades_by_account) <= 1:
             return {"synchronization_detected": False}
         
-        # Check for synchronized timing
-        synchronized_pairs = 0
-        total_pairs = 0
-        
-        accounts = list(trades_by_account.keys())
-        for i, account1 in enumerate(accounts):
-            for account2 in accounts[i+1:]:
-                total_pairs += 1
-                if self._check_account_timing_sync(trades_by_account[account1], trades_by_account[account2]):
-                    synchronized_pairs += 1
+        # Account pairs with at least two trade pairs within 5 minutes
+        sync_counts = synchronized_pair_counts({
+            account: EpochArrays.from_trades(trades) for account, trades in trades_by_account.items()
+        })
+        synchronized_pairs = sum(1 for count in sync_counts.values() if count >= 2)
+        total_pairs = len(trades_by_account) * (len(trades_by_account) - 1) // 2
         
         sync_ratio = synchronized_pairs / total_pairs if total_pairs > 0 else 0
         
@@ -843,33 +804,6 @@ class PersonEvidenceAggregator:
             "synchronized_pairs": synchronized_pairs
         }
     
-    def _check_account_timing_sync(
-        self, 
-        trades1: List[RawTradeData], 
-        trades2: List[RawTradeData]
-    ) -> bool:
-        """Check if two accounts show timing synchronization"""
-        
-        if not trades1 or not trades2:
-            return False
-        
-        # Check for trades within 5-minute windows
-        sync_count = 0
-        
-        for trade1 in trades1:
-            for trade2 in trades2:
-                try:
-                    dt1 = datetime.fromisoformat(trade1.execution_timestamp.replace('Z', '+00:00'))
-                    dt2 = datetime.fromisoformat(trade2.execution_timestamp.replace('Z', '+00:00'))
-                    
-                    time_diff = abs((dt1 - dt2).total_seconds())
-                    if time_diff <= 300:  # Within 5 minutes
-                        sync_count += 1
-                except:
-                    continue
-        
-        return sync_count >= 2
-    
     def _analyze_role_access(self, person_identity: PersonIdentity) -> Dict[str, Any]:
         """Analyze role-based access and risk factors"""
         
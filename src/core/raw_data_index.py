@@ -0,0 +1,230 @@
+"""
+Raw Data Index
+
+Secondary indexes over cached raw trades and orders so that searches
+intersect posting lists instead of scanning every cached alert.
+"""
+
+import bisect
+import itertools
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Search criterion -> record attribute for equality-indexed fields
+TRADE_INDEX_FIELDS = {
+    "trader_id": "trader_id",
+    "instrument": "instrument",
+    "venue": "exchange",
+    "desk": "desk",
+    "direction": "direction",
+}
+ORDER_INDEX_FIELDS = {
+    "trader_id": "trader_id",
+    "instrument": "instrument",
+    "venue": "exchange",
+    "direction": "side",
+}
+
+# ISO timestamps are bucketed by hour ("YYYY-MM-DDTHH")
+TIME_BUCKET_CHARS = 13
+
+# (timestamp, record id) position of the last returned match
+SearchPosition = Tuple[str, int]
+
+
+class RawDataIndex:
+    """
+    Inverted index over raw trade or order records grouped by alert.
+
+    Records are indexed by the configured equality fields, by alert id and
+    by hourly time bucket. Quantity and price are kept alongside each entry
+    so range filters are applied without touching the records themselves.
+    Matches are ordered by timestamp, which gives stable cursor positions.
+    """
+
+    def __init__(
+        self,
+        index_fields: Mapping[str, str],
+        timestamp_field: str,
+        price_field: Optional[str] = None,
+    ):
+        """
+        Args:
+            index_fields: Search criterion name to record attribute
+            timestamp_field: Record attribute holding the ISO timestamp
+            price_field: Record attribute used by min_price/max_price, if any
+        """
+        self.index_fields = dict(index_fields)
+        self.timestamp_field = timestamp_field
+        self.price_field = price_field
+
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        # record id -> (alert_id, position, timestamp, indexed values, quantity, price)
+        self._entries: Dict[int, Tuple[str, int, str, Tuple[Any, ...], Any, Any]] = {}
+        self._by_alert: Dict[str, List[int]] = {}
+        self._postings: Dict[str, Dict[Any, Set[int]]] = {
+            criterion: {} for criterion in self.index_fields
+        }
+        self._buckets: Dict[str, Set[int]] = {}
+        self._bucket_keys: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, alert_id: str, records: Sequence[Any]) -> None:
+        """Index the records cached for an alert, replacing any previous ones"""
+        with self._lock:
+            self._remove_locked(alert_id)
+            record_ids = []
+            for position, record in enumerate(records):
+                record_id = next(self._ids)
+                timestamp = getattr(record, self.timestamp_field) or ""
+                values = tuple(
+                    _index_value(getattr(record, attribute, None))
+                    for attribute in self.index_fields.values()
+                )
+                for criterion, value in zip(self.index_fields, values):
+                    if value is not None:
+                        self._postings[criterion].setdefault(value, set()).add(record_id)
+
+                bucket = timestamp[:TIME_BUCKET_CHARS]
+                if bucket not in self._buckets:
+                    self._buckets[bucket] = set()
+                    bisect.insort(self._bucket_keys, bucket)
+                self._buckets[bucket].add(record_id)
+
+                price = getattr(record, self.price_field) if self.price_field else None
+                self._entries[record_id] = (
+                    alert_id,
+                    position,
+                    timestamp,
+                    values,
+                    record.quantity,
+                    price,
+                )
+                record_ids.append(record_id)
+            self._by_alert[alert_id] = record_ids
+
+    def remove(self, alert_id: str) -> None:
+        """Drop all records indexed for an alert"""
+        with self._lock:
+            self._remove_locked(alert_id)
+
+    def search(
+        self,
+        criteria: Mapping[str, Any],
+        after: Optional[SearchPosition] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, int]], int, Optional[SearchPosition]]:
+        """
+        Find records matching the criteria.
+
+        Args:
+            criteria: Search criteria (indexed fields, alert_id, start_date,
+                end_date, min/max_quantity, min/max_price)
+            after: Position of the last match of the previous page
+            limit: Maximum number of matches to return (None for all)
+
+        Returns:
+            Tuple of (alert_id, position) pairs for the page, total number of
+            matches, and the position to resume from (None when exhausted)
+        """
+        with self._lock:
+            candidates = self._candidates(criteria)
+            matches = sorted(
+                (self._entries[record_id][2], record_id)
+                for record_id in candidates
+                if self._passes_filters(self._entries[record_id], criteria)
+            )
+
+            total = len(matches)
+            start = bisect.bisect_right(matches, after) if after is not None else 0
+            end = total if limit is None else min(start + limit, total)
+            page = [self._entries[record_id][:2] for _, record_id in matches[start:end]]
+
+        next_position = matches[end - 1] if end < total else None
+        return page, total, next_position
+
+    def _candidates(self, criteria: Mapping[str, Any]) -> Set[int]:
+        """Intersect the posting lists selected by the criteria"""
+        postings = []
+        for criterion in self.index_fields:
+            if criteria.get(criterion):
+                postings.append(self._postings[criterion].get(criteria[criterion], set()))
+
+        if criteria.get("alert_id"):
+            postings.append(set(self._by_alert.get(criteria["alert_id"], ())))
+
+        start_date = criteria.get("start_date")
+        end_date = criteria.get("end_date")
+        if start_date or end_date:
+            low = (
+                bisect.bisect_left(self._bucket_keys, start_date[:TIME_BUCKET_CHARS])
+                if start_date
+                else 0
+            )
+            high = (
+                bisect.bisect_right(self._bucket_keys, end_date[:TIME_BUCKET_CHARS])
+                if end_date
+                else len(self._bucket_keys)
+            )
+            in_range = set()
+            for bucket in self._bucket_keys[low:high]:
+                in_range |= self._buckets[bucket]
+            postings.append(in_range)
+
+        if not postings:
+            return set(self._entries)
+
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    def _passes_filters(self, entry, criteria: Mapping[str, Any]) -> bool:
+        """Apply exact timestamp bounds and quantity/price ranges"""
+        _, _, timestamp, _, quantity, price = entry
+
+        if criteria.get("start_date") and timestamp < criteria["start_date"]:
+            return False
+        if criteria.get("end_date") and timestamp > criteria["end_date"]:
+            return False
+        if criteria.get("min_quantity") and quantity < criteria["min_quantity"]:
+            return False
+        if criteria.get("max_quantity") and quantity > criteria["max_quantity"]:
+            return False
+        if self.price_field:
+            if criteria.get("min_price") and price < criteria["min_price"]:
+                return False
+            if criteria.get("max_price") and price > criteria["max_price"]:
+                return False
+        return True
+
+    def _remove_locked(self, alert_id: str) -> None:
+        for record_id in self._by_alert.pop(alert_id, ()):
+            _, _, timestamp, values, _, _ = self._entries.pop(record_id)
+            for criterion, value in zip(self.index_fields, values):
+                if value is None:
+                    continue
+                posting = self._postings[criterion].get(value)
+                if posting is not None:
+                    posting.discard(record_id)
+                    if not posting:
+                        del self._postings[criterion][value]
+
+            bucket = timestamp[:TIME_BUCKET_CHARS]
+            posting = self._buckets.get(bucket)
+            if posting is not None:
+                posting.discard(record_id)
+                if not posting:
+                    del self._buckets[bucket]
+                    del self._bucket_keys[bisect.bisect_left(self._bucket_keys, bucket)]
+
+
+def _index_value(value: Any) -> Any:
+    """Normalise an attribute value to its indexed key"""
+    return getattr(value, "value", value)
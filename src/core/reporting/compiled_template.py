@@ -0,0 +1,101 @@
+"""
+Compiled Narrative Templates
+
+Parses ``str.format`` templates once into render functions. Each template
+is compiled to a function returning a single f-string, so rendering skips
+re-parsing the template and building keyword arguments, while producing
+exactly the text ``template.format(**values)`` would.
+"""
+
+import logging
+import threading
+from string import Formatter
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+RenderFunction = Callable[[Mapping[str, Any]], str]
+
+_CONVERSIONS = {None: "", "r": "!r", "s": "!s", "a": "!a"}
+
+
+class CompiledTemplate:
+    """A ``str.format`` template parsed into a render function"""
+
+    __slots__ = ("source", "fields", "_render")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.fields: Tuple[str, ...] = ()
+        self._render = self._compile(source)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Render with the given field values (extra values are ignored)"""
+        return self._render(values)
+
+    def render_many(self, values_list: Iterable[Mapping[str, Any]]) -> List[str]:
+        """Render once per set of field values"""
+        render = self._render
+        return [render(values) for values in values_list]
+
+    def _compile(self, source: str) -> RenderFunction:
+        parsed = list(Formatter().parse(source))
+        fields: Dict[str, str] = {}
+        pieces = []
+        for literal, field_name, format_spec, conversion in parsed:
+            pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or not _is_plain_spec(format_spec):
+                # Positional, attribute or index fields and nested specs keep
+                # the standard formatting path
+                self.fields = tuple(
+                    name for _, name, _, _ in parsed if name and name.isidentifier()
+                )
+                return source.format_map
+            local = fields.setdefault(field_name, f"_{len(fields)}")
+            spec = f":{format_spec}" if format_spec else ""
+            pieces.append(f"{{{local}{_CONVERSIONS[conversion]}{spec}}}")
+
+        self.fields = tuple(fields)
+        body = repr("".join(pieces))
+        lines = ["def render(values):"]
+        lines.extend(f"    {local} = values[{name!r}]" for name, local in fields.items())
+        lines.append(f"    return f{body}")
+        namespace: Dict[str, Any] = {}
+        exec(compile("\n".join(lines), "<narrative template>", "exec"), namespace)
+        return namespace["render"]
+
+
+def _is_plain_spec(format_spec: str) -> bool:
+    """Whether a format spec can be written into an f-string verbatim"""
+    return not any(char in format_spec for char in "{}'\"\\\n")
+
+
+class TemplateCache:
+    """Compiled templates keyed by template id and version"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._templates: Dict[Tuple[Hashable, Hashable], CompiledTemplate] = {}
+
+    def get(self, template_id: Hashable, version: Hashable, source: str) -> CompiledTemplate:
+        """
+        Get the compiled template for an id and version, compiling it on
+        first use or if its source changed under the same version.
+        """
+        key = (template_id, version)
+        compiled = self._templates.get(key)
+        if compiled is None or compiled.source != source:
+            compiled = CompiledTemplate(source)
+            with self._lock:
+                self._templates[key] = compiled
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+
+# Shared by all generators; templates are immutable once compiled
+template_cache = TemplateCache()
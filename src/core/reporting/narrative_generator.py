@@ -10,8 +10,21 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from enum import Enum
 
+from .compiled_template import CompiledTemplate, template_cache
+
 logger = logging.getLogger(__name__)
 
+# Version of the built-in templates; compiled templates are cached per
+# (section, version)
+TEMPLATE_VERSION = "1"
+
+_SIGNIFICANCE_BY_EVIDENCE_TYPE = {
+    'communication': 'Demonstrates potential access to material non-public information',
+    'timing_anomaly': 'Highly suspicious timing suggests advance knowledge',
+    'trading_pattern': 'Abnormal pattern indicates confidence in outcome',
+    'cross_account_correlation': 'Coordination across accounts suggests deliberate strategy'
+}
+
 class ReportSection(Enum):
     """Report section types"""
     HEADER = "header"
@@ -26,6 +39,13 @@ class NarrativeGenerator:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.templates = self._load_templates()
+        self.template_version = self.config.get("template_version", TEMPLATE_VERSION)
+    
+    def _template(self, section: ReportSection) -> CompiledTemplate:
+        """Get the compiled template for a section"""
+        return template_cache.get(
+            section.value, self.template_version, self.templates[section]
+        )
     
     def _load_templates(self) -> Dict[ReportSection, str]:
         """Load narrative templates for each section"""
@@ -111,20 +131,52 @@ examination and demonstrates clear {risk_typology} patterns requiring immediate
             logger.error(f"Error generating regulatory narrative: {e}")
             return self._generate_error_narrative(evidence_data, str(e))
     
-    def generate_report_header(self, evidence_data: Dict[str, Any]) -> str:
+    def generate_regulatory_narratives(self, evidence_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate narratives for many alerts in one pass.
+        
+        Section templates are resolved once for the batch and all reports
+        share one generation timestamp.
+        
+        Args:
+            evidence_list: Evidence data for each alert
+            
+        Returns:
+            Regulatory narrative for each alert, in order
+        """
+        generation_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+        narratives = []
+        for evidence_data in evidence_list:
+            try:
+                sections = [
+                    self.generate_report_header(evidence_data, generation_timestamp),
+                    self.generate_executive_summary(evidence_data),
+                    self.generate_evidence_analysis(evidence_data),
+                    self.generate_regulatory_conclusions(evidence_data),
+                    self.generate_audit_trail(evidence_data)
+                ]
+                narratives.append('\n\n'.join(filter(None, sections)))
+            except Exception as e:
+                logger.error(f"Error generating regulatory narrative: {e}")
+                narratives.append(self._generate_error_narrative(evidence_data, str(e)))
+        return narratives
+    
+    def generate_report_header(
+        self, evidence_data: Dict[str, Any], generation_timestamp: Optional[str] = None
+    ) -> str:
         """Generate report header section"""
         try:
             person = evidence_data.get("person_info", {})
             summary = evidence_data.get("scenario_summary", {})
             
-            return self.templates[ReportSection.HEADER].format(
-                person_name=person.get("person_name", "Unknown"),
-                person_id=person.get("person_id", "Unknown"),
-                risk_typology=summary.get("alert_type", "Unknown").replace("_", " ").title(),
-                detection_confidence=summary.get("detection_confidence", 0.0),
-                stor_eligible="Yes" if summary.get("stor_eligible", False) else "No",
-                generation_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-            )
+            return self._template(ReportSection.HEADER).render({
+                "person_name": person.get("person_name", "Unknown"),
+                "person_id": person.get("person_id", "Unknown"),
+                "risk_typology": summary.get("alert_type", "Unknown").replace("_", " ").title(),
+                "detection_confidence": summary.get("detection_confidence", 0.0),
+                "stor_eligible": "Yes" if summary.get("stor_eligible", False) else "No",
+                "generation_timestamp": generation_timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+            })
         except Exception as e:
             logger.error(f"Error generating report header: {e}")
             return "REGULATORY EXPLAINABILITY REPORT\n================================\nError generating header"
@@ -138,16 +190,16 @@ examination and demonstrates clear {risk_typology} patterns requiring immediate
             # Generate timing description
             timing_description = self._generate_timing_description(evidence_data)
             
-            return self.templates[ReportSection.EXECUTIVE_SUMMARY].format(
-                detection_confidence=summary.get("detection_confidence", 0.0),
-                risk_typology=summary.get("alert_type", "unknown").replace("_", " "),
-                person_name=person.get("person_name", "Unknown"),
-                employment=person.get("employment", "Unknown position"),
-                access_level=person.get("access_level", "Unknown access"),
-                accounts_involved=summary.get("accounts_involved", 0),
-                total_financial_exposure=summary.get("total_financial_exposure", 0),
-                timing_description=timing_description
-            )
+            return self._template(ReportSection.EXECUTIVE_SUMMARY).render({
+                "detection_confidence": summary.get("detection_confidence", 0.0),
+                "risk_typology": summary.get("alert_type", "unknown").replace("_", " "),
+                "person_name": person.get("person_name", "Unknown"),
+                "employment": person.get("employment", "Unknown position"),
+                "access_level": person.get("access_level", "Unknown access"),
+                "accounts_involved": summary.get("accounts_involved", 0),
+                "total_financial_exposure": summary.get("total_financial_exposure", 0),
+                "timing_description": timing_description
+            })
         except Exception as e:
             logger.error(f"Error generating executive summary: {e}")
             return "EXECUTIVE SUMMARY: Error generating summary"
@@ -165,9 +217,9 @@ examination and demonstrates clear {risk_typology} patterns requiring immediate
             
             evidence_text = '\n\n'.join(evidence_items)
             
-            return self.templates[ReportSection.EVIDENCE_ANALYSIS].format(
-                evidence_items=evidence_text
-            )
+            return self._template(ReportSection.EVIDENCE_ANALYSIS).render({
+                "evidence_items": evidence_text
+            })
         except Exception as e:
             logger.error(f"Error generating evidence analysis: {e}")
             return "EVIDENCE CHAIN ANALYSIS: Error generating analysis"
@@ -187,12 +239,12 @@ examination and demonstrates clear {risk_typology} patterns requiring immediate
             # Generate framework-specific assessment
             assessment_details = self._generate_framework_assessment(evidence_data)
             
-            return self.templates[ReportSection.REGULATORY_CONCLUSIONS].format(
-                framework_name=self._get_primary_framework(evidence_data),
-                assessment_details=assessment_details,
-                cross_reference_count=cross_reference_count,
-                risk_typology=summary.get("alert_type", "unknown").replace("_", " ")
-            )
+            return self._template(ReportSection.REGULATORY_CONCLUSIONS).render({
+                "framework_name": self._get_primary_framework(evidence_data),
+                "assessment_details": assessment_details,
+                "cross_reference_count": cross_reference_count,
+                "risk_typology": summary.get("alert_type", "unknown").replace("_", " ")
+            })
         except Exception as e:
             logger.error(f"Error generating regulatory conclusions: {e}")
             return "REGULATORY CONCLUSIONS: Error generating conclusions"
@@ -202,15 +254,15 @@ examination and demonstrates clear {risk_typology} patterns requiring immediate
         try:
             summary = evidence_data.get("scenario_summary", {})
             
-            return self.templates[ReportSection.AUDIT_TRAIL].format(
-                total_evidence_items=summary.get("total_evidence_items", 0),
-                evidence_time_span_hours=summary.get("evidence_time_span_hours", 0),
-                accounts_involved=summary.get("accounts_involved", 0),
-                regulatory_frameworks=", ".join(summary.get("regulatory_frameworks_triggered", [])),
-                detection_algorithms="Bayesian Network, Temporal Analysis, Cross-Account Correlation",
-                data_sources="Trading records, Communication logs, Market data, Corporate announcements",
-                risk_typology=summary.get("alert_type", "unknown").replace("_", " ")
-            )
+            return self._template(ReportSection.AUDIT_TRAIL).render({
+                "total_evidence_items": summary.get("total_evidence_items", 0),
+                "evidence_time_span_hours": summary.get("evidence_time_span_hours", 0),
+                "accounts_involved": summary.get("accounts_involved", 0),
+                "regulatory_frameworks": ", ".join(summary.get("regulatory_frameworks_triggered", [])),
+                "detection_algorithms": "Bayesian Network, Temporal Analysis, Cross-Account Correlation",
+                "data_sources": "Trading records, Communication logs, Market data, Corporate announcements",
+                "risk_typology": summary.get("alert_type", "unknown").replace("_", " ")
+            })
         except Exception as e:
             logger.error(f"Error generating audit trail: {e}")
             return "AUDIT TRAIL: Error generating audit trail"
@@ -228,14 +280,7 @@ examination and demonstrates clear {risk_typology} patterns requiring immediate
         evidence_type = evidence.get('evidence_type', '')
         frameworks = evidence.get('regulatory_frameworks', [])
         
-        significance_map = {
-            'communication': 'Demonstrates potential access to material non-public information',
-            'timing_anomaly': 'Highly suspicious timing suggests advance knowledge',
-            'trading_pattern': 'Abnormal pattern indicates confidence in outcome',
-            'cross_account_correlation': 'Coordination across accounts suggests deliberate strategy'
-        }
-        
-        base_significance = significance_map.get(evidence_type, 'Requires regulatory attention')
+        base_significance = _SIGNIFICANCE_BY_EVIDENCE_TYPE.get(evidence_type, 'Requires regulatory attention')
         
         if 'mar_article_8' in frameworks:
             return f"{base_significance} (MAR Article 8 violation)"
@@ -337,52 +382,42 @@ class OptimizedOutputFormatter:
             Formatted output string
         """
         try:
-            # Build output in chunks for better performance
-            output_chunks = []
-            
-            # Header section
-            person = evidence_data.get("person_info", {})
-            summary = evidence_data.get("scenario_summary", {})
-            
-            output_chunks.append("🔗 EVIDENCE CHAIN STRUCTURE:")
-            output_chunks.append("-" * 35)
-            
             # Evidence items - build all at once instead of multiple print calls
             chain = evidence_data.get("evidence_chain", [])
-            evidence_lines = []
-            
-            for evidence in chain:
-                sequence_id = evidence.get('sequence_id', 0)
-                evidence_type = evidence.get('evidence_type', 'unknown').upper()
-                timestamp = evidence.get('timestamp', 'Unknown')
-                account_id = evidence.get('account_id', 'Unknown')
-                strength = evidence.get('strength', 0.0)
-                reliability = evidence.get('reliability', 0.0)
-                description = evidence.get('description', 'No description')
-                frameworks = evidence.get('regulatory_frameworks', [])
-                cross_refs = evidence.get('cross_references', [])
-                
-                # Build evidence item as single string
-                evidence_block = [
-                    f"\n[{sequence_id}] {evidence_type}",
-                    f"    Time: {timestamp}",
-                    f"    Account: {account_id}",
-                    f"    Strength: {strength:.2f} | Reliability: {reliability:.2f}",
-                    f"    Description: {description}",
-                    f"    Frameworks: {', '.join(frameworks)}"
-                ]
-                
-                if cross_refs:
-                    evidence_block.append(f"    Cross-refs: {', '.join(cross_refs)}")
-                
-                evidence_lines.append('\n'.join(evidence_block))
-            
-            # Join all evidence items
-            output_chunks.append('\n'.join(evidence_lines))
+            evidence_lines = [
+                OptimizedOutputFormatter._format_evidence_block(evidence)
+                for evidence in chain
+            ]
             
             # Return complete output as single string
-            return '\n'.join(output_chunks)
+            return "🔗 EVIDENCE CHAIN STRUCTURE:\n" + "-" * 35 + "\n" + '\n'.join(evidence_lines)
             
         except Exception as e:
             logger.error(f"Error formatting evidence chain output: {e}")
-            return f"Error formatting output: {e}"
\ No newline at end of file
+            return f"Error formatting output: {e}"
+    
+    @staticmethod
+    def format_evidence_chain_outputs(evidence_list: List[Dict[str, Any]]) -> List[str]:
+        """Format evidence chain output for many alerts in one pass"""
+        return [
+            OptimizedOutputFormatter.format_evidence_chain_output(evidence_data)
+            for evidence_data in evidence_list
+        ]
+    
+    @staticmethod
+    def _format_evidence_block(evidence: Dict[str, Any]) -> str:
+        """Format one evidence item as a single string"""
+        get = evidence.get
+        block = (
+            f"\n[{get('sequence_id', 0)}] {get('evidence_type', 'unknown').upper()}\n"
+            f"    Time: {get('timestamp', 'Unknown')}\n"
+            f"    Account: {get('account_id', 'Unknown')}\n"
+            f"    Strength: {get('strength', 0.0):.2f} | Reliability: {get('reliability', 0.0):.2f}\n"
+            f"    Description: {get('description', 'No description')}\n"
+            f"    Frameworks: {', '.join(get('regulatory_frameworks', []))}"
+        )
+        
+        cross_refs = get('cross_references', [])
+        if cross_refs:
+            block += f"\n    Cross-refs: {', '.join(cross_refs)}"
+        return block
@@ -6,7 +6,9 @@ including authorization checks and data sanitization for logging and output.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Set
+import re
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional, Set
 from enum import Enum
 import copy
 
@@ -30,12 +32,42 @@ class SensitiveDataType(Enum):
     PARTICIPANT_EMAIL = "participant_email"
     PHONE_NUMBER = "phone_number"
 
+# Description masks, applied in a single pass as one alternation. The
+# patterns cannot overlap, so this matches applying them one after another.
+_DESCRIPTION_MASKS = (
+    ("account", r"ACC_[A-Z0-9_]+", "ACC_***"),
+    ("amount", r"\$[\d,]+", "$***"),
+    ("percentage", r"\d{3,}%", "***%"),
+)
+_DESCRIPTION_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _DESCRIPTION_MASKS)
+)
+_DESCRIPTION_REPLACEMENTS = {name: replacement for name, _, replacement in _DESCRIPTION_MASKS}
+
+
+def _description_replacement(match: "re.Match[str]") -> str:
+    return _DESCRIPTION_REPLACEMENTS[match.lastgroup]
+
+
+@dataclass(frozen=True)
+class SanitizationPlan:
+    """Sanitization steps for one access level, resolved once per sanitizer"""
+    access_level: AccessLevel
+    full_access: bool = False
+    summary_only: bool = False
+    mask_account_id: bool = False
+    masked_raw_fields: FrozenSet[str] = frozenset()
+    mask_external_participants: bool = False
+
 class DataSanitizer:
     """Sanitizes sensitive regulatory data based on user access levels"""
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.sensitive_fields = self._load_sensitive_fields()
+        self._sensitive_field_names = frozenset().union(*self.sensitive_fields.values())
+        self._internal_domains = tuple(self.config.get("internal_domains", ["techcorp.com"]))
+        self._plans = self._build_plans()
         
     def _load_sensitive_fields(self) -> Dict[SensitiveDataType, Set[str]]:
         """Load configuration of sensitive field mappings"""
@@ -57,6 +89,31 @@ class DataSanitizer:
                 "participants", "email_addresses", "contact_info"
             }
         }
+
+    def _build_plans(self) -> Dict[AccessLevel, SanitizationPlan]:
+        """Resolve the sanitization steps for each access level"""
+        return {
+            # Regulators get full access
+            AccessLevel.REGULATOR: SanitizationPlan(AccessLevel.REGULATOR, full_access=True),
+            # Public users only see a summary with identifiers removed
+            AccessLevel.PUBLIC: SanitizationPlan(AccessLevel.PUBLIC, summary_only=True),
+            AccessLevel.ANALYST: SanitizationPlan(
+                AccessLevel.ANALYST,
+                mask_account_id=True,
+                masked_raw_fields=self._sensitive_field_names,
+            ),
+            # Compliance get most data
+            AccessLevel.COMPLIANCE: SanitizationPlan(AccessLevel.COMPLIANCE),
+            # Admins only have external email addresses redacted
+            AccessLevel.ADMIN: SanitizationPlan(AccessLevel.ADMIN, mask_external_participants=True),
+        }
+
+    def get_plan(self, access_level: AccessLevel) -> SanitizationPlan:
+        """Get the sanitization plan for an access level"""
+        plan = self._plans.get(access_level)
+        if plan is None:
+            return SanitizationPlan(access_level)
+        return plan
     
     def sanitize_evidence_item(
         self, 
@@ -75,96 +132,67 @@ class DataSanitizer:
         Returns:
             Sanitized evidence item
         """
-        if access_level == AccessLevel.REGULATOR:
-            # Regulators get full access
+        return self._apply_plan(evidence_item, self.get_plan(access_level), preserve_structure)
+
+    def sanitize_evidence_chain(
+        self,
+        evidence_chain: List[Dict[str, Any]],
+        access_level: AccessLevel,
+        preserve_structure: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Sanitize every item of an evidence chain for one access level"""
+        plan = self.get_plan(access_level)
+        return [self._apply_plan(item, plan, preserve_structure) for item in evidence_chain]
+
+    def _apply_plan(
+        self,
+        evidence_item: Dict[str, Any],
+        plan: SanitizationPlan,
+        preserve_structure: bool
+    ) -> Dict[str, Any]:
+        """Apply a sanitization plan to a single copy of the evidence item"""
+        if plan.full_access:
             return evidence_item
-            
-        sanitized = copy.deepcopy(evidence_item) if preserve_structure else {}
-        
-        # Apply sanitization rules based on access level
-        if access_level == AccessLevel.PUBLIC:
-            sanitized = self._apply_public_sanitization(sanitized)
-        elif access_level == AccessLevel.ANALYST:
-            sanitized = self._apply_analyst_sanitization(sanitized)
-        elif access_level == AccessLevel.COMPLIANCE:
-            sanitized = self._apply_compliance_sanitization(sanitized)
-        elif access_level == AccessLevel.ADMIN:
-            sanitized = self._apply_admin_sanitization(sanitized)
-            
+
+        data = evidence_item if preserve_structure else {}
+        if plan.summary_only:
+            return self._apply_public_sanitization(data)
+
+        sanitized = copy.deepcopy(data)
+        if plan.mask_account_id:
+            sanitized["account_id"] = self._mask_account_id(sanitized.get("account_id", ""))
+        if "raw_data" in sanitized:
+            raw_data = sanitized["raw_data"]
+            if plan.masked_raw_fields:
+                self._mask_raw_data(raw_data, plan.masked_raw_fields)
+            if plan.mask_external_participants and "participants" in raw_data:
+                raw_data["participants"] = [
+                    self._mask_external_email(email)
+                    for email in raw_data["participants"]
+                ]
         return sanitized
     
     def _apply_public_sanitization(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply public-level sanitization (most restrictive)"""
-        # Remove all sensitive identifiers
+        # Remove all sensitive identifiers; only the fields kept are copied
         sanitized = {
-            "evidence_type": data.get("evidence_type", "REDACTED"),
-            "timestamp": data.get("timestamp", "REDACTED"),
+            "evidence_type": copy.deepcopy(data.get("evidence_type", "REDACTED")),
+            "timestamp": copy.deepcopy(data.get("timestamp", "REDACTED")),
             "strength": self._round_score(data.get("strength", 0.0)),
             "description": self._sanitize_description(data.get("description", "")),
-            "regulatory_frameworks": data.get("regulatory_frameworks", [])
+            "regulatory_frameworks": copy.deepcopy(data.get("regulatory_frameworks", []))
         }
         return sanitized
     
-    def _apply_analyst_sanitization(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply analyst-level sanitization"""
-        sanitized = copy.deepcopy(data)
-        
-        # Mask account IDs
-        sanitized["account_id"] = self._mask_account_id(data.get("account_id", ""))
-        
-        # Sanitize raw data
-        if "raw_data" in sanitized:
-            sanitized["raw_data"] = self._sanitize_raw_data(
-                sanitized["raw_data"], AccessLevel.ANALYST
-            )
-            
-        return sanitized
-    
-    def _apply_compliance_sanitization(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply compliance-level sanitization (minimal restrictions)"""
-        sanitized = copy.deepcopy(data)
-        
-        # Only sanitize external communication details
-        if "raw_data" in sanitized:
-            sanitized["raw_data"] = self._sanitize_raw_data(
-                sanitized["raw_data"], AccessLevel.COMPLIANCE
-            )
-            
-        return sanitized
-    
-    def _apply_admin_sanitization(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply admin-level sanitization (very minimal restrictions)"""
-        sanitized = copy.deepcopy(data)
-        
-        # Only redact external email addresses
-        if "raw_data" in sanitized and "participants" in sanitized["raw_data"]:
-            sanitized["raw_data"]["participants"] = [
-                self._mask_external_email(email) 
-                for email in sanitized["raw_data"]["participants"]
-            ]
-            
-        return sanitized
-    
-    def _sanitize_raw_data(self, raw_data: Dict[str, Any], access_level: AccessLevel) -> Dict[str, Any]:
-        """Sanitize raw data fields based on access level"""
-        sanitized = copy.deepcopy(raw_data)
-        
+    def _mask_raw_data(self, raw_data: Dict[str, Any], fields: FrozenSet[str]) -> None:
+        """Mask sensitive raw data fields in place"""
         for field_name, field_value in raw_data.items():
-            if self._is_sensitive_field(field_name):
-                if access_level == AccessLevel.PUBLIC:
-                    sanitized[field_name] = "REDACTED"
-                elif access_level == AccessLevel.ANALYST:
-                    sanitized[field_name] = self._mask_sensitive_value(field_value, field_name)
-                # Compliance and Admin get most data
-                    
-        return sanitized
+            if field_name in fields:
+                raw_data[field_name] = self._mask_sensitive_value(field_value, field_name)
     
     def _is_sensitive_field(self, field_name: str) -> bool:
         """Check if a field contains sensitive data"""
-        for sensitive_type, field_set in self.sensitive_fields.items():
-            if field_name in field_set:
-                return True
-        return False
+        return field_name in self._sensitive_field_names
     
     def _mask_account_id(self, account_id: str) -> str:
         """Mask account ID for privacy"""
@@ -202,22 +230,13 @@ class DataSanitizer:
             return email
         local, domain = email.split("@", 1)
         # Only mask external domains (not internal company domains)
-        internal_domains = self.config.get("internal_domains", ["techcorp.com"])
-        if any(domain.endswith(internal) for internal in internal_domains):
+        if domain.endswith(self._internal_domains):
             return email  # Keep internal emails
         return f"{local[0]}***@{domain}"
     
     def _sanitize_description(self, description: str) -> str:
-        """Sanitize description text"""
-        # Remove specific account references
-        import re
-        # Replace account patterns
-        description = re.sub(r'ACC_[A-Z0-9_]+', 'ACC_***', description)
-        # Replace dollar amounts
-        description = re.sub(r'\$[\d,]+', '$***', description)
-        # Replace percentages over 100%
-        description = re.sub(r'(\d{3,})%', '***%', description)
-        return description
+        """Sanitize description text (account references, dollar amounts and percentages over 100%)"""
+        return _DESCRIPTION_PATTERN.sub(_description_replacement, description)
     
     def _round_score(self, score: float) -> float:
         """Round scores to prevent inference attacks"""
@@ -294,11 +313,9 @@ def secure_print_evidence(
     
     # Sanitize the data based on user access level
     if "evidence_chain" in evidence_data:
-        sanitized_chain = [
-            sanitizer.sanitize_evidence_item(item, user_level)
-            for item in evidence_data["evidence_chain"]
-        ]
-        evidence_data["evidence_chain"] = sanitized_chain
+        evidence_data["evidence_chain"] = sanitizer.sanitize_evidence_chain(
+            evidence_data["evidence_chain"], user_level
+        )
     
     # Log the access for audit trail
     logger.info(f"Evidence data accessed by user {user_id} with level {user_level.value}")
@@ -1,8 +1,16 @@
+import csv
+import io
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ...services.alert_aggregates import AlertAggregates
+from ...services.alert_repository import AlertRepository
+from ...services.alert_store import AlertStore
+from ...utils.bounded_cache import BoundedCache
+from ...utils.serialization import drain_buffer, to_json_compatible
 from ..regulatory_explainability import (
     RegulatoryExplainability,
     RegulatoryRationale,
@@ -11,22 +19,83 @@ from ..regulatory_explainability import (
 
 logger = logging.getLogger(__name__)
 
+# Relative alert database paths are resolved against the project root, not
+# the working directory of whichever process starts the service
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Columns of the bulk regulatory CSV export
+BULK_CSV_COLUMNS = (
+    "alert_id",
+    "type",
+    "severity",
+    "timestamp",
+    "trader_id",
+    "risk_score",
+    "instruments",
+    "regulatory_frameworks",
+    "narrative",
+    "error",
+)
+
 
 class AlertService:
     """
     Alert generation system for market abuse detection
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        rationale_cache: Optional[Dict[str, Any]] = None,
+        alert_history: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the alert service.
+
+        Args:
+            rationale_cache: Settings for the regulatory rationale cache
+                ("max_entries", "ttl_seconds")
+            alert_history: Alert history settings ("max_alerts",
+                "retention_days", and "db_path" to persist alerts in SQLite;
+                relative paths are resolved against the project root)
+        """
+        rationale_cache = rationale_cache or {}
+        alert_history = alert_history or {}
         self.alert_thresholds = {
             "insider_dealing": {"high_risk": 0.7, "medium_risk": 0.4},
             "spoofing": {"high_risk": 0.8, "medium_risk": 0.5},
             "overall_risk": {"critical": 0.8, "high": 0.6, "medium": 0.4},
         }
 
-        self.alert_history = []
+        retention = {
+            "max_alerts": alert_history.get("max_alerts"),
+            "retention_days": alert_history.get("retention_days"),
+        }
+        if alert_history.get("db_path"):
+            # Durable history shared by all workers. Summaries are counted in
+            # SQL so they see every worker's inserts, status changes and
+            # retention deletions
+            db_path = alert_history["db_path"]
+            if db_path != ":memory:":
+                db_path = str(PROJECT_ROOT / db_path)
+            self.alert_aggregates = None
+            self.alert_history = AlertRepository(db_path, **retention)
+        else:
+            # Running summary counts, windowed over the retention period
+            self.alert_aggregates = AlertAggregates(
+                days=max(1, int(alert_history.get("retention_days") or 90))
+            )
+            self.alert_history = AlertStore(
+                on_remove=self.alert_aggregates.remove, **retention
+            )
         self.regulatory_explainability = RegulatoryExplainability()
 
+        # Rationales by alert id, reused by single and bulk exports
+        self.rationale_cache = BoundedCache(
+            max_entries=rationale_cache.get("max_entries", 5000),
+            ttl_seconds=rationale_cache.get("ttl_seconds"),
+            name="regulatory_rationales",
+        )
+
     def generate_alerts(
         self,
         processed_data: Dict,
@@ -59,8 +128,10 @@ class AlertService:
             )
             alerts.extend(overall_alerts)
             # Store alerts in history
+            self.alert_history.extend(alerts)
             for alert in alerts:
-                self.alert_history.append(alert)
+                if self.alert_aggregates is not None:
+                    self.alert_aggregates.add(alert)
                 logger.warning(
                     f"ALERT GENERATED: {alert['type']} - {alert['severity']}"
                 )
@@ -326,81 +397,207 @@ class AlertService:
             ]
 
     def get_historical_alerts(
-        self, limit: int = 100, alert_type: Optional[str] = None
+        self,
+        limit: int = 100,
+        alert_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        trader_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        offset: int = 0,
+        status: Optional[str] = None,
     ) -> List[Dict]:
-        """Get historical alerts with optional filtering"""
-        filtered_alerts = self.alert_history
-
-        if alert_type:
-            filtered_alerts = [
-                a for a in filtered_alerts if a["type"] == alert_type.upper()
-            ]
-
-        # Sort by timestamp (most recent first)
-        filtered_alerts.sort(key=lambda x: x["timestamp"], reverse=True)
+        """Get historical alerts with optional filtering, most recent first"""
+        return self.alert_history.query(
+            start=start_date,
+            end=end_date,
+            alert_type=alert_type.upper() if alert_type else None,
+            severity=severity.upper() if severity else None,
+            trader_id=trader_id,
+            status=status,
+            limit=limit,
+            offset=offset,
+        )
 
-        return filtered_alerts[:limit]
+    def get_alert_details(self, alert_id: str) -> Optional[Dict]:
+        """Get an alert by id"""
+        return self.alert_history.get(alert_id)
+
+    def update_alert_status(
+        self, alert_id: str, status: str, notes: str = ""
+    ) -> Optional[Dict]:
+        """Record a new investigation status on an alert"""
+        alert = self.alert_history.update_status(alert_id, status, notes)
+        if alert is None:
+            return None
+        history = alert["status_history"]
+        previous_status = history[-2]["status"] if len(history) > 1 else None
+        if self.alert_aggregates is not None:
+            self.alert_aggregates.update_status(alert, previous_status)
+        return alert
 
     def get_alert_summary(self, days: int = 30) -> Dict:
         """Get summary of alerts over specified period"""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        recent_alerts = [
-            a
-            for a in self.alert_history
-            if datetime.fromisoformat(a["timestamp"]) > cutoff_date
-        ]
-
-        summary = {
-            "total_alerts": len(recent_alerts),
-            "by_type": {},
-            "by_severity": {},
-            "unique_traders": set(),
-            "instruments_affected": set(),
-        }
-
-        for alert in recent_alerts:
-            # Count by type
-            alert_type = alert["type"]
-            summary["by_type"][alert_type] = summary["by_type"].get(alert_type, 0) + 1
-
-            # Count by severity
-            severity = alert["severity"]
-            summary["by_severity"][severity] = (
-                summary["by_severity"].get(severity, 0) + 1
-            )
-
-            # Track unique traders
-            if alert.get("trader_id"):
-                summary["unique_traders"].add(alert["trader_id"])
-
-            # Track instruments
-            for instrument in alert.get("instruments", []):
-                summary["instruments_affected"].add(instrument)
-
-        # Convert sets to lists for JSON serialization
-        summary["unique_traders"] = list(summary["unique_traders"])
-        summary["instruments_affected"] = list(summary["instruments_affected"])
-
-        return summary
+        start = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        if self.alert_aggregates is None:
+            return self.alert_history.summary(start)
+        if self.alert_aggregates.covers(days):
+            return self.alert_aggregates.summary(days)
+
+        # Windows longer than the aggregated period are counted from the history
+        aggregates = AlertAggregates(days=days)
+        aggregates.rebuild(self.alert_history.query(start=start))
+        return aggregates.summary(days)
+
+    def rebuild_alert_summary(self) -> None:
+        """Recount the summary aggregates from the alert history"""
+        if self.alert_aggregates is not None:
+            self.alert_aggregates.rebuild(self.alert_history)
 
     def generate_regulatory_rationale(
         self, alert: Dict, risk_scores: Dict, processed_data: Dict
     ) -> RegulatoryRationale:
         """Generate regulatory rationale for an alert"""
         try:
-            return self.regulatory_explainability.generate_regulatory_rationale(
+            rationale = self.regulatory_explainability.generate_regulatory_rationale(
                 alert, risk_scores, processed_data
             )
+            if alert.get("id"):
+                self.rationale_cache[alert["id"]] = rationale
+            return rationale
         except Exception as e:
             logger.error(f"Error generating regulatory rationale: {str(e)}")
             raise
 
+    def get_regulatory_rationale(
+        self,
+        alert: Dict,
+        risk_scores: Optional[Dict] = None,
+        processed_data: Optional[Dict] = None,
+    ) -> RegulatoryRationale:
+        """
+        Get the regulatory rationale for an alert.
+
+        Without explicit inputs an already generated rationale is reused, or
+        one is built from the risk scores and context recorded on the alert
+        itself. Explicit inputs always generate a fresh rationale, which then
+        replaces the cached one.
+        """
+        if risk_scores is None and processed_data is None:
+            rationale = self.rationale_cache.get(alert.get("id"))
+            if rationale is not None:
+                return rationale
+
+        if risk_scores is None:
+            risk_scores = alert.get("evidence", {}).get("risk_scores") or {
+                "overall_score": alert.get("risk_score", 0)
+            }
+        if processed_data is None:
+            processed_data = self._alert_context(alert)
+        return self.generate_regulatory_rationale(alert, risk_scores, processed_data)
+
+    def select_alerts(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        alert_type: Optional[str] = None,
+        severity: Optional[str] = None,
+    ) -> Iterable[Dict]:
+        """
+        Select alerts for export by timestamp range, typology and severity.
+
+        Args:
+            start_date: Earliest alert timestamp (ISO format, inclusive)
+            end_date: Latest alert timestamp (ISO format, inclusive)
+            alert_type: Alert type (typology) filter
+            severity: Severity filter
+
+        Returns:
+            Matching alerts, oldest first, read lazily
+        """
+        return self.alert_history.iter_query(
+            start=start_date,
+            end=end_date,
+            alert_type=alert_type.upper() if alert_type else None,
+            severity=severity.upper() if severity else None,
+            newest_first=False,
+        )
+
+    def iter_stor_records(self, alerts: Iterable[Dict]) -> Iterator[Tuple[Dict, Any]]:
+        """
+        Yield (alert, STOR record or error message) pairs one alert at a time.
+
+        Already generated rationales are reused; failures are reported per
+        alert so one bad alert does not abort a bulk export.
+        """
+        for alert in alerts:
+            try:
+                rationale = self.get_regulatory_rationale(alert)
+                yield alert, self.regulatory_explainability.export_stor_format(
+                    rationale, self._alert_context(alert)
+                )
+            except Exception as e:
+                logger.error(f"Error exporting STOR record for alert {alert.get('id')}: {str(e)}")
+                yield alert, str(e)
+
+    def iter_stor_lines(self, alerts: Iterable[Dict]) -> Iterator[str]:
+        """Yield STOR records for bulk export as JSON lines"""
+        for alert, record in self.iter_stor_records(alerts):
+            if isinstance(record, str):
+                line = {"alert_id": alert.get("id"), "error": record}
+            else:
+                line = {"alert_id": alert.get("id"), "stor_record": record}
+            yield json.dumps(line, default=to_json_compatible) + "\n"
+
+    def iter_regulatory_csv_rows(self, alerts: Iterable[Dict]) -> Iterator[str]:
+        """Yield a regulatory CSV report across many alerts, one row at a time"""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(BULK_CSV_COLUMNS)
+        yield drain_buffer(output)
+
+        for alert in alerts:
+            try:
+                rationale = self.get_regulatory_rationale(alert)
+                narrative = rationale.deterministic_narrative
+                frameworks = rationale.regulatory_frameworks
+                error = ""
+            except Exception as e:
+                logger.error(f"Error exporting CSV row for alert {alert.get('id')}: {str(e)}")
+                narrative, frameworks, error = "", [], str(e)
+
+            writer.writerow(
+                [
+                    alert.get("id"),
+                    alert.get("type"),
+                    alert.get("severity"),
+                    alert.get("timestamp"),
+                    alert.get("trader_id"),
+                    alert.get("risk_score"),
+                    ";".join(str(i) for i in alert.get("instruments", [])),
+                    ";".join(str(f) for f in frameworks),
+                    narrative,
+                    error,
+                ]
+            )
+            yield drain_buffer(output)
+
+    def _alert_context(self, alert: Dict) -> Dict:
+        """Minimal processed-data context recorded on an alert"""
+        evidence = alert.get("evidence", {})
+        return {
+            "trader_info": evidence.get("trader_info")
+            or {"id": alert.get("trader_id")},
+            "instruments": alert.get("instruments", []),
+            "timeframe": alert.get("timeframe"),
+        }
+
     def export_stor_report(
         self, alert: Dict, risk_scores: Dict, processed_data: Dict
     ) -> STORRecord:
         """Export alert in STOR format"""
         try:
-            rationale = self.generate_regulatory_rationale(
+            rationale = self.get_regulatory_rationale(
                 alert, risk_scores, processed_data
             )
             return self.regulatory_explainability.export_stor_format(
@@ -419,7 +616,7 @@ class AlertService:
     ) -> str:
         """Export regulatory rationale as CSV report"""
         try:
-            rationale = self.generate_regulatory_rationale(
+            rationale = self.get_regulatory_rationale(
                 alert, risk_scores, processed_data
             )
             return self.regulatory_explainability.export_csv_report(rationale, filename)
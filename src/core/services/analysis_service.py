@@ -8,9 +8,12 @@ managing data processing, risk calculation, and alert generation.
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...services.analysis_jobs import AnalysisJobManager, AnalysisJobStore
 from ...utils.logger import setup_logger
+from ...utils.micro_batcher import MicroBatcher
 from ..engines.bayesian_engine import BayesianEngine
 from ..engines.risk_calculator import RiskCalculator
 from ..processors.data_processor import DataProcessor
@@ -18,6 +21,10 @@ from ..services.alert_service import AlertService
 
 logger = setup_logger()
 
+# Relative job database paths are resolved against the project root, not the
+# working directory of whichever process starts the service
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
 
 @dataclass
 class AnalysisResult:
@@ -43,13 +50,49 @@ class AnalysisService:
     4. Result aggregation and formatting
     """
 
-    def __init__(self):
-        """Initialize the analysis service with required components."""
+    def __init__(
+        self,
+        realtime_batching: Optional[Dict[str, Any]] = None,
+        analysis_jobs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the analysis service with required components.
+
+        Args:
+            realtime_batching: Optional micro-batching settings for real-time
+                scoring ("enabled", "max_batch_size", "max_delay_ms")
+            analysis_jobs: Optional settings for asynchronous batch jobs
+                ("db_path", "max_workers", "chunk_size", "heartbeat_seconds",
+                "stale_after_seconds")
+        """
         self.bayesian_engine = BayesianEngine()
         self.data_processor = DataProcessor()
         self.alert_service = AlertService()
         self.risk_calculator = RiskCalculator()
 
+        self.realtime_batcher: Optional[MicroBatcher] = None
+        batching = realtime_batching or {}
+        if batching.get("enabled", False):
+            self.realtime_batcher = MicroBatcher(
+                self.analyze_realtime_batch,
+                max_batch_size=batching.get("max_batch_size", 64),
+                max_delay_ms=batching.get("max_delay_ms", 5.0),
+                name="realtime-scoring-batcher",
+            )
+
+        jobs = analysis_jobs or {}
+        db_path = jobs.get("db_path") or ":memory:"
+        if db_path != ":memory:":
+            db_path = str(PROJECT_ROOT / db_path)
+        self.job_manager = AnalysisJobManager(
+            self._analyze_batch_item,
+            store=AnalysisJobStore(db_path),
+            max_workers=jobs.get("max_workers", 2),
+            chunk_size=jobs.get("chunk_size", 100),
+            heartbeat_seconds=jobs.get("heartbeat_seconds", 10.0),
+            stale_after_seconds=jobs.get("stale_after_seconds", 60.0),
+        )
+
     def analyze_trading_data(
         self, data: Dict[str, Any], use_latent_intent: bool = False
     ) -> AnalysisResult:
@@ -143,41 +186,79 @@ class AnalysisService:
         Returns:
             List of analysis results
         """
-        results = []
+        return [self._analyze_batch_item(i, data) for i, data in enumerate(batch_data)]
 
-        for i, data in enumerate(batch_data):
-            try:
-                # Analyze each dataset
-                result = self.analyze_trading_data(data)
-
-                # Convert to dictionary format for batch response
-                batch_result = {
-                    "batch_index": i,
-                    "analysis_id": result.analysis_id,
-                    "timestamp": result.timestamp,
-                    "risk_scores": result.risk_scores,
-                    "alerts": result.alerts,
-                    "processing_time_ms": result.processing_time_ms,
-                    "summary": {
-                        "trades_analyzed": len(result.processed_data.get("trades", [])),
-                        "alerts_generated": len(result.alerts),
-                    },
-                }
+    def _analyze_batch_item(self, index: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze one batch dataset into its batch response entry"""
+        try:
+            # Analyze each dataset
+            result = self.analyze_trading_data(data)
+
+            # Convert to dictionary format for batch response
+            return {
+                "batch_index": index,
+                "analysis_id": result.analysis_id,
+                "timestamp": result.timestamp,
+                "risk_scores": result.risk_scores,
+                "alerts": result.alerts,
+                "processing_time_ms": result.processing_time_ms,
+                "summary": {
+                    "trades_analyzed": len(result.processed_data.get("trades", [])),
+                    "alerts_generated": len(result.alerts),
+                },
+            }
 
-                results.append(batch_result)
+        except Exception as e:
+            logger.error(f"Error analyzing batch item {index}: {str(e)}")
+            # Add error result to maintain batch integrity
+            return {
+                "batch_index": index,
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
 
-            except Exception as e:
-                logger.error(f"Error analyzing batch item {i}: {str(e)}")
-                # Add error result to maintain batch integrity
-                results.append(
-                    {
-                        "batch_index": i,
-                        "error": str(e),
-                        "timestamp": datetime.utcnow().isoformat(),
-                    }
-                )
+    def submit_batch_job(
+        self, batch_data: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Submit a batch analysis to run asynchronously on the job worker pool.
 
-        return results
+        Args:
+            batch_data: List of trading datasets to analyze
+            metadata: Optional caller metadata stored with the job
+
+        Returns:
+            Job ID for polling status and results
+        """
+        return self.job_manager.submit(batch_data, metadata)
+
+    def get_batch_job_results(
+        self, job_id: str, offset: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Get partial or final results of a batch job.
+
+        Args:
+            job_id: ID returned by submit_batch_job
+            offset: Index of the first result to return
+            limit: Maximum number of results to return
+
+        Returns:
+            Batch results ordered by batch index
+        """
+        return self.job_manager.get_results(job_id, offset, limit)
+
+    def cancel_batch_job(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running batch job.
+
+        Args:
+            job_id: ID returned by submit_batch_job
+
+        Returns:
+            True if the job was cancelled or flagged for cancellation
+        """
+        return self.job_manager.cancel(job_id)
 
     def analyze_realtime_data(self, data: Dict[str, Any]) -> AnalysisResult:
         """
@@ -188,74 +269,126 @@ class AnalysisService:
         - Skipping non-essential calculations
         - Using cached model components
 
+        When real-time batching is enabled, the request joins the current
+        micro-batch and is scored together with concurrent requests; added
+        latency is bounded by the configured max_delay_ms.
+
         Args:
             data: Trading data to analyze
 
         Returns:
             AnalysisResult with minimal processing overhead
         """
-        start_time = time.time()
+        if self.realtime_batcher is not None:
+            return self.realtime_batcher.submit(data).result()
 
-        try:
-            # Generate analysis ID for real-time
-            analysis_id = f"rt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
+        result = self.analyze_realtime_batch([data])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-            # Fast-track data processing for real-time
-            processed_data = self.data_processor.process_realtime(data)
+    def analyze_realtime_batch(self, batch_data: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Score several real-time requests with one batched inference pass.
 
-            # Calculate only essential risk scores
-            insider_dealing_score = self.bayesian_engine.calculate_insider_dealing_risk(
-                processed_data
-            )
-            spoofing_score = self.bayesian_engine.calculate_spoofing_risk(
-                processed_data
-            )
+        Args:
+            batch_data: Trading data payloads, one per real-time request
 
-            # Skip overall risk calculation for speed
-            risk_scores = {
-                "insider_dealing": insider_dealing_score,
-                "spoofing": spoofing_score,
-            }
+        Returns:
+            One AnalysisResult per payload, or the exception raised while
+            processing that payload
+        """
+        start_time = time.time()
 
-            # Generate only high-priority alerts
-            alerts = self.alert_service.generate_realtime_alerts(
-                processed_data, insider_dealing_score, spoofing_score
-            )
+        processed_batch = []
+        results: List[Any] = [None] * len(batch_data)
+        for i, data in enumerate(batch_data):
+            try:
+                # Fast-track data processing for real-time
+                processed_batch.append((i, self.data_processor.process_realtime(data)))
+            except Exception as e:
+                logger.error(f"Error in analyze_realtime_data: {str(e)}")
+                results[i] = e
+
+        if not processed_batch:
+            return results
+
+        # Calculate only essential risk scores, vectorised across the batch
+        processed_list = [processed for _, processed in processed_batch]
+        insider_dealing_scores = self.bayesian_engine.calculate_insider_dealing_risk_batch(
+            processed_list
+        )
+        spoofing_scores = self.bayesian_engine.calculate_spoofing_risk_batch(
+            processed_list
+        )
+
+        for (i, processed_data), insider_dealing_score, spoofing_score in zip(
+            processed_batch, insider_dealing_scores, spoofing_scores
+        ):
+            try:
+                # Generate analysis ID for real-time
+                analysis_id = f"rt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
 
-            # Calculate processing time
-            processing_time_ms = (time.time() - start_time) * 1000
+                # Skip overall risk calculation for speed
+                risk_scores = {
+                    "insider_dealing": insider_dealing_score,
+                    "spoofing": spoofing_score,
+                }
 
-            # Create minimal result for real-time response
-            result = AnalysisResult(
-                analysis_id=analysis_id,
-                timestamp=datetime.utcnow().isoformat(),
-                processed_data=processed_data,
-                risk_scores=risk_scores,
-                alerts=alerts,
-                processing_time_ms=processing_time_ms,
-            )
+                # Generate only high-priority alerts
+                alerts = self.alert_service.generate_realtime_alerts(
+                    processed_data, insider_dealing_score, spoofing_score
+                )
 
-            return result
+                # Calculate processing time
+                processing_time_ms = (time.time() - start_time) * 1000
+
+                # Create minimal result for real-time response
+                results[i] = AnalysisResult(
+                    analysis_id=analysis_id,
+                    timestamp=datetime.utcnow().isoformat(),
+                    processed_data=processed_data,
+                    risk_scores=risk_scores,
+                    alerts=alerts,
+                    processing_time_ms=processing_time_ms,
+                    metadata={"batch_size": len(batch_data)},
+                )
 
-        except Exception as e:
-            logger.error(f"Error in analyze_realtime_data: {str(e)}")
-            raise
+            except Exception as e:
+                logger.error(f"Error in analyze_realtime_data: {str(e)}")
+                results[i] = e
+
+        return results
 
     def get_analysis_status(self, analysis_id: str) -> Dict[str, Any]:
         """
         Get the status of a specific analysis.
 
         Args:
-            analysis_id: ID of the analysis to check
+            analysis_id: ID of the analysis job to check
 
         Returns:
-            Status information for the analysis
+            Status and progress information for the analysis
         """
-        # This would typically query a database or cache
-        # For now, return a placeholder implementation
+        job = self.job_manager.get_status(analysis_id)
+        if job is None:
+            return {
+                "analysis_id": analysis_id,
+                "status": "not_found",
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
         return {
             "analysis_id": analysis_id,
-            "status": "completed",
+            "status": job["status"],
+            "progress": job["progress"],
+            "total_items": job["total_items"],
+            "completed_items": job["completed_items"],
+            "failed_items": job["failed_items"],
+            "created_at": job["created_at"],
+            "started_at": job["started_at"],
+            "finished_at": job["finished_at"],
+            "error": job["error"],
             "timestamp": datetime.utcnow().isoformat(),
         }
 
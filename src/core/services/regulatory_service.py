@@ -5,8 +5,10 @@ This service handles the generation of regulatory explanations and rationales
 for market abuse detection alerts to support compliance and regulatory reporting.
 """
 
+import bisect
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from ...utils.logger import setup_logger
@@ -14,6 +16,100 @@ from ..regulatory_explainability import generate_regulatory_rationale
 
 logger = setup_logger()
 
+# Static narrative fragments. Rationales only depend on these through the
+# alert type, the regulatory risk level and a couple of score thresholds,
+# so each combination is assembled once (see _compliance_template and
+# _risk_assessment_template) and only copied per alert.
+
+# Alert type -> (compliance actions, regulatory thresholds, reporting requirements)
+_COMPLIANCE_BY_TYPE = {
+    "INSIDER_DEALING": (
+        (
+            "Review trader access to material information",
+            "Investigate trading timing relative to information events",
+            "Document investigation findings",
+            "Consider STOR reporting if threshold exceeded",
+        ),
+        (("stor_threshold", 0.7),),
+        ("STOR (if applicable)",),
+    ),
+    "SPOOFING": (
+        (
+            "Analyze order placement and cancellation patterns",
+            "Review trader intent and market impact",
+            "Document market manipulation evidence",
+            "Consider regulatory notification",
+        ),
+        (("manipulation_threshold", 0.6),),
+        ("Market Surveillance Report",),
+    ),
+}
+_ESCALATION_ACTIONS = (
+    "Escalate to senior compliance officer",
+    "Consider immediate trading restrictions",
+)
+
+# Minimum overall score -> (regulatory risk level, priority)
+_RISK_LEVELS = (
+    (0.9, "CRITICAL", "IMMEDIATE"),
+    (0.7, "HIGH", "URGENT"),
+    (0.5, "MEDIUM", "STANDARD"),
+)
+_DEFAULT_RISK_LEVEL = ("LOW", "MONITORING")
+
+# (alert type, consequence tier) -> potential consequences; tier 2 is a
+# score of at least 0.8, tier 1 at least 0.6
+_CONSEQUENCES = {
+    ("INSIDER_DEALING", 2): (
+        "Potential FCA investigation",
+        "Criminal prosecution risk",
+        "Significant financial penalties",
+        "Reputational damage",
+    ),
+    ("INSIDER_DEALING", 1): (
+        "Regulatory scrutiny",
+        "Enhanced monitoring requirements",
+        "Potential administrative action",
+    ),
+    ("SPOOFING", 2): (
+        "Market manipulation charges",
+        "Trading ban possibility",
+        "Civil monetary penalties",
+        "Disgorgement of profits",
+    ),
+    ("SPOOFING", 1): ("Warning letter", "Enhanced surveillance", "Trading restrictions"),
+}
+
+_RECOMMENDED_ACTIONS = {
+    "CRITICAL": (
+        "Immediate escalation to Chief Compliance Officer",
+        "Consider trading suspension",
+        "Prepare regulatory notification",
+        "Engage external legal counsel",
+        "Document all evidence",
+    ),
+    "HIGH": (
+        "Escalate to senior compliance team",
+        "Enhanced monitoring of trader",
+        "Detailed investigation",
+        "Prepare preliminary report",
+    ),
+    "MEDIUM": (
+        "Standard investigation procedures",
+        "Monitor for pattern development",
+        "Document findings",
+    ),
+    "LOW": ("Continue routine monitoring", "Log for trend analysis"),
+}
+
+_RESPONSE_TIMELINES = {
+    "CRITICAL": "Immediate (within 1 hour)",
+    "HIGH": "Urgent (within 4 hours)",
+    "MEDIUM": "Standard (within 24 hours)",
+    "LOW": "Routine (within 1 week)",
+}
+_DEFAULT_RESPONSE_TIMELINE = "Standard (within 24 hours)"
+
 
 class RegulatoryService:
     """
@@ -45,7 +141,10 @@ class RegulatoryService:
         processed_data: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
         """
-        Generate regulatory rationales for a list of alerts.
+        Generate regulatory rationales for a list of alerts in one pass.
+
+        Risk scores are resolved once per alert type and all rationales in
+        the batch share a generation timestamp.
 
         Args:
             alerts: List of generated alerts
@@ -56,22 +155,21 @@ class RegulatoryService:
             List of regulatory rationales for each alert
         """
         rationales = []
+        timestamp = datetime.utcnow().isoformat()
+        scores_by_type: Dict[str, Dict[str, Any]] = {}
 
         for alert in alerts:
             try:
                 # Determine which risk scores to use based on alert type
-                if alert["type"] == "INSIDER_DEALING":
-                    alert_risk_scores = risk_scores.get("insider_dealing", {})
-                elif alert["type"] == "SPOOFING":
-                    alert_risk_scores = risk_scores.get("spoofing", {})
-                else:
-                    alert_risk_scores = {
-                        "overall_score": risk_scores.get("overall_risk", 0)
-                    }
+                alert_type = alert["type"]
+                alert_risk_scores = scores_by_type.get(alert_type)
+                if alert_risk_scores is None:
+                    alert_risk_scores = self._alert_risk_scores(alert_type, risk_scores)
+                    scores_by_type[alert_type] = alert_risk_scores
 
                 # Generate rationale for this alert
                 rationale = self.generate_single_rationale(
-                    alert, alert_risk_scores, processed_data
+                    alert, alert_risk_scores, processed_data, timestamp=timestamp
                 )
 
                 if rationale:
@@ -86,11 +184,21 @@ class RegulatoryService:
 
         return rationales
 
+    @staticmethod
+    def _alert_risk_scores(alert_type: str, risk_scores: Dict[str, Any]) -> Dict[str, Any]:
+        """Select the risk scores relevant to an alert type"""
+        if alert_type == "INSIDER_DEALING":
+            return risk_scores.get("insider_dealing", {})
+        if alert_type == "SPOOFING":
+            return risk_scores.get("spoofing", {})
+        return {"overall_score": risk_scores.get("overall_risk", 0)}
+
     def generate_single_rationale(
         self,
         alert: Dict[str, Any],
         risk_scores: Dict[str, Any],
         processed_data: Dict[str, Any],
+        timestamp: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Generate a regulatory rationale for a single alert.
@@ -99,6 +207,7 @@ class RegulatoryService:
             alert: Alert to generate rationale for
             risk_scores: Risk scores for the alert
             processed_data: Processed trading data
+            timestamp: Generation timestamp (defaults to now)
 
         Returns:
             Regulatory rationale dictionary or None if generation fails
@@ -112,7 +221,7 @@ class RegulatoryService:
             # Format the rationale for API response
             formatted_rationale = {
                 "alert_id": alert.get("id"),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp or datetime.utcnow().isoformat(),
                 "deterministic_narrative": rationale.deterministic_narrative,
                 "inference_paths": [
                     {
@@ -155,48 +264,12 @@ class RegulatoryService:
         Returns:
             Compliance notes dictionary
         """
-        notes = {
-            "alert_type": alert.get("type"),
-            "risk_level": alert.get("severity"),
-            "compliance_actions": [],
-            "regulatory_thresholds": {},
-            "reporting_requirements": [],
-        }
-
-        # Add specific compliance actions based on alert type
-        if alert.get("type") == "INSIDER_DEALING":
-            notes["compliance_actions"].extend(
-                [
-                    "Review trader access to material information",
-                    "Investigate trading timing relative to information events",
-                    "Document investigation findings",
-                    "Consider STOR reporting if threshold exceeded",
-                ]
-            )
-            notes["regulatory_thresholds"]["stor_threshold"] = 0.7
-            notes["reporting_requirements"].append("STOR (if applicable)")
-
-        elif alert.get("type") == "SPOOFING":
-            notes["compliance_actions"].extend(
-                [
-                    "Analyze order placement and cancellation patterns",
-                    "Review trader intent and market impact",
-                    "Document market manipulation evidence",
-                    "Consider regulatory notification",
-                ]
-            )
-            notes["regulatory_thresholds"]["manipulation_threshold"] = 0.6
-            notes["reporting_requirements"].append("Market Surveillance Report")
-
-        # Add general compliance considerations
-        risk_score = risk_scores.get("overall_score", 0)
-        if risk_score >= 0.8:
-            notes["compliance_actions"].append("Escalate to senior compliance officer")
-            notes["compliance_actions"].append(
-                "Consider immediate trading restrictions"
-            )
-
-        return notes
+        notes = _compliance_template(
+            alert.get("type"),
+            alert.get("severity"),
+            risk_scores.get("overall_score", 0) >= 0.8,
+        )
+        return _copy_fragment(notes)
 
     def _assess_regulatory_risk(
         self, alert: Dict[str, Any], risk_scores: Dict[str, Any]
@@ -212,114 +285,17 @@ class RegulatoryService:
             Regulatory risk assessment
         """
         overall_score = risk_scores.get("overall_score", 0)
-        alert_type = alert.get("type")
-
-        # Determine regulatory risk level
-        if overall_score >= 0.9:
-            risk_level = "CRITICAL"
-            regulatory_priority = "IMMEDIATE"
-        elif overall_score >= 0.7:
-            risk_level = "HIGH"
-            regulatory_priority = "URGENT"
-        elif overall_score >= 0.5:
-            risk_level = "MEDIUM"
-            regulatory_priority = "STANDARD"
-        else:
-            risk_level = "LOW"
-            regulatory_priority = "MONITORING"
-
-        # Determine potential regulatory consequences
-        consequences = []
-        if alert_type == "INSIDER_DEALING":
-            if overall_score >= 0.8:
-                consequences.extend(
-                    [
-                        "Potential FCA investigation",
-                        "Criminal prosecution risk",
-                        "Significant financial penalties",
-                        "Reputational damage",
-                    ]
-                )
-            elif overall_score >= 0.6:
-                consequences.extend(
-                    [
-                        "Regulatory scrutiny",
-                        "Enhanced monitoring requirements",
-                        "Potential administrative action",
-                    ]
-                )
-
-        elif alert_type == "SPOOFING":
-            if overall_score >= 0.8:
-                consequences.extend(
-                    [
-                        "Market manipulation charges",
-                        "Trading ban possibility",
-                        "Civil monetary penalties",
-                        "Disgorgement of profits",
-                    ]
-                )
-            elif overall_score >= 0.6:
-                consequences.extend(
-                    ["Warning letter", "Enhanced surveillance", "Trading restrictions"]
-                )
-
-        return {
-            "regulatory_risk_level": risk_level,
-            "priority": regulatory_priority,
-            "potential_consequences": consequences,
-            "recommended_actions": self._get_recommended_actions(
-                risk_level, alert_type
-            ),
-            "timeline": self._get_response_timeline(risk_level),
-        }
+        return _copy_fragment(
+            _risk_assessment_template(alert.get("type"), _score_band(overall_score))
+        )
 
     def _get_recommended_actions(self, risk_level: str, alert_type: str) -> List[str]:
         """Get recommended actions based on risk level and alert type."""
-        actions = []
-
-        if risk_level == "CRITICAL":
-            actions.extend(
-                [
-                    "Immediate escalation to Chief Compliance Officer",
-                    "Consider trading suspension",
-                    "Prepare regulatory notification",
-                    "Engage external legal counsel",
-                    "Document all evidence",
-                ]
-            )
-        elif risk_level == "HIGH":
-            actions.extend(
-                [
-                    "Escalate to senior compliance team",
-                    "Enhanced monitoring of trader",
-                    "Detailed investigation",
-                    "Prepare preliminary report",
-                ]
-            )
-        elif risk_level == "MEDIUM":
-            actions.extend(
-                [
-                    "Standard investigation procedures",
-                    "Monitor for pattern development",
-                    "Document findings",
-                ]
-            )
-        else:  # LOW
-            actions.extend(["Continue routine monitoring", "Log for trend analysis"])
-
-        return actions
+        return list(_RECOMMENDED_ACTIONS.get(risk_level, _RECOMMENDED_ACTIONS["LOW"]))
 
     def _get_response_timeline(self, risk_level: str) -> str:
         """Get recommended response timeline based on risk level."""
-        timelines = {
-            "CRITICAL": "Immediate (within 1 hour)",
-            "HIGH": "Urgent (within 4 hours)",
-            "MEDIUM": "Standard (within 24 hours)",
-            "LOW": "Routine (within 1 week)",
-        }
-
-        return timelines.get(risk_level, "Standard (within 24 hours)")
+        return _RESPONSE_TIMELINES.get(risk_level, _DEFAULT_RESPONSE_TIMELINE)
 
     def generate_stor_report(
         self,
@@ -348,3 +324,68 @@ class RegulatoryService:
             "regulatory_framework": "MAR",
             "status": "DRAFT",
         }
+
+
+# Score thresholds at which the regulatory risk assessment changes
+_SCORE_BANDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+
+
+def _score_band(overall_score: float) -> int:
+    """Number of score thresholds reached"""
+    return bisect.bisect_right(_SCORE_BANDS, overall_score)
+
+
+def _copy_fragment(fragment: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a memoised fragment for one alert. The memoised sequences are
+    tuples so they cannot be changed through a shared fragment; each copy
+    gets its own lists and mappings, as when the fragment was built per alert.
+    """
+    copy = {}
+    for key, value in fragment.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        copy[key] = value
+    return copy
+
+
+@lru_cache(maxsize=256)
+def _compliance_template(
+    alert_type: Optional[str], severity: Optional[str], escalate: bool
+) -> Dict[str, Any]:
+    """Compliance notes for an alert type, severity and escalation state"""
+    actions, thresholds, requirements = _COMPLIANCE_BY_TYPE.get(alert_type, ((), (), ()))
+    if escalate:
+        actions = actions + _ESCALATION_ACTIONS
+    return {
+        "alert_type": alert_type,
+        "risk_level": severity,
+        "compliance_actions": actions,
+        "regulatory_thresholds": dict(thresholds),
+        "reporting_requirements": requirements,
+    }
+
+
+@lru_cache(maxsize=256)
+def _risk_assessment_template(alert_type: Optional[str], band: int) -> Dict[str, Any]:
+    """Regulatory risk assessment for an alert type and score band"""
+    # Representative score for the band: the threshold it starts at
+    score = _SCORE_BANDS[band - 1] if band else 0.0
+    risk_level, priority = next(
+        (
+            (risk_level, priority)
+            for minimum, risk_level, priority in _RISK_LEVELS
+            if score >= minimum
+        ),
+        _DEFAULT_RISK_LEVEL,
+    )
+    consequence_tier = 2 if score >= 0.8 else 1 if score >= 0.6 else 0
+    return {
+        "regulatory_risk_level": risk_level,
+        "priority": priority,
+        "potential_consequences": _CONSEQUENCES.get((alert_type, consequence_tier), ()),
+        "recommended_actions": _RECOMMENDED_ACTIONS.get(risk_level, _RECOMMENDED_ACTIONS["LOW"]),
+        "timeline": _RESPONSE_TIMELINES.get(risk_level, _DEFAULT_RESPONSE_TIMELINE),
+    }
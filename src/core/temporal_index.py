@@ -0,0 +1,269 @@
+"""
+Temporal Indexing Primitives
+
+Helpers for comparing trade timestamps across accounts without pairwise
+scans. Timestamps are converted once to sorted epoch arrays, and pairs of
+trades within a time window are counted with a two-pointer sweep.
+
+Features:
+- ISO timestamp parsing matching the aggregator's tolerance
+- Sorted epoch arrays per trade list
+- Linear-time counting of cross-list pairs within a window
+- Per-account-pair window counts from one sweep over all accounts
+- Time-bucket hashing of trades for synchronized activity detection
+- Sorted per-person record indexes answering lookback windows by bisection
+"""
+
+import math
+from bisect import bisect_left
+from collections import abc, defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional,
+    Sequence, Tuple, TypeVar, Union
+)
+
+from src.models.trading_data import RawTradeData
+
+Number = Union[int, float]
+Record = TypeVar("Record")
+
+UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NAIVE_EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+# Trades this close together are treated as synchronized
+SYNC_WINDOW_SECONDS = 300
+
+
+def parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp, accepting a trailing Z; None if unreadable"""
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+
+def parse_record_time(value: Any) -> Optional[datetime]:
+    """Parse a record timestamp as UTC, or None when it cannot be read"""
+    if isinstance(value, datetime):
+        timestamp = value
+    elif isinstance(value, str):
+        try:
+            timestamp = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+def epoch_microseconds(timestamp: datetime) -> int:
+    """Microseconds since the epoch; naive times are measured from a naive epoch"""
+    if timestamp.tzinfo is None:
+        return (timestamp - NAIVE_EPOCH) // MICROSECOND
+    return (timestamp - UTC_EPOCH) // MICROSECOND
+
+
+def epoch_minutes(timestamp: Optional[str]) -> float:
+    """Minutes since the epoch, with unreadable timestamps at zero"""
+    parsed = parse_timestamp(timestamp)
+    return parsed.timestamp() / 60 if parsed is not None else 0
+
+
+def sorted_epoch_minutes(trades: Iterable[RawTradeData]) -> List[float]:
+    """Execution times of trades in epoch minutes, ascending"""
+    return sorted(epoch_minutes(trade.execution_timestamp) for trade in trades)
+
+
+class EpochArrays(NamedTuple):
+    """
+    Sorted execution times in microseconds since the epoch
+
+    Timezone-aware and naive timestamps cannot be compared with each other,
+    so they are kept apart; unreadable timestamps are left out.
+    """
+    aware: List[int]
+    naive: List[int]
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[RawTradeData]) -> "EpochArrays":
+        aware, naive = [], []
+        for trade in trades:
+            parsed = parse_timestamp(trade.execution_timestamp)
+            if parsed is None:
+                continue
+            (naive if parsed.tzinfo is None else aware).append(epoch_microseconds(parsed))
+        aware.sort()
+        naive.sort()
+        return cls(aware, naive)
+
+
+def count_pairs_within(times1: Sequence[Number], times2: Sequence[Number], window: Number) -> int:
+    """
+    Count pairs (t1, t2) with abs(t1 - t2) <= window
+
+    Both sequences must be sorted ascending. Each t1 has its matches in a
+    contiguous run of times2 whose bounds only move forward, so the sweep
+    is O(len(times1) + len(times2)).
+    """
+    count = 0
+    low = high = 0
+    size = len(times2)
+    for t1 in times1:
+        while low < size and t1 - times2[low] > window:
+            low += 1
+        if high < low:
+            high = low
+        while high < size and times2[high] - t1 <= window:
+            high += 1
+        count += high - low
+    return count
+
+
+def count_synchronized_pairs(
+    epochs1: EpochArrays,
+    epochs2: EpochArrays,
+    window_seconds: int = SYNC_WINDOW_SECONDS
+) -> int:
+    """Count comparable cross-list trade pairs executed within the window"""
+    window = window_seconds * 1_000_000
+    return (
+        count_pairs_within(epochs1.aware, epochs2.aware, window) +
+        count_pairs_within(epochs1.naive, epochs2.naive, window)
+    )
+
+
+def pair_counts_within(
+    times_by_key: Mapping[Hashable, Sequence[Number]],
+    window: Number
+) -> Dict[Tuple[Hashable, Hashable], int]:
+    """
+    Count, for every two keys, the pairs of their times within the window
+
+    Generalises count_pairs_within to any number of keys with one sweep over
+    the merged times: each time is paired with the per-key counts of the
+    times still inside the window behind it. Pairs are keyed in mapping
+    order, (earlier key, later key); keys with no close times are absent.
+    """
+    keys = list(times_by_key)
+    events = sorted(
+        (time, index) for index, key in enumerate(keys) for time in times_by_key[key]
+    )
+    in_window = deque()
+    window_counts: Dict[int, int] = {}
+    counts: Dict[Tuple[int, int], int] = defaultdict(int)
+    for time, index in events:
+        while in_window and time - in_window[0][0] > window:
+            expired = in_window.popleft()[1]
+            window_counts[expired] -= 1
+            if not window_counts[expired]:
+                del window_counts[expired]
+        for other, count in window_counts.items():
+            if other != index:
+                counts[(other, index) if other < index else (index, other)] += count
+        in_window.append((time, index))
+        window_counts[index] = window_counts.get(index, 0) + 1
+    return {(keys[i], keys[j]): count for (i, j), count in counts.items()}
+
+
+def synchronized_pair_counts(
+    epochs_by_key: Mapping[Hashable, EpochArrays],
+    window_seconds: int = SYNC_WINDOW_SECONDS
+) -> Dict[Tuple[Hashable, Hashable], int]:
+    """Per key pair, count comparable trade pairs executed within the window"""
+    window = window_seconds * 1_000_000
+    counts = pair_counts_within({key: epochs.aware for key, epochs in epochs_by_key.items()}, window)
+    for pair, count in pair_counts_within(
+        {key: epochs.naive for key, epochs in epochs_by_key.items()}, window
+    ).items():
+        counts[pair] = counts.get(pair, 0) + count
+    return counts
+
+
+def synchronized_trade_pairs(
+    trades: Iterable[RawTradeData],
+    window_seconds: int = SYNC_WINDOW_SECONDS,
+    bucket_seconds: Optional[int] = None
+) -> Iterator[Tuple[RawTradeData, RawTradeData]]:
+    """
+    Yield pairs of trades from different accounts, in the same instrument and
+    direction, executed within the window of each other
+
+    Trades are hashed by (instrument, side, time bucket) in a single pass;
+    each trade probes its own and neighbouring buckets for earlier trades,
+    so callers checking a threshold can stop as soon as it is reached.
+    Unreadable timestamps are skipped and naive and aware times never pair.
+    """
+    window = window_seconds * 1_000_000
+    width = (bucket_seconds or window_seconds) * 1_000_000
+    reach = -(-window // width)
+    buckets: Dict[Tuple[Hashable, ...], List[Tuple[int, RawTradeData]]] = defaultdict(list)
+    for trade in trades:
+        parsed = parse_timestamp(trade.execution_timestamp)
+        if parsed is None:
+            continue
+        epoch = epoch_microseconds(parsed)
+        group = (parsed.tzinfo is not None, trade.symbol, trade.direction)
+        bucket = epoch // width
+        for neighbour in range(bucket - reach, bucket + reach + 1):
+            for other_epoch, other in buckets.get(group + (neighbour,), ()):
+                if other.trader_id != trade.trader_id and abs(epoch - other_epoch) <= window:
+                    yield other, trade
+        buckets[group + (bucket,)].append((epoch, trade))
+
+
+class RecordWindow(abc.Sequence, Generic[Record]):
+    """Read-only view of a contiguous run of records, sharing the backing list"""
+
+    __slots__ = ("_records", "_start", "_stop")
+
+    def __init__(self, records: List[Record], start: int = 0, stop: Optional[int] = None):
+        self._records = records
+        self._start = start
+        self._stop = len(records) if stop is None else stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, item):
+        positions = range(self._start, self._stop)[item]
+        if isinstance(item, slice):
+            return [self._records[position] for position in positions]
+        return self._records[positions]
+
+    def __iter__(self) -> Iterator[Record]:
+        return map(self._records.__getitem__, range(self._start, self._stop))
+
+    def __repr__(self) -> str:
+        return f"RecordWindow({list(self)!r})"
+
+
+class RecordTimeIndex(Generic[Record]):
+    """
+    Records sorted by timestamp for lookback queries by binary search
+
+    Timestamps are parsed once, naive ones read as UTC. Records whose
+    timestamp cannot be read sort after every dated record, so each lookback
+    window keeps them, as the evidence filters always have. Records with
+    equal timestamps keep their input order.
+    """
+
+    def __init__(self, records: Iterable[Record], timestamp_of: Callable[[Record], Any]):
+        keyed = []
+        for record in records:
+            parsed = parse_record_time(timestamp_of(record))
+            keyed.append((math.inf if parsed is None else epoch_microseconds(parsed), record))
+        keyed.sort(key=lambda entry: entry[0])
+        self.epochs: List[Number] = [epoch for epoch, _ in keyed]
+        self.records: List[Record] = [record for _, record in keyed]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def since(self, cutoff: datetime) -> RecordWindow[Record]:
+        """Records at or after the cutoff, plus undated ones, without copying"""
+        start = bisect_left(self.epochs, epoch_microseconds(parse_record_time(cutoff)))
+        return RecordWindow(self.records, start)
@@ -6,32 +6,105 @@ capabilities for analyst investigations of market abuse alerts.
 """
 
 import logging
+import os
 from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from pathlib import Path
 
 import numpy as np
 
 from models.trading_data import (
+    ColumnarRecordBuffer,
     OrderStatus,
     RawOrderData,
     RawTradeData,
     TradeDirection,
     TradingDataSummary,
 )
+from core.raw_data_index import (
+    ORDER_INDEX_FIELDS,
+    TRADE_INDEX_FIELDS,
+    RawDataIndex,
+    SearchPosition,
+)
+from utils.bounded_cache import BoundedCache
+from utils.config import config
 
 logger = logging.getLogger(__name__)
 
+# Relative spill directories are resolved against the project root, not the
+# working directory of whichever process starts the service
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 class TradingDataService:
     """
     Service for extracting and aggregating raw trading data for analyst investigations
     """
 
-    def __init__(self):
-        self.raw_trades_cache = {}
-        self.raw_orders_cache = {}
-        self.data_summaries = {}
+    def __init__(self, cache_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the service and its raw data caches.
+
+        Args:
+            cache_config: Cache settings; defaults to performance.raw_data_cache
+        """
+        cache_config = cache_config or config.get("performance.raw_data_cache", {})
+        spill_dir = cache_config.get("spill_dir")
+        if spill_dir:
+            spill_dir = str(PROJECT_ROOT / spill_dir)
+
+        def make_cache(name: str, index: RawDataIndex) -> BoundedCache:
+            # Spill files are private to this process: the indexes only
+            # track entries this process cached, so a shared file would let
+            # other workers remove entries behind their back
+            spill_path = (
+                os.path.join(spill_dir, f"{name}.{os.getpid()}.db") if spill_dir else None
+            )
+            return BoundedCache(
+                max_entries=cache_config.get("max_entries", 1000),
+                max_bytes=cache_config.get("max_bytes"),
+                ttl_seconds=cache_config.get("ttl_seconds"),
+                spill_path=spill_path,
+                name=name,
+                on_remove=index.remove,
+            )
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+        # Search indexes are kept in step with the caches they cover
+        self.trade_index = RawDataIndex(
+            TRADE_INDEX_FIELDS, "execution_timestamp", price_field="executed_price"
+        )
+        self.order_index = RawDataIndex(ORDER_INDEX_FIELDS, "order_timestamp")
+        self.raw_trades_cache = make_cache("raw_trades", self.trade_index)
+        self.raw_orders_cache = make_cache("raw_orders", self.order_index)
+        self.data_summaries = BoundedCache(
+            max_entries=cache_config.get("max_entries", 1000),
+            ttl_seconds=cache_config.get("ttl_seconds"),
+            name="data_summaries",
+        )
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get memory usage and eviction statistics of the raw data caches
+
+        Returns:
+            Statistics keyed by cache name
+        """
+        return {
+            "raw_trades": self.raw_trades_cache.get_stats(),
+            "raw_orders": self.raw_orders_cache.get_stats(),
+            "data_summaries": self.data_summaries.get_stats(),
+        }
+
+    def close(self) -> None:
+        """Release the raw data caches and delete this process's spill files"""
+        self.raw_trades_cache.close()
+        self.raw_orders_cache.close()
 
     def extract_raw_trades_for_alert(
         self, alert_id: str, processed_data: Dict[str, Any]
@@ -47,71 +120,94 @@ class TradingDataService:
             List of comprehensive raw trade data
         """
         try:
-            raw_trades = []
             trades = processed_data.get("trades", [])
             trader_info = processed_data.get("trader_info", {})
             market_data = processed_data.get("market_data", {})
 
-            for trade in trades:
-                # Calculate additional metrics
-                notional = trade.get(
-                    "value", trade.get("volume", 0) * trade.get("price", 0)
+            # Per-trade values are gathered column-wise and the records built
+            # in bulk; trader and market context is shared by every trade
+            columns = {
+                name: []
+                for name in (
+                    "trade_id",
+                    "execution_timestamp",
+                    "instrument",
+                    "instrument_type",
+                    "symbol",
+                    "exchange",
+                    "direction",
+                    "quantity",
+                    "executed_price",
+                    "notional_value",
+                    "trader_id",
+                    "order_id",
+                    "market_session",
+                    "reference_price",
+                    "price_deviation",
                 )
+            }
+            for trade in trades:
+                instrument = trade.get("instrument", "")
+                price = trade.get("price", 0)
 
-                # Determine market session
-                market_session = self._determine_market_session(trade.get("timestamp"))
+                # Calculate additional metrics
+                notional = trade.get("value", trade.get("volume", 0) * price)
 
                 # Calculate price deviation from reference
-                reference_price = market_data.get(
-                    "reference_price", trade.get("price", 0)
-                )
-                price_deviation = self._calculate_price_deviation(
-                    trade.get("price", 0), reference_price
-                )
+                reference_price = market_data.get("reference_price", price)
 
-                # Create comprehensive trade data
-                raw_trade = RawTradeData(
-                    trade_id=trade.get(
+                columns["trade_id"].append(
+                    trade.get(
                         "id", f"trade_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
-                    ),
-                    execution_timestamp=trade.get(
-                        "timestamp", datetime.utcnow().isoformat()
-                    ),
-                    instrument=trade.get("instrument", "UNKNOWN"),
-                    instrument_type=self._determine_instrument_type(
-                        trade.get("instrument", "")
-                    ),
-                    symbol=trade.get("instrument", "UNKNOWN"),
-                    exchange=self._determine_exchange(trade.get("instrument", "")),
-                    direction=TradeDirection(trade.get("side", "unknown")),
-                    quantity=float(trade.get("volume", 0)),
-                    executed_price=float(trade.get("price", 0)),
-                    notional_value=float(notional),
-                    trader_id=trade.get("trader_id", trader_info.get("id", "unknown")),
-                    # Optional fields with enhanced data
-                    order_id=trade.get("order_id"),
-                    trader_name=trader_info.get("name"),
-                    trader_role=trader_info.get("role"),
-                    desk=trader_info.get("department"),
-                    book=trader_info.get("book"),
-                    market_session=market_session,
-                    bid_price=market_data.get("bid_price"),
-                    ask_price=market_data.get("ask_price"),
-                    mid_price=market_data.get("mid_price"),
-                    spread=self._calculate_spread(
-                        market_data.get("bid_price"), market_data.get("ask_price")
-                    ),
-                    market_volume=market_data.get("volume"),
-                    reference_price=reference_price,
-                    price_deviation=price_deviation,
-                    alert_ids=[alert_id],
-                    data_source="surveillance_platform",
+                    )
+                )
+                columns["execution_timestamp"].append(
+                    trade.get("timestamp", datetime.utcnow().isoformat())
+                )
+                columns["instrument"].append(trade.get("instrument", "UNKNOWN"))
+                columns["instrument_type"].append(
+                    self._determine_instrument_type(instrument)
+                )
+                columns["symbol"].append(trade.get("instrument", "UNKNOWN"))
+                columns["exchange"].append(self._determine_exchange(instrument))
+                columns["direction"].append(trade.get("side", "unknown"))
+                columns["quantity"].append(float(trade.get("volume", 0)))
+                columns["executed_price"].append(float(price))
+                columns["notional_value"].append(float(notional))
+                columns["trader_id"].append(
+                    trade.get("trader_id", trader_info.get("id", "unknown"))
+                )
+                columns["order_id"].append(trade.get("order_id"))
+                columns["market_session"].append(
+                    self._determine_market_session(trade.get("timestamp"))
+                )
+                columns["reference_price"].append(reference_price)
+                columns["price_deviation"].append(
+                    self._calculate_price_deviation(price, reference_price)
                 )
 
-                raw_trades.append(raw_trade)
+            raw_trades = RawTradeData.from_arrays(
+                columns,
+                trader_name=trader_info.get("name"),
+                trader_role=trader_info.get("role"),
+                desk=trader_info.get("department"),
+                book=trader_info.get("book"),
+                bid_price=market_data.get("bid_price"),
+                ask_price=market_data.get("ask_price"),
+                mid_price=market_data.get("mid_price"),
+                spread=self._calculate_spread(
+                    market_data.get("bid_price"), market_data.get("ask_price")
+                ),
+                market_volume=market_data.get("volume"),
+                alert_ids=[alert_id],
+                data_source="surveillance_platform",
+            )
 
-            # Cache the results
-            self.raw_trades_cache[alert_id] = raw_trades
+            # Cache compactly and index the results
+            self.raw_trades_cache[alert_id] = ColumnarRecordBuffer.from_records(
+                raw_trades, RawTradeData
+            )
+            self.trade_index.add(alert_id, raw_trades)
 
             logger.info(f"Extracted {len(raw_trades)} raw trades for alert {alert_id}")
             return raw_trades
@@ -134,69 +230,103 @@ class TradingDataService:
             List of comprehensive raw order data
         """
         try:
-            raw_orders = []
             orders = processed_data.get("orders", [])
             trader_info = processed_data.get("trader_info", {})
             market_data = processed_data.get("market_data", {})
 
+            # Per-order values are gathered column-wise and the records built
+            # in bulk; trader and market context is shared by every order
+            columns = {
+                name: []
+                for name in (
+                    "order_id",
+                    "order_timestamp",
+                    "status",
+                    "instrument",
+                    "instrument_type",
+                    "symbol",
+                    "exchange",
+                    "side",
+                    "order_type",
+                    "quantity",
+                    "filled_quantity",
+                    "remaining_quantity",
+                    "trader_id",
+                    "client_order_id",
+                    "last_update_timestamp",
+                    "order_price",
+                    "avg_fill_price",
+                    "limit_price",
+                    "stop_price",
+                    "time_in_force",
+                    "cancellation_timestamp",
+                    "cancellation_reason",
+                    "strategy",
+                    "notional_value",
+                    "risk_indicators",
+                )
+            }
             for order in orders:
+                instrument = order.get("instrument", "")
+
                 # Calculate filled and remaining quantities
                 filled_qty = float(order.get("filled_quantity", 0))
                 total_qty = float(order.get("size", 0))
-                remaining_qty = max(0, total_qty - filled_qty)
 
-                # Determine order status
-                status = OrderStatus(order.get("status", "unknown"))
-
-                # Calculate notional value
-                notional = total_qty * order.get("price", 0)
-
-                # Create comprehensive order data
-                raw_order = RawOrderData(
-                    order_id=order.get(
+                columns["order_id"].append(
+                    order.get(
                         "id", f"order_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
-                    ),
-                    order_timestamp=order.get(
-                        "timestamp", datetime.utcnow().isoformat()
-                    ),
-                    status=status,
-                    instrument=order.get("instrument", "UNKNOWN"),
-                    instrument_type=self._determine_instrument_type(
-                        order.get("instrument", "")
-                    ),
-                    symbol=order.get("instrument", "UNKNOWN"),
-                    exchange=self._determine_exchange(order.get("instrument", "")),
-                    side=TradeDirection(order.get("side", "unknown")),
-                    order_type=self._determine_order_type(order),
-                    quantity=total_qty,
-                    filled_quantity=filled_qty,
-                    remaining_quantity=remaining_qty,
-                    trader_id=order.get("trader_id", trader_info.get("id", "unknown")),
-                    # Optional fields
-                    client_order_id=order.get("client_order_id"),
-                    last_update_timestamp=order.get("last_update"),
-                    order_price=order.get("price"),
-                    avg_fill_price=order.get("avg_fill_price"),
-                    limit_price=order.get("limit_price"),
-                    stop_price=order.get("stop_price"),
-                    time_in_force=order.get("time_in_force", "DAY"),
-                    cancellation_timestamp=order.get("cancellation_time"),
-                    cancellation_reason=order.get("cancellation_reason"),
-                    bid_at_order=market_data.get("bid_price"),
-                    ask_at_order=market_data.get("ask_price"),
-                    mid_at_order=market_data.get("mid_price"),
-                    trader_name=trader_info.get("name"),
-                    strategy=order.get("strategy"),
-                    notional_value=notional,
-                    alert_ids=[alert_id],
-                    risk_indicators=self._identify_order_risk_indicators(order),
-                    data_source="surveillance_platform",
+                    )
+                )
+                columns["order_timestamp"].append(
+                    order.get("timestamp", datetime.utcnow().isoformat())
+                )
+                columns["status"].append(order.get("status", "unknown"))
+                columns["instrument"].append(order.get("instrument", "UNKNOWN"))
+                columns["instrument_type"].append(
+                    self._determine_instrument_type(instrument)
+                )
+                columns["symbol"].append(order.get("instrument", "UNKNOWN"))
+                columns["exchange"].append(self._determine_exchange(instrument))
+                columns["side"].append(order.get("side", "unknown"))
+                columns["order_type"].append(self._determine_order_type(order))
+                columns["quantity"].append(total_qty)
+                columns["filled_quantity"].append(filled_qty)
+                columns["remaining_quantity"].append(max(0, total_qty - filled_qty))
+                columns["trader_id"].append(
+                    order.get("trader_id", trader_info.get("id", "unknown"))
+                )
+                columns["client_order_id"].append(order.get("client_order_id"))
+                columns["last_update_timestamp"].append(order.get("last_update"))
+                columns["order_price"].append(order.get("price"))
+                columns["avg_fill_price"].append(order.get("avg_fill_price"))
+                columns["limit_price"].append(order.get("limit_price"))
+                columns["stop_price"].append(order.get("stop_price"))
+                columns["time_in_force"].append(order.get("time_in_force", "DAY"))
+                columns["cancellation_timestamp"].append(order.get("cancellation_time"))
+                columns["cancellation_reason"].append(order.get("cancellation_reason"))
+                columns["strategy"].append(order.get("strategy"))
+                # Calculate notional value
+                columns["notional_value"].append(total_qty * order.get("price", 0))
+                columns["risk_indicators"].append(
+                    self._identify_order_risk_indicators(order)
                 )
 
-                raw_orders.append(raw_order)
+            raw_orders = RawOrderData.from_arrays(
+                columns,
+                bid_at_order=market_data.get("bid_price"),
+                ask_at_order=market_data.get("ask_price"),
+                mid_at_order=market_data.get("mid_price"),
+                trader_name=trader_info.get("name"),
+                alert_ids=[alert_id],
+                data_source="surveillance_platform",
+            )
 
-            # Cache the results
-            self.raw_orders_cache[alert_id] = raw_orders
+            # Cache compactly and index the results
+            self.raw_orders_cache[alert_id] = ColumnarRecordBuffer.from_records(
+                raw_orders, RawOrderData
+            )
+            self.order_index.add(alert_id, raw_orders)
 
             logger.info(f"Extracted {len(raw_orders)} raw orders for alert {alert_id}")
             return raw_orders
@@ -391,25 +521,18 @@ class TradingDataService:
             Dictionary containing raw trades and orders for the trader
         """
         try:
-            # Filter cached data for the trader
-            trader_trades = []
-            trader_orders = []
-
-            for alert_id, trades in self.raw_trades_cache.items():
-                for trade in trades:
-                    if (
-                        trade.trader_id == trader_id
-                        and start_date <= trade.execution_timestamp <= end_date
-                    ):
-                        trader_trades.append(trade)
-
-            for alert_id, orders in self.raw_orders_cache.items():
-                for order in orders:
-                    if (
-                        order.trader_id == trader_id
-                        and start_date <= order.order_timestamp <= end_date
-                    ):
-                        trader_orders.append(order)
+            # Look up cached data for the trader through the indexes
+            criteria = {
+                "trader_id": trader_id,
+                "start_date": start_date,
+                "end_date": end_date,
+            }
+            trader_trades = self._resolve_page(
+                self.raw_trades_cache, self.trade_index.search(criteria)[0]
+            )
+            trader_orders = self._resolve_page(
+                self.raw_orders_cache, self.order_index.search(criteria)[0]
+            )
 
             # Generate summary
             summary = self.generate_trading_data_summary(
@@ -431,6 +554,76 @@ class TradingDataService:
             )
             raise
 
+    def search_raw_data(
+        self,
+        criteria: Dict[str, Any],
+        limit: Optional[int] = None,
+        trades_after: Optional[SearchPosition] = None,
+        orders_after: Optional[SearchPosition] = None,
+        search_trades: bool = True,
+        search_orders: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Search cached raw trades and orders using the secondary indexes
+
+        Only the requested page of matches is materialised and serialised.
+        Orders carry no desk, so a desk criterion matches trades only.
+
+        Args:
+            criteria: Search criteria
+            limit: Maximum trades and orders returned per page (None for all)
+            trades_after: Position of the last trade on the previous page
+            orders_after: Position of the last order on the previous page
+            search_trades: Whether to search trades; False when a previous
+                page already exhausted them
+            search_orders: Whether to search orders, likewise
+
+        Returns:
+            Dictionary with page results, totals and resume positions. The
+            total of a list that was not searched is None.
+        """
+        if search_trades:
+            trade_page, total_trades, next_trade = self.trade_index.search(
+                criteria, after=trades_after, limit=limit
+            )
+        else:
+            trade_page, total_trades, next_trade = [], None, None
+        if not search_orders:
+            order_page, total_orders, next_order = [], None, None
+        elif criteria.get("desk"):
+            order_page, total_orders, next_order = [], 0, None
+        else:
+            order_page, total_orders, next_order = self.order_index.search(
+                criteria, after=orders_after, limit=limit
+            )
+
+        return {
+            "trades": [
+                trade.to_dict()
+                for trade in self._resolve_page(self.raw_trades_cache, trade_page)
+            ],
+            "orders": [
+                order.to_dict()
+                for order in self._resolve_page(self.raw_orders_cache, order_page)
+            ],
+            "total_trades": total_trades,
+            "total_orders": total_orders,
+            "next_trade_position": next_trade,
+            "next_order_position": next_order,
+        }
+
+    def _resolve_page(self, cache: BoundedCache, page: List[Tuple[str, int]]) -> List[Any]:
+        """Look up the cached records at (alert_id, position) pairs in page order"""
+        records = []
+        alert_records = {}
+        for alert_id, position in page:
+            if alert_id not in alert_records:
+                alert_records[alert_id] = cache.get(alert_id)
+            cached = alert_records[alert_id]
+            if cached is not None and position < len(cached):
+                records.append(cached[position])
+        return records
+
     def _determine_market_session(self, timestamp: str) -> str:
         """Determine market session based on timestamp"""
         try:
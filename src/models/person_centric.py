@@ -210,6 +210,10 @@ class PersonCentricAlert:
     activity_period_start: Optional[datetime] = None
     activity_period_end: Optional[datetime] = None
     
+    # Repeat detections merged into this alert
+    occurrence_count: int = 1
+    last_detection_timestamp: Optional[datetime] = None
+    
     # Cross-typology context
     related_typologies: Dict[RiskTypology, float] = field(default_factory=dict)
     escalation_factors: List[str] = field(default_factory=list)
@@ -248,6 +252,8 @@ class PersonCentricAlert:
             "detection_timestamp": self.detection_timestamp.isoformat(),
             "activity_period_start": self.activity_period_start.isoformat() if self.activity_period_start else None,
             "activity_period_end": self.activity_period_end.isoformat() if self.activity_period_end else None,
+            "occurrence_count": self.occurrence_count,
+            "last_detection_timestamp": self.last_detection_timestamp.isoformat() if self.last_detection_timestamp else None,
             "related_typologies": {k.value: v for k, v in self.related_typologies.items()},
             "escalation_factors": self.escalation_factors,
             "regulatory_rationale": self.regulatory_rationale,
@@ -5,10 +5,30 @@ This module contains comprehensive data models for raw trading data
 that analysts need to investigate alerts and perform detailed analysis.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 class TradeDirection(Enum):
@@ -30,6 +50,76 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ and no per-instance __dict__.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10+.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__, not as class attributes
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def _to_python_list(values: Sequence[Any]) -> List[Any]:
+    """Convert an array-like column to a list of native Python values"""
+    if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+def _bulk_construct(
+    record_cls,
+    columns: Mapping[str, Sequence[Any]],
+    constants: Mapping[str, Any],
+    enum_fields: Mapping[str, type],
+) -> List[Any]:
+    """Build records column-wise, interning repeated strings"""
+    names = list(columns)
+    data = [_to_python_list(columns[name]) for name in names]
+    lengths = {len(column) for column in data}
+    if len(lengths) > 1:
+        raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+
+    for position, name in enumerate(names):
+        column = data[position]
+        if name in enum_fields:
+            enum_cls = enum_fields[name]
+            data[position] = [
+                value if isinstance(value, enum_cls) else enum_cls(value)
+                for value in column
+            ]
+        elif name in record_cls.INTERNED_FIELDS:
+            data[position] = [
+                sys.intern(value) if type(value) is str else value for value in column
+            ]
+
+    list_constants = {
+        name: value for name, value in constants.items() if isinstance(value, list)
+    }
+    scalar_constants = {
+        name: value for name, value in constants.items() if name not in list_constants
+    }
+
+    records = []
+    for row in zip(*data):
+        kwargs = dict(zip(names, row))
+        kwargs.update(scalar_constants)
+        for name, value in list_constants.items():
+            kwargs[name] = list(value)
+        records.append(record_cls(**kwargs))
+    return records
+
+
+@_slotted
 @dataclass
 class RawTradeData:
     """
@@ -45,8 +135,30 @@ class RawTradeData:
                                    linked to the same person (see CrossAccountRiskFactors)
         person_level_context: Person-level contextual information including
                              behavioral profiles and compliance flags (see PersonLevelContext)
+
+    Instances are slotted (no per-instance __dict__); use from_arrays to
+    build many trades at once and ColumnarRecordBuffer for compact storage.
     """
 
+    # String fields interned on bulk construction (highly repetitive values)
+    INTERNED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        [
+            "instrument",
+            "instrument_type",
+            "symbol",
+            "exchange",
+            "trader_id",
+            "person_id",
+            "trader_name",
+            "trader_role",
+            "desk",
+            "book",
+            "market_session",
+            "counterparty",
+            "data_source",
+        ]
+    )
+
     # Core trade identifiers (required fields)
     trade_id: str
     execution_timestamp: str
@@ -116,55 +228,99 @@ class RawTradeData:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            "trade_id": self.trade_id,
-            "order_id": self.order_id,
-            "parent_order_id": self.parent_order_id,
-            "execution_timestamp": self.execution_timestamp,
-            "settlement_date": self.settlement_date,
-            "instrument": self.instrument,
-            "instrument_type": self.instrument_type,
-            "symbol": self.symbol,
-            "exchange": self.exchange,
-            "direction": self.direction.value,
-            "quantity": self.quantity,
-            "executed_price": self.executed_price,
-            "notional_value": self.notional_value,
-            "bid_price": self.bid_price,
-            "ask_price": self.ask_price,
-            "mid_price": self.mid_price,
-            "spread": self.spread,
-            "market_volume": self.market_volume,
-            "trader_id": self.trader_id,
-            "trader_name": self.trader_name,
-            "trader_role": self.trader_role,
-            "desk": self.desk,
-            "book": self.book,
-            "position_before": self.position_before,
-            "position_after": self.position_after,
-            "pnl_realized": self.pnl_realized,
-            "pnl_unrealized": self.pnl_unrealized,
-            "order_timestamp": self.order_timestamp,
-            "time_to_execution": self.time_to_execution,
-            "market_session": self.market_session,
-            "counterparty": self.counterparty,
-            "commission": self.commission,
-            "fees": self.fees,
-            "reference_price": self.reference_price,
-            "price_deviation": self.price_deviation,
-            "alert_ids": self.alert_ids,
-            "risk_score": self.risk_score,
-            "data_source": self.data_source,
-            "created_at": self.created_at,
-        }
-
-
+        result = dict(zip(_TRADE_DICT_KEYS, _trade_dict_values(self)))
+        result["direction"] = self.direction.value
+        return result
+
+    @classmethod
+    def from_arrays(
+        cls, columns: Mapping[str, Sequence[Any]], **constants: Any
+    ) -> List["RawTradeData"]:
+        """
+        Build trades in bulk from column arrays.
+
+        Args:
+            columns: Field name to equal-length sequence (lists or numpy arrays)
+            **constants: Field values shared by every trade
+
+        Returns:
+            List of RawTradeData, one per row
+        """
+        return _bulk_construct(
+            cls, columns, constants, {"direction": TradeDirection}
+        )
+
+
+_TRADE_DICT_KEYS = (
+    "trade_id",
+    "order_id",
+    "parent_order_id",
+    "execution_timestamp",
+    "settlement_date",
+    "instrument",
+    "instrument_type",
+    "symbol",
+    "exchange",
+    "direction",
+    "quantity",
+    "executed_price",
+    "notional_value",
+    "bid_price",
+    "ask_price",
+    "mid_price",
+    "spread",
+    "market_volume",
+    "trader_id",
+    "trader_name",
+    "trader_role",
+    "desk",
+    "book",
+    "position_before",
+    "position_after",
+    "pnl_realized",
+    "pnl_unrealized",
+    "order_timestamp",
+    "time_to_execution",
+    "market_session",
+    "counterparty",
+    "commission",
+    "fees",
+    "reference_price",
+    "price_deviation",
+    "alert_ids",
+    "risk_score",
+    "data_source",
+    "created_at",
+)
+_trade_dict_values = attrgetter(*_TRADE_DICT_KEYS)
+
+
+@_slotted
 @dataclass
 class RawOrderData:
     """
     Comprehensive raw order data structure for analyst investigations
+
+    Instances are slotted (no per-instance __dict__); use from_arrays to
+    build many orders at once and ColumnarRecordBuffer for compact storage.
     """
 
+    # String fields interned on bulk construction (highly repetitive values)
+    INTERNED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        [
+            "instrument",
+            "instrument_type",
+            "symbol",
+            "exchange",
+            "order_type",
+            "trader_id",
+            "trader_name",
+            "time_in_force",
+            "strategy",
+            "data_source",
+        ]
+    )
+
     # Required fields
     order_id: str
     order_timestamp: str
@@ -226,45 +382,70 @@ class RawOrderData:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            "order_id": self.order_id,
-            "parent_order_id": self.parent_order_id,
-            "client_order_id": self.client_order_id,
-            "order_timestamp": self.order_timestamp,
-            "status": self.status.value,
-            "last_update_timestamp": self.last_update_timestamp,
-            "instrument": self.instrument,
-            "instrument_type": self.instrument_type,
-            "symbol": self.symbol,
-            "exchange": self.exchange,
-            "side": self.side.value,
-            "order_type": self.order_type,
-            "quantity": self.quantity,
-            "filled_quantity": self.filled_quantity,
-            "remaining_quantity": self.remaining_quantity,
-            "order_price": self.order_price,
-            "avg_fill_price": self.avg_fill_price,
-            "limit_price": self.limit_price,
-            "stop_price": self.stop_price,
-            "fills": self.fills,
-            "partial_fills": self.partial_fills,
-            "time_in_force": self.time_in_force,
-            "expiry_timestamp": self.expiry_timestamp,
-            "cancellation_timestamp": self.cancellation_timestamp,
-            "cancellation_reason": self.cancellation_reason,
-            "bid_at_order": self.bid_at_order,
-            "ask_at_order": self.ask_at_order,
-            "mid_at_order": self.mid_at_order,
-            "trader_id": self.trader_id,
-            "trader_name": self.trader_name,
-            "strategy": self.strategy,
-            "notional_value": self.notional_value,
-            "margin_requirement": self.margin_requirement,
-            "alert_ids": self.alert_ids,
-            "risk_indicators": self.risk_indicators,
-            "data_source": self.data_source,
-            "created_at": self.created_at,
-        }
+        result = dict(zip(_ORDER_DICT_KEYS, _order_dict_values(self)))
+        result["status"] = self.status.value
+        result["side"] = self.side.value
+        return result
+
+    @classmethod
+    def from_arrays(
+        cls, columns: Mapping[str, Sequence[Any]], **constants: Any
+    ) -> List["RawOrderData"]:
+        """
+        Build orders in bulk from column arrays.
+
+        Args:
+            columns: Field name to equal-length sequence (lists or numpy arrays)
+            **constants: Field values shared by every order
+
+        Returns:
+            List of RawOrderData, one per row
+        """
+        return _bulk_construct(
+            cls, columns, constants, {"status": OrderStatus, "side": TradeDirection}
+        )
+
+
+_ORDER_DICT_KEYS = (
+    "order_id",
+    "parent_order_id",
+    "client_order_id",
+    "order_timestamp",
+    "status",
+    "last_update_timestamp",
+    "instrument",
+    "instrument_type",
+    "symbol",
+    "exchange",
+    "side",
+    "order_type",
+    "quantity",
+    "filled_quantity",
+    "remaining_quantity",
+    "order_price",
+    "avg_fill_price",
+    "limit_price",
+    "stop_price",
+    "fills",
+    "partial_fills",
+    "time_in_force",
+    "expiry_timestamp",
+    "cancellation_timestamp",
+    "cancellation_reason",
+    "bid_at_order",
+    "ask_at_order",
+    "mid_at_order",
+    "trader_id",
+    "trader_name",
+    "strategy",
+    "notional_value",
+    "margin_requirement",
+    "alert_ids",
+    "risk_indicators",
+    "data_source",
+    "created_at",
+)
+_order_dict_values = attrgetter(*_ORDER_DICT_KEYS)
 
 
 @dataclass
@@ -345,3 +526,146 @@ class TradingDataSummary:
             "unrealized_pnl": self.unrealized_pnl,
             "generated_at": self.generated_at,
         }
+
+
+class ColumnarRecordBuffer:
+    """
+    Compact column-oriented store for RawTradeData / RawOrderData records.
+
+    Values are held per field rather than per object: repeated strings are
+    interned, float columns without gaps become numpy arrays, and enums are
+    kept as their string values. Record objects and dicts are only
+    materialised for the rows actually read, so a buffer can hold raw
+    snapshots for many alerts at a fraction of the per-object footprint.
+    """
+
+    def __init__(self, record_cls, columns: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            record_cls: RawTradeData or RawOrderData
+            columns: Optional pre-built columns (field name to sequence)
+        """
+        self.record_cls = record_cls
+        self.field_names = tuple(f.name for f in fields(record_cls))
+        self._enum_fields = {
+            f.name: f.type
+            for f in fields(record_cls)
+            if isinstance(f.type, type) and issubclass(f.type, Enum)
+        }
+        self._columns: Dict[str, Any] = {name: [] for name in self.field_names}
+        self._length = 0
+        if columns:
+            self.extend_columns(columns)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any], record_cls=None) -> "ColumnarRecordBuffer":
+        """Build a buffer from existing record objects"""
+        records = list(records)
+        if record_cls is None:
+            if not records:
+                raise ValueError("record_cls is required for an empty buffer")
+            record_cls = type(records[0])
+        buffer = cls(record_cls)
+        buffer.extend(records)
+        return buffer
+
+    def __len__(self) -> int:
+        return self._length
+
+    def extend(self, records: Iterable[Any]) -> None:
+        """Append record objects"""
+        getter = attrgetter(*self.field_names)
+        rows = [getter(record) for record in records]
+        if not rows:
+            return
+        self.extend_columns(
+            {name: [row[i] for row in rows] for i, name in enumerate(self.field_names)}
+        )
+
+    def extend_columns(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """Append rows given column-wise; missing fields take their defaults"""
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+        count = lengths.pop()
+
+        defaults = {
+            f.name: f for f in fields(self.record_cls) if f.name not in columns
+        }
+        for name in self.field_names:
+            if name in columns:
+                values = _to_python_list(columns[name])
+            else:
+                values = [self._default_value(defaults[name]) for _ in range(count)]
+            values = self._encode_column(name, values)
+            self._append_column(name, values)
+        self._length += count
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Get a column (numpy array for dense float columns, list otherwise)"""
+        return self._columns[name]
+
+    def record(self, index: int):
+        """Materialise the record object at ``index``"""
+        return self.record_cls(**self._row_kwargs(index))
+
+    def __getitem__(self, index: int):
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._length):
+            yield self.record(index)
+
+    def iter_dicts(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield to_dict()-compatible dicts lazily for rows [start, stop)"""
+        stop = self._length if stop is None else min(stop, self._length)
+        for index in range(start, stop):
+            yield self.record(index).to_dict()
+
+    def _row_kwargs(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+
+        kwargs = {}
+        for name in self.field_names:
+            value = self._columns[name][index]
+            if NUMPY_AVAILABLE and isinstance(value, np.generic):
+                value = value.item()
+            if name in self._enum_fields:
+                value = self._enum_fields[name](value)
+            elif isinstance(value, (list, dict)):
+                value = value.copy()
+            kwargs[name] = value
+        return kwargs
+
+    def _encode_column(self, name: str, values: List[Any]) -> List[Any]:
+        if name in self._enum_fields:
+            return [
+                sys.intern(v.value) if isinstance(v, Enum) else v for v in values
+            ]
+        if name in self.record_cls.INTERNED_FIELDS:
+            return [sys.intern(v) if type(v) is str else v for v in values]
+        return values
+
+    def _append_column(self, name: str, values: List[Any]) -> None:
+        current = self._columns[name]
+        dense_float = NUMPY_AVAILABLE and all(type(v) is float for v in values)
+        if dense_float and isinstance(current, np.ndarray):
+            self._columns[name] = np.concatenate([current, np.asarray(values)])
+        elif dense_float and self._length == 0:
+            self._columns[name] = np.asarray(values, dtype=float)
+        else:
+            if NUMPY_AVAILABLE and isinstance(current, np.ndarray):
+                current = current.tolist()
+            current.extend(values)
+            self._columns[name] = current
+
+    @staticmethod
+    def _default_value(field_def) -> Any:
+        if field_def.default_factory is not MISSING:
+            return field_def.default_factory()
+        if field_def.default is not MISSING:
+            return field_def.default
+        raise ValueError(f"Missing required column: {field_def.name}")
@@ -0,0 +1,228 @@
+"""
+Kor.ai Alert Aggregates
+Running alert counts windowed by hour and day
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .alert_store import DEFAULT_STATUS
+
+_EPOCH = datetime(1970, 1, 1)
+_HOURS_PER_DAY = 24
+
+
+class _Bucket:
+    """Alert counts for one hour or one day"""
+
+    __slots__ = ("total", "by_type", "by_severity", "by_status", "traders", "instruments")
+
+    def __init__(self):
+        self.total = 0
+        self.by_type: Counter = Counter()
+        self.by_severity: Counter = Counter()
+        self.by_status: Counter = Counter()
+        # Counted rather than kept as sets so alerts can be removed again
+        self.traders: Counter = Counter()
+        self.instruments: Counter = Counter()
+
+    def add(self, alert: Dict[str, Any], sign: int) -> None:
+        self.total += sign
+        self.by_type[alert.get("type")] += sign
+        self.by_severity[alert.get("severity")] += sign
+        self.by_status[alert.get("status") or DEFAULT_STATUS] += sign
+        if alert.get("trader_id"):
+            self.traders[alert["trader_id"]] += sign
+        for instrument in alert.get("instruments") or ():
+            self.instruments[instrument] += sign
+
+    def move_status(self, old_status: str, new_status: str) -> None:
+        self.by_status[old_status] -= 1
+        self.by_status[new_status] += 1
+
+
+class _Ring:
+    """Fixed number of buckets addressed by period number (hour or day)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._slots: List[Optional[Tuple[int, _Bucket]]] = [None] * size
+
+    def bucket(self, period: int, create: bool = False) -> Optional[_Bucket]:
+        slot = self._slots[period % self.size]
+        if slot is not None and slot[0] == period:
+            return slot[1]
+        if not create or (slot is not None and slot[0] > period):
+            return None
+        bucket = _Bucket()
+        self._slots[period % self.size] = (period, bucket)
+        return bucket
+
+    def clear(self) -> None:
+        self._slots = [None] * self.size
+
+
+class AlertAggregates:
+    """
+    Alert counts by type, severity, status, trader and instrument, kept in
+    hourly and daily ring buffers and updated as alerts are added, change
+    status or leave the history.
+
+    Summaries merge at most one bucket per day plus the hours of the
+    partial first day, so their cost depends on the window rather than on
+    the number of alerts, and are cached until the aggregates change or
+    the hour rolls over. Windows are resolved to the hour.
+    """
+
+    def __init__(self, days: int = 90):
+        """
+        Args:
+            days: Number of days covered by the ring buffers
+        """
+        if days < 1:
+            raise ValueError("days must be at least 1")
+
+        self.days = days
+        self._lock = threading.RLock()
+        self._hours = _Ring((days + 1) * _HOURS_PER_DAY)
+        self._days = _Ring(days + 1)
+        self._version = 0
+        self._summaries: Dict[Tuple[int, int], Tuple[int, Dict[str, Any]]] = {}
+
+    def add(self, alert: Dict[str, Any]) -> None:
+        """Count a new alert"""
+        self._apply(alert, 1)
+
+    def remove(self, alert: Dict[str, Any]) -> None:
+        """Stop counting an alert that left the history"""
+        self._apply(alert, -1)
+
+    def update_status(self, alert: Dict[str, Any], previous_status: Optional[str]) -> None:
+        """Move an alert from its previous status to its current one"""
+        hour = _hour_of(alert.get("timestamp"))
+        if hour is None:
+            return
+        old_status = previous_status or DEFAULT_STATUS
+        new_status = alert.get("status") or DEFAULT_STATUS
+        with self._lock:
+            for bucket in self._buckets_for(hour, create=False):
+                bucket.move_status(old_status, new_status)
+            self._version += 1
+
+    def rebuild(self, alerts: Iterable[Dict[str, Any]]) -> None:
+        """Recount from scratch, e.g. after the history is reloaded"""
+        with self._lock:
+            self._hours.clear()
+            self._days.clear()
+            for alert in alerts:
+                self._apply(alert, 1)
+            self._version += 1
+
+    def covers(self, days: int) -> bool:
+        """Whether a window of this many days fits in the ring buffers"""
+        return days <= self.days
+
+    def summary(self, days: int = 30, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Summarise alerts raised in the last ``days`` days.
+
+        Args:
+            days: Window length in days, at most the configured ``days``
+            now: End of the window (defaults to the current UTC time)
+
+        Returns:
+            Alert totals by type, severity and status, plus affected traders
+            and instruments
+        """
+        if not self.covers(days):
+            raise ValueError(f"summary window exceeds the {self.days} days aggregated")
+
+        current_hour = _hour_number(now or datetime.utcnow())
+        with self._lock:
+            cached = self._summaries.get((days, current_hour))
+            if cached is not None and cached[0] == self._version:
+                return _copy_summary(cached[1])
+
+            merged = _Bucket()
+            for bucket in self._window(days, current_hour):
+                merged.total += bucket.total
+                merged.by_type.update(bucket.by_type)
+                merged.by_severity.update(bucket.by_severity)
+                merged.by_status.update(bucket.by_status)
+                merged.traders.update(bucket.traders)
+                merged.instruments.update(bucket.instruments)
+
+            summary = {
+                "total_alerts": merged.total,
+                "by_type": _positive(merged.by_type),
+                "by_severity": _positive(merged.by_severity),
+                "by_status": _positive(merged.by_status),
+                "unique_traders": list(_positive(merged.traders)),
+                "instruments_affected": list(_positive(merged.instruments)),
+            }
+            # Only the current hour's summaries can be served again
+            self._summaries = {
+                key: value
+                for key, value in self._summaries.items()
+                if key[1] == current_hour
+            }
+            self._summaries[(days, current_hour)] = (self._version, summary)
+            return _copy_summary(summary)
+
+    def _apply(self, alert: Dict[str, Any], sign: int) -> None:
+        hour = _hour_of(alert.get("timestamp"))
+        if hour is None:
+            return
+        with self._lock:
+            for bucket in self._buckets_for(hour, create=sign > 0):
+                bucket.add(alert, sign)
+            self._version += 1
+
+    def _buckets_for(self, hour: int, create: bool) -> List[_Bucket]:
+        buckets = (
+            self._hours.bucket(hour, create),
+            self._days.bucket(hour // _HOURS_PER_DAY, create),
+        )
+        return [bucket for bucket in buckets if bucket is not None]
+
+    def _window(self, days: int, current_hour: int) -> Iterable[_Bucket]:
+        """Hour buckets of the partial first day, then whole day buckets"""
+        first_hour = current_hour - days * _HOURS_PER_DAY
+        first_whole_day = -(-first_hour // _HOURS_PER_DAY)
+
+        for hour in range(first_hour, first_whole_day * _HOURS_PER_DAY):
+            bucket = self._hours.bucket(hour)
+            if bucket is not None:
+                yield bucket
+        for day in range(first_whole_day, current_hour // _HOURS_PER_DAY + 1):
+            bucket = self._days.bucket(day)
+            if bucket is not None:
+                yield bucket
+
+
+def _hour_number(moment: datetime) -> int:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return int((moment - _EPOCH) // timedelta(hours=1))
+
+
+def _hour_of(timestamp: Any) -> Optional[int]:
+    if isinstance(timestamp, datetime):
+        return _hour_number(timestamp)
+    try:
+        return _hour_number(datetime.fromisoformat(timestamp))
+    except (TypeError, ValueError):
+        return None
+
+
+def _positive(counter: Counter) -> Dict[Any, int]:
+    return {key: count for key, count in counter.items() if count > 0}
+
+
+def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in summary.items()
+    }
@@ -0,0 +1,515 @@
+"""
+Kor.ai Alert Repository
+Durable SQLite alert history shared by every worker process
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .alert_store import DEFAULT_STATUS, record_status
+
+logger = logging.getLogger(__name__)
+
+# Indexed column -> alert field, for AlertService alert dicts
+ALERT_COLUMNS = {
+    "alert_id": "id",
+    "timestamp": "timestamp",
+    "trader_id": "trader_id",
+    "type": "type",
+    "severity": "severity",
+    "status": "status",
+}
+# Same columns for PersonCentricAlert.to_dict() payloads
+PERSON_ALERT_COLUMNS = {
+    "alert_id": "alert_id",
+    "timestamp": "detection_timestamp",
+    "trader_id": "person_id",
+    "type": "risk_typology",
+    "severity": "severity",
+    "status": "status",
+}
+
+# Filter argument -> column, in the order conditions are written
+_FILTER_COLUMNS = (
+    ("alert_type", "type"),
+    ("severity", "severity"),
+    ("trader_id", "trader_id"),
+    ("status", "status"),
+)
+
+
+class AlertRepository:
+    """
+    SQLite alert history with the same interface as AlertStore.
+
+    Alerts are stored as JSON payloads next to indexed id, timestamp,
+    trader (or person), typology, severity and status columns. The database
+    runs in WAL mode so several worker processes can share one file, with
+    readers never blocked by a writer. Batches are inserted in a single
+    transaction, and each combination of query filters always produces the
+    same SQL text so sqlite3 reuses the prepared statement.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        table: str = "alerts",
+        columns: Mapping[str, str] = ALERT_COLUMNS,
+        max_alerts: Optional[int] = None,
+        retention_days: Optional[float] = None,
+        on_remove: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Args:
+            db_path: SQLite database file
+            table: Table holding this repository's alerts
+            columns: Indexed column to alert field (see ALERT_COLUMNS)
+            max_alerts: Maximum alerts retained; oldest are dropped first
+            retention_days: Maximum alert age in days
+            on_remove: Called with each alert dropped by retention
+        """
+        if max_alerts is not None and max_alerts < 1:
+            raise ValueError("max_alerts must be at least 1")
+        if retention_days is not None and retention_days <= 0:
+            raise ValueError("retention_days must be positive")
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+
+        self.db_path = db_path
+        self.table = table
+        self.columns = dict(columns)
+        self.max_alerts = max_alerts
+        self.retention_days = retention_days
+        self.on_remove = on_remove
+
+        # The count limit is enforced every 1% of max_alerts inserts, since
+        # finding the alerts beyond it walks the timestamp index
+        self._count_check_interval = max(1, (max_alerts or 0) // 100)
+        self._inserted_since_check = 0
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create the alert table and its indexes if they do not exist"""
+        table = self.table
+        with self._lock, self._conn:
+            self._conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    alert_id TEXT,
+                    timestamp TEXT NOT NULL,
+                    trader_id TEXT,
+                    type TEXT,
+                    severity TEXT,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_{table}_alert_id ON {table} (alert_id);
+                CREATE INDEX IF NOT EXISTS idx_{table}_timestamp ON {table} (timestamp);
+                CREATE INDEX IF NOT EXISTS idx_{table}_trader
+                    ON {table} (trader_id, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_{table}_type ON {table} (type, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_{table}_severity
+                    ON {table} (severity, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_{table}_status
+                    ON {table} (status, timestamp);
+                """
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over alerts, oldest first, reading in chunks"""
+        return self.iter_query(newest_first=False)
+
+    def append(self, alert: Dict[str, Any]) -> None:
+        """Insert an alert and apply retention"""
+        self.extend((alert,))
+
+    def extend(self, alerts: Iterable[Dict[str, Any]]) -> None:
+        """Insert a batch of alerts in one transaction and apply retention"""
+        rows = [self._row(alert) for alert in alerts]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"""
+                    INSERT INTO {self.table}
+                        (alert_id, timestamp, trader_id, type, severity, status, payload)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+            self._inserted_since_check += len(rows)
+            removed = self._apply_retention()
+
+        if self.on_remove is not None:
+            for alert in removed:
+                self.on_remove(alert)
+
+    def get(self, alert_id: str) -> Optional[Dict[str, Any]]:
+        """Get the most recently inserted alert with the given id"""
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                SELECT payload FROM {self.table}
+                WHERE alert_id = ? ORDER BY seq DESC LIMIT 1
+                """,
+                (alert_id,),
+            ).fetchone()
+        return json.loads(row["payload"]) if row is not None else None
+
+    def replace(self, alert: Dict[str, Any]) -> bool:
+        """
+        Overwrite the latest stored alert with the same id, e.g. after
+        repeat detections were merged into it. Investigation status and
+        status history recorded on the stored alert are kept.
+
+        Returns:
+            Whether an alert with the id was stored
+        """
+        alert_id = alert.get(self.columns["alert_id"])
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._latest_locked(alert_id)
+                if row is None:
+                    self._conn.rollback()
+                    return False
+
+                stored = json.loads(row["payload"])
+                alert = dict(alert)
+                for field in ("status", "status_history"):
+                    if field in stored and field not in alert:
+                        alert[field] = stored[field]
+                values = self._row(alert)
+                self._conn.execute(
+                    f"""
+                    UPDATE {self.table}
+                    SET timestamp = ?, trader_id = ?, type = ?, severity = ?,
+                        status = ?, payload = ?
+                    WHERE seq = ?
+                    """,
+                    values[1:] + (row["seq"],),
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return True
+
+    def update_status(
+        self, alert_id: str, status: str, notes: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Record a new investigation status on the latest alert with an id.
+
+        Returns:
+            The updated alert, or None if the id is unknown
+        """
+        with self._lock:
+            # Take the write lock before reading so concurrent workers
+            # cannot interleave status history updates
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._latest_locked(alert_id)
+                if row is None:
+                    self._conn.rollback()
+                    return None
+
+                alert = json.loads(row["payload"])
+                record_status(alert, status, notes)
+                self._conn.execute(
+                    f"UPDATE {self.table} SET status = ?, payload = ? WHERE seq = ?",
+                    (status, json.dumps(alert, default=str), row["seq"]),
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return alert
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        alert_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        trader_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        newest_first: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get alerts in time order within a timestamp range.
+
+        Args:
+            start: Earliest timestamp (ISO format, inclusive)
+            end: Latest timestamp (ISO format, inclusive)
+            alert_type: Alert type filter
+            severity: Severity filter
+            trader_id: Trader (or person) filter
+            status: Investigation status filter
+            limit: Maximum alerts returned (None for all)
+            offset: Matching alerts skipped before the first returned
+            newest_first: Return the most recent alerts first
+
+        Returns:
+            Matching alerts
+        """
+        filters = {
+            "alert_type": alert_type,
+            "severity": severity,
+            "trader_id": trader_id,
+            "status": status,
+        }
+        rows = self._fetch(start, end, filters, newest_first, limit, offset)
+        return [json.loads(row["payload"]) for row in rows]
+
+    def iter_query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        alert_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        trader_id: Optional[str] = None,
+        status: Optional[str] = None,
+        newest_first: bool = True,
+        chunk_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the alerts ``query`` would return, reading ``chunk_size`` rows
+        at a time and resuming each chunk after the last row returned, so
+        large exports neither load the whole history nor rescan it.
+        """
+        filters = {
+            "alert_type": alert_type,
+            "severity": severity,
+            "trader_id": trader_id,
+            "status": status,
+        }
+        after = None
+        while True:
+            rows = self._fetch(start, end, filters, newest_first, chunk_size, 0, after)
+            for row in rows:
+                yield json.loads(row["payload"])
+            if len(rows) < chunk_size:
+                return
+            after = (rows[-1]["timestamp"], rows[-1]["seq"])
+
+    def summary(
+        self, start: Optional[str] = None, instruments_field: str = "instruments"
+    ) -> Dict[str, Any]:
+        """
+        Count stored alerts from ``start`` on, in the shape of
+        AlertAggregates.summary.
+
+        Counts are grouped in SQL over the timestamp index, so they include
+        alerts inserted, updated or dropped by every process sharing the
+        database file.
+
+        Args:
+            start: Earliest timestamp (ISO format, inclusive)
+            instruments_field: Payload field listing the alert's instruments
+
+        Returns:
+            Alert totals by type, severity and status, plus affected traders
+            and instruments
+        """
+        window = "timestamp >= ?" if start else "1"
+        params = (start,) if start else ()
+        table = self.table
+        with self._lock:
+            groups = self._conn.execute(
+                f"""
+                SELECT type, severity, status, COUNT(*) AS n FROM {table}
+                WHERE {window} GROUP BY type, severity, status
+                """,
+                params,
+            ).fetchall()
+            traders = self._conn.execute(
+                f"""
+                SELECT DISTINCT trader_id FROM {table}
+                WHERE {window} AND trader_id IS NOT NULL AND trader_id != ''
+                """,
+                params,
+            ).fetchall()
+            instruments = self._conn.execute(
+                f"""
+                SELECT DISTINCT instrument.value
+                FROM {table}, json_each({table}.payload, ?) AS instrument
+                WHERE {window}
+                """,
+                (f"$.{instruments_field}",) + params,
+            ).fetchall()
+
+        summary = {
+            "total_alerts": 0,
+            "by_type": {},
+            "by_severity": {},
+            "by_status": {},
+            "unique_traders": [row[0] for row in traders],
+            "instruments_affected": [row[0] for row in instruments],
+        }
+        for row in groups:
+            summary["total_alerts"] += row["n"]
+            for key, value in (
+                ("by_type", row["type"]),
+                ("by_severity", row["severity"]),
+                ("by_status", row["status"]),
+            ):
+                summary[key][value] = summary[key].get(value, 0) + row["n"]
+        return summary
+
+    def clear(self) -> None:
+        """Remove all alerts"""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _latest_locked(self, alert_id: str) -> Optional[sqlite3.Row]:
+        return self._conn.execute(
+            f"""
+            SELECT seq, payload FROM {self.table}
+            WHERE alert_id = ? ORDER BY seq DESC LIMIT 1
+            """,
+            (alert_id,),
+        ).fetchone()
+
+    def _row(self, alert: Dict[str, Any]) -> Tuple[Any, ...]:
+        values = {
+            column: alert.get(field) for column, field in self.columns.items()
+        }
+        timestamp = values["timestamp"]
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        return (
+            values["alert_id"],
+            timestamp or "",
+            values["trader_id"],
+            values["type"],
+            values["severity"],
+            values["status"] or DEFAULT_STATUS,
+            json.dumps(alert, default=str),
+        )
+
+    def _fetch(
+        self,
+        start: Optional[str],
+        end: Optional[str],
+        filters: Dict[str, Any],
+        newest_first: bool,
+        limit: Optional[int],
+        offset: int,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[sqlite3.Row]:
+        """Run a query; the SQL depends only on which filters are set"""
+        params: List[Any] = []
+        if start:
+            params.append(start)
+        if end:
+            params.append(end)
+        for argument, _ in _FILTER_COLUMNS:
+            if filters[argument]:
+                params.append(filters[argument])
+        if after is not None:
+            params.extend(after)
+        params.extend((-1 if limit is None else limit, offset))
+
+        used = tuple(bool(filters[argument]) for argument, _ in _FILTER_COLUMNS)
+        sql = _select_sql(
+            self.table, bool(start), bool(end), used, after is not None, newest_first
+        )
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _apply_retention(self) -> List[Dict[str, Any]]:
+        """Delete alerts beyond the retention limits and return them"""
+        conditions = []
+        params: List[Any] = []
+        if self.retention_days is not None:
+            cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+            conditions.append("timestamp < ?")
+            params.append(cutoff.isoformat())
+        if (
+            self.max_alerts is not None
+            and self._inserted_since_check >= self._count_check_interval
+        ):
+            self._inserted_since_check = 0
+            # Everything older than the newest max_alerts alerts
+            conditions.append(
+                f"""seq IN (
+                    SELECT seq FROM {self.table}
+                    ORDER BY timestamp DESC, seq DESC LIMIT -1 OFFSET ?
+                )"""
+            )
+            params.append(self.max_alerts)
+        if not conditions:
+            return []
+
+        where = " OR ".join(conditions)
+        with self._conn:
+            rows = self._conn.execute(
+                f"SELECT seq, payload FROM {self.table} WHERE {where}", params
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    f"DELETE FROM {self.table} WHERE seq = ?",
+                    [(row["seq"],) for row in rows],
+                )
+        if rows:
+            logger.info(f"Dropped {len(rows)} alerts from {self.table} by retention")
+        return [json.loads(row["payload"]) for row in rows]
+
+
+@lru_cache(maxsize=256)
+def _select_sql(
+    table: str,
+    has_start: bool,
+    has_end: bool,
+    filters_used: Tuple[bool, ...],
+    has_after: bool,
+    newest_first: bool,
+) -> str:
+    conditions = []
+    if has_start:
+        conditions.append("timestamp >= ?")
+    if has_end:
+        conditions.append("timestamp <= ?")
+    for (_, column), used in zip(_FILTER_COLUMNS, filters_used):
+        if used:
+            conditions.append(f"{column} = ?")
+    if has_after:
+        conditions.append(f"(timestamp, seq) {'<' if newest_first else '>'} (?, ?)")
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    direction = "DESC" if newest_first else "ASC"
+    return (
+        f"SELECT seq, timestamp, payload FROM {table} {where} "
+        f"ORDER BY timestamp {direction}, seq {direction} LIMIT ? OFFSET ?"
+    )
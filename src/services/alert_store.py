@@ -0,0 +1,306 @@
+"""
+Kor.ai Alert Store
+In-memory alert history kept in time order with secondary indexes
+"""
+
+import bisect
+import itertools
+import math
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# (timestamp, insertion sequence) position of an alert in time order
+_Position = Tuple[str, int]
+
+# Status of alerts that have not been triaged yet
+DEFAULT_STATUS = "open"
+
+# Dropped timeline entries kept before the list is compacted
+_COMPACT_MIN = 64
+
+
+class AlertStore:
+    """
+    Time-ordered alert history with hash indexes by alert id, trader,
+    typology, severity and status.
+
+    Alerts are placed in timestamp order on insert, and every index keeps
+    its own time-ordered position list, so range queries with limit/offset
+    walk only the positions they return instead of sorting the history.
+    Retention is bounded by alert count and by age.
+    """
+
+    INDEXED_FIELDS = ("trader_id", "type", "severity", "status")
+
+    def __init__(
+        self,
+        max_alerts: Optional[int] = None,
+        retention_days: Optional[float] = None,
+        on_remove: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Args:
+            max_alerts: Maximum alerts retained; oldest are dropped first
+            retention_days: Maximum alert age in days
+            on_remove: Called with each alert dropped by retention
+        """
+        if max_alerts is not None and max_alerts < 1:
+            raise ValueError("max_alerts must be at least 1")
+        if retention_days is not None and retention_days <= 0:
+            raise ValueError("retention_days must be positive")
+
+        self.max_alerts = max_alerts
+        self.retention_days = retention_days
+        self.on_remove = on_remove
+
+        self._lock = threading.RLock()
+        self._sequence = itertools.count()
+        # Retention drops the oldest alerts without touching the lists:
+        # timeline positions before _head and index positions of alerts no
+        # longer held are dead, and are compacted away in bulk so each drop
+        # stays O(1) amortised
+        self._timeline: List[_Position] = []
+        self._head = 0
+        self._alerts: Dict[int, Dict[str, Any]] = {}
+        self._by_id: Dict[str, List[int]] = {}
+        self._indexes: Dict[str, Dict[Any, List[_Position]]] = {
+            field: {} for field in self.INDEXED_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return len(self._timeline) - self._head
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over alerts, oldest first"""
+        return iter(self.query(newest_first=False))
+
+    def append(self, alert: Dict[str, Any]) -> None:
+        """Insert an alert in timestamp order and apply retention"""
+        with self._lock:
+            sequence = next(self._sequence)
+            position = (alert.get("timestamp") or "", sequence)
+            _insert(self._timeline, position, self._head)
+            self._alerts[sequence] = alert
+            self._by_id.setdefault(alert.get("id"), []).append(sequence)
+            for field in self.INDEXED_FIELDS:
+                value = field_value(alert, field)
+                if value is not None:
+                    _insert(self._indexes[field].setdefault(value, []), position)
+            self._apply_retention()
+
+    def extend(self, alerts) -> None:
+        """Insert several alerts"""
+        for alert in alerts:
+            self.append(alert)
+
+    def get(self, alert_id: str) -> Optional[Dict[str, Any]]:
+        """Get the most recently inserted alert with the given id"""
+        with self._lock:
+            sequences = self._by_id.get(alert_id)
+            return self._alerts[sequences[-1]] if sequences else None
+
+    def update_status(
+        self, alert_id: str, status: str, notes: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Record a new investigation status on the latest alert with an id.
+
+        Returns:
+            The updated alert, or None if the id is unknown
+        """
+        with self._lock:
+            sequences = self._by_id.get(alert_id)
+            if not sequences:
+                return None
+            sequence = sequences[-1]
+            alert = self._alerts[sequence]
+            position = (alert.get("timestamp") or "", sequence)
+
+            self._unindex(position, "status", field_value(alert, "status"))
+            record_status(alert, status, notes)
+            _insert(self._indexes["status"].setdefault(status, []), position)
+            return alert
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        alert_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        trader_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        newest_first: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get alerts in time order within a timestamp range.
+
+        Args:
+            start: Earliest timestamp (ISO format, inclusive)
+            end: Latest timestamp (ISO format, inclusive)
+            alert_type: Alert type filter
+            severity: Severity filter
+            trader_id: Trader filter
+            status: Investigation status filter
+            limit: Maximum alerts returned (None for all)
+            offset: Matching alerts skipped before the first returned
+            newest_first: Return the most recent alerts first
+
+        Returns:
+            Matching alerts
+        """
+        filters = {
+            field: value
+            for field, value in (
+                ("type", alert_type),
+                ("severity", severity),
+                ("trader_id", trader_id),
+                ("status", status),
+            )
+            if value
+        }
+
+        with self._lock:
+            # Walk the shortest index list and check the other filters per alert
+            positions, first = self._timeline, self._head
+            for field, value in filters.items():
+                candidate = self._indexes[field].get(value, [])
+                if len(candidate) < len(positions) - first:
+                    positions, first = candidate, 0
+            if positions is not self._timeline:
+                # Index positions older than the oldest alert held are dead
+                first = (
+                    bisect.bisect_left(positions, self._timeline[self._head])
+                    if len(self)
+                    else len(positions)
+                )
+
+            low = bisect.bisect_left(positions, (start, -1), first) if start else first
+            high = (
+                bisect.bisect_right(positions, (end, math.inf), first)
+                if end
+                else len(positions)
+            )
+            ordered = (
+                (positions[i] for i in range(high - 1, low - 1, -1))
+                if newest_first
+                else (positions[i] for i in range(low, high))
+            )
+
+            results = []
+            skipped = 0
+            for _, sequence in ordered:
+                alert = self._alerts.get(sequence)
+                if alert is None:
+                    # Dropped by retention, not yet compacted away
+                    continue
+                if any(
+                    field_value(alert, field) != value
+                    for field, value in filters.items()
+                ):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                results.append(alert)
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    def iter_query(self, **criteria) -> Iterator[Dict[str, Any]]:
+        """Iterate over the alerts ``query`` returns"""
+        return iter(self.query(**criteria))
+
+    def clear(self) -> None:
+        """Remove all alerts"""
+        with self._lock:
+            self._timeline.clear()
+            self._head = 0
+            self._alerts.clear()
+            self._by_id.clear()
+            for index in self._indexes.values():
+                index.clear()
+
+    def _apply_retention(self) -> None:
+        cutoff = None
+        if self.retention_days is not None:
+            cutoff = (
+                datetime.utcnow() - timedelta(days=self.retention_days)
+            ).isoformat()
+
+        while len(self) and (
+            (self.max_alerts is not None and len(self) > self.max_alerts)
+            or (cutoff is not None and self._timeline[self._head][0] < cutoff)
+        ):
+            self._remove_oldest()
+
+        if self._head >= _COMPACT_MIN and self._head * 2 >= len(self._timeline):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop the dead positions left behind by retention"""
+        del self._timeline[: self._head]
+        self._head = 0
+        for index in self._indexes.values():
+            for value in list(index):
+                positions = [p for p in index[value] if p[1] in self._alerts]
+                if positions:
+                    index[value] = positions
+                else:
+                    del index[value]
+
+    def _remove_oldest(self) -> None:
+        position = self._timeline[self._head]
+        self._head += 1
+        alert = self._alerts.pop(position[1])
+
+        sequences = self._by_id.get(alert.get("id"))
+        if sequences:
+            sequences.remove(position[1])
+            if not sequences:
+                del self._by_id[alert.get("id")]
+
+        if self.on_remove is not None:
+            self.on_remove(alert)
+
+    def _unindex(self, position: _Position, field: str, value: Any) -> None:
+        positions = self._indexes[field].get(value)
+        if positions is None:
+            return
+        index = bisect.bisect_left(positions, position)
+        if index < len(positions) and positions[index] == position:
+            del positions[index]
+        if not positions:
+            del self._indexes[field][value]
+
+
+def field_value(alert: Dict[str, Any], field: str) -> Any:
+    """Value an alert is indexed and filtered under for a field"""
+    if field == "status":
+        return alert.get("status") or DEFAULT_STATUS
+    return alert.get(field)
+
+
+def record_status(alert: Dict[str, Any], status: str, notes: str = "") -> None:
+    """Set an alert's status and append the change to its status history"""
+    alert["status"] = status
+    alert.setdefault("status_history", []).append(
+        {
+            "status": status,
+            "notes": notes,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    )
+
+
+def _insert(positions: List[_Position], position: _Position, lo: int = 0) -> None:
+    """
+    Insert keeping time order from ``lo`` on; alerts usually arrive in
+    order, so append
+    """
+    if len(positions) == lo or positions[-1] <= position:
+        positions.append(position)
+    else:
+        bisect.insort(positions, position, lo)
@@ -0,0 +1,403 @@
+"""
+Kor.ai Analysis Job Store and Runner
+Local SQLite-backed job queue for long-running batch analyses
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    """Lifecycle states of an analysis job"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    TERMINAL = (COMPLETED, FAILED, CANCELLED)
+
+
+class AnalysisJobStore:
+    """
+    SQLite store for analysis jobs, their input items and per-item results.
+    Inputs are persisted at submission so workers stream them in chunks and
+    memory stays bounded regardless of batch size.
+
+    Several processes may share one database file. Each store owns the jobs
+    it creates and refreshes their heartbeat while they are unfinished, so
+    only jobs whose owner has stopped heartbeating are treated as interrupted.
+    """
+
+    def __init__(self, db_path: str = ":memory:", owner_id: Optional[str] = None):
+        self.db_path = db_path
+        self.owner_id = owner_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        if db_path != ":memory:":
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create job tables if they do not exist"""
+        with self._lock, self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS analysis_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    total_items INTEGER NOT NULL,
+                    completed_items INTEGER NOT NULL DEFAULT 0,
+                    failed_items INTEGER NOT NULL DEFAULT 0,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    error TEXT,
+                    metadata TEXT,
+                    owner TEXT,
+                    heartbeat_at REAL
+                );
+                CREATE TABLE IF NOT EXISTS analysis_job_items (
+                    job_id TEXT NOT NULL,
+                    item_index INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (job_id, item_index)
+                );
+                CREATE TABLE IF NOT EXISTS analysis_job_results (
+                    job_id TEXT NOT NULL,
+                    item_index INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    PRIMARY KEY (job_id, item_index)
+                );
+                CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status
+                    ON analysis_jobs (status);
+                """
+            )
+            # Databases created before jobs had owners
+            columns = {
+                row["name"]
+                for row in self._conn.execute("PRAGMA table_info(analysis_jobs)")
+            }
+            if "owner" not in columns:
+                self._conn.execute("ALTER TABLE analysis_jobs ADD COLUMN owner TEXT")
+            if "heartbeat_at" not in columns:
+                self._conn.execute("ALTER TABLE analysis_jobs ADD COLUMN heartbeat_at REAL")
+
+    def create_job(
+        self, items: Iterable[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Persist a new queued job with its input items and return its id"""
+        job_id = f"job_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        rows = [
+            (job_id, index, json.dumps(item, default=str))
+            for index, item in enumerate(items)
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO analysis_job_items (job_id, item_index, payload) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                """
+                INSERT INTO analysis_jobs
+                    (job_id, status, total_items, created_at, metadata, owner, heartbeat_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    JobStatus.QUEUED,
+                    len(rows),
+                    datetime.utcnow().isoformat(),
+                    json.dumps(metadata or {}, default=str),
+                    self.owner_id,
+                    time.time(),
+                ),
+            )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job status and progress, or None if unknown"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM analysis_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job["metadata"] = json.loads(job["metadata"] or "{}")
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        processed = job["completed_items"] + job["failed_items"]
+        job["progress"] = processed / job["total_items"] if job["total_items"] else 1.0
+        return job
+
+    def iter_items(self, job_id: str, start: int = 0, chunk_size: int = 100):
+        """Yield (item_index, payload) pairs in chunks from ``start``"""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    """
+                    SELECT item_index, payload FROM analysis_job_items
+                    WHERE job_id = ? AND item_index >= ?
+                    ORDER BY item_index LIMIT ?
+                    """,
+                    (job_id, start, chunk_size),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row["item_index"], json.loads(row["payload"])
+            start = rows[-1]["item_index"] + 1
+
+    def record_result(
+        self, job_id: str, item_index: int, result: Dict[str, Any], failed: bool = False
+    ) -> None:
+        """Store one item's result and advance job progress"""
+        counter = "failed_items" if failed else "completed_items"
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_job_results (job_id, item_index, result) VALUES (?, ?, ?)",
+                (job_id, item_index, json.dumps(result, default=str)),
+            )
+            self._conn.execute(
+                f"UPDATE analysis_jobs SET {counter} = {counter} + 1 WHERE job_id = ?",
+                (job_id,),
+            )
+
+    def get_results(
+        self, job_id: str, offset: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get stored (partial or final) results ordered by item index"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT result FROM analysis_job_results WHERE job_id = ?
+                ORDER BY item_index LIMIT ? OFFSET ?
+                """,
+                (job_id, limit, offset),
+            ).fetchall()
+        return [json.loads(row["result"]) for row in rows]
+
+    def mark_running(self, job_id: str) -> bool:
+        """Move a queued job to running; False if it is no longer queued"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE analysis_jobs SET status = ?, started_at = ? WHERE job_id = ? AND status = ?",
+                (JobStatus.RUNNING, datetime.utcnow().isoformat(), job_id, JobStatus.QUEUED),
+            )
+        return cursor.rowcount == 1
+
+    def mark_finished(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        """Record a terminal state and release the job's input payloads"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE analysis_jobs SET status = ?, finished_at = ?, error = ? WHERE job_id = ?",
+                (status, datetime.utcnow().isoformat(), error, job_id),
+            )
+            self._conn.execute(
+                "DELETE FROM analysis_job_items WHERE job_id = ?", (job_id,)
+            )
+
+    def request_cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job. Queued jobs are cancelled immediately; running jobs are
+        flagged and stop before their next item. False if unknown or finished.
+        """
+        now = datetime.utcnow().isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """
+                UPDATE analysis_jobs SET status = ?, cancel_requested = 1, finished_at = ?
+                WHERE job_id = ? AND status = ?
+                """,
+                (JobStatus.CANCELLED, now, job_id, JobStatus.QUEUED),
+            )
+            if cursor.rowcount == 1:
+                self._conn.execute(
+                    "DELETE FROM analysis_job_items WHERE job_id = ?", (job_id,)
+                )
+                return True
+            cursor = self._conn.execute(
+                "UPDATE analysis_jobs SET cancel_requested = 1 WHERE job_id = ? AND status = ?",
+                (job_id, JobStatus.RUNNING),
+            )
+        return cursor.rowcount == 1
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """Check the cancellation flag of a job"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cancel_requested FROM analysis_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def heartbeat(self) -> int:
+        """Refresh the heartbeat of this store's unfinished jobs; returns how many"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE analysis_jobs SET heartbeat_at = ? WHERE owner = ? AND status IN (?, ?)",
+                (time.time(), self.owner_id, JobStatus.QUEUED, JobStatus.RUNNING),
+            )
+        return cursor.rowcount
+
+    def fail_interrupted_jobs(self, stale_after_seconds: float) -> int:
+        """
+        Mark as failed the queued or running jobs of other owners whose
+        heartbeat is older than ``stale_after_seconds`` (their process died)
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """
+                UPDATE analysis_jobs SET status = ?, finished_at = ?, error = ?
+                WHERE status IN (?, ?)
+                  AND (owner IS NULL OR owner != ?)
+                  AND (heartbeat_at IS NULL OR heartbeat_at < ?)
+                """,
+                (
+                    JobStatus.FAILED,
+                    datetime.utcnow().isoformat(),
+                    "Interrupted by process restart",
+                    JobStatus.QUEUED,
+                    JobStatus.RUNNING,
+                    self.owner_id,
+                    time.time() - stale_after_seconds,
+                ),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class AnalysisJobManager:
+    """
+    Runs analysis jobs on a bounded local worker pool.
+    Each job processes its items in order, writing every result as it is
+    produced so progress and partial results are visible while it runs.
+
+    A background thread heartbeats this manager's unfinished jobs and fails
+    jobs of other processes sharing the store once their heartbeat is stale.
+    """
+
+    def __init__(
+        self,
+        run_item: Callable[[int, Dict[str, Any]], Dict[str, Any]],
+        store: Optional[AnalysisJobStore] = None,
+        max_workers: int = 2,
+        chunk_size: int = 100,
+        heartbeat_seconds: float = 10.0,
+        stale_after_seconds: float = 60.0,
+    ):
+        self.run_item = run_item
+        self.store = store or AnalysisJobStore()
+        self.chunk_size = chunk_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="analysis-job"
+        )
+
+        self._recover_interrupted_jobs()
+        self._stopped = threading.Event()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name="analysis-job-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _recover_interrupted_jobs(self) -> None:
+        """Fail jobs whose owning process stopped heartbeating"""
+        interrupted = self.store.fail_interrupted_jobs(self.stale_after_seconds)
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted analysis jobs as failed")
+
+    def _heartbeat_loop(self) -> None:
+        """Keep this manager's jobs alive and recover other processes' dead ones"""
+        while not self._stopped.wait(self.heartbeat_seconds):
+            try:
+                self.store.heartbeat()
+                self._recover_interrupted_jobs()
+            except Exception as e:
+                logger.error(f"Analysis job heartbeat failed: {str(e)}")
+
+    def submit(
+        self, items: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Persist a job and schedule it; returns the job id immediately"""
+        job_id = self.store.create_job(items, metadata)
+        self._executor.submit(self._run_job, job_id)
+        logger.info(f"Queued analysis job {job_id} with {len(items)} items")
+        return job_id
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job status and progress"""
+        return self.store.get_job(job_id)
+
+    def get_results(
+        self, job_id: str, offset: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get partial or final results of a job"""
+        return self.store.get_results(job_id, offset, limit)
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation; queued jobs stop before starting, running ones after the current item"""
+        return self.store.request_cancel(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool and the heartbeat"""
+        self._executor.shutdown(wait=wait)
+        self._stopped.set()
+
+    def _run_job(self, job_id: str) -> None:
+        """Worker entry point for a single job"""
+        if not self.store.mark_running(job_id):
+            # Cancelled while still queued
+            return
+
+        try:
+            for item_index, item in self.store.iter_items(
+                job_id, chunk_size=self.chunk_size
+            ):
+                if self.store.is_cancel_requested(job_id):
+                    self.store.mark_finished(job_id, JobStatus.CANCELLED)
+                    logger.info(f"Analysis job {job_id} cancelled at item {item_index}")
+                    return
+                try:
+                    result = self.run_item(item_index, item)
+                    self.store.record_result(
+                        job_id, item_index, result, failed="error" in result
+                    )
+                except Exception as e:
+                    logger.error(f"Error in job {job_id} item {item_index}: {str(e)}")
+                    self.store.record_result(
+                        job_id,
+                        item_index,
+                        {"batch_index": item_index, "error": str(e)},
+                        failed=True,
+                    )
+
+            self.store.mark_finished(job_id, JobStatus.COMPLETED)
+            logger.info(f"Analysis job {job_id} completed")
+
+        except Exception as e:
+            logger.error(f"Analysis job {job_id} failed: {str(e)}")
+            self.store.mark_finished(job_id, JobStatus.FAILED, error=str(e))
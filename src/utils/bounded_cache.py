@@ -0,0 +1,429 @@
+"""
+Bounded in-process cache with LRU and TTL eviction.
+
+Entries are bounded by count and by an estimated byte size. Entries evicted
+to make room can optionally be spilled to a local SQLite file and are
+reloaded transparently on the next access; expired entries are dropped.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Containers longer than this are sized from a sample of their elements
+_SIZE_SAMPLE = 32
+
+
+def estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estimate the deep memory footprint of an object in bytes.
+
+    Follows containers, instance dicts and __slots__. Long sequences are
+    extrapolated from a sample so sizing stays cheap for large record lists.
+    Interned strings and shared objects are only counted once.
+
+    Args:
+        obj: Object to size
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+
+    if isinstance(obj, dict):
+        return size + sum(
+            estimate_size(key, seen) + estimate_size(value, seen)
+            for key, value in obj.items()
+        )
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = list(obj)
+        if len(items) <= _SIZE_SAMPLE:
+            return size + sum(estimate_size(item, seen) for item in items)
+        step = len(items) / _SIZE_SAMPLE
+        sample = [items[int(i * step)] for i in range(_SIZE_SAMPLE)]
+        sampled = sum(estimate_size(item, seen) for item in sample)
+        return size + int(sampled * len(items) / _SIZE_SAMPLE)
+
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        # numpy arrays: getsizeof already includes owned data
+        return max(size, nbytes)
+
+    if hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), seen)
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(obj, name):
+                size += estimate_size(getattr(obj, name), seen)
+    return size
+
+
+class _SpillStore:
+    """
+    SQLite file holding pickled entries evicted from memory.
+
+    The file belongs to a single cache: anything left from an earlier run is
+    discarded on open, and the file is deleted again on close.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._remove_files()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_spill (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+
+    def put(self, key: str, value: Any, stored_at: float) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_spill (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), stored_at),
+            )
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        row = self._conn.execute(
+            "SELECT value, stored_at FROM cache_spill WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0]), row[1]
+
+    def delete(self, key: str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM cache_spill WHERE key = ?", (key,))
+
+    def delete_older_than(self, cutoff: float) -> list:
+        with self._conn:
+            keys = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT key FROM cache_spill WHERE stored_at < ?", (cutoff,)
+                )
+            ]
+            self._conn.execute("DELETE FROM cache_spill WHERE stored_at < ?", (cutoff,))
+        return keys
+
+    def keys(self) -> list:
+        return [row[0] for row in self._conn.execute("SELECT key FROM cache_spill")]
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cache_spill").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM cache_spill")
+
+    def close(self) -> None:
+        self._conn.close()
+        self._remove_files()
+
+    def _remove_files(self) -> None:
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
+
+
+class BoundedCache:
+    """
+    Thread-safe mapping bounded by entry count and estimated byte size.
+
+    Least recently used entries are evicted first once either bound is
+    exceeded; entries older than ``ttl_seconds`` are treated as absent. When
+    ``spill_path`` is set, capacity evictions are written to disk instead of
+    being discarded and are promoted back into memory when read.
+
+    Keys must be strings when spilling is enabled. ``on_remove`` is called
+    with the key whenever an entry leaves the cache for good (discarded,
+    expired, popped or cleared), but not when it is spilled.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        spill_path: Optional[str] = None,
+        size_fn: Callable[[Any], int] = estimate_size,
+        name: str = "cache",
+        on_remove: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries held in memory
+            max_bytes: Maximum estimated bytes held in memory (None for no limit)
+            ttl_seconds: Entry lifetime in seconds (None for no expiry)
+            spill_path: SQLite file receiving evicted entries (None to discard)
+            size_fn: Function estimating the size of a value in bytes
+            name: Name used in log messages
+            on_remove: Callback receiving keys of entries removed for good
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.size_fn = size_fn
+        self.name = name
+        self.on_remove = on_remove
+
+        # key -> (value, size_bytes, stored_at)
+        self._entries: "OrderedDict[Any, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._spill = _SpillStore(spill_path) if spill_path else None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "spilled": 0,
+            "reloaded": 0,
+        }
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set(key, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key: Any) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING, _count=False) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            spilled = self._spill.count() if self._spill else 0
+            return len(self._entries) + spilled
+
+    def set(self, key: Any, value: Any) -> None:
+        """Insert or replace an entry, evicting others if bounds are exceeded"""
+        self._store(key, value, time.time())
+
+    def get(self, key: Any, default: Any = None, _count: bool = True) -> Any:
+        """
+        Get an entry, marking it most recently used.
+
+        Spilled entries are reloaded into memory; expired entries are removed.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry[2], now):
+                    self._remove(key)
+                    self._stats["expirations"] += 1
+                    self._notify_removed(key)
+                else:
+                    self._entries.move_to_end(key)
+                    if _count:
+                        self._stats["hits"] += 1
+                    return entry[0]
+
+            if self._spill is not None:
+                spilled = self._spill.get(key)
+                if spilled is not None:
+                    value, stored_at = spilled
+                    self._spill.delete(key)
+                    if self._expired(stored_at, now):
+                        self._stats["expirations"] += 1
+                        self._notify_removed(key)
+                    else:
+                        self._stats["reloaded"] += 1
+                        if _count:
+                            self._stats["hits"] += 1
+                        self._store(key, value, stored_at)
+                        return value
+
+            if _count:
+                self._stats["misses"] += 1
+            return default
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove an entry from memory and the spill store and return it"""
+        value = self.get(key, _MISSING, _count=False)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                self._notify_removed(key)
+        return default if value is _MISSING else value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Iterate over live entries, including spilled ones.
+
+        Iteration works on a snapshot and does not change recency, so a full
+        scan does not reload the spill store into memory.
+        """
+        self.purge_expired()
+        with self._lock:
+            snapshot = [(key, entry[0]) for key, entry in self._entries.items()]
+            spilled_keys = self._spill.keys() if self._spill else []
+
+        yield from snapshot
+        for key in spilled_keys:
+            with self._lock:
+                spilled = self._spill.get(key)
+            if spilled is not None:
+                yield key, spilled[0]
+
+    def keys(self) -> Iterator[Any]:
+        """Iterate over live keys, including spilled ones"""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over live values, including spilled ones"""
+        for _, value in self.items():
+            yield value
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns the number removed"""
+        if self.ttl_seconds is None:
+            return 0
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if self._expired(entry[2], now)
+            ]
+            for key in expired:
+                self._remove(key)
+            if self._spill is not None:
+                expired.extend(self._spill.delete_older_than(now - self.ttl_seconds))
+            self._stats["expirations"] += len(expired)
+            for key in expired:
+                self._notify_removed(key)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries from memory and the spill store"""
+        with self._lock:
+            removed = list(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            if self._spill is not None:
+                removed.extend(self._spill.keys())
+                self._spill.clear()
+            for key in removed:
+                self._notify_removed(key)
+
+    def close(self) -> None:
+        """Release the spill store and delete its file"""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get memory usage and eviction statistics.
+
+        Returns:
+            Dictionary of counters and current usage
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(
+                {
+                    "entries": len(self._entries),
+                    "bytes": self._bytes,
+                    "max_entries": self.max_entries,
+                    "max_bytes": self.max_bytes,
+                    "ttl_seconds": self.ttl_seconds,
+                    "spilled_entries": self._spill.count() if self._spill else 0,
+                }
+            )
+        return stats
+
+    def _store(self, key: Any, value: Any, stored_at: float) -> None:
+        size = self.size_fn(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            elif self._spill is not None:
+                self._spill.delete(key)
+            self._entries[key] = (value, size, stored_at)
+            self._bytes += size
+            self._enforce_bounds(keep=key)
+
+    def _enforce_bounds(self, keep: Any) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            if key == keep:
+                # Never evict the entry just written, even if it alone is too big
+                break
+            value, _, stored_at = self._entries[key]
+            self._remove(key)
+            self._stats["evictions"] += 1
+            if self._spill is not None:
+                try:
+                    self._spill.put(key, value, stored_at)
+                    self._stats["spilled"] += 1
+                    continue
+                except Exception as e:
+                    logger.warning(f"Failed to spill {self.name} entry {key}: {str(e)}")
+            self._notify_removed(key)
+
+    def _remove(self, key: Any) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _notify_removed(self, key: Any) -> None:
+        if self.on_remove is None:
+            return
+        try:
+            self.on_remove(key)
+        except Exception as e:
+            logger.warning(f"{self.name} removal callback failed for {key}: {str(e)}")
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
@@ -0,0 +1,187 @@
+"""
+In-process micro-batching scheduler.
+
+Collects individually submitted work items for at most ``max_delay_ms`` (or
+until ``max_batch_size`` items are queued) and hands them to a single batch
+function call. Each submitter receives a ``concurrent.futures.Future`` that is
+completed with its own result, so callers keep a request/response interface
+while the scorer sees whole batches.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN = object()
+
+
+class MicroBatcher:
+    """
+    Groups concurrent submissions into batches for a vectorised batch function.
+
+    The batch function receives a list of items and must return a list of the
+    same length. An element of the returned list that is an ``Exception``
+    instance fails only the corresponding caller's future; an exception raised
+    by the batch function itself fails every future in that batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 64,
+        max_delay_ms: float = 5.0,
+        name: str = "micro-batcher",
+    ):
+        """
+        Initialize the micro-batcher and start its worker thread.
+
+        Args:
+            batch_fn: Function scoring a list of items in one call
+            max_batch_size: Maximum number of items dispatched together
+            max_delay_ms: Maximum time the first item of a batch waits
+            name: Name of the worker thread
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_delay_ms < 0:
+            raise ValueError("max_delay_ms must be non-negative")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay_ms = max_delay_ms
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stats = {
+            "batches_dispatched": 0,
+            "items_processed": 0,
+            "max_batch_observed": 0,
+            "batch_errors": 0,
+        }
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item: Work item passed to the batch function
+
+        Returns:
+            Future completed with the item's result
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher has been shut down")
+            self._queue.put((item, future))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting items and drain the queue.
+
+        Args:
+            wait: Whether to block until the worker thread has exited
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_SHUTDOWN)
+        if wait:
+            self._worker.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+        batches = stats["batches_dispatched"]
+        stats["average_batch_size"] = (
+            stats["items_processed"] / batches if batches else 0.0
+        )
+        stats["max_batch_size"] = self.max_batch_size
+        stats["max_delay_ms"] = self.max_delay_ms
+        return stats
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch, dispatch it, repeat."""
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _SHUTDOWN:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_delay_ms / 1000.0
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    entry = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if entry is _SHUTDOWN:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._dispatch(batch)
+
+        # Anything queued after the shutdown marker is still served
+        leftovers = []
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _SHUTDOWN:
+                leftovers.append(entry)
+        for start in range(0, len(leftovers), self.max_batch_size):
+            self._dispatch(leftovers[start : start + self.max_batch_size])
+
+    def _dispatch(self, batch: List[Any]) -> None:
+        """Run the batch function and complete each caller's future."""
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+
+        try:
+            results = list(self.batch_fn(items))
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batch function returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"Micro-batch of {len(items)} items failed: {str(e)}")
+            with self._lock:
+                self._stats["batch_errors"] += 1
+            for future in futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results):
+            if not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        with self._lock:
+            self._stats["batches_dispatched"] += 1
+            self._stats["items_processed"] += len(items)
+            self._stats["max_batch_observed"] = max(
+                self._stats["max_batch_observed"], len(items)
+            )
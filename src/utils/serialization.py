@@ -0,0 +1,361 @@
+"""
+Response serialization for the Flask applications.
+
+This module provides a faster JSON provider for Flask that understands numpy
+scalars and arrays, datetimes, decimals, sets and dataclasses natively, an
+after-request hook that gzip/deflate-compresses large JSON responses when
+the client accepts it, and helpers for streamed (chunked) downloads that are
+compressed on the fly.
+"""
+
+import dataclasses
+import gzip
+import io
+import json
+import logging
+import math
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def to_json_compatible(obj: Any) -> Any:
+    """
+    Convert a value the stdlib encoder cannot handle into a JSON-compatible one.
+
+    Used as the ``default`` hook of the JSON encoder, so it is only called for
+    values outside the native JSON types.
+
+    Args:
+        obj: Value to convert
+
+    Returns:
+        JSON-compatible representation of the value
+
+    Raises:
+        TypeError: If the value type is not supported
+    """
+    if NUMPY_AVAILABLE:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite_floats(obj: Any) -> Any:
+    """Replace NaN and infinite floats in nested dicts and lists with None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_floats(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_floats(value) for value in obj]
+    return obj
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider with native numpy/datetime support.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder with
+    ``to_json_compatible`` as its default hook otherwise. Both backends honour
+    the compact ``separators`` or ``indent=2`` that ``response()`` passes and
+    ``sort_keys``, and both write NaN and infinite floats as ``null`` (the
+    stdlib would otherwise emit invalid JSON such as ``NaN``).
+    """
+
+    sort_keys = False
+    compact = True
+
+    # json.dumps options orjson can reproduce
+    ORJSON_KWARGS = frozenset(["separators", "indent"])
+
+    def __init__(self, app: Flask, backend: Optional[str] = None):
+        super().__init__(app)
+        if backend is None:
+            backend = "orjson" if ORJSON_AVAILABLE else "stdlib"
+        if backend == "orjson" and not ORJSON_AVAILABLE:
+            raise ValueError("orjson backend requested but orjson is not installed")
+        self.backend = backend
+
+    def _orjson_option(self, kwargs: Dict[str, Any], sort_keys: bool) -> Optional[int]:
+        """orjson flags matching the json.dumps kwargs, or None if it cannot match them."""
+        if not self.ORJSON_KWARGS.issuperset(kwargs) or kwargs.get("indent") not in (None, 2):
+            return None
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON text."""
+        sort_keys = kwargs.pop("sort_keys", self.sort_keys)
+        if self.backend == "orjson":
+            option = self._orjson_option(kwargs, sort_keys)
+            if option is not None:
+                try:
+                    return orjson.dumps(
+                        obj, default=to_json_compatible, option=option
+                    ).decode("utf-8")
+                except TypeError:
+                    # orjson rejects some inputs the stdlib accepts (e.g. >64-bit ints)
+                    pass
+
+        default = kwargs.pop("default", to_json_compatible)
+        kwargs.pop("allow_nan", None)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", (",", ":"))
+        kwargs["sort_keys"] = sort_keys
+        try:
+            return json.dumps(obj, default=default, allow_nan=False, **kwargs)
+        except ValueError as e:
+            if "Out of range float" not in str(e):
+                raise
+        return json.dumps(
+            _finite_floats(obj),
+            default=lambda value: _finite_floats(default(value)),
+            allow_nan=False,
+            **kwargs,
+        )
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick gzip or deflate from an Accept-Encoding header, honouring q=0."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+
+    for encoding in ("gzip", "deflate"):
+        if accepted.get(encoding, 0.0) > 0:
+            return encoding
+    return None
+
+
+def compress_response(response, min_size: int = 1024, level: int = 6):
+    """
+    Compress a JSON response body if the client accepts gzip or deflate.
+
+    Args:
+        response: Flask response object
+        min_size: Minimum body size in bytes worth compressing
+        level: zlib compression level (1-9)
+
+    Returns:
+        The (possibly compressed) response
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype != "application/json"
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+    ):
+        return response
+
+    encoding = _negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+    response.vary.add("Accept-Encoding")
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    if encoding == "gzip":
+        compressed = gzip.compress(body, compresslevel=level)
+    else:
+        compressed = zlib.compress(body, level)
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Content-Length"] = str(len(compressed))
+    return response
+
+
+def compress_stream(
+    chunks: Iterable[str], encoding: str, level: int = 6
+) -> Iterator[bytes]:
+    """
+    Compress text chunks incrementally without buffering the whole body.
+
+    Args:
+        chunks: Text chunks in output order
+        encoding: "gzip" or "deflate"
+        level: zlib compression level (1-9)
+
+    Yields:
+        Compressed byte chunks
+    """
+    wbits = 31 if encoding == "gzip" else 15
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def drain_buffer(output: io.StringIO) -> str:
+    """Return and clear the contents of a text buffer used to build stream chunks."""
+    content = output.getvalue()
+    output.seek(0)
+    output.truncate()
+    return content
+
+
+def streaming_response(
+    chunks: Iterable[str],
+    mimetype: str,
+    filename: Optional[str] = None,
+    compress: bool = True,
+    level: int = 6,
+) -> Response:
+    """
+    Build a chunked response that writes text chunks as they are produced.
+
+    The body is gzip/deflate-compressed on the fly when ``compress`` is set
+    and the client accepts it. Must be called inside a request context; the
+    chunk generator itself runs after the view returns.
+
+    Args:
+        chunks: Text chunks in output order
+        mimetype: Response MIME type
+        filename: Download filename; sets an attachment Content-Disposition
+        compress: Whether on-the-fly compression may be applied
+        level: zlib compression level (1-9)
+
+    Returns:
+        Streamed Flask response
+    """
+    headers = {}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    encoding = (
+        _negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+        if compress
+        else None
+    )
+    if encoding is None:
+        body = (chunk.encode("utf-8") for chunk in chunks)
+    else:
+        body = compress_stream(chunks, encoding, level)
+        headers["Content-Encoding"] = encoding
+
+    response = Response(body, mimetype=mimetype, headers=headers)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def export_response(
+    chunks: Iterable[str],
+    mimetype: str,
+    filename: str,
+    settings: Optional[Dict[str, Any]] = None,
+) -> Response:
+    """
+    Stream a download, logging failures raised after streaming has started.
+
+    Once the first chunk is sent the view can no longer return an error
+    response, so exceptions from the chunk generator are logged here before
+    the connection is dropped.
+
+    Args:
+        chunks: Text chunks in output order
+        mimetype: Response MIME type
+        filename: Download filename
+        settings: Serialization settings ("compression_enabled",
+            "compression_level")
+
+    Returns:
+        Streamed Flask response
+    """
+    settings = settings or {}
+    return streaming_response(
+        _log_stream_errors(chunks, filename),
+        mimetype,
+        filename=filename,
+        compress=settings.get("compression_enabled", True),
+        level=settings.get("compression_level", 6),
+    )
+
+
+def _log_stream_errors(chunks: Iterable[str], filename: str) -> Iterator[str]:
+    try:
+        yield from chunks
+    except Exception as e:
+        logger.error(f"Error streaming export {filename}: {str(e)}")
+        raise
+
+
+def init_serialization(app: Flask, config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Install the fast JSON provider and response compression on an app.
+
+    Args:
+        app: Flask application
+        config: Optional settings ("backend", "compression_enabled",
+            "compression_min_size", "compression_level")
+    """
+    config = config or {}
+    if app.extensions.get("kor_serialization"):
+        return
+
+    app.json = FastJSONProvider(app, backend=config.get("backend"))
+
+    if config.get("compression_enabled", True):
+        min_size = config.get("compression_min_size", 1024)
+        level = config.get("compression_level", 6)
+
+        @app.after_request
+        def _compress(response):
+            return compress_response(response, min_size=min_size, level=level)
+
+    app.extensions["kor_serialization"] = True
+    logger.info(f"JSON serialization backend: {app.json.backend}")
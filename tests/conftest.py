@@ -380,6 +380,24 @@ def test_utils():
     return TestUtils
 
 
+# Alert history fixtures
+@pytest.fixture
+def make_alert():
+    """Factory for minimal alert dicts; timestamps may be datetimes or ISO strings"""
+    def factory(alert_id, timestamp, alert_type="SPOOFING", severity="HIGH", trader_id="TR1", **fields):
+        alert = {
+            "id": alert_id,
+            "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+            "type": alert_type,
+            "severity": severity,
+            "trader_id": trader_id,
+        }
+        alert.update(fields)
+        return alert
+
+    return factory
+
+
 # Performance test configuration
 @pytest.fixture
 def performance_config():
@@ -0,0 +1,108 @@
+"""
+Unit tests for the windowed alert summary aggregates.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.alert_aggregates import AlertAggregates
+from src.services.alert_store import AlertStore
+
+NOW = datetime(2024, 3, 10, 12, 30)
+
+
+@pytest.fixture
+def alerts(make_alert):
+    return [
+        make_alert("A1", NOW - timedelta(hours=1)),
+        make_alert(
+            "A2",
+            NOW - timedelta(days=2),
+            alert_type="INSIDER_DEALING",
+            trader_id="TR2",
+            instruments=["VOD.L"],
+        ),
+        make_alert("A3", NOW - timedelta(days=6, hours=23), severity="MEDIUM"),
+        make_alert("A4", NOW - timedelta(days=7, hours=2)),
+        make_alert("A5", NOW - timedelta(days=40)),
+    ]
+
+
+@pytest.mark.unit
+class TestAlertAggregates:
+    """Unit tests for AlertAggregates."""
+
+    def test_window_matches_recount(self, alerts):
+        """Windows include whole days plus the hours of the partial first day."""
+        aggregates = AlertAggregates(days=90)
+        for alert in alerts:
+            aggregates.add(alert)
+
+        week = aggregates.summary(days=7, now=NOW)
+        assert week["total_alerts"] == 3
+        assert week["by_type"] == {"SPOOFING": 2, "INSIDER_DEALING": 1}
+        assert week["by_severity"] == {"HIGH": 2, "MEDIUM": 1}
+        assert week["by_status"] == {"open": 3}
+        assert sorted(week["unique_traders"]) == ["TR1", "TR2"]
+        assert week["instruments_affected"] == ["VOD.L"]
+
+        assert aggregates.summary(days=30, now=NOW)["total_alerts"] == 4
+        assert aggregates.summary(days=90, now=NOW)["total_alerts"] == 5
+
+    def test_status_changes_and_removal(self, alerts):
+        """Status moves and removals adjust the counts and invalidate summaries."""
+        aggregates = AlertAggregates(days=30)
+        for alert in alerts[:2]:
+            aggregates.add(alert)
+        assert aggregates.summary(days=7, now=NOW)["by_status"] == {"open": 2}
+
+        alerts[0]["status"] = "closed"
+        aggregates.update_status(alerts[0], None)
+        assert aggregates.summary(days=7, now=NOW)["by_status"] == {"open": 1, "closed": 1}
+
+        aggregates.remove(alerts[1])
+        summary = aggregates.summary(days=7, now=NOW)
+        assert summary["total_alerts"] == 1
+        assert summary["unique_traders"] == ["TR1"]
+        assert "INSIDER_DEALING" not in summary["by_type"]
+
+    def test_summaries_are_copies(self, alerts):
+        """Mutating a returned summary does not affect cached results."""
+        aggregates = AlertAggregates(days=30)
+        aggregates.add(alerts[0])
+        aggregates.summary(days=7, now=NOW)["by_type"].clear()
+        assert aggregates.summary(days=7, now=NOW)["by_type"] == {"SPOOFING": 1}
+
+    def test_rebuild_from_store(self, alerts):
+        """Aggregates rebuilt from the history match incremental counts."""
+        store = AlertStore()
+        incremental = AlertAggregates(days=90)
+        for alert in alerts:
+            store.append(alert)
+            incremental.add(alert)
+
+        rebuilt = AlertAggregates(days=90)
+        rebuilt.rebuild(store)
+        for days in (1, 7, 30, 90):
+            assert rebuilt.summary(days, now=NOW) == incremental.summary(days, now=NOW)
+
+    def test_store_eviction_is_uncounted(self, alerts):
+        """Alerts dropped by store retention leave the aggregates."""
+        aggregates = AlertAggregates(days=90)
+        store = AlertStore(max_alerts=2, on_remove=aggregates.remove)
+        for alert in reversed(alerts):
+            store.append(alert)
+            aggregates.add(alert)
+
+        assert aggregates.summary(days=90, now=NOW)["total_alerts"] == 2
+
+    def test_window_limits(self):
+        """Windows longer than the aggregated period are rejected."""
+        aggregates = AlertAggregates(days=7)
+        assert aggregates.covers(7)
+        assert not aggregates.covers(8)
+        with pytest.raises(ValueError):
+            aggregates.summary(days=8)
+        with pytest.raises(ValueError):
+            AlertAggregates(days=0)
@@ -0,0 +1,143 @@
+"""
+Unit tests for bulk STOR and regulatory CSV exports of the alert history.
+"""
+
+import csv
+import gzip
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+try:
+    from src.core.services.alert_service import BULK_CSV_COLUMNS, AlertService
+except ImportError as e:
+    pytest.skip(f"Alert service not available: {e}", allow_module_level=True)
+
+
+class FakeExplainability:
+    """Records rationale generation and renders inputs into the outputs."""
+
+    def __init__(self):
+        self.generated = []
+
+    def generate_regulatory_rationale(self, alert, risk_scores, processed_data):
+        if alert["id"] == "BAD":
+            raise ValueError("no evidence recorded")
+        self.generated.append(alert["id"])
+        return SimpleNamespace(
+            alert_id=alert["id"],
+            deterministic_narrative=f"score {risk_scores.get('overall_score')}",
+            regulatory_frameworks=["MAR Art. 12", "STOR"],
+        )
+
+    def export_stor_format(self, rationale, processed_data):
+        return {"alert_id": rationale.alert_id, "narrative": rationale.deterministic_narrative}
+
+    def export_csv_report(self, rationale, filename=None):
+        return rationale.deterministic_narrative
+
+
+@pytest.fixture
+def service(make_alert):
+    """Alert service with a few alerts and a recording explainability engine."""
+    alert_service = AlertService()
+    alert_service.regulatory_explainability = FakeExplainability()
+    alert_service.alert_history.extend(
+        [
+            make_alert("A2", "2024-01-02T10:00:00", risk_score=0.6, instruments=["VOD.L"]),
+            make_alert("A1", "2024-01-01T10:00:00", alert_type="INSIDER_DEALING", risk_score=0.9),
+            make_alert("BAD", "2024-01-03T10:00:00", severity="MEDIUM"),
+            make_alert("A4", "2024-01-04T10:00:00", severity="LOW", risk_score=0.3),
+        ]
+    )
+    return alert_service
+
+
+@pytest.mark.unit
+class TestAlertExports:
+    """Unit tests for selecting and streaming alerts for regulatory export."""
+
+    def test_select_alerts(self, service):
+        """Selection filters by range, type and severity, oldest first."""
+        assert [a["id"] for a in service.select_alerts()] == ["A1", "A2", "BAD", "A4"]
+        selected = service.select_alerts(start_date="2024-01-02", end_date="2024-01-03T23:59:59")
+        assert [a["id"] for a in selected] == ["A2", "BAD"]
+        assert [a["id"] for a in service.select_alerts(alert_type="insider_dealing")] == ["A1"]
+        assert [a["id"] for a in service.select_alerts(severity="high")] == ["A1", "A2"]
+
+    def test_stor_lines(self, service):
+        """One JSON line per alert; failures are reported without stopping the export."""
+        lines = [json.loads(line) for line in service.iter_stor_lines(service.select_alerts())]
+        assert [line["alert_id"] for line in lines] == ["A1", "A2", "BAD", "A4"]
+        assert lines[0]["stor_record"] == {"alert_id": "A1", "narrative": "score 0.9"}
+        assert lines[2]["error"] == "no evidence recorded"
+
+    def test_regulatory_csv_rows(self, service):
+        """The CSV has a header and one row per alert, reusing generated rationales."""
+        list(service.iter_stor_lines(service.select_alerts()))
+        chunks = list(service.iter_regulatory_csv_rows(service.select_alerts()))
+
+        assert len(chunks) == 5
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert list(rows[0]) == list(BULK_CSV_COLUMNS)
+        assert rows[1]["instruments"] == "VOD.L"
+        assert rows[1]["regulatory_frameworks"] == "MAR Art. 12;STOR"
+        assert rows[2]["error"] == "no evidence recorded"
+        assert service.regulatory_explainability.generated == ["A1", "A2", "A4"]
+
+    def test_explicit_inputs_are_not_served_from_cache(self, service):
+        """Single exports with new risk scores regenerate the rationale."""
+        alert = service.get_alert_details("A1")
+        assert service.get_regulatory_rationale(alert).deterministic_narrative == "score 0.9"
+
+        record = service.export_stor_report(alert, {"overall_score": 0.5}, {})
+        assert record["narrative"] == "score 0.5"
+        assert service.export_regulatory_csv(alert, {"overall_score": 0.4}, {}) == "score 0.4"
+        # Bulk exports reuse the latest rationale
+        assert service.get_regulatory_rationale(alert).deterministic_narrative == "score 0.4"
+
+
+try:
+    from src.api.v1 import api_v1
+    from src.api.v1.routes import alerts as alert_routes
+except ImportError:
+    api_v1 = alert_routes = None
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(alert_routes is None, reason="API v1 routes not available")
+class TestAlertExportRoutes:
+    """Unit tests for the streamed /alerts/export endpoints."""
+
+    @pytest.fixture
+    def client(self, service, monkeypatch):
+        monkeypatch.setattr(alert_routes, "alert_service", service)
+        app = Flask(__name__)
+        app.register_blueprint(api_v1)
+        return app.test_client()
+
+    def test_stor_export(self, client):
+        """STOR records stream as JSON lines for the filtered alerts."""
+        response = client.get("/api/v1/alerts/export/stor?severity=HIGH")
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == "application/x-ndjson"
+        assert "attachment" in response.headers["Content-Disposition"]
+        lines = response.get_data(as_text=True).splitlines()
+        assert [json.loads(line)["alert_id"] for line in lines] == ["A1", "A2"]
+
+    def test_csv_export(self, client):
+        """The CSV export honours the date range and compresses when accepted."""
+        response = client.get(
+            "/api/v1/alerts/export/csv?start_date=2024-01-03",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "text/csv"
+        assert response.headers["Content-Encoding"] == "gzip"
+
+        rows = list(csv.reader(io.StringIO(gzip.decompress(response.get_data()).decode())))
+        assert [row[0] for row in rows] == ["alert_id", "BAD", "A4"]
@@ -0,0 +1,163 @@
+"""
+Unit tests for the SQLite alert repository.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.alert_aggregates import AlertAggregates
+from src.services.alert_repository import PERSON_ALERT_COLUMNS, AlertRepository
+from src.services.alert_store import AlertStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "alerts" / "alerts.db")
+
+
+@pytest.mark.unit
+class TestAlertRepository:
+    """Unit tests for AlertRepository."""
+
+    def test_persists_across_instances(self, db_path, make_alert):
+        """Alerts and status changes survive reopening the database."""
+        repository = AlertRepository(db_path)
+        repository.extend(
+            [
+                make_alert("A2", "2024-01-02T10:00:00", evidence={"score": 0.9}),
+                make_alert("A1", "2024-01-01T10:00:00", evidence={"score": 0.9}),
+            ]
+        )
+        repository.update_status("A1", "closed", "false positive")
+        repository.close()
+
+        reopened = AlertRepository(db_path)
+        assert len(reopened) == 2
+        assert [a["id"] for a in reopened] == ["A1", "A2"]
+
+        alert = reopened.get("A1")
+        assert alert["evidence"] == {"score": 0.9}
+        assert alert["status"] == "closed"
+        assert alert["status_history"][0]["notes"] == "false positive"
+        assert [a["id"] for a in reopened.query(status="closed")] == ["A1"]
+        assert [a["id"] for a in reopened.query(status="open")] == ["A2"]
+
+    def test_unknown_alert(self, db_path):
+        """Unknown ids are reported as None."""
+        repository = AlertRepository(db_path)
+        assert repository.get("missing") is None
+        assert repository.update_status("missing", "closed") is None
+
+    def test_retention(self, db_path, make_alert):
+        """The oldest alerts are dropped beyond max_alerts and reported."""
+        removed = []
+        repository = AlertRepository(db_path, max_alerts=2, on_remove=removed.append)
+        for day in range(1, 5):
+            repository.append(make_alert(f"A{day}", f"2024-01-0{day}T10:00:00"))
+
+        assert [a["id"] for a in repository.query()] == ["A4", "A3"]
+        assert [a["id"] for a in removed] == ["A1", "A2"]
+
+    def test_matches_in_memory_store(self, make_alert):
+        """Queries return the same alerts as AlertStore."""
+        rng = random.Random(7)
+        store = AlertStore()
+        repository = AlertRepository()
+        for index in range(300):
+            alert = make_alert(
+                f"A{index}",
+                f"2024-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00",
+                alert_type=rng.choice(["SPOOFING", "INSIDER_DEALING"]),
+                severity=rng.choice(["HIGH", "MEDIUM"]),
+                trader_id=rng.choice(["TR1", "TR2", "TR3"]),
+            )
+            store.append(alert)
+            repository.append(alert)
+        for alert_id in ("A3", "A50", "A99"):
+            store.update_status(alert_id, "escalated")
+            repository.update_status(alert_id, "escalated")
+
+        cases = [
+            {},
+            {"trader_id": "TR2", "limit": 10, "offset": 5},
+            {"alert_type": "SPOOFING", "severity": "HIGH", "newest_first": False},
+            {"start": "2024-01-05T00:00:00", "end": "2024-01-09T23:00:00"},
+            {"status": "escalated"},
+        ]
+        for criteria in cases:
+            expected = [a["id"] for a in store.query(**criteria)]
+            assert [a["id"] for a in repository.query(**criteria)] == expected
+
+        chunked = repository.iter_query(severity="MEDIUM", chunk_size=7)
+        assert [a["id"] for a in chunked] == [
+            a["id"] for a in store.query(severity="MEDIUM")
+        ]
+
+    def test_person_alert_columns(self, db_path):
+        """Person-centric alert dicts are indexed by person and typology."""
+        repository = AlertRepository(
+            db_path, table="person_alerts", columns=PERSON_ALERT_COLUMNS
+        )
+        repository.append(
+            {
+                "alert_id": "P1",
+                "person_id": "person_1",
+                "risk_typology": "spoofing",
+                "severity": "high",
+                "detection_timestamp": "2024-01-01T10:00:00+00:00",
+            }
+        )
+
+        assert repository.query(trader_id="person_1", alert_type="spoofing")[0]["alert_id"] == "P1"
+        assert repository.get("P1")["person_id"] == "person_1"
+
+    def test_replace_keeps_status(self, db_path, make_alert):
+        """Replacing a merged alert keeps its recorded status."""
+        repository = AlertRepository(db_path)
+        repository.append(make_alert("A1", "2024-01-01T10:00:00"))
+        repository.update_status("A1", "escalated")
+
+        merged = make_alert("A1", "2024-01-01T10:00:00", severity="CRITICAL")
+        assert repository.replace(merged)
+        assert not repository.replace(make_alert("missing", "2024-01-01T10:00:00"))
+
+        alert = repository.get("A1")
+        assert alert["severity"] == "CRITICAL"
+        assert alert["status"] == "escalated"
+        assert [a["id"] for a in repository.query(severity="CRITICAL", status="escalated")] == ["A1"]
+
+    def test_summary_matches_aggregates(self, db_path, make_alert):
+        """SQL summaries count the same alerts as the in-memory aggregates."""
+        now = datetime(2024, 3, 10, 12, 30)
+        repository = AlertRepository(db_path)
+        aggregates = AlertAggregates(days=90)
+        rng = random.Random(11)
+        for index in range(60):
+            alert = make_alert(
+                f"A{index}",
+                now - timedelta(hours=index * 29),
+                alert_type=rng.choice(["SPOOFING", "INSIDER_DEALING"]),
+                severity=rng.choice(["HIGH", "MEDIUM", "LOW"]),
+                trader_id=rng.choice(["TR1", "TR2", "TR3", ""]),
+                instruments=rng.sample(["VOD.L", "BP.L", "ES_FUT"], rng.randint(0, 2)),
+            )
+            repository.append(alert)
+            aggregates.add(alert)
+        for alert_id in ("A3", "A20"):
+            aggregates.update_status(repository.update_status(alert_id, "closed"), None)
+
+        for days in (1, 7, 30, 90):
+            expected = aggregates.summary(days, now=now)
+            actual = repository.summary((now - timedelta(days=days)).isoformat())
+            for key in ("unique_traders", "instruments_affected"):
+                assert sorted(actual.pop(key)) == sorted(expected.pop(key))
+            assert actual == expected
+
+    def test_invalid_configuration(self):
+        """Invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            AlertRepository(max_alerts=0)
+        with pytest.raises(ValueError):
+            AlertRepository(table="alerts; DROP TABLE alerts")
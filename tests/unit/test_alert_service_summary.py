@@ -0,0 +1,45 @@
+"""
+Unit tests for alert summaries of AlertService alert histories.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+try:
+    from src.core.services.alert_service import AlertService
+except ImportError as e:
+    pytest.skip(f"Alert service not available: {e}", allow_module_level=True)
+
+
+@pytest.mark.unit
+class TestAlertServiceSummary:
+    """Unit tests for AlertService.get_alert_summary."""
+
+    def test_workers_share_summary(self, tmp_path, make_alert):
+        """Services sharing a database see each other's alerts, status changes and retention."""
+        settings = {"db_path": str(tmp_path / "alerts.db"), "max_alerts": 2}
+        first = AlertService(alert_history=settings)
+        second = AlertService(alert_history=settings)
+        now = datetime.utcnow()
+
+        first.alert_history.append(make_alert("A1", now - timedelta(hours=3)))
+        second.alert_history.append(
+            make_alert("A2", now - timedelta(hours=2), trader_id="TR2", instruments=["VOD.L"])
+        )
+        for service in (first, second):
+            summary = service.get_alert_summary(days=7)
+            assert summary["total_alerts"] == 2
+            assert sorted(summary["unique_traders"]) == ["TR1", "TR2"]
+            assert summary["instruments_affected"] == ["VOD.L"]
+
+        second.update_alert_status("A1", "closed")
+        assert first.get_alert_summary(days=7)["by_status"] == {"open": 1, "closed": 1}
+
+        # Retention in the second service drops A1 for both
+        second.alert_history.append(make_alert("A3", now - timedelta(hours=1), severity="LOW"))
+        summary = first.get_alert_summary(days=7)
+        assert summary["total_alerts"] == 2
+        assert summary["by_severity"] == {"HIGH": 1, "LOW": 1}
+        assert summary["by_status"] == {"open": 2}
+
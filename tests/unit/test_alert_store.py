@@ -0,0 +1,112 @@
+"""
+Unit tests for the time-ordered alert history store.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.alert_store import AlertStore
+
+
+@pytest.fixture
+def store(make_alert):
+    """Store with alerts inserted out of time order."""
+    alert_store = AlertStore()
+    alert_store.extend(
+        [
+            make_alert("A3", "2024-01-03T10:00:00", trader_id="TR2"),
+            make_alert("A1", "2024-01-01T10:00:00", alert_type="INSIDER_DEALING"),
+            make_alert("A4", "2024-01-04T10:00:00", severity="MEDIUM"),
+            make_alert("A2", "2024-01-02T10:00:00"),
+        ]
+    )
+    return alert_store
+
+
+@pytest.mark.unit
+class TestAlertStore:
+    """Unit tests for AlertStore."""
+
+    def test_time_ordered_regardless_of_insert_order(self, store):
+        """Queries return alerts newest first, iteration oldest first."""
+        assert [a["id"] for a in store.query()] == ["A4", "A3", "A2", "A1"]
+        assert [a["id"] for a in store] == ["A1", "A2", "A3", "A4"]
+
+    def test_lookup_by_id(self, store):
+        """Alerts are resolved by id without scanning."""
+        assert store.get("A3")["trader_id"] == "TR2"
+        assert store.get("missing") is None
+
+    def test_indexed_filters(self, store):
+        """Type, severity and trader filters combine."""
+        assert [a["id"] for a in store.query(alert_type="SPOOFING")] == ["A4", "A3", "A2"]
+        assert [a["id"] for a in store.query(severity="HIGH", trader_id="TR1")] == [
+            "A2",
+            "A1",
+        ]
+        assert store.query(trader_id="TR9") == []
+
+    def test_range_limit_offset(self, store):
+        """Range bounds are inclusive and paging skips matches in order."""
+        in_range = store.query(start="2024-01-02T10:00:00", end="2024-01-03T10:00:00")
+        assert [a["id"] for a in in_range] == ["A3", "A2"]
+
+        page = store.query(limit=2, offset=1, newest_first=False)
+        assert [a["id"] for a in page] == ["A2", "A3"]
+
+    def test_count_retention(self, make_alert):
+        """The oldest alerts are dropped beyond max_alerts."""
+        alert_store = AlertStore(max_alerts=2)
+        for day in range(1, 5):
+            alert_store.append(make_alert(f"A{day}", f"2024-01-0{day}T10:00:00"))
+
+        assert len(alert_store) == 2
+        assert alert_store.get("A1") is None
+        assert [a["id"] for a in alert_store.query(alert_type="SPOOFING")] == ["A4", "A3"]
+
+    def test_long_running_count_retention(self, make_alert):
+        """Many drops keep the newest alerts in time order, with late arrivals placed correctly."""
+        base = datetime(2024, 1, 1)
+        alert_store = AlertStore(max_alerts=50)
+        for i in range(500):
+            # Every tenth alert arrives late, behind the twenty before it
+            minutes = i - 20 if i % 10 == 9 else i
+            alert_store.append(make_alert(f"A{i}", base + timedelta(minutes=minutes), severity="LOW" if i % 2 else "HIGH"))
+
+        kept = sorted(
+            ((i - 20 if i % 10 == 9 else i), i) for i in range(500)
+        )[-50:]
+        assert len(alert_store) == 50
+        assert [a["id"] for a in alert_store] == [f"A{i}" for _, i in kept]
+        assert [a["id"] for a in alert_store.query(severity="LOW", limit=3)] == [
+            f"A{i}" for _, i in reversed(kept) if i % 2
+        ][:3]
+        start = (base + timedelta(minutes=470)).isoformat()
+        assert len(alert_store.query(start=start)) == sum(1 for minutes, _ in kept if minutes >= 470)
+
+    def test_age_retention(self, make_alert):
+        """Alerts older than retention_days are dropped on insert."""
+        alert_store = AlertStore(retention_days=1)
+        old = (datetime.utcnow() - timedelta(days=3)).isoformat()
+        recent = datetime.utcnow().isoformat()
+        alert_store.append(make_alert("OLD", old))
+        alert_store.append(make_alert("NEW", recent))
+
+        assert [a["id"] for a in alert_store] == ["NEW"]
+
+    def test_invalid_configuration(self):
+        """Invalid retention settings are rejected."""
+        with pytest.raises(ValueError):
+            AlertStore(max_alerts=0)
+        with pytest.raises(ValueError):
+            AlertStore(retention_days=0)
+
+    def test_status_updates(self, store):
+        """Status changes are recorded and re-indexed."""
+        assert store.update_status("missing", "closed") is None
+
+        alert = store.update_status("A2", "closed", "false positive")
+        assert alert["status_history"][0]["notes"] == "false positive"
+        assert [a["id"] for a in store.query(status="closed")] == ["A2"]
+        assert [a["id"] for a in store.query(status="open")] == ["A4", "A3", "A1"]
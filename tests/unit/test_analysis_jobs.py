@@ -0,0 +1,168 @@
+"""
+Unit tests for the SQLite-backed analysis job store and runner.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.services.analysis_jobs import AnalysisJobManager, AnalysisJobStore, JobStatus
+
+
+def wait_for_status(manager, job_id, statuses, timeout=5.0):
+    """Poll a job until it reaches one of the given statuses."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get_status(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not reach {statuses}")
+
+
+@pytest.mark.unit
+class TestAnalysisJobManager:
+    """Unit tests for AnalysisJobManager."""
+
+    def test_job_runs_to_completion(self):
+        """Submission returns immediately and results are retrievable by id."""
+        manager = AnalysisJobManager(
+            lambda index, item: {"batch_index": index, "value": item["value"] * 2},
+            chunk_size=3,
+        )
+        try:
+            job_id = manager.submit([{"value": i} for i in range(10)])
+            job = wait_for_status(manager, job_id, JobStatus.TERMINAL)
+
+            assert job["status"] == JobStatus.COMPLETED
+            assert job["completed_items"] == 10
+            assert job["progress"] == 1.0
+            results = manager.get_results(job_id)
+            assert [r["value"] for r in results] == [i * 2 for i in range(10)]
+            assert manager.get_results(job_id, offset=8, limit=5)[0]["batch_index"] == 8
+        finally:
+            manager.shutdown()
+
+    def test_item_failures_recorded(self):
+        """Failing items are counted and reported without stopping the job."""
+
+        def run_item(index, item):
+            if index == 1:
+                raise ValueError("bad dataset")
+            return {"batch_index": index}
+
+        manager = AnalysisJobManager(run_item)
+        try:
+            job_id = manager.submit([{}, {}, {}])
+            job = wait_for_status(manager, job_id, JobStatus.TERMINAL)
+
+            assert job["status"] == JobStatus.COMPLETED
+            assert job["completed_items"] == 2
+            assert job["failed_items"] == 1
+            assert manager.get_results(job_id)[1]["error"] == "bad dataset"
+        finally:
+            manager.shutdown()
+
+    def test_partial_results_and_cancellation(self):
+        """A running job exposes partial results and stops when cancelled."""
+        release = threading.Event()
+
+        def run_item(index, item):
+            if index == 2:
+                release.wait(timeout=5)
+            return {"batch_index": index}
+
+        manager = AnalysisJobManager(run_item)
+        try:
+            job_id = manager.submit([{} for _ in range(50)])
+            deadline = time.monotonic() + 5
+            while manager.get_status(job_id)["completed_items"] < 2:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            assert len(manager.get_results(job_id)) == 2
+            assert manager.cancel(job_id) is True
+            release.set()
+
+            job = wait_for_status(manager, job_id, JobStatus.TERMINAL)
+            assert job["status"] == JobStatus.CANCELLED
+            assert job["completed_items"] < 50
+            assert manager.cancel(job_id) is False
+        finally:
+            release.set()
+            manager.shutdown()
+
+    def test_queued_job_cancelled_before_start(self):
+        """Jobs waiting for a worker are cancelled without running."""
+        release = threading.Event()
+        ran = []
+
+        def run_item(index, item):
+            ran.append(item["job"])
+            release.wait(timeout=5)
+            return {"batch_index": index}
+
+        manager = AnalysisJobManager(run_item, max_workers=1)
+        try:
+            first = manager.submit([{"job": "first"}])
+            second = manager.submit([{"job": "second"}])
+
+            assert manager.cancel(second) is True
+            assert manager.get_status(second)["status"] == JobStatus.CANCELLED
+            release.set()
+
+            wait_for_status(manager, first, JobStatus.TERMINAL)
+            manager.shutdown()
+            assert ran == ["first"]
+        finally:
+            release.set()
+
+    def test_unknown_job(self):
+        """Unknown ids report no status."""
+        manager = AnalysisJobManager(lambda index, item: {})
+        try:
+            assert manager.get_status("job_missing") is None
+            assert manager.cancel("job_missing") is False
+        finally:
+            manager.shutdown()
+
+    def test_interrupted_jobs_failed_on_restart(self, tmp_path):
+        """Jobs whose process stopped heartbeating are failed; live ones are left alone."""
+        db_path = str(tmp_path / "jobs.db")
+        dead = AnalysisJobStore(db_path)
+        dead_job = dead.create_job([{"value": 1}])
+        dead.mark_running(dead_job)
+        with dead._conn:
+            dead._conn.execute("UPDATE analysis_jobs SET heartbeat_at = ?", (time.time() - 3600,))
+        dead.close()
+
+        live = AnalysisJobStore(db_path)
+        live_job = live.create_job([{"value": 2}])
+        live.mark_running(live_job)
+
+        manager = AnalysisJobManager(lambda index, item: {}, store=AnalysisJobStore(db_path))
+        try:
+            job = manager.get_status(dead_job)
+            assert job["status"] == JobStatus.FAILED
+            assert "restart" in job["error"]
+            assert manager.get_status(live_job)["status"] == JobStatus.RUNNING
+        finally:
+            manager.shutdown()
+            live.close()
+
+    def test_heartbeat_keeps_jobs_alive(self, tmp_path):
+        """Owners refresh their unfinished jobs; others fail them once stale."""
+        db_path = str(tmp_path / "jobs.db")
+        owner = AnalysisJobStore(db_path)
+        other = AnalysisJobStore(db_path)
+        job_id = owner.create_job([{"value": 1}])
+
+        assert other.fail_interrupted_jobs(stale_after_seconds=60) == 0
+        assert owner.fail_interrupted_jobs(stale_after_seconds=-1) == 0
+        assert owner.heartbeat() == 1
+        assert other.fail_interrupted_jobs(stale_after_seconds=-1) == 1
+        assert owner.get_job(job_id)["status"] == JobStatus.FAILED
+        assert owner.heartbeat() == 0
+        owner.close()
+        other.close()
@@ -0,0 +1,106 @@
+"""
+Unit tests for batch entity resolution.
+"""
+
+import logging
+
+import pytest
+
+from src.core.entity_resolution import DisjointSet, EntityResolutionService, IdentityGraph
+
+
+@pytest.mark.unit
+class TestDisjointSet:
+    """Unit tests for the union-find structure."""
+
+    def test_union_and_groups(self):
+        """Groups keep first-added order and transitive unions."""
+        sets = DisjointSet(range(6))
+        assert sets.union(0, 3)
+        assert sets.union(3, 5)
+        assert not sets.union(5, 0)
+        sets.add(6)
+        assert sets.find(5) == sets.find(0)
+        assert sets.groups() == [[0, 3, 5], [1], [2], [4], [6]]
+
+
+@pytest.mark.unit
+class TestBatchResolution:
+    """Unit tests for IdentityGraph.resolve_batch."""
+
+    def test_identical_records_resolved_once(self):
+        """Duplicate attribute sets map to one person."""
+        graph = IdentityGraph()
+        record = {"account_id": "ACC1", "name": "John Smith", "desk": "RATES"}
+        result = graph.resolve_batch([record, dict(record), dict(record)])
+        assert len(set(result.person_ids)) == 1
+        assert result.report["records"] == 3
+        assert result.report["unique_attribute_sets"] == 1
+        assert result.report["new_persons"] == 1
+        assert len(graph.persons) == 1
+
+    def test_exact_matches_joined(self):
+        """Known identifiers resolve to their person without fuzzy matching."""
+        graph = IdentityGraph()
+        first = graph.resolve_batch([{"account_id": "ACC1", "name": "John Smith"}])
+        graph.persons[first.person_ids[0]].confidence_score = 0.95
+
+        result = graph.resolve_batch([{"account_id": "ACC1", "name": "Someone Else"}])
+        assert result.person_ids == first.person_ids
+        assert result.confidences == [0.95]
+        assert result.report["exact_matches"] == 1
+
+    def test_clusters_on_shared_identifiers_and_fuzzy_matches(self):
+        """Records sharing an identifier or matching a cluster leader are merged."""
+        graph = IdentityGraph()
+        result = graph.resolve_batch([
+            {"account_id": "ACC1", "name": "John Smith", "desk": "RATES"},
+            {"account_id": "ACC1", "name": "J. Smith"},
+            {"account_id": "ACC2", "name": "Jon Smith", "desk": "RATES"},
+            {"account_id": "ACC3", "name": "Mary Jones", "desk": "FX"},
+        ])
+        john, _, jon, mary = result.person_ids
+        assert result.person_ids[:3] == [john, john, john]
+        assert mary != john
+        assert graph.get_person_accounts(john) == {"ACC1", "ACC2"}
+        assert result.report["new_persons"] == 2
+        assert result.report["merges"] == [
+            {"person_id": john, "attribute_sets": 3, "matched_existing_person": False}
+        ]
+
+    def test_clusters_matched_to_existing_persons(self):
+        """A cluster fuzzy-matching a known person joins that person."""
+        graph = IdentityGraph()
+        known = graph.resolve_batch([{"account_id": "ACC1", "name": "John Smith", "desk": "RATES"}])
+
+        result = graph.resolve_batch([
+            {"account_id": "ACC9", "name": "John Smith", "desk": "RATES"},
+            {"account_id": "ACC9", "name": "John Smyth", "desk": "RATES"},
+        ])
+        assert set(result.person_ids) == set(known.person_ids)
+        assert result.report["fuzzy_matches"] == 2
+        assert graph.get_person_accounts(known.person_ids[0]) == {"ACC1", "ACC9"}
+
+    def test_logs_only_aggregate_statistics(self, caplog):
+        """Batch resolution logs counts, not attributes."""
+        graph = IdentityGraph()
+        with caplog.at_level(logging.INFO, logger="src.core.entity_resolution"):
+            graph.resolve_batch([{"account_id": "ACC1", "name": "John Smith"}] * 50)
+        messages = [record.getMessage() for record in caplog.records if record.levelno >= logging.INFO]
+        assert len(messages) == 1
+        assert "50 records" in messages[0]
+        assert "John Smith" not in messages[0]
+
+    def test_service_batch_for_trades_and_communications(self):
+        """Service batches map trade and communication fields to attributes."""
+        service = EntityResolutionService()
+        trades = service.resolve_trading_data_batch([
+            {"trader_id": "TR1", "trader_name": "John Smith", "desk": "RATES"},
+            {"trader_id": "TR1", "trader_name": "John Smith", "desk": "RATES"},
+        ])
+        comms = service.resolve_communication_batch([
+            {"sender_email": "john.smith@bank.com", "sender_name": "John Smith"},
+        ])
+        assert len(set(trades.person_ids)) == 1
+        assert trades.record_to_person() == {0: trades.person_ids[0], 1: trades.person_ids[0]}
+        assert comms.person_ids == trades.person_ids[:1]
@@ -0,0 +1,79 @@
+"""
+Unit tests for batched Bayesian risk scoring.
+"""
+
+import itertools
+
+import pytest
+
+try:
+    from src.core.engines.bayesian_engine import BayesianEngine
+
+    ENGINE = BayesianEngine()
+except Exception as e:  # models or their dependencies unavailable
+    pytest.skip(f"Bayesian engine not available: {e}", allow_module_level=True)
+
+MODELS = {
+    "insider_dealing": ("MaterialInfo", "TradingActivity", "Timing", "PriceImpact"),
+    "spoofing": ("OrderPattern", "CancellationRate", "PriceMovement", "VolumeRatio"),
+}
+
+
+def evidence_combinations(model_name):
+    """Every joint state of a model's evidence nodes."""
+    model = getattr(ENGINE, f"{model_name}_model")
+    nodes = MODELS[model_name]
+    states = [range(model.get_cardinality(node)) for node in nodes]
+    return [dict(zip(nodes, combination)) for combination in itertools.product(*states)]
+
+
+def read_evidence(processed_data, node_defs=None):
+    return dict(processed_data["evidence"]), {}
+
+
+def record_posterior(processed_data, evidence, fallback_usage, risk_probabilities):
+    return {"risk_probabilities": [float(p) for p in risk_probabilities], "evidence_factors": evidence}
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """
+    Engine reading evidence straight off the input and returning the posterior.
+
+    Single and batch calls share evidence extraction and scoring; what
+    differs is how the posterior is inferred, which is what these tests compare.
+    """
+    for model_name in MODELS:
+        monkeypatch.setattr(ENGINE, f"_{model_name}_evidence", read_evidence)
+        monkeypatch.setattr(ENGINE, f"_score_{model_name}", record_posterior)
+    return ENGINE
+
+
+@pytest.mark.unit
+class TestRiskBatch:
+    """Unit tests for calculate_*_risk_batch."""
+
+    @pytest.mark.parametrize("model_name", sorted(MODELS))
+    def test_batch_matches_single_calls(self, engine, model_name):
+        """Every evidence combination scores the same in a batch as on its own."""
+        batch = [{"evidence": evidence} for evidence in evidence_combinations(model_name)]
+        single_fn = getattr(engine, f"calculate_{model_name}_risk")
+        batch_results = getattr(engine, f"calculate_{model_name}_risk_batch")(batch)
+
+        assert len(batch_results) == len(batch) == 81
+        for processed_data, result in zip(batch, batch_results):
+            expected = single_fn(processed_data)
+            assert "error" not in expected
+            assert result["risk_probabilities"] == pytest.approx(expected["risk_probabilities"], abs=1e-9)
+            assert result["evidence_factors"] == expected["evidence_factors"]
+
+    def test_failures_stay_with_their_item(self, engine):
+        """An item whose evidence cannot be extracted errors alone."""
+        good = {"evidence": evidence_combinations("spoofing")[5]}
+        results = engine.calculate_spoofing_risk_batch([good, {}, good])
+
+        assert "error" in results[1]
+        assert results[0] == results[2]
+        assert results[0]["risk_probabilities"] == pytest.approx(
+            engine.calculate_spoofing_risk(good)["risk_probabilities"]
+        )
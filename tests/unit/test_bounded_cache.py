@@ -0,0 +1,142 @@
+"""
+Unit tests for the bounded LRU/TTL cache.
+"""
+
+import time
+
+import pytest
+
+from src.utils.bounded_cache import BoundedCache, estimate_size
+
+
+@pytest.mark.unit
+class TestBoundedCache:
+    """Unit tests for BoundedCache."""
+
+    def test_lru_eviction_by_count(self):
+        """The least recently used entry is evicted first."""
+        cache = BoundedCache(max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Entries are evicted once the estimated byte budget is exceeded."""
+        cache = BoundedCache(max_entries=100, max_bytes=250, size_fn=lambda value: 100)
+        for key in "abc":
+            cache[key] = key
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 200
+        assert "a" not in cache
+
+    def test_oversized_entry_kept(self):
+        """A single entry larger than the budget is still cached."""
+        cache = BoundedCache(max_bytes=10, size_fn=lambda value: 100)
+        cache["big"] = "value"
+        assert cache["big"] == "value"
+
+    def test_ttl_expiry(self):
+        """Expired entries are treated as absent."""
+        cache = BoundedCache(ttl_seconds=0.05)
+        cache["a"] = 1
+        time.sleep(0.1)
+
+        assert cache.get("a") is None
+        with pytest.raises(KeyError):
+            cache["a"]
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_spill_and_reload(self, tmp_path):
+        """Evicted entries are spilled to disk and reloaded on access."""
+        cache = BoundedCache(max_entries=1, spill_path=str(tmp_path / "spill.db"))
+        cache["a"] = [1, 2, 3]
+        cache["b"] = [4, 5]
+
+        assert len(cache) == 2
+        assert dict(cache.items()) == {"b": [4, 5], "a": [1, 2, 3]}
+        assert cache["a"] == [1, 2, 3]
+
+        stats = cache.get_stats()
+        assert stats["spilled"] == 2
+        assert stats["reloaded"] == 1
+        assert stats["spilled_entries"] == 1
+        cache.close()
+
+    def test_pop_removes_spilled_entry(self, tmp_path):
+        """Popping removes an entry wherever it is stored."""
+        cache = BoundedCache(max_entries=1, spill_path=str(tmp_path / "spill.db"))
+        cache["a"] = 1
+        cache["b"] = 2
+
+        assert cache.pop("a") == 1
+        assert "a" not in cache
+        assert len(cache) == 1
+        cache.close()
+
+    def test_spill_file_private_to_cache(self, tmp_path):
+        """Leftover spill files are discarded on open and deleted on close."""
+        path = tmp_path / "spill.db"
+        first = BoundedCache(max_entries=1, spill_path=str(path))
+        first["a"] = 1
+        first["b"] = 2
+        first._spill._conn.close()
+
+        second = BoundedCache(max_entries=1, spill_path=str(path))
+        assert "a" not in second
+        assert len(second) == 0
+
+        second.close()
+        assert not path.exists()
+
+    def test_hit_and_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        cache = BoundedCache()
+        cache["a"] = 1
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_invalid_configuration(self):
+        """Invalid bounds are rejected."""
+        with pytest.raises(ValueError):
+            BoundedCache(max_entries=0)
+        with pytest.raises(ValueError):
+            BoundedCache(max_bytes=0)
+        with pytest.raises(ValueError):
+            BoundedCache(ttl_seconds=0)
+
+
+@pytest.mark.unit
+class TestEstimateSize:
+    """Unit tests for estimate_size."""
+
+    def test_grows_with_content(self):
+        """Larger containers report larger sizes."""
+        assert estimate_size(["x" * 1000]) > estimate_size(["x"])
+        assert estimate_size({"a": list(range(1000))}) > estimate_size({"a": []})
+
+    def test_shared_objects_counted_once(self):
+        """Repeated references to one object are not double counted."""
+        shared = "y" * 10000
+        assert estimate_size([shared, shared]) < 2 * len(shared)
+
+    def test_slotted_objects(self):
+        """Attributes stored in __slots__ are included."""
+
+        class Slotted:
+            __slots__ = ("payload",)
+
+            def __init__(self, payload):
+                self.payload = payload
+
+        assert estimate_size(Slotted("z" * 5000)) > 5000
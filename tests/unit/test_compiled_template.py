@@ -0,0 +1,95 @@
+"""
+Unit tests for compiled narrative templates.
+"""
+
+import pytest
+
+from src.core.reporting.compiled_template import CompiledTemplate, TemplateCache
+from src.core.reporting.narrative_generator import NarrativeGenerator, ReportSection
+
+VALUES = {
+    "name": "J {Smith}",
+    "score": 0.8734,
+    "amount": 1234567,
+    "quote": "it's \"quoted\"\\",
+}
+
+
+@pytest.mark.unit
+class TestCompiledTemplate:
+    """Unit tests for CompiledTemplate and TemplateCache."""
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "Plain text",
+            "{name} scored {score:.1%} on ${amount:,}",
+            "{{literal}} {name!r} {quote} {quote!s:>30}",
+            "Line one\nLine 'two' {name}\n\t\"three\" \\ {score:.2f}",
+            "{name} and {name} again",
+        ],
+    )
+    def test_matches_str_format(self, source):
+        """Rendering is identical to str.format."""
+        assert CompiledTemplate(source).render(VALUES) == source.format(**VALUES)
+
+    def test_complex_fields_fall_back(self):
+        """Index, attribute and nested-spec fields use standard formatting."""
+        source = "{values[name]} {score:{width}}"
+        values = {"values": VALUES, "score": 1.5, "width": 6}
+        assert CompiledTemplate(source).render(values) == source.format(**values)
+
+    def test_missing_field_raises(self):
+        """Missing values raise KeyError like str.format."""
+        with pytest.raises(KeyError):
+            CompiledTemplate("{name} {missing}").render(VALUES)
+
+    def test_render_many(self):
+        """Batches render once per set of values."""
+        template = CompiledTemplate("{name}: {score:.2f}")
+        assert template.render_many([VALUES, {"name": "B", "score": 1}]) == [
+            "J {Smith}: 0.87",
+            "B: 1.00",
+        ]
+
+    def test_cache_by_id_and_version(self):
+        """Templates are compiled once per id and version."""
+        cache = TemplateCache()
+        first = cache.get("header", "1", "{name}")
+        assert cache.get("header", "1", "{name}") is first
+        assert cache.get("header", "2", "{name}") is not first
+        assert cache.get("header", "1", "Name: {name}").render(VALUES) == "Name: J {Smith}"
+
+    def test_narrative_batch_matches_single(self):
+        """Batch narratives match narratives generated one at a time."""
+        generator = NarrativeGenerator()
+        evidence = {
+            "person_info": {"person_name": "J Smith", "person_id": "P1"},
+            "scenario_summary": {
+                "alert_type": "insider_dealing",
+                "detection_confidence": 0.91,
+                "total_financial_exposure": 250000,
+                "regulatory_frameworks_triggered": ["MAR Article 8"],
+            },
+            "evidence_chain": [
+                {"evidence_type": "timing_anomaly", "strength": 0.9,
+                 "raw_data": {"hours_before_announcement": 4}},
+            ],
+        }
+
+        header = generator.generate_report_header(evidence, "2024-01-01 00:00:00 UTC")
+        assert "Alert Confidence: 91.0%" in header
+        assert generator.templates[ReportSection.HEADER].format(
+            person_name="J Smith",
+            person_id="P1",
+            risk_typology="Insider Dealing",
+            detection_confidence=0.91,
+            stor_eligible="No",
+            generation_timestamp="2024-01-01 00:00:00 UTC",
+        ) == header
+
+        batch = generator.generate_regulatory_narratives([evidence, evidence])
+        single = generator.generate_regulatory_narrative(evidence)
+        strip = lambda text: text.split("\n", 8)[8]
+        assert [strip(narrative) for narrative in batch] == [strip(single)] * 2
+        assert "exactly 4 hours before a material announcement" in single
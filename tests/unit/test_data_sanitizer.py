@@ -0,0 +1,96 @@
+"""
+Unit tests for role-based sanitization of regulatory evidence.
+"""
+
+import pytest
+
+from src.core.security.data_sanitizer import AccessLevel, DataSanitizer
+
+
+def make_evidence():
+    """Build an evidence item carrying every kind of sensitive field."""
+    return {
+        "evidence_type": "trading_pattern",
+        "timestamp": "2024-01-01T10:00:00",
+        "strength": 0.87654,
+        "description": "ACC_TRADER_001 bought $1,250,000 of stock, up 250% (from 45%)",
+        "regulatory_frameworks": ["MAR Article 14"],
+        "account_id": "ACC_TRADER_001",
+        "raw_data": {
+            "participants": ["jane@techcorp.com", "bob@broker.com"],
+            "position_size_usd": 1250400,
+            "accounts_involved": ["ACC_TRADER_001", "AB"],
+            "trader_name": "John Smith",
+            "venue": "LME",
+        },
+    }
+
+
+@pytest.fixture
+def sanitizer():
+    return DataSanitizer()
+
+
+@pytest.mark.unit
+class TestDataSanitizer:
+    """Unit tests for DataSanitizer."""
+
+    def test_description_masks_applied_in_one_pass(self, sanitizer):
+        """Account references, dollar amounts and large percentages are masked."""
+        assert sanitizer._sanitize_description(make_evidence()["description"]) == (
+            "ACC_*** bought $*** of stock, up ***% (from 45%)"
+        )
+        assert sanitizer._sanitize_description("ACC_X1234% and $5,000%") == "ACC_***% and $***%"
+
+    def test_public_gets_summary_only(self, sanitizer):
+        """Public users only see non-identifying summary fields."""
+        sanitized = sanitizer.sanitize_evidence_item(make_evidence(), AccessLevel.PUBLIC)
+        assert sanitized == {
+            "evidence_type": "trading_pattern",
+            "timestamp": "2024-01-01T10:00:00",
+            "strength": 0.88,
+            "description": "ACC_*** bought $*** of stock, up ***% (from 45%)",
+            "regulatory_frameworks": ["MAR Article 14"],
+        }
+
+    def test_analyst_masks_sensitive_raw_fields(self, sanitizer):
+        """Analysts see masked identifiers and rounded amounts."""
+        sanitized = sanitizer.sanitize_evidence_item(make_evidence(), AccessLevel.ANALYST)
+        assert sanitized["account_id"] == "ACC***01"
+        assert sanitized["raw_data"] == {
+            "participants": ["j***@techcorp.com", "b***@broker.com"],
+            "position_size_usd": 1250000,
+            "accounts_involved": ["ACC***01", "ACC_***"],
+            "trader_name": "***10 chars***",
+            "venue": "LME",
+        }
+
+    def test_admin_masks_external_emails_only(self):
+        """Internal domains come from config and are left unmasked."""
+        sanitizer = DataSanitizer({"internal_domains": ["broker.com"]})
+        sanitized = sanitizer.sanitize_evidence_item(make_evidence(), AccessLevel.ADMIN)
+        assert sanitized["raw_data"]["participants"] == ["j***@techcorp.com", "bob@broker.com"]
+        assert sanitized["account_id"] == "ACC_TRADER_001"
+
+    def test_sanitizing_does_not_mutate_input(self, sanitizer):
+        """Each level works on its own copy; regulators get the original item."""
+        evidence = make_evidence()
+        for level in (AccessLevel.PUBLIC, AccessLevel.ANALYST, AccessLevel.COMPLIANCE, AccessLevel.ADMIN):
+            sanitized = sanitizer.sanitize_evidence_item(evidence, level)
+            assert sanitized is not evidence
+        assert evidence == make_evidence()
+        assert sanitizer.sanitize_evidence_item(evidence, AccessLevel.REGULATOR) is evidence
+
+    def test_chain_matches_item_by_item(self, sanitizer):
+        """Sanitizing a chain applies the same plan to every item."""
+        chain = [make_evidence(), make_evidence()]
+        for level in AccessLevel:
+            assert sanitizer.sanitize_evidence_chain(chain, level) == [
+                sanitizer.sanitize_evidence_item(item, level) for item in chain
+            ]
+
+    def test_plans_resolved_once(self, sanitizer):
+        """Plans are built at construction and reused per access level."""
+        assert sanitizer.get_plan(AccessLevel.ANALYST) is sanitizer.get_plan(AccessLevel.ANALYST)
+        assert "trader_name" in sanitizer.get_plan(AccessLevel.ANALYST).masked_raw_fields
+        assert sanitizer.get_plan(AccessLevel.COMPLIANCE).masked_raw_fields == frozenset()
@@ -0,0 +1,139 @@
+"""
+Unit tests for the blocking index used by fuzzy identity resolution.
+"""
+
+import logging
+import random
+
+import pytest
+
+from src.core.entity_resolution import BlockingIndex, IdentityGraph, blocking_keys, soundex
+
+FIRST_NAMES = ["james", "john", "robert", "mary", "linda", "sarah", "wei", "priya", "ahmed", "olga"]
+LAST_NAMES = [
+    "smith", "johnson", "williams", "garcia", "miller", "davis", "martinez", "wilson",
+    "anderson", "taylor", "thompson", "harris", "robinson", "walker", "nguyen", "kowalski",
+]
+
+
+def swap_letters(value, rng):
+    """Introduce a transposition typo."""
+    if len(value) < 4:
+        return value
+    i = rng.randrange(1, len(value) - 2)
+    return value[:i] + value[i + 1] + value[i] + value[i + 2:]
+
+
+def make_population(size, rng):
+    """Build attribute sets for distinct persons."""
+    people = []
+    for i in range(size):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES) + str(i % 7 or "")
+        people.append({
+            "name": f"{first.title()} {last.title()}",
+            "email": f"{first}.{last}@bank.com",
+            "desk": f"DESK_{i % 12}",
+            "role": rng.choice(["trader", "sales"]),
+        })
+    return people
+
+
+def make_variant(person, rng):
+    """Build a noisy record of a known person."""
+    first, last = person["name"].split()
+    record = {"name": rng.choice([f"{first[0]}. {last}", swap_letters(person["name"], rng), person["name"]])}
+    if rng.random() < 0.5:
+        record["email"] = swap_letters(person["email"], rng)
+    if rng.random() < 0.5:
+        record["desk"] = person["desk"]
+    return record
+
+
+def build_graph(people, **kwargs):
+    graph = IdentityGraph(**kwargs)
+    for person in people:
+        person_id = graph._create_new_person(person)
+        graph._update_person_identity(person_id, person)
+    return graph
+
+
+@pytest.mark.unit
+class TestBlockingIndex:
+    """Unit tests for blocking keys and the blocking index."""
+
+    def test_soundex(self):
+        """Spelling variants share a phonetic code."""
+        assert soundex("robert") == soundex("rupert") == "R163"
+        assert soundex("ashcraft") == "A261"
+        assert soundex("pfister") == "P236"
+        assert soundex("smith") == soundex("smyth")
+
+    def test_blocking_keys(self):
+        """Names, emails and desks are normalised into keys."""
+        keys = blocking_keys({"name": "J. Smith", "email": "John.Smith@Bank.com", "desk": " fx-desk "})
+        assert keys == {
+            "name:smith", "name_sound:S530", "name_gram:smi", "name_gram:mit", "name_gram:ith",
+            "email_local:john.smith", "email_local:john", "email_local:smith",
+            "email_domain:bank.com", "desk:FX_DESK",
+        }
+        assert blocking_keys({"role": "trader", "account_id": "ACC1"}) == set()
+
+    def test_candidates_in_index_order(self):
+        """Candidates share a key with the record and keep insertion order."""
+        index = BlockingIndex()
+        index.add("p2", {"name": "Jane Smyth"})
+        index.add("p1", {"name": "John Smith"})
+        index.add("p3", {"name": "Mary Jones"})
+        assert index.candidates({"name": "Jon Smith"}) == ["p2", "p1"]
+        assert index.candidates({"name": "Zed Quill"}) == []
+        assert index.candidates({"role": "trader"}) is None
+
+    def test_name_grams_survive_sound_changes(self):
+        """A typo in a name's first letter changes its Soundex code but keeps most n-grams."""
+        assert soundex("kowalski") != soundex("gowalski")
+        index = BlockingIndex()
+        index.add("p1", {"name": "Olga Kowalski"})
+        index.add("p2", {"name": "Mary Jones"})
+        assert index.candidates({"name": "Gowalski"}) == ["p1"]
+        assert "name_gram:jon" not in blocking_keys({"name": "Jon"})
+
+    def test_oversized_blocks_ignored(self):
+        """Keys shared by too many persons do not generate candidates."""
+        index = BlockingIndex(max_block_size=2)
+        for i, name in enumerate(["Ann Lee", "Bob Ray", "Cy Fox"]):
+            index.add(f"p{i}", {"name": name, "desk": "FX"})
+        assert index.candidates({"desk": "FX", "name": "Cy Fox"}) == ["p2"]
+        # Only an oversized key: every person has to be considered
+        assert index.candidates({"desk": "FX"}) is None
+
+    def test_graph_indexes_incrementally(self):
+        """Emails and desks linked after creation become blocking keys."""
+        graph = IdentityGraph()
+        person_id = graph._create_new_person({"name": "John Smith"})
+        assert graph.blocking_index.candidates({"desk": "RATES"}) == []
+        graph._update_person_identity(person_id, {"desk": "RATES", "email": "jsmith@bank.com"})
+        assert graph.blocking_index.candidates({"desk": "RATES"}) == [person_id]
+        assert graph.blocking_index.candidates({"email": "jsmith@other.com"}) == [person_id]
+
+    def test_recall_against_brute_force(self):
+        """Blocked matching finds the brute-force match for nearly every record."""
+        logging.disable(logging.INFO)
+        try:
+            rng = random.Random(11)
+            people = make_population(240, rng)
+            blocked = build_graph(people, max_block_size=40)
+            # Scores every person the blocked graph holds
+            brute_force = IdentityGraph(use_blocking=False)
+            brute_force.persons = blocked.persons
+
+            records = [make_variant(rng.choice(people), rng) for _ in range(80)]
+            expected = [brute_force._find_fuzzy_match(record) for record in records]
+            found = [blocked._find_fuzzy_match(record) for record in records]
+        finally:
+            logging.disable(logging.NOTSET)
+
+        matched = [(exp, got) for exp, got in zip(expected, found) if exp]
+        recall = sum(1 for exp, got in matched if got == exp) / len(matched)
+        assert len(matched) > 60
+        assert recall >= 0.95, f"blocking recall {recall:.3f} against brute force"
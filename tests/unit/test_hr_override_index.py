@@ -0,0 +1,66 @@
+"""
+Unit tests for HR override lookups in the identity graph.
+"""
+
+import pytest
+
+from src.core.entity_resolution import EntityResolutionService, IdentityGraph, hr_identifier_keys
+
+
+@pytest.fixture
+def hr_graph():
+    """Graph with one person linked to an HR record, and that person's id."""
+    identity_graph = IdentityGraph()
+    person_id = identity_graph._create_new_person({"name": "John Doe"})
+    identity_graph._update_person_identity(person_id, {
+        "hr_employee_id": "EMP001",
+        "email": "John.Doe@company.com",
+        "hr_account_ids": ["TRADER001", "TRADER002"],
+    })
+    return identity_graph, person_id
+
+
+@pytest.mark.unit
+class TestHROverrideIndex:
+    """Unit tests for the HR identifier index."""
+
+    def test_identifier_keys(self):
+        """Employee id comes first, emails are normalised."""
+        assert hr_identifier_keys({
+            "employee_id": "EMP001", "email": " A.B@Company.com", "account_ids": ["T1", "T2"]
+        }) == ["employee_id:EMP001", "email:a.b@company.com", "account_id:T1", "account_id:T2"]
+        assert hr_identifier_keys({"employee_id": None, "account_ids": None}) == []
+
+    def test_override_by_employee_id(self, hr_graph):
+        """A known employee id resolves to the HR-linked person."""
+        graph, john = hr_graph
+        person_id, confidence = graph.resolve_person_id(
+            {"hr_employee_id": "EMP001", "name": "Zed Quill"}, hr_override=True
+        )
+        assert (person_id, confidence) == (john, 1.0)
+        assert len(graph.persons[john].hr_records) == 2
+
+    def test_override_by_other_identifiers(self, hr_graph):
+        """New employee ids still resolve through HR emails and accounts."""
+        graph, john = hr_graph
+        assert graph._handle_hr_override({"hr_employee_id": "EMP900", "hr_account_ids": ["TRADER002"]}) == john
+        assert graph._handle_hr_override({"hr_employee_id": "EMP901", "email": "john.doe@company.com"}) == john
+        assert graph._handle_hr_override({"hr_employee_id": "EMP902"}) is None
+
+    def test_index_updated_incrementally(self, hr_graph):
+        """Identifiers stay with the person first linked to them."""
+        graph, john = hr_graph
+        other = graph._create_new_person({"name": "Jane Roe"})
+        graph._update_person_identity(other, {"hr_employee_id": "EMP002", "hr_account_ids": ["TRADER001", "TRADER003"]})
+        assert graph.hr_index["employee_id:EMP002"] == other
+        assert graph.hr_index["account_id:TRADER003"] == other
+        assert graph.hr_index["account_id:TRADER001"] == john
+
+    def test_hr_feed_accounts_recorded(self):
+        """Trading accounts from the HR feed are kept on the HR record."""
+        service = EntityResolutionService()
+        person_id = service.identity_graph._create_new_person({"name": "John Doe"})
+        service.identity_graph._update_person_identity(person_id, {"hr_employee_id": "EMP001"})
+        service.add_hr_data([{"employee_id": "EMP001", "full_name": "John Doe", "trading_accounts": ["TRADER001"]}])
+        assert service.identity_graph.persons[person_id].hr_records[-1]["account_ids"] == ["TRADER001"]
+        assert service.identity_graph.hr_index["account_id:TRADER001"] == person_id
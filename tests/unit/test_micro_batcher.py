@@ -0,0 +1,124 @@
+"""
+Unit tests for the in-process micro-batching scheduler.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.micro_batcher import MicroBatcher
+
+
+@pytest.mark.unit
+class TestMicroBatcher:
+    """Unit tests for MicroBatcher."""
+
+    def test_each_caller_gets_its_own_result(self):
+        """Results are routed back to the submitting caller."""
+        batcher = MicroBatcher(lambda items: [item * 2 for item in items])
+        try:
+            futures = [batcher.submit(i) for i in range(20)]
+            assert [f.result(timeout=2) for f in futures] == [i * 2 for i in range(20)]
+        finally:
+            batcher.shutdown()
+
+    def test_concurrent_submissions_are_batched(self):
+        """Requests arriving within the window share one batch call."""
+        batch_sizes = []
+
+        def batch_fn(items):
+            batch_sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=100, max_delay_ms=200)
+        barrier = threading.Barrier(10)
+        results = []
+
+        def worker(value):
+            barrier.wait()
+            results.append(batcher.submit(value).result(timeout=2))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.shutdown()
+
+        assert sorted(results) == list(range(10))
+        assert len(batch_sizes) < 10
+        assert batcher.get_stats()["items_processed"] == 10
+
+    def test_batch_size_is_capped(self):
+        """No batch exceeds max_batch_size."""
+        batch_sizes = []
+
+        def batch_fn(items):
+            batch_sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=4, max_delay_ms=50)
+        futures = [batcher.submit(i) for i in range(10)]
+        for future in futures:
+            future.result(timeout=2)
+        batcher.shutdown()
+
+        assert max(batch_sizes) <= 4
+        assert sum(batch_sizes) == 10
+
+    def test_latency_bounded_by_delay(self):
+        """A lone request is dispatched once the delay window expires."""
+        batcher = MicroBatcher(lambda items: items, max_batch_size=1000, max_delay_ms=20)
+        try:
+            start = time.monotonic()
+            assert batcher.submit("x").result(timeout=2) == "x"
+            assert time.monotonic() - start < 1.0
+        finally:
+            batcher.shutdown()
+
+    def test_per_item_exception_isolated(self):
+        """An Exception result fails only its own future."""
+
+        def batch_fn(items):
+            return [ValueError("bad") if item < 0 else item for item in items]
+
+        batcher = MicroBatcher(batch_fn, max_delay_ms=50)
+        good = batcher.submit(1)
+        bad = batcher.submit(-1)
+        try:
+            assert good.result(timeout=2) == 1
+            with pytest.raises(ValueError):
+                bad.result(timeout=2)
+        finally:
+            batcher.shutdown()
+
+    def test_batch_failure_propagates_to_all(self):
+        """A raising batch function fails every future in the batch."""
+
+        def batch_fn(items):
+            raise RuntimeError("inference down")
+
+        batcher = MicroBatcher(batch_fn, max_delay_ms=50)
+        futures = [batcher.submit(i) for i in range(3)]
+        try:
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result(timeout=2)
+        finally:
+            batcher.shutdown()
+        assert batcher.get_stats()["batch_errors"] >= 1
+
+    def test_submit_after_shutdown_rejected(self):
+        """Shut down batchers refuse new work."""
+        batcher = MicroBatcher(lambda items: items)
+        batcher.shutdown()
+        with pytest.raises(RuntimeError):
+            batcher.submit(1)
+
+    def test_invalid_configuration(self):
+        """Invalid window settings are rejected."""
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda items: items, max_batch_size=0)
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda items: items, max_delay_ms=-1)
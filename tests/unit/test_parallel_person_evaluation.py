@@ -0,0 +1,182 @@
+"""
+Unit tests for parallel per-person evaluation in the surveillance engine.
+"""
+
+import json
+import zlib
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.person_centric_alert_generator import PersonCentricAlertGenerator
+from src.core.person_centric_surveillance_engine import PersonCentricSurveillanceEngine
+from src.core.person_evidence_aggregator import PersonEvidenceAggregator
+from src.models.trading_data import RawTradeData, TradeDirection
+
+TRADER_NAMES = ["Alice Carter", "Boris Novak", "Chen Wei", "Dana Okafor", "Erik Lund", "Fatima Rahman"]
+
+
+def make_trades():
+    """Build a few trades for each trader on separate desks."""
+    base = datetime.now(timezone.utc) - timedelta(hours=12)
+    trades = []
+    for i, name in enumerate(TRADER_NAMES):
+        for k in range(4):
+            trades.append(RawTradeData(
+                trade_id=f"T{i}_{k}",
+                execution_timestamp=(base + timedelta(minutes=37 * k + i)).isoformat(),
+                instrument="AAPL",
+                instrument_type="equity",
+                symbol="AAPL",
+                exchange="NYSE",
+                direction=TradeDirection.BUY if k % 2 else TradeDirection.SELL,
+                quantity=100 * (k + 1),
+                executed_price=150.0 + k,
+                notional_value=100 * (k + 1) * (150.0 + k),
+                trader_id=f"TR{i:03d}",
+                trader_name=name,
+                desk=f"DESK_{i}",
+            ))
+    return trades
+
+
+def make_engine(tmp_path, workers=1, pool="thread", min_persons=2):
+    """Engine configured with the given worker pool."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "person_centric_surveillance": {
+            "enabled": True,
+            "performance_optimization": {
+                "batch_processing": {
+                    "parallel_processing_enabled": workers > 1,
+                    "max_worker_threads": workers,
+                    "worker_pool": pool,
+                    "parallel_min_persons": min_persons,
+                }
+            },
+        }
+    }))
+    return PersonCentricSurveillanceEngine(str(config_path))
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """Engine factory that stops each engine's worker pool after the test."""
+    created = []
+
+    def factory(**kwargs):
+        engine = make_engine(tmp_path, **kwargs)
+        created.append(engine)
+        return engine
+
+    yield factory
+    for engine in created:
+        engine.close()
+
+
+def failing_for(name):
+    """Evidence aggregation that raises for one trader's records."""
+    aggregate = PersonEvidenceAggregator.aggregate_person_evidence
+
+    def failing_aggregate(self, person_id, trade_data, *args, **kwargs):
+        if trade_data and trade_data[0].trader_name == name:
+            raise ValueError("corrupt trade record")
+        return aggregate(self, person_id, trade_data, *args, **kwargs)
+
+    return failing_aggregate
+
+
+@pytest.fixture
+def alerting_model(monkeypatch):
+    """Give every person a stable, name-derived risk probability above the alert threshold."""
+    def base_risk_probability(self, person_id, risk_typology, person_profile, *args):
+        key = f"{person_profile.primary_name}:{risk_typology.value}".encode()
+        return 0.45 + (zlib.crc32(key) % 50) / 100
+
+    monkeypatch.setattr(PersonCentricAlertGenerator, "_calculate_base_risk_probability", base_risk_probability)
+
+
+def run_summary(engine, trades):
+    """Alerts and per-person state of a run, keyed by person name."""
+    results = engine.process_surveillance_data(trades)
+    names = {
+        person_id: identity.primary_name
+        for person_id, identity in engine.entity_resolution.identity_graph.persons.items()
+    }
+    return {
+        "status": results["status"],
+        "failed": [names[failure["person_id"]] for failure in results["failed_persons"]],
+        "alerts": [
+            (alert["person_name"], alert["risk_typology"], alert["probability_score"], alert["occurrence_count"])
+            for alert in results["alerts"]
+        ],
+        "profiles": sorted(names[person_id] for person_id in engine.evidence_aggregator.risk_profiles),
+        "risk_nodes": sorted(
+            (names[person_id], sorted(typology.value for typology in nodes))
+            for person_id, nodes in engine.cross_typology_engine.person_risk_nodes.items()
+        ),
+        "alert_history": len(engine.alert_generator.alert_history),
+    }
+
+
+@pytest.mark.unit
+class TestParallelPersonEvaluation:
+    """Unit tests for fanning per-person evaluation out over a worker pool."""
+
+    def test_matches_sequential_run(self, engines, alerting_model):
+        """A threaded run produces the same alerts, order and carried state as a sequential one."""
+        trades = make_trades()
+        sequential = engines()
+        parallel = engines(workers=3)
+        for _ in range(2):
+            expected = run_summary(sequential, trades)
+            assert expected["alerts"]
+            assert run_summary(parallel, trades) == expected
+        # Repeat detections were merged in the engine's own alert history
+        assert {alert[3] for alert in expected["alerts"]} == {2}
+        # One pool served both runs
+        assert parallel._executor is not None
+
+    def test_process_pool_matches_sequential_run(self, engines, alerting_model):
+        """Process workers produce the same results as a sequential run."""
+        trades = make_trades()
+        sequential = engines()
+        parallel = engines(workers=2, pool="process")
+        for _ in range(2):
+            assert run_summary(parallel, trades) == run_summary(sequential, trades)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_failures_isolated_per_person(self, engines, alerting_model, monkeypatch, workers):
+        """A person whose evaluation raises is reported; the others are still evaluated."""
+        monkeypatch.setattr(PersonEvidenceAggregator, "aggregate_person_evidence", failing_for("Chen Wei"))
+        summary = run_summary(engines(workers=workers), make_trades())
+
+        assert summary["status"] == "completed"
+        assert summary["failed"] == ["Chen Wei"]
+        assert "Chen Wei" not in summary["profiles"]
+        assert len(summary["profiles"]) == len(TRADER_NAMES) - 1
+        assert "Chen Wei" not in {alert[0] for alert in summary["alerts"]}
+
+    def test_single_worker_stays_in_process(self, engines):
+        """Without parallel processing no pool is started."""
+        engine = engines()
+        engine._evaluate_persons_parallel = Mock()
+        results = engine.process_surveillance_data(make_trades())
+        assert results["status"] == "completed"
+        assert results["failed_persons"] == []
+        engine._evaluate_persons_parallel.assert_not_called()
+
+    def test_small_runs_stay_in_process(self, engines):
+        """Runs with fewer persons than the threshold are evaluated sequentially."""
+        engine = engines(workers=4, min_persons=len(TRADER_NAMES) + 1)
+        engine._evaluate_persons_parallel = Mock()
+        assert engine.process_surveillance_data(make_trades())["status"] == "completed"
+        engine._evaluate_persons_parallel.assert_not_called()
+        assert engine._executor is None
+
+    def test_worker_pool_configuration(self, tmp_path):
+        """Pool size, kind and threshold come from batch processing settings."""
+        engine = make_engine(tmp_path, workers=4, pool="process", min_persons=20)
+        assert (engine.max_workers, engine.worker_pool, engine.parallel_min_persons) == (4, "process", 20)
+        assert make_engine(tmp_path, workers=2, pool="fibers").worker_pool == "thread"
@@ -0,0 +1,168 @@
+"""
+Unit tests for incremental per-person activity tracking.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.entity_resolution import PersonIdentity
+from src.core.person_activity_tracker import PersonActivityTracker, communication_key
+from src.core.person_centric_surveillance_engine import PersonCentricSurveillanceEngine
+from src.models.trading_data import RawTradeData, TradeDirection
+
+NOW = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "person_centric_surveillance.json"
+
+
+def trade(trade_id, hours_ago, trader_id="TR1", trader_name="Alice Carter", now=NOW):
+    return RawTradeData(
+        trade_id=trade_id,
+        execution_timestamp=(now - timedelta(hours=hours_ago)).isoformat(),
+        instrument="AAPL",
+        instrument_type="equity",
+        symbol="AAPL",
+        exchange="NYSE",
+        direction=TradeDirection.BUY,
+        quantity=100,
+        executed_price=150.0,
+        notional_value=15000.0,
+        trader_id=trader_id,
+        trader_name=trader_name,
+        desk="EQUITY",
+    )
+
+
+@pytest.mark.unit
+class TestPersonActivityTracker:
+    """Unit tests for PersonActivityTracker."""
+
+    def test_new_records_bump_version(self):
+        """Unseen records make a person dirty; repeats do not."""
+        tracker = PersonActivityTracker(lookback_hours=24)
+        assert tracker.add_trades("P1", [trade("T1", 2), trade("T2", 1)], NOW) == 2
+        assert tracker.dirty_persons() == ["P1"]
+
+        tracker.mark_evaluated("P1")
+        assert tracker.add_trades("P1", [trade("T1", 2)], NOW) == 0
+        assert tracker.dirty_persons() == []
+
+        tracker.add_communications("P1", [{"id": "M1", "timestamp": NOW.isoformat()}], NOW)
+        assert tracker.dirty_persons() == ["P1"]
+        assert [t.trade_id for t in tracker.get_trades("P1")] == ["T1", "T2"]
+        assert tracker.data_versions["P1"] == 2
+
+    def test_amended_records_bump_version(self):
+        """A known trade id with changed content replaces the stored trade."""
+        tracker = PersonActivityTracker(lookback_hours=24)
+        tracker.add_trades("P1", [trade("T1", 20), trade("T2", 1)], NOW)
+        tracker.mark_evaluated("P1")
+
+        amended = trade("T1", 2)
+        amended.quantity = 250
+        assert tracker.add_trades("P1", [amended, trade("T2", 1)], NOW) == 1
+        assert tracker.dirty_persons() == ["P1"]
+        assert [t.quantity for t in tracker.get_trades("P1")] == [250, 100]
+
+        # The amended trade expires at its new time, not the original one
+        tracker.mark_evaluated("P1")
+        assert tracker.expire(NOW + timedelta(hours=6)) == 0
+        assert tracker.expire(NOW + timedelta(hours=22, minutes=30)) == 1
+        assert [t.trade_id for t in tracker.get_trades("P1")] == ["T2"]
+
+    def test_records_age_out_of_window(self):
+        """Expired records are dropped and their person re-evaluated, then forgotten once empty."""
+        tracker = PersonActivityTracker(lookback_hours=24)
+        tracker.add_trades("P1", [trade("T1", 20), trade("T2", 1)], NOW)
+        tracker.add_trades("P2", [trade("T3", 2)], NOW)
+        tracker.add_trades("P3", [trade("T4", 30)], NOW)
+        assert "P3" not in tracker.records
+        for person_id in tracker.dirty_persons():
+            tracker.mark_evaluated(person_id)
+
+        assert tracker.expire(NOW + timedelta(hours=6)) == 1
+        assert tracker.dirty_persons() == ["P1"]
+        assert [t.trade_id for t in tracker.get_trades("P1")] == ["T2"]
+
+        later = NOW + timedelta(hours=30)
+        assert tracker.expire(later) == 2
+        assert tracker.dirty_persons() == ["P1", "P2"]
+        tracker.mark_evaluated("P2")
+        assert "P2" not in tracker.records
+
+    def test_unreadable_timestamps_never_expire(self):
+        """Records the aggregator cannot date stay in every window."""
+        tracker = PersonActivityTracker(lookback_hours=1)
+        comm = {"timestamp": "not a time", "sender_email": "a@bank.com", "content": "hi"}
+        assert tracker.add_communications("P1", [comm, dict(comm)], NOW) == 1
+        assert tracker.expire(NOW + timedelta(days=30)) == 0
+        assert tracker.get_communications("P1") == [comm]
+        assert communication_key({"id": 7, "content": "x"}) == 7
+
+    def test_identity_changes_mark_dirty(self):
+        """Linking a new account to a tracked person makes them dirty."""
+        tracker = PersonActivityTracker()
+        identity = PersonIdentity(person_id="P1", confidence_score=0.9, linked_accounts={"TR1"})
+        tracker.add_trades("P1", [trade("T1", 1, now=datetime.now(timezone.utc))], datetime.now(timezone.utc))
+        tracker.update_identity("P1", identity)
+        tracker.mark_evaluated("P1")
+
+        tracker.update_identity("P1", identity)
+        assert tracker.dirty_persons() == []
+        identity.linked_accounts.add("TR2")
+        tracker.update_identity("P1", identity)
+        assert tracker.dirty_persons() == ["P1"]
+        tracker.update_identity("P9", SimpleNamespace())
+        assert "P9" not in tracker.records
+
+
+@pytest.mark.unit
+class TestIncrementalProcessing:
+    """Unit tests for incremental re-runs of the surveillance engine."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({
+            "person_centric_surveillance": {
+                "performance_optimization": {"incremental_processing": {"enabled": True}}
+            }
+        }))
+        return PersonCentricSurveillanceEngine(str(config_path))
+
+    def test_reruns_evaluate_only_changed_persons(self, engine):
+        """Unchanged persons are skipped; new activity re-evaluates its person."""
+        now = datetime.now(timezone.utc)
+        trades = [
+            trade("T1", 3, "TR1", "Alice Carter", now),
+            trade("T2", 2, "TR2", "Boris Novak", now),
+            trade("T3", 40, "TR3", "Chen Wei", now),
+        ]
+        first = engine.process_surveillance_data(trades)
+        assert (first["status"], first["persons_evaluated"]) == ("completed", 2)
+
+        assert engine.process_surveillance_data(trades)["persons_evaluated"] == 0
+
+        rerun = engine.process_surveillance_data(trades + [trade("T4", 1, "TR4", "Dana Okafor", now)])
+        assert rerun["persons_evaluated"] == 1
+        dana = engine.entity_resolution.identity_graph.attribute_to_person["account_id:TR4"]
+        assert engine.activity_tracker.evaluated_versions[dana] == engine.activity_tracker.data_versions[dana]
+
+    def test_disabled_by_default(self, tmp_path):
+        """Without configuration every person is evaluated on every run."""
+        engine = PersonCentricSurveillanceEngine(str(tmp_path / "missing.json"))
+        assert engine.activity_tracker is None
+
+    def test_shipped_configuration_evaluates_every_run(self):
+        """Incremental re-runs are opt-in; the shipped configuration re-evaluates identical input."""
+        engine = PersonCentricSurveillanceEngine(str(CONFIG_PATH))
+        assert engine.activity_tracker is None
+
+        now = datetime.now(timezone.utc)
+        trades = [trade("T1", 3, "TR1", "Alice Carter", now), trade("T2", 2, "TR2", "Boris Novak", now)]
+        first = engine.process_surveillance_data(trades)
+        second = engine.process_surveillance_data(trades)
+        assert first["persons_evaluated"] == second["persons_evaluated"] == 2
@@ -0,0 +1,93 @@
+"""
+Unit tests for the deduplicating person alert buffer.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.person_alert_buffer import PersonAlertBuffer
+from src.models.person_centric import AlertSeverity, PersonCentricAlert, RiskTypology
+
+
+def make_alert(alert_id, person_id="person_1", hour=9, probability=0.6,
+               typology=RiskTypology.SPOOFING, accounts=("ACC1",)):
+    """Build a person alert whose activity starts at ``hour`` on 2024-01-02."""
+    start = datetime(2024, 1, 2, hour, tzinfo=timezone.utc)
+    return PersonCentricAlert(
+        alert_id=alert_id,
+        person_id=person_id,
+        risk_typology=typology,
+        severity=AlertSeverity.MEDIUM if probability < 0.7 else AlertSeverity.HIGH,
+        probability_score=probability,
+        confidence_score=0.8,
+        involved_accounts=list(accounts),
+        account_count=len(accounts),
+        activity_period_start=start,
+        activity_period_end=start.replace(hour=hour + 1),
+        escalation_factors=[f"factor_{alert_id}"],
+    )
+
+
+@pytest.mark.unit
+class TestPersonAlertBuffer:
+    """Unit tests for PersonAlertBuffer."""
+
+    def test_repeat_detection_is_merged(self):
+        """Repeats in the same window supersede scores and keep the first id."""
+        buffer = PersonAlertBuffer()
+        first, merged = buffer.add(make_alert("A1", hour=9))
+        assert not merged
+
+        held, merged = buffer.add(make_alert("A2", hour=11, probability=0.8, accounts=("ACC2",)))
+        assert merged
+        assert held is first
+        assert len(buffer) == 1
+        assert held.alert_id == "A1"
+        assert held.probability_score == 0.8
+        assert held.severity == AlertSeverity.HIGH
+        assert held.involved_accounts == ["ACC1", "ACC2"]
+        assert held.account_count == 2
+        assert held.escalation_factors == ["factor_A1", "factor_A2"]
+        assert held.activity_period_end.hour == 12
+        assert held.occurrence_count == 2
+        assert held.last_detection_timestamp is not None
+
+    def test_weaker_repeat_keeps_assessment(self):
+        """A less probable repeat does not replace the held scores."""
+        buffer = PersonAlertBuffer()
+        buffer.add(make_alert("A1", probability=0.8))
+        held, merged = buffer.add(make_alert("A2", probability=0.5))
+
+        assert merged
+        assert held.probability_score == 0.8
+        assert held.occurrence_count == 2
+
+    def test_distinct_keys_are_kept(self):
+        """Different people, typologies or windows are separate alerts."""
+        buffer = PersonAlertBuffer(window_hours=6)
+        buffer.add(make_alert("A1", hour=1))
+        buffer.add(make_alert("A2", hour=7))
+        buffer.add(make_alert("A3", hour=1, typology=RiskTypology.INSIDER_DEALING))
+        buffer.add(make_alert("A4", hour=1, person_id="person_2"))
+
+        assert len(buffer) == 4
+        assert [a.alert_id for a in buffer.for_person("person_1")] == ["A1", "A2", "A3"]
+
+    def test_bounded(self):
+        """The least recently raised or merged alert is dropped when full."""
+        buffer = PersonAlertBuffer(max_alerts=2)
+        buffer.add(make_alert("A1", person_id="p1"))
+        buffer.add(make_alert("A2", person_id="p2"))
+        buffer.add(make_alert("A1b", person_id="p1"))
+        buffer.add(make_alert("A3", person_id="p3"))
+
+        assert [a.alert_id for a in buffer] == ["A1", "A3"]
+        assert buffer.for_person("p2") == []
+
+    def test_invalid_configuration(self):
+        """Invalid sizes are rejected."""
+        with pytest.raises(ValueError):
+            PersonAlertBuffer(max_alerts=0)
+        with pytest.raises(ValueError):
+            PersonAlertBuffer(window_hours=0)
@@ -0,0 +1,47 @@
+"""
+Unit tests for per-person record partitioning in the surveillance engine.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.person_centric_surveillance_engine import PersonCentricSurveillanceEngine
+
+
+@pytest.mark.unit
+class TestPersonPartitioning:
+    """Unit tests for grouping trades and communications by person."""
+
+    def test_group_by_person_keeps_record_order(self):
+        """Each person's slice keeps the input order of their records."""
+        trades = [SimpleNamespace(trade_id=f"T{i}", person_id=person) for i, person in enumerate("ABAB")]
+        grouped = PersonCentricSurveillanceEngine._group_by_person(trades, lambda trade: trade.person_id)
+        assert {person: [t.trade_id for t in slice_] for person, slice_ in grouped.items()} == {
+            "A": ["T0", "T2"],
+            "B": ["T1", "T3"],
+        }
+
+    def test_steps_receive_pre_grouped_slices(self):
+        """Evidence aggregation and alert generation get each person's own records."""
+        engine = PersonCentricSurveillanceEngine()
+        engine.evidence_aggregator = Mock(risk_profiles={})
+        engine.alert_generator = Mock()
+        engine.alert_generator.build_person_alert.return_value = None
+
+        trades = {"P1": ["t1", "t3"], "P2": ["t2"]}
+        comms = {"P1": [{"person_id": "P1"}]}
+        profiles = engine._aggregate_person_evidence(["P1", "P2"], trades, comms)
+        received = {
+            call.args[0]: call.args[1:] for call in engine.evidence_aggregator.aggregate_person_evidence.call_args_list
+        }
+        assert received == {"P1": (["t1", "t3"], [{"person_id": "P1"}]), "P2": (["t2"], [])}
+
+        engine._generate_person_alerts(profiles, trades, comms, None, None)
+        calls = engine.alert_generator.build_person_alert.call_args_list
+        assert {call.kwargs["person_id"] for call in calls} == {"P1", "P2"}
+        for call in calls:
+            person_id = call.kwargs["person_id"]
+            assert call.kwargs["trade_data"] == trades[person_id]
+            assert call.kwargs["communication_data"] == comms.get(person_id, [])
@@ -0,0 +1,110 @@
+"""
+Unit tests for the raw data secondary indexes.
+"""
+
+import pytest
+
+from src.core.raw_data_index import TRADE_INDEX_FIELDS, RawDataIndex
+from src.models.trading_data import RawTradeData, TradeDirection
+
+
+def make_trade(trade_id, timestamp, trader_id="TR1", instrument="AAPL", **overrides):
+    """Build a trade with sensible defaults."""
+    values = dict(
+        trade_id=trade_id,
+        execution_timestamp=timestamp,
+        instrument=instrument,
+        instrument_type="equity",
+        symbol=instrument,
+        exchange="NASDAQ",
+        direction=TradeDirection.BUY,
+        quantity=100.0,
+        executed_price=150.0,
+        notional_value=15000.0,
+        trader_id=trader_id,
+        desk="equities",
+    )
+    values.update(overrides)
+    return RawTradeData(**values)
+
+
+@pytest.fixture
+def index():
+    """Index holding trades for two alerts."""
+    trade_index = RawDataIndex(
+        TRADE_INDEX_FIELDS, "execution_timestamp", price_field="executed_price"
+    )
+    trade_index.add(
+        "ALERT1",
+        [
+            make_trade("T1", "2024-01-01T09:30:00"),
+            make_trade("T2", "2024-01-01T11:00:00", instrument="MSFT"),
+            make_trade("T3", "2024-01-02T10:00:00", quantity=5000.0),
+        ],
+    )
+    trade_index.add(
+        "ALERT2",
+        [
+            make_trade("T4", "2024-01-01T10:15:00", trader_id="TR2", exchange="LSE"),
+            make_trade("T5", "2024-01-03T15:00:00", direction=TradeDirection.SELL),
+        ],
+    )
+    return trade_index
+
+
+@pytest.mark.unit
+class TestRawDataIndex:
+    """Unit tests for RawDataIndex."""
+
+    def test_equality_fields_intersect(self, index):
+        """Matches satisfy every indexed criterion."""
+        page, total, _ = index.search({"trader_id": "TR1", "instrument": "AAPL"})
+        assert total == 3
+        assert page == [("ALERT1", 0), ("ALERT1", 2), ("ALERT2", 1)]
+
+        page, total, _ = index.search({"venue": "LSE"})
+        assert page == [("ALERT2", 0)]
+
+        page, total, _ = index.search({"direction": "sell", "alert_id": "ALERT2"})
+        assert page == [("ALERT2", 1)]
+
+    def test_unknown_value_matches_nothing(self, index):
+        """Values never indexed give an empty result."""
+        assert index.search({"desk": "rates"}) == ([], 0, None)
+
+    def test_time_range_and_ranges(self, index):
+        """Date bounds are exact within buckets and range filters apply."""
+        page, total, _ = index.search(
+            {"start_date": "2024-01-01T10:00:00", "end_date": "2024-01-02T10:00:00"}
+        )
+        assert page == [("ALERT2", 0), ("ALERT1", 1), ("ALERT1", 2)]
+
+        page, _, _ = index.search({"min_quantity": 1000})
+        assert page == [("ALERT1", 2)]
+
+    def test_pagination_resumes_after_position(self, index):
+        """Pages are contiguous and end with no resume position."""
+        seen = []
+        after = None
+        while True:
+            page, total, after = index.search({}, after=after, limit=2)
+            seen.extend(page)
+            if after is None:
+                break
+
+        assert total == 5
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_re_adding_alert_replaces_entries(self, index):
+        """Indexing an alert again drops its previous records."""
+        index.add("ALERT1", [make_trade("T9", "2024-02-01T10:00:00")])
+        assert len(index) == 3
+        assert index.search({"instrument": "MSFT"})[1] == 0
+
+    def test_remove(self, index):
+        """Removed alerts leave no postings behind."""
+        index.remove("ALERT2")
+        assert len(index) == 3
+        assert index.search({"trader_id": "TR2"})[1] == 0
+        assert index.search({"start_date": "2024-01-03"})[1] == 0
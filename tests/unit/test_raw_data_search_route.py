@@ -0,0 +1,109 @@
+"""
+Unit tests for cursor paging through the /raw-data/search route.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+ROUTES_PATH = os.path.join(SRC_DIR, "api", "v1", "routes", "trading_data.py")
+
+# The route module imports from src as the application root
+sys.path.insert(0, os.path.abspath(SRC_DIR))
+try:
+    spec = importlib.util.spec_from_file_location("trading_data_routes", ROUTES_PATH)
+    trading_data_routes = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(trading_data_routes)
+except ImportError as e:
+    pytest.skip(f"Trading data routes not available: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client for an app serving the trading data routes over fresh caches."""
+    service = trading_data_routes.TradingDataService()
+    monkeypatch.setattr(trading_data_routes, "trading_data_service", service)
+    service.extract_raw_trades_for_alert(
+        "ALERT1",
+        {
+            "trades": [
+                {
+                    "id": f"T{i}",
+                    "timestamp": f"2024-01-02T10:0{i}:00",
+                    "instrument": "AAPL",
+                    "side": "buy",
+                    "volume": 100,
+                    "price": 150.0,
+                    "trader_id": "TR1",
+                }
+                for i in range(5)
+            ]
+        },
+    )
+    service.extract_raw_orders_for_alert(
+        "ALERT1",
+        {
+            "orders": [
+                {
+                    "id": f"O{i}",
+                    "timestamp": f"2024-01-02T10:0{i}:30",
+                    "instrument": "AAPL",
+                    "side": "buy",
+                    "size": 100,
+                    "price": 150.0,
+                    "status": "filled",
+                    "trader_id": "TR1",
+                }
+                for i in range(2)
+            ]
+        },
+    )
+
+    app = Flask(__name__)
+    app.register_blueprint(trading_data_routes.trading_data_bp, url_prefix="/api/v1")
+    return app.test_client()
+
+
+@pytest.mark.unit
+class TestRawDataSearchRoute:
+    """Unit tests for paging search results with a cursor."""
+
+    def test_lists_exhausted_on_different_pages(self, client):
+        """Orders run out on the first page and trades on the third; paging keeps working."""
+        pages = []
+        cursor = None
+        while True:
+            criteria = {"trader_id": "TR1", "limit": 2}
+            if cursor:
+                criteria["cursor"] = cursor
+            response = client.post("/api/v1/raw-data/search", json=criteria)
+            assert response.status_code == 200, response.get_json()
+            body = response.get_json()
+            pages.append(body["results"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert [[t["trade_id"] for t in page["trades"]] for page in pages] == [
+            ["T0", "T1"],
+            ["T2", "T3"],
+            ["T4"],
+        ]
+        assert [[o["order_id"] for o in page["orders"]] for page in pages] == [
+            ["O0", "O1"],
+            [],
+            [],
+        ]
+        assert pages[0]["total_trades"] == 5
+        assert pages[0]["total_orders"] == 2
+
+    def test_invalid_cursor_rejected(self, client):
+        """A cursor that does not decode is a client error."""
+        response = client.post(
+            "/api/v1/raw-data/search", json={"trader_id": "TR1", "cursor": "bogus"}
+        )
+        assert response.status_code == 400
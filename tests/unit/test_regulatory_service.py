@@ -0,0 +1,155 @@
+"""
+Unit tests for the compliance notes and risk assessment of regulatory rationales.
+"""
+
+import itertools
+import json
+
+import pytest
+
+try:
+    from src.core.services.regulatory_service import RegulatoryService
+except ImportError as e:
+    pytest.skip(f"Regulatory service not available: {e}", allow_module_level=True)
+
+ALERT_TYPES = ["INSIDER_DEALING", "SPOOFING", "WASH_TRADING", None]
+SEVERITIES = ["HIGH", "MEDIUM", "LOW", None]
+SCORES = [0, 0.3, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.79, 0.8, 0.85, 0.9, 1.0]
+
+TYPE_NOTES = {
+    "INSIDER_DEALING": (
+        [
+            "Review trader access to material information",
+            "Investigate trading timing relative to information events",
+            "Document investigation findings",
+            "Consider STOR reporting if threshold exceeded",
+        ],
+        {"stor_threshold": 0.7},
+        ["STOR (if applicable)"],
+    ),
+    "SPOOFING": (
+        [
+            "Analyze order placement and cancellation patterns",
+            "Review trader intent and market impact",
+            "Document market manipulation evidence",
+            "Consider regulatory notification",
+        ],
+        {"manipulation_threshold": 0.6},
+        ["Market Surveillance Report"],
+    ),
+}
+CONSEQUENCES = {
+    ("INSIDER_DEALING", True): [
+        "Potential FCA investigation",
+        "Criminal prosecution risk",
+        "Significant financial penalties",
+        "Reputational damage",
+    ],
+    ("INSIDER_DEALING", False): [
+        "Regulatory scrutiny",
+        "Enhanced monitoring requirements",
+        "Potential administrative action",
+    ],
+    ("SPOOFING", True): [
+        "Market manipulation charges",
+        "Trading ban possibility",
+        "Civil monetary penalties",
+        "Disgorgement of profits",
+    ],
+    ("SPOOFING", False): ["Warning letter", "Enhanced surveillance", "Trading restrictions"],
+}
+ACTIONS = {
+    "CRITICAL": [
+        "Immediate escalation to Chief Compliance Officer",
+        "Consider trading suspension",
+        "Prepare regulatory notification",
+        "Engage external legal counsel",
+        "Document all evidence",
+    ],
+    "HIGH": [
+        "Escalate to senior compliance team",
+        "Enhanced monitoring of trader",
+        "Detailed investigation",
+        "Prepare preliminary report",
+    ],
+    "MEDIUM": [
+        "Standard investigation procedures",
+        "Monitor for pattern development",
+        "Document findings",
+    ],
+    "LOW": ["Continue routine monitoring", "Log for trend analysis"],
+}
+TIMELINES = {
+    "CRITICAL": "Immediate (within 1 hour)",
+    "HIGH": "Urgent (within 4 hours)",
+    "MEDIUM": "Standard (within 24 hours)",
+    "LOW": "Routine (within 1 week)",
+}
+
+
+def expected_notes(alert_type, severity, score):
+    """Compliance notes as built per alert before the fragments were memoised."""
+    actions, thresholds, requirements = TYPE_NOTES.get(alert_type, ([], {}, []))
+    actions = list(actions)
+    if score >= 0.8:
+        actions += ["Escalate to senior compliance officer", "Consider immediate trading restrictions"]
+    return {
+        "alert_type": alert_type,
+        "risk_level": severity,
+        "compliance_actions": actions,
+        "regulatory_thresholds": dict(thresholds),
+        "reporting_requirements": list(requirements),
+    }
+
+
+def expected_assessment(alert_type, score):
+    """Risk assessment as built per alert before the fragments were memoised."""
+    if score >= 0.9:
+        risk_level, priority = "CRITICAL", "IMMEDIATE"
+    elif score >= 0.7:
+        risk_level, priority = "HIGH", "URGENT"
+    elif score >= 0.5:
+        risk_level, priority = "MEDIUM", "STANDARD"
+    else:
+        risk_level, priority = "LOW", "MONITORING"
+    consequences = CONSEQUENCES.get((alert_type, score >= 0.8), []) if score >= 0.6 else []
+    return {
+        "regulatory_risk_level": risk_level,
+        "priority": priority,
+        "potential_consequences": list(consequences),
+        "recommended_actions": list(ACTIONS[risk_level]),
+        "timeline": TIMELINES[risk_level],
+    }
+
+
+@pytest.mark.unit
+class TestRegulatoryService:
+    """Unit tests for memoised rationale fragments."""
+
+    def test_fragments_match_per_alert_output(self):
+        """Every alert type, severity and score serialises exactly as before memoisation."""
+        service = RegulatoryService()
+        for alert_type, severity, score in itertools.product(ALERT_TYPES, SEVERITIES, SCORES):
+            alert = {"type": alert_type, "severity": severity}
+            risk_scores = {"overall_score": score}
+            notes = service._generate_compliance_notes(alert, risk_scores)
+            assessment = service._assess_regulatory_risk(alert, risk_scores)
+            assert json.dumps(notes) == json.dumps(expected_notes(alert_type, severity, score))
+            assert json.dumps(assessment) == json.dumps(expected_assessment(alert_type, score))
+
+    def test_fragments_are_copied_per_alert(self):
+        """Changing one alert's notes does not leak into the next alert's."""
+        service = RegulatoryService()
+        alert = {"type": "SPOOFING", "severity": "HIGH"}
+        risk_scores = {"overall_score": 0.95}
+
+        notes = service._generate_compliance_notes(alert, risk_scores)
+        assessment = service._assess_regulatory_risk(alert, risk_scores)
+        assert isinstance(notes["compliance_actions"], list)
+        notes["compliance_actions"].append("Added by reviewer")
+        notes["regulatory_thresholds"]["manipulation_threshold"] = 0.1
+        assessment["recommended_actions"].clear()
+
+        assert service._generate_compliance_notes(alert, risk_scores) == expected_notes("SPOOFING", "HIGH", 0.95)
+        assert service._assess_regulatory_risk(alert, risk_scores) == expected_assessment("SPOOFING", 0.95)
+        assert service._get_recommended_actions("CRITICAL", "SPOOFING") == ACTIONS["CRITICAL"]
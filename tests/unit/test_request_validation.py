@@ -0,0 +1,147 @@
+"""
+Unit tests for compiled request validation and Server-Timing reporting.
+"""
+
+import pytest
+from flask import Flask, jsonify
+
+try:
+    from src.api.v1.middleware.timing import add_server_timing_header, record_stage_timing
+    from src.api.v1.middleware.validation import (
+        CompiledValidator,
+        compile_schema,
+        validate_request,
+    )
+    from src.api.v1.schemas.request_schemas import (
+        AnalysisRequestSchema,
+        BaseRequestSchema,
+        BatchAnalysisRequestSchema,
+        SimulationRequestSchema,
+    )
+except ImportError as e:
+    pytest.skip(f"API v1 middleware not available: {e}", allow_module_level=True)
+
+TRADE = {"timestamp": "2024-01-02T10:00:00", "volume": 100, "value": 15000.0, "symbol": "AAPL"}
+ORDER = {"timestamp": "2024-01-02T09:59:00", "quantity": 100, "price": 150.0, "side": "buy"}
+VALID_ANALYSIS = {"trades": [TRADE], "orders": [ORDER]}
+
+ANALYSIS_PAYLOADS = [
+    VALID_ANALYSIS,
+    {"trades": [TRADE, dict(TRADE)], "orders": [ORDER], "analysis_type": "spoofing"},
+    {"trades": [TRADE]},
+    {"trades": [], "orders": [ORDER]},
+    {"trades": [{"timestamp": "2024-01-02T10:00:00"}], "orders": [ORDER]},
+    {"trades": [TRADE], "orders": [{k: v for k, v in ORDER.items() if k != "side"}]},
+    {"trades": ["not a trade"], "orders": [ORDER]},
+    {"trades": "not a list", "orders": [ORDER]},
+    {"trades": {"0": TRADE}, "orders": [ORDER]},
+    {"trades": [TRADE], "orders": None},
+    {},
+]
+
+BATCH_PAYLOADS = [
+    {"batch_data": [VALID_ANALYSIS, VALID_ANALYSIS]},
+    {"batch_data": [VALID_ANALYSIS, {"trades": [TRADE]}]},
+    {"batch_data": []},
+    {"batch_data": "not a list"},
+    {},
+]
+
+
+def outcome(result):
+    return result.is_valid, result.errors
+
+
+@pytest.mark.unit
+class TestCompiledValidator:
+    """Unit tests for CompiledValidator and compile_schema."""
+
+    @pytest.mark.parametrize(
+        "schema_class, data",
+        [(AnalysisRequestSchema, data) for data in ANALYSIS_PAYLOADS]
+        + [(BatchAnalysisRequestSchema, data) for data in BATCH_PAYLOADS]
+        + [(SimulationRequestSchema, {"scenario_type": "spoofing"}), (SimulationRequestSchema, {})],
+    )
+    def test_matches_full_validation(self, schema_class, data):
+        """Compiled validation gives the same verdict and errors as the schema itself."""
+        assert outcome(CompiledValidator(schema_class).validate(data)) == outcome(
+            schema_class().validate(data)
+        )
+
+    def test_fast_path_skips_full_validation(self, monkeypatch):
+        """Well-formed payloads are accepted without running the full checks."""
+        validator = CompiledValidator(AnalysisRequestSchema)
+
+        def full_validation(*args):
+            raise AssertionError("full validation should not run")
+
+        monkeypatch.setattr(validator.schema, "validate", full_validation)
+        assert validator.validate(VALID_ANALYSIS).is_valid
+
+    def test_fast_path_errors_fall_back(self):
+        """A fast check that raises or answers non-True defers to full validation."""
+
+        class FragileSchema(BaseRequestSchema):
+            def is_well_formed(self, data):
+                raise KeyError("surprise")
+
+            def _validate_specific(self, data, result):
+                if "name" not in data:
+                    result.add_error("Missing required field: name")
+
+        validator = CompiledValidator(FragileSchema)
+        assert validator.validate({"name": "x"}).is_valid
+        assert validator.validate({}).errors == ["Missing required field: name"]
+
+    def test_compiled_once_per_schema(self):
+        """Routes sharing a schema share its compiled validator."""
+        assert compile_schema(AnalysisRequestSchema) is compile_schema(AnalysisRequestSchema)
+        assert compile_schema(AnalysisRequestSchema) is not compile_schema(SimulationRequestSchema)
+
+
+@pytest.fixture
+def client():
+    """Client for an app with one validated route reporting stage timings."""
+    app = Flask(__name__)
+    app.after_request(add_server_timing_header)
+
+    @app.route("/analyze", methods=["POST"])
+    @validate_request(AnalysisRequestSchema)
+    def analyze():
+        record_stage_timing("inference", 1.5)
+        return jsonify({"ok": True})
+
+    return app.test_client()
+
+
+def stage_timings(response):
+    entries = [entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", ")]
+    return {stage: float(duration) for stage, duration in entries}
+
+
+@pytest.mark.unit
+class TestServerTiming:
+    """Unit tests for the Server-Timing header."""
+
+    def test_accepted_request_reports_stages(self, client):
+        """Each recorded stage appears with its duration."""
+        response = client.post("/analyze", json=VALID_ANALYSIS)
+        assert response.status_code == 200
+        timings = stage_timings(response)
+        assert list(timings) == ["validation", "inference"]
+        assert timings["validation"] >= 0
+        assert timings["inference"] == 1.5
+
+    @pytest.mark.parametrize("payload", [{"trades": [TRADE]}, ["not", "an", "object"]])
+    def test_rejected_request_reports_validation(self, client, payload):
+        """Requests failing validation still report how long validation took."""
+        response = client.post("/analyze", json=payload)
+        assert response.status_code == 400
+        assert list(stage_timings(response)) == ["validation"]
+
+    def test_no_header_without_timings(self):
+        """Responses with nothing recorded carry no header."""
+        app = Flask(__name__)
+        app.after_request(add_server_timing_header)
+        app.add_url_rule("/ping", "ping", lambda: "pong")
+        assert "Server-Timing" not in app.test_client().get("/ping").headers
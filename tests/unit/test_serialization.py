@@ -0,0 +1,196 @@
+"""
+Unit tests for the fast JSON provider and response compression.
+"""
+
+import gzip
+import json
+import logging
+import zlib
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from flask import Flask, jsonify
+
+from src.utils.serialization import (
+    ORJSON_AVAILABLE,
+    FastJSONProvider,
+    compress_stream,
+    export_response,
+    init_serialization,
+    streaming_response,
+    to_json_compatible,
+)
+
+PAYLOAD = {
+    "score": np.float64(0.75),
+    "count": np.int64(3),
+    "flag": np.bool_(True),
+    "probabilities": np.array([0.1, 0.2, 0.7]),
+    "timestamp": datetime(2024, 1, 2, 3, 4, 5),
+    "amount": Decimal("1.5"),
+    "nodes": [{"name": f"node_{i}", "value": np.float32(i)} for i in range(100)],
+}
+
+
+def make_app(**config):
+    """Create a test app with serialization installed."""
+    app = Flask(__name__)
+    init_serialization(app, config)
+
+    @app.route("/payload")
+    def payload():
+        return jsonify(PAYLOAD)
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/stream")
+    def stream():
+        rows = (f"{i},{i * 2}\n" for i in range(1000))
+        return streaming_response(rows, "text/csv", filename="rows.csv")
+
+    @app.route("/export/broken")
+    def broken_export():
+        def rows():
+            yield "id\n"
+            raise ValueError("record went missing")
+
+        return export_response(rows(), "text/csv", "broken.csv", {"compression_enabled": False})
+
+    return app
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Unit tests for serialization helpers."""
+
+    def test_default_hook_handles_numpy_and_datetimes(self):
+        """Non-native values are converted to plain JSON types."""
+        assert to_json_compatible(np.int32(4)) == 4
+        assert to_json_compatible(np.array([[1, 2]])) == [[1, 2]]
+        assert to_json_compatible(datetime(2024, 1, 1)) == "2024-01-01T00:00:00"
+        assert to_json_compatible({"a"}) == ["a"]
+        with pytest.raises(TypeError):
+            to_json_compatible(object())
+
+    @pytest.mark.parametrize(
+        "backend", ["stdlib"] + (["orjson"] if ORJSON_AVAILABLE else [])
+    )
+    def test_backends_produce_equivalent_json(self, backend):
+        """Every backend serialises numpy and datetime values natively."""
+        provider = FastJSONProvider(Flask(__name__), backend=backend)
+        decoded = json.loads(provider.dumps(PAYLOAD))
+
+        assert decoded["score"] == 0.75
+        assert decoded["count"] == 3
+        assert decoded["flag"] is True
+        assert decoded["probabilities"] == [0.1, 0.2, 0.7]
+        assert decoded["timestamp"].startswith("2024-01-02T03:04:05")
+        assert decoded["amount"] == 1.5
+        assert decoded["nodes"][5]["value"] == 5.0
+
+    @pytest.mark.parametrize(
+        "backend", ["stdlib"] + (["orjson"] if ORJSON_AVAILABLE else [])
+    )
+    def test_backends_agree_on_non_finite_floats_and_key_order(self, backend):
+        """NaN and infinities become null; sort_keys and indent=2 are honoured."""
+        provider = FastJSONProvider(Flask(__name__), backend=backend)
+        data = {"b": float("nan"), "a": [np.float64("inf"), np.array([1.0, np.nan])]}
+
+        assert provider.dumps(data) == '{"b":null,"a":[null,[1.0,null]]}'
+        assert provider.dumps(data, sort_keys=True) == '{"a":[null,[1.0,null]],"b":null}'
+        assert json.loads(provider.dumps(data, indent=2)) == {"b": None, "a": [None, [1.0, None]]}
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_jsonify_uses_orjson(self, monkeypatch):
+        """Responses built by jsonify go through orjson, compact or indented."""
+        import orjson
+
+        calls = []
+        dumps = orjson.dumps
+
+        def spy(*args, **kwargs):
+            calls.append(kwargs.get("option"))
+            return dumps(*args, **kwargs)
+
+        monkeypatch.setattr(orjson, "dumps", spy)
+        app = make_app()
+        assert app.test_client().get("/payload").get_json()["count"] == 3
+        assert len(calls) == 1
+
+        app.json.compact = False
+        body = app.test_client().get("/small").get_data(as_text=True)
+        assert body == '{\n  "ok": true\n}\n'
+        assert calls[-1] & orjson.OPT_INDENT_2
+
+    def test_gzip_negotiation(self):
+        """Large responses are gzip-compressed when the client accepts it."""
+        client = make_app(compression_min_size=256).test_client()
+        response = client.get("/payload", headers={"Accept-Encoding": "gzip, deflate"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        decoded = json.loads(gzip.decompress(response.get_data()))
+        assert decoded["count"] == 3
+
+    def test_deflate_negotiation(self):
+        """Deflate is used when gzip is refused."""
+        client = make_app(compression_min_size=256).test_client()
+        response = client.get("/payload", headers={"Accept-Encoding": "gzip;q=0, deflate"})
+
+        assert response.headers["Content-Encoding"] == "deflate"
+        assert json.loads(zlib.decompress(response.get_data()))["count"] == 3
+
+    def test_no_compression_without_accept_or_for_small_bodies(self):
+        """Small bodies and clients without Accept-Encoding get plain JSON."""
+        client = make_app(compression_min_size=256).test_client()
+
+        plain = client.get("/payload")
+        assert "Content-Encoding" not in plain.headers
+        assert plain.get_json()["count"] == 3
+
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in small.headers
+
+    def test_compression_can_be_disabled(self):
+        """compression_enabled=False leaves responses untouched."""
+        client = make_app(compression_enabled=False, compression_min_size=0).test_client()
+        response = client.get("/payload", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    def test_compress_stream_round_trip(self):
+        """Incrementally compressed chunks decode to the original text."""
+        chunks = [f"line {i}\n" for i in range(500)]
+        gzipped = b"".join(compress_stream(chunks, "gzip"))
+        deflated = b"".join(compress_stream(chunks, "deflate"))
+
+        assert gzip.decompress(gzipped).decode("utf-8") == "".join(chunks)
+        assert zlib.decompress(deflated).decode("utf-8") == "".join(chunks)
+
+    def test_streaming_response(self):
+        """Streamed downloads are attachments, compressed only when accepted."""
+        client = make_app().test_client()
+
+        plain = client.get("/stream")
+        assert plain.is_streamed
+        assert "Content-Encoding" not in plain.headers
+        assert 'filename="rows.csv"' in plain.headers["Content-Disposition"]
+        assert plain.get_data(as_text=True).startswith("0,0\n1,2\n")
+
+        compressed = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+    def test_export_stream_errors_are_logged(self, caplog):
+        """Failures after an export has started streaming are logged, then raised."""
+        client = make_app().test_client()
+        response = client.get("/export/broken")
+        assert 'filename="broken.csv"' in response.headers["Content-Disposition"]
+
+        with caplog.at_level(logging.ERROR, logger="src.utils.serialization"):
+            with pytest.raises(ValueError):
+                response.get_data()
+        assert "Error streaming export broken.csv: record went missing" in caplog.text
@@ -0,0 +1,213 @@
+"""
+Unit tests for the temporal indexing primitives.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.entity_resolution import EntityResolutionService, PersonIdentity
+from src.core.person_evidence_aggregator import PersonEvidenceAggregator
+from src.core.temporal_index import (
+    EpochArrays,
+    RecordTimeIndex,
+    count_pairs_within,
+    count_synchronized_pairs,
+    epoch_minutes,
+    pair_counts_within,
+    sorted_epoch_minutes,
+    synchronized_trade_pairs,
+)
+
+BASE = datetime(2024, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def trades_at(*timestamps):
+    return [SimpleNamespace(execution_timestamp=timestamp) for timestamp in timestamps]
+
+
+def trade(account, seconds, symbol="AAPL", direction="BUY"):
+    return SimpleNamespace(
+        trader_id=account,
+        symbol=symbol,
+        direction=direction,
+        execution_timestamp=(BASE + timedelta(seconds=seconds)).isoformat(),
+    )
+
+
+def in_lookback(timestamp, cutoff):
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return True
+    if not isinstance(timestamp, datetime):
+        return True
+    return timestamp.replace(tzinfo=timestamp.tzinfo or timezone.utc) >= cutoff
+
+
+def brute_force_pairs(times1, times2, window):
+    return sum(1 for t1 in times1 for t2 in times2 if abs(t1 - t2) <= window)
+
+
+@pytest.mark.unit
+class TestTemporalIndex:
+    """Unit tests for epoch arrays and window pair counting."""
+
+    def test_sweep_matches_pairwise_count(self):
+        """The two-pointer sweep counts exactly the pairs a nested loop finds."""
+        rng = random.Random(3)
+        for _ in range(200):
+            times1 = sorted(rng.choice([rng.randrange(60), rng.uniform(0, 60)]) for _ in range(rng.randrange(15)))
+            times2 = sorted(rng.choice([rng.randrange(60), rng.uniform(0, 60)]) for _ in range(rng.randrange(15)))
+            assert count_pairs_within(times1, times2, 5) == brute_force_pairs(times1, times2, 5)
+
+    def test_window_bounds_are_inclusive(self):
+        """Pairs exactly one window apart count; duplicates count once per pair."""
+        assert count_pairs_within([0, 10], [5, 5, 15, 15.5], 5) == 5
+
+    def test_epoch_minutes_tolerates_bad_timestamps(self):
+        """Unreadable timestamps sort at zero, as the aggregator always treated them."""
+        assert epoch_minutes("2024-01-02T09:00:00Z") == BASE.timestamp() / 60
+        assert sorted_epoch_minutes(trades_at(None, "junk", BASE.isoformat())) == [0, 0, BASE.timestamp() / 60]
+
+    def test_aware_and_naive_times_kept_apart(self):
+        """Naive and aware times are never paired; offsets are normalised to UTC."""
+        epochs1 = EpochArrays.from_trades(trades_at(
+            BASE.isoformat(),
+            BASE.astimezone(timezone(timedelta(hours=5))).isoformat(),
+            BASE.replace(tzinfo=None).isoformat(),
+            "junk",
+        ))
+        epochs2 = EpochArrays.from_trades(trades_at(
+            (BASE + timedelta(seconds=300)).isoformat().replace("+00:00", "Z"),
+            (BASE + timedelta(seconds=300, microseconds=1)).isoformat(),
+        ))
+        assert epochs1.aware[0] == epochs1.aware[1]
+        assert len(epochs1.naive) == 1
+        assert count_synchronized_pairs(epochs1, epochs2) == 2
+
+
+@pytest.mark.unit
+class TestSynchronizedActivity:
+    """Unit tests for multi-account window counts and bucketed synchronization."""
+
+    def test_pair_counts_match_pairwise_counts(self):
+        """One sweep gives every account pair's count from the two-list primitive."""
+        rng = random.Random(5)
+        times = {f"A{i}": sorted(rng.uniform(0, 120) for _ in range(rng.randrange(1, 12))) for i in range(6)}
+        counts = pair_counts_within(times, 5)
+        keys = list(times)
+        for i, key1 in enumerate(keys):
+            for key2 in keys[i + 1:]:
+                assert counts.get((key1, key2), 0) == count_pairs_within(times[key1], times[key2], 5)
+
+    def test_pairs_need_same_instrument_side_and_other_account(self):
+        """Only cross-account trades in one instrument and direction within the window pair up."""
+        trades = [
+            trade("A1", 0),
+            trade("A1", 10),
+            trade("A2", 20, direction="SELL"),
+            trade("A3", 30, symbol="MSFT"),
+            trade("A4", 301),
+            trade("A5", 700),
+        ]
+        pairs = [(first.trader_id, second.trader_id) for first, second in synchronized_trade_pairs(trades)]
+        assert pairs == [("A1", "A4")]
+
+    def test_neighbouring_buckets_probed(self):
+        """Trades straddling a bucket boundary are still paired, with small buckets too."""
+        trades = [trade("A1", 299), trade("A2", 301), trade("A3", 590)]
+        assert len(list(synchronized_trade_pairs(trades))) == 3
+        assert len(list(synchronized_trade_pairs(trades, bucket_seconds=60))) == 3
+
+    def test_aggregator_threshold(self):
+        """Synchronized activity needs the configured number of pairs."""
+        aggregator = PersonEvidenceAggregator(None)
+        trades_by_account = {"A1": [trade("A1", 0)], "A2": [trade("A2", 60)], "A3": [trade("A3", 4000)]}
+        assert not aggregator._detect_synchronized_activity(trades_by_account)
+        trades_by_account["A3"].append(trade("A3", 120))
+        assert aggregator._detect_synchronized_activity(trades_by_account)
+        aggregator.synchronization["window_seconds"] = 30
+        assert not aggregator._detect_synchronized_activity(trades_by_account)
+
+
+@pytest.mark.unit
+class TestRecordTimeIndex:
+    """Unit tests for sorted record indexes and the aggregator's lookback filters."""
+
+    def test_since_matches_linear_filter(self):
+        """A lookback keeps what a scan would, oldest first, with undated records last."""
+        rng = random.Random(7)
+        records = [
+            {"id": i, "timestamp": rng.choice([
+                None,
+                "junk",
+                (BASE - timedelta(minutes=rng.randrange(600))).isoformat().replace("+00:00", "Z"),
+                (BASE - timedelta(minutes=rng.randrange(600))).replace(tzinfo=None),
+            ])}
+            for i in range(300)
+        ]
+        index = RecordTimeIndex(records, lambda record: record["timestamp"])
+        for minutes in (0, 1, 90, 599, 1000):
+            cutoff = BASE - timedelta(minutes=minutes)
+            expected = [record for record in records if in_lookback(record["timestamp"], cutoff)]
+            window = index.since(cutoff)
+            assert sorted(record["id"] for record in window) == [record["id"] for record in expected]
+        assert index.since(BASE)[-1]["timestamp"] in (None, "junk")
+
+    def test_window_is_a_view(self):
+        """Windows share the index's list and support sequence access."""
+        index = RecordTimeIndex(
+            trades_at("junk", BASE.isoformat(), (BASE - timedelta(hours=2)).isoformat()),
+            lambda trade: trade.execution_timestamp
+        )
+        window = index.since(BASE - timedelta(hours=1))
+        assert [trade.execution_timestamp for trade in window] == [BASE.isoformat(), "junk"]
+        assert window[-1] is index.records[-1]
+        assert window[:1] == [index.records[1]]
+        with pytest.raises(IndexError):
+            window[2]
+
+    def test_aggregator_filters_use_person_records(self):
+        """Filters keep only the person's records inside the lookback."""
+        now = datetime.now(timezone.utc)
+        service = EntityResolutionService()
+        service.identity_graph.persons["P1"] = PersonIdentity(
+            person_id="P1", confidence_score=0.9, linked_accounts={"A1", "A2"}, linked_emails={"p1@bank.com"}
+        )
+        aggregator = PersonEvidenceAggregator(service)
+        trades = [
+            SimpleNamespace(trader_id=account, execution_timestamp=(now - timedelta(hours=hours)).isoformat())
+            for account, hours in (("A1", 1), ("A9", 1), ("A2", 30), ("A2", 5))
+        ]
+        comms = [
+            {"sender_email": "p1@bank.com", "timestamp": now - timedelta(hours=2)},
+            {"sender_email": "p1@bank.com", "timestamp": None},
+            {"sender_email": "other@bank.com", "timestamp": now.isoformat()},
+        ]
+        assert list(aggregator._filter_person_trades("P1", trades, 24)) == [trades[3], trades[0]]
+        assert len(aggregator._filter_person_trades("P1", trades, 48)) == 3
+        assert list(aggregator._filter_person_communications("P1", comms, 1)) == [comms[1]]
+        assert aggregator._filter_person_trades("P9", trades, 24) == []
+
+    def test_aggregator_releases_record_indexes_on_failure(self, monkeypatch):
+        """A failed aggregation does not leave the person's record indexes behind."""
+        now = datetime.now(timezone.utc)
+        service = EntityResolutionService()
+        service.identity_graph.persons["P1"] = PersonIdentity(
+            person_id="P1", confidence_score=0.9, linked_accounts={"A1"}
+        )
+        aggregator = PersonEvidenceAggregator(service)
+        trades = [SimpleNamespace(trader_id="A1", execution_timestamp=now.isoformat())]
+
+        def failing_trading_evidence(person_id, trade_data, time_window_hours):
+            aggregator._filter_person_trades(person_id, trade_data, time_window_hours)
+            raise ValueError("bad trade record")
+
+        monkeypatch.setattr(aggregator, "_aggregate_trading_evidence", failing_trading_evidence)
+        with pytest.raises(ValueError):
+            aggregator.aggregate_person_evidence("P1", trades, [])
+        assert aggregator._record_indexes == {}
@@ -0,0 +1,141 @@
+"""
+Unit tests for the compact raw trading data models.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.trading_data import (
+    ColumnarRecordBuffer,
+    OrderStatus,
+    RawOrderData,
+    RawTradeData,
+    TradeDirection,
+)
+
+TRADE_COLUMNS = {
+    "trade_id": ["T1", "T2", "T3"],
+    "execution_timestamp": ["2024-01-01T10:00:00"] * 3,
+    "instrument": ["AAPL"] * 3,
+    "instrument_type": ["equity"] * 3,
+    "symbol": ["AAPL"] * 3,
+    "exchange": ["NASDAQ"] * 3,
+    "direction": ["buy", "sell", "buy"],
+    "quantity": np.array([100.0, 200.0, 300.0]),
+    "executed_price": np.array([150.0, 151.0, 152.0]),
+    "notional_value": np.array([15000.0, 30200.0, 45600.0]),
+    "trader_id": ["TR1"] * 3,
+}
+
+
+def make_trade(**overrides):
+    """Build a single trade with sensible defaults."""
+    values = {name: column[0] for name, column in TRADE_COLUMNS.items()}
+    values["direction"] = TradeDirection.BUY
+    values["quantity"] = 100.0
+    values["executed_price"] = 150.0
+    values["notional_value"] = 15000.0
+    values.update(overrides)
+    return RawTradeData(**values)
+
+
+@pytest.mark.unit
+class TestSlottedRecords:
+    """Unit tests for the slotted record layout."""
+
+    def test_no_instance_dict(self):
+        """Records carry no per-instance __dict__."""
+        trade = make_trade()
+        assert not hasattr(trade, "__dict__")
+        with pytest.raises(AttributeError):
+            trade.unknown_field = 1
+
+    def test_to_dict_unchanged(self):
+        """Serialised keys, order and enum values match the public format."""
+        data = make_trade(alert_ids=["A1"]).to_dict()
+        assert list(data)[:3] == ["trade_id", "order_id", "parent_order_id"]
+        assert list(data)[-1] == "created_at"
+        assert len(data) == 39
+        assert data["direction"] == "buy"
+        assert data["alert_ids"] == ["A1"]
+
+    def test_order_to_dict_enums(self):
+        """Order status and side serialise to their string values."""
+        order = RawOrderData(
+            order_id="O1",
+            order_timestamp="2024-01-01T10:00:00",
+            status=OrderStatus.FILLED,
+            instrument="AAPL",
+            instrument_type="equity",
+            symbol="AAPL",
+            exchange="NASDAQ",
+            side=TradeDirection.SELL,
+            order_type="limit",
+            quantity=10.0,
+            filled_quantity=10.0,
+            remaining_quantity=0.0,
+            trader_id="TR1",
+        )
+        data = order.to_dict()
+        assert data["status"] == "filled"
+        assert data["side"] == "sell"
+        assert not hasattr(order, "__dict__")
+
+
+@pytest.mark.unit
+class TestBulkConstruction:
+    """Unit tests for column-wise construction."""
+
+    def test_from_arrays(self):
+        """Arrays become native values, enums are coerced and lists are not shared."""
+        trades = RawTradeData.from_arrays(TRADE_COLUMNS, alert_ids=["A1"])
+
+        assert len(trades) == 3
+        assert trades[1].direction is TradeDirection.SELL
+        assert type(trades[2].quantity) is float
+        assert trades[0].alert_ids == ["A1"]
+        assert trades[0].alert_ids is not trades[1].alert_ids
+
+    def test_mismatched_columns_rejected(self):
+        """Columns of different lengths are rejected."""
+        columns = dict(TRADE_COLUMNS, trade_id=["T1"])
+        with pytest.raises(ValueError):
+            RawTradeData.from_arrays(columns)
+
+
+@pytest.mark.unit
+class TestColumnarRecordBuffer:
+    """Unit tests for ColumnarRecordBuffer."""
+
+    def test_round_trip(self):
+        """Records read back from the buffer equal the originals."""
+        trades = RawTradeData.from_arrays(TRADE_COLUMNS)
+        buffer = ColumnarRecordBuffer.from_records(trades)
+
+        assert len(buffer) == 3
+        assert list(buffer) == trades
+        assert buffer[-1] == trades[-1]
+        assert isinstance(buffer.column("quantity"), np.ndarray)
+
+    def test_lazy_dict_page(self):
+        """A page of dicts matches to_dict() for the same rows."""
+        columns = dict(TRADE_COLUMNS, created_at=["2024-01-01T12:00:00"] * 3)
+        trades = RawTradeData.from_arrays(columns)
+        buffer = ColumnarRecordBuffer(RawTradeData, columns=columns)
+
+        page = list(buffer.iter_dicts(1, 10))
+        assert page == [trade.to_dict() for trade in trades[1:]]
+
+    def test_sparse_float_column_stays_list(self):
+        """Float columns with gaps fall back to plain lists."""
+        buffer = ColumnarRecordBuffer.from_records(
+            [make_trade(bid_price=1.0), make_trade(bid_price=None)]
+        )
+        assert buffer.column("bid_price") == [1.0, None]
+        assert buffer[1].bid_price is None
+
+    def test_missing_required_column(self):
+        """Required fields must be supplied."""
+        columns = {k: v for k, v in TRADE_COLUMNS.items() if k != "trade_id"}
+        with pytest.raises(ValueError):
+            ColumnarRecordBuffer(RawTradeData, columns=columns)
@@ -0,0 +1,120 @@
+"""
+Unit tests for raw trade and order extraction in the trading data service.
+"""
+
+import os
+import sys
+
+import pytest
+
+# The service imports from src as the application root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+try:
+    from core.trading_data_service import TradingDataService
+    from models.trading_data import ColumnarRecordBuffer, OrderStatus, TradeDirection
+except ImportError as e:
+    pytest.skip(f"Trading data service not available: {e}", allow_module_level=True)
+
+PROCESSED_DATA = {
+    "trades": [
+        {
+            "id": "T1",
+            "timestamp": "2024-01-02T10:00:00",
+            "instrument": "AAPL",
+            "side": "buy",
+            "volume": 100,
+            "price": 150.0,
+            "order_id": "O1",
+        },
+        {
+            "id": "T2",
+            "timestamp": "2024-01-02T10:05:00",
+            "instrument": "ES_FUT",
+            "side": "sell",
+            "volume": 5,
+            "price": 4000.0,
+            "value": 20000.0,
+            "trader_id": "TR2",
+        },
+    ],
+    "orders": [
+        {
+            "id": "O1",
+            "timestamp": "2024-01-02T09:59:00",
+            "instrument": "AAPL",
+            "side": "buy",
+            "size": 300,
+            "filled_quantity": 100,
+            "price": 150.0,
+            "status": "cancelled",
+        }
+    ],
+    "trader_info": {"id": "TR1", "name": "Alice Carter", "department": "EQUITY"},
+    "market_data": {"bid_price": 149.5, "ask_price": 150.5, "reference_price": 150.0},
+}
+
+
+@pytest.fixture
+def service():
+    return TradingDataService({})
+
+
+@pytest.mark.unit
+class TestTradingDataService:
+    """Unit tests for TradingDataService extraction."""
+
+    def test_extracts_trades(self, service):
+        """Per-trade values and shared trader/market context are filled in."""
+        trades = service.extract_raw_trades_for_alert("A1", PROCESSED_DATA)
+
+        assert [t.trade_id for t in trades] == ["T1", "T2"]
+        assert [t.direction for t in trades] == [TradeDirection.BUY, TradeDirection.SELL]
+        assert [t.trader_id for t in trades] == ["TR1", "TR2"]
+        assert [t.notional_value for t in trades] == [15000.0, 20000.0]
+        assert [t.instrument_type for t in trades] == ["equity", "future"]
+        assert {t.desk for t in trades} == {"EQUITY"}
+        assert trades[0].spread == 1.0
+        assert trades[0].alert_ids == ["A1"]
+        assert trades[0].alert_ids is not trades[1].alert_ids
+
+    def test_extracts_orders(self, service):
+        """Order quantities, status and risk indicators are derived per order."""
+        (order,) = service.extract_raw_orders_for_alert("A1", PROCESSED_DATA)
+
+        assert order.status is OrderStatus.CANCELLED
+        assert (order.quantity, order.filled_quantity, order.remaining_quantity) == (300.0, 100.0, 200.0)
+        assert order.notional_value == 45000.0
+        assert order.trader_name == "Alice Carter"
+        assert order.bid_at_order == 149.5
+
+    def test_caches_records_in_columns(self, service):
+        """The caches hold compact columnar copies that read back as the extracted records."""
+        trades = service.extract_raw_trades_for_alert("A1", PROCESSED_DATA)
+        orders = service.extract_raw_orders_for_alert("A1", PROCESSED_DATA)
+
+        cached_trades = service.raw_trades_cache["A1"]
+        assert isinstance(cached_trades, ColumnarRecordBuffer)
+        assert [t.to_dict() for t in cached_trades] == [t.to_dict() for t in trades]
+        assert isinstance(service.raw_orders_cache["A1"], ColumnarRecordBuffer)
+
+        results = service.search_raw_data({"trader_id": "TR1"})
+        assert results["trades"] == [trades[0].to_dict()]
+        assert results["orders"] == [orders[0].to_dict()]
+
+    def test_spill_files_per_process(self, tmp_path):
+        """Each process spills to its own files, deleted when the service closes."""
+        service = TradingDataService({"max_entries": 1, "spill_dir": str(tmp_path)})
+        expected = {
+            tmp_path / f"raw_trades.{os.getpid()}.db",
+            tmp_path / f"raw_orders.{os.getpid()}.db",
+        }
+        assert expected <= set(tmp_path.iterdir())
+
+        service.close()
+        assert not list(tmp_path.iterdir())
+
+    def test_empty_extraction(self, service):
+        """Alerts without trades or orders cache empty buffers."""
+        assert service.extract_raw_trades_for_alert("A1", {}) == []
+        assert service.extract_raw_orders_for_alert("A1", {}) == []
+        assert len(service.raw_trades_cache["A1"]) == 0